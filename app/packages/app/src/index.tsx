@@ -16,6 +16,7 @@ import {
   useReset,
   useRouter,
   useScreenshot,
+  useStatePatch,
 } from "@fiftyone/state";
 import { env, getEventSource, toCamelCase } from "@fiftyone/utilities";
 import React, { useEffect, useRef, useState } from "react";
@@ -36,6 +37,7 @@ enum AppReadyState {
 
 enum Events {
   DEACTIVATE_NOTEBOOK_CELL = "deactivate_notebook_cell",
+  STATE_PATCH = "state_patch",
   STATE_UPDATE = "state_update",
 }
 
@@ -50,6 +52,10 @@ const App: React.FC = ({}) => {
   contextRef.current = context;
   const reset = useReset();
   const clearModal = useClearModal();
+  const patchState = useStatePatch();
+  // the last serialized state and its version, to which patches are applied
+  const serializedStateRef = useRef<{ [key: string]: unknown }>({});
+  const versionRef = useRef<number>(-1);
 
   useEffect(() => {
     readyState === AppReadyState.CLOSED && reset();
@@ -94,11 +100,69 @@ const App: React.FC = ({}) => {
               controller.abort();
               screenshot();
               break;
+            case Events.STATE_PATCH:
             case Events.STATE_UPDATE: {
               const payload = JSON.parse(msg.data);
-              const { colorscale, config, ...data } = payload.state;
+
+              // versions also advance with this App's own updates, which are
+              // not echoed back, and the server sends the full state in
+              // place of any patch that this App cannot apply
+              if (
+                typeof payload.version === "number" &&
+                payload.version <= versionRef.current
+              ) {
+                break;
+              }
+
+              serializedStateRef.current =
+                msg.event === Events.STATE_PATCH
+                  ? { ...serializedStateRef.current, ...payload.patch }
+                  : payload.state;
+
+              if (typeof payload.version === "number") {
+                versionRef.current = payload.version;
+              }
 
               payload.refresh && refresh();
+
+              // patches only contain selections, spaces, the color scheme or
+              // the config, which are applied to their atoms directly rather
+              // than by navigating, which would reload the dataset
+              if (
+                msg.event === Events.STATE_PATCH &&
+                readyStateRef.current === AppReadyState.OPEN
+              ) {
+                const { colorscale, config, ...data } = payload.patch;
+                const patch = toCamelCase(data) as Partial<State.Description>;
+                patchState({
+                  config: config
+                    ? (toCamelCase(config) as State.Config)
+                    : undefined,
+                  state: patch,
+                });
+
+                // keep the current location's state in sync for when the
+                // dataset is next loaded from it
+                const locationState = contextRef.current.history.location
+                  .state as {
+                  state?: Partial<State.Description>;
+                  config?: unknown;
+                  colorscale?: unknown;
+                } | null;
+                if (locationState) {
+                  locationState.state &&
+                    Object.assign(locationState.state, patch);
+                  config && (locationState.config = config);
+                  "colorscale" in payload.patch &&
+                    (locationState.colorscale = colorscale);
+                }
+
+                break;
+              }
+
+              const { colorscale, config, ...data } =
+                serializedStateRef.current;
+
               const state = {
                 ...toCamelCase(data),
                 view: data.view,
@@ -158,7 +222,11 @@ const App: React.FC = ({}) => {
           view: getSavedViewName(contextRef.current),
         },
         subscription,
-        events: [Events.DEACTIVATE_NOTEBOOK_CELL, Events.STATE_UPDATE],
+        events: [
+          Events.DEACTIVATE_NOTEBOOK_CELL,
+          Events.STATE_PATCH,
+          Events.STATE_UPDATE,
+        ],
       }
     );
 
@@ -2,7 +2,7 @@ import { PopoutSectionTitle, useTheme } from "@fiftyone/components";
 import { FrameLooker, ImageLooker, VideoLooker } from "@fiftyone/looker";
 import * as fos from "@fiftyone/state";
 import { Lookers, groupId, groupStatistics, refresher } from "@fiftyone/state";
-import { getFetchFunction } from "@fiftyone/utilities";
+import { ServerError, getFetchFunction } from "@fiftyone/utilities";
 import { useSpring } from "@react-spring/web";
 import numeral from "numeral";
 import React, {
@@ -11,6 +11,7 @@ import React, {
   useLayoutEffect,
   useState,
 } from "react";
+import { useErrorHandler } from "react-error-boundary";
 import {
   RecoilState,
   RecoilValue,
@@ -68,6 +69,7 @@ const TaggingInput = styled.input`
 interface SectionProps {
   countAndPlaceholder: () => [number, string];
   taggingAtom: RecoilState<boolean>;
+  progressAtom: RecoilValue<number | null>;
   itemsAtom: RecoilValue<{ [key: string]: number }>;
   submit: ({ changes }) => Promise<void>;
   close: () => void;
@@ -78,6 +80,7 @@ const Section = ({
   countAndPlaceholder,
   submit,
   taggingAtom,
+  progressAtom,
   itemsAtom,
   close,
   labels,
@@ -86,6 +89,7 @@ const Section = ({
   const elementNames = useRecoilValue(fos.elementNames);
   const theme = useTheme();
   const [tagging, setTagging] = useRecoilState(taggingAtom);
+  const progress = useRecoilValue(progressAtom);
   const [value, setValue] = useState("");
   const [count, placeholder] = countAndPlaceholder();
   const disabled = tagging || typeof count !== "number";
@@ -131,7 +135,14 @@ const Section = ({
     <>
       <TaggingContainerInput data-cy="tagger-container">
         {isLoading ? (
-          <LoadingDots text="" style={{ color: theme.text.secondary }} />
+          <LoadingDots
+            text={
+              tagging && progress !== null
+                ? numeral(progress).format("0%")
+                : ""
+            }
+            style={{ color: theme.text.secondary }}
+          />
         ) : (
           <TaggingInput
             data-cy={`${labels ? "label" : "sample"}-tag-input`}
@@ -309,6 +320,7 @@ const useTagCallback = (
   const setLabels = fos.useSetSelectedLabels();
   const setSamples = fos.useSetSelected();
   const updateSamples = fos.useUpdateSamples();
+  const handleError = useErrorHandler();
 
   const finalize = [
     () => setLabels([]),
@@ -325,7 +337,7 @@ const useTagCallback = (
       async ({ changes }) => {
         const isGroup = await snapshot.getPromise(fos.isGroup);
         const slices = await snapshot.getPromise(fos.currentSlices(modal));
-        const { samples } = await getFetchFunction()("POST", "/tag", {
+        const body = {
           ...tagParameters({
             activeFields: await snapshot.getPromise(
               fos.activeLabelFields({ modal })
@@ -354,7 +366,38 @@ const useTagCallback = (
           }),
           current_frame: lookerRef?.current?.frameNumber,
           changes,
-        });
+        };
+
+        let samples = null;
+        if (targetLabels) {
+          // label tagging streams its progress, followed by the samples
+          const parser = await getFetchFunction()(
+            "POST",
+            "/tag",
+            { ...body, stream: true },
+            "json-stream"
+          );
+          let error = null;
+          await parser.parse((chunk) => {
+            if (chunk.error) {
+              error = chunk;
+            } else if (chunk.samples) {
+              samples = chunk.samples;
+            } else {
+              set(fos.taggingProgress({ modal }), chunk.progress);
+            }
+          });
+          reset(fos.taggingProgress({ modal }));
+
+          // the stream ends with an error line if the tags were not edited
+          if (error) {
+            set(fos.anyTagging, false);
+            handleError(new ServerError({ stack: error.stack }, error.error));
+            return;
+          }
+        } else {
+          samples = (await getFetchFunction()("POST", "/tag", body)).samples;
+        }
         set(refresher, (i) => i + 1);
 
         if (!modal) {
@@ -378,7 +421,7 @@ const useTagCallback = (
 
         finalize.forEach((r) => r());
       },
-    [modal, targetLabels, lookerRef, updateSamples]
+    [modal, targetLabels, lookerRef, updateSamples, handleError]
   );
 };
 
@@ -507,6 +550,7 @@ const Tagger = ({
             countAndPlaceholder={labelPlaceholder}
             submit={submit}
             taggingAtom={fos.tagging({ modal, labels })}
+            progressAtom={fos.taggingProgress({ modal })}
             itemsAtom={tagStats({ modal, labels })}
             close={close}
             labels={true}
@@ -519,6 +563,7 @@ const Tagger = ({
             countAndPlaceholder={samplePlaceholder}
             submit={submit}
             taggingAtom={fos.tagging({ modal, labels })}
+            progressAtom={fos.taggingProgress({ modal })}
             itemsAtom={tagStats({ modal, labels })}
             close={close}
             labels={false}
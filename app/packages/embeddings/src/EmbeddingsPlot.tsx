@@ -7,7 +7,12 @@ import { useRecoilValue } from "recoil";
 import { tracesToData } from "./tracesToData";
 import { useKeyDown } from "./useKeyDown";
 import { usePlot } from "./usePlot";
-import { useResetPlotZoom, useZoomRevision } from "./useResetPlotZoom";
+import {
+  getRelayoutViewport,
+  usePlotViewport,
+  useResetPlotZoom,
+  useZoomRevision,
+} from "./useResetPlotZoom";
 
 export function EmbeddingsPlot({
   labelSelectorLoading,
@@ -34,6 +39,7 @@ export function EmbeddingsPlot({
   } = plotSelection;
   const [zoomRev] = useZoomRevision();
   const resetZoom = useResetPlotZoom();
+  const [, setViewport] = usePlotViewport();
   const { isLoading, traces, style, error } = usePlot(plotSelection);
   const [dragMode, setDragMode] = usePanelStatePartial(
     "dragMode",
@@ -94,6 +100,12 @@ export function EmbeddingsPlot({
           onDeselect={() => {
             handleSelected(null);
           }}
+          onRelayout={(event) => {
+            const relayoutViewport = getRelayoutViewport(event);
+            if (relayoutViewport !== undefined) {
+              setViewport(relayoutViewport);
+            }
+          }}
           config={{
             scrollZoom: true,
             displaylogo: false,
@@ -1 +1,4 @@
 export const SELECTION_SCOPE = "embe@fiftyone/embeddingsddings";
+
+// the maximum number of points to load for the current plot viewport
+export const MAX_PLOT_POINTS = 50000;
@@ -0,0 +1,94 @@
+const ARRAY_TYPES = {
+  float32: Float32Array,
+  int32: Int32Array,
+  uint32: Uint32Array,
+  uint8: Uint8Array,
+};
+
+// decodes the binary payload returned by the `/embeddings/plot` route when
+// `format: "binary"` is requested into the same `traces` structure that the
+// JSON payload provides
+export function decodePlot(buffer: ArrayBuffer) {
+  const error = parseError(buffer);
+  if (error) {
+    return error;
+  }
+
+  const decoder = new TextDecoder();
+  const headerLength = new DataView(buffer).getUint32(0, true);
+  const { buffers, categories, labels_type, ...info } = JSON.parse(
+    decoder.decode(new Uint8Array(buffer, 4, headerLength))
+  );
+  const dataOffset = 4 + headerLength;
+
+  const getArray = (name: string) => {
+    const [dtype, offset, length] = buffers[name];
+    return new ARRAY_TYPES[dtype](buffer, dataOffset + offset, length);
+  };
+
+  const getStrings = (name: string) => {
+    const data = getArray(`${name}_data`);
+    const offsets = getArray(`${name}_offsets`);
+    return (idx: number) =>
+      decoder.decode(data.subarray(offsets[idx], offsets[idx + 1])) || null;
+  };
+
+  const points = getArray("points");
+  const getId = getStrings("ids");
+  const getSampleId = buffers.sample_ids_data
+    ? getStrings("sample_ids")
+    : () => null;
+  const getLabel = getLabelGetter(labels_type, categories, getArray, getStrings);
+
+  const traces = {};
+  for (let idx = 0; idx < points.length / 2; idx++) {
+    const id = getId(idx);
+    const label = getLabel(idx);
+    const key = info.style === "categorical" ? String(label) : "points";
+    if (!traces[key]) {
+      traces[key] = [];
+    }
+
+    traces[key].push({
+      points: [points[2 * idx], points[2 * idx + 1]],
+      id,
+      sample_id: getSampleId(idx) ?? id,
+      label,
+      selected: true,
+    });
+  }
+
+  return { ...info, traces };
+}
+
+function getLabelGetter(labelsType, categories, getArray, getStrings) {
+  if (labelsType === "codes") {
+    const codes = getArray("labels");
+    return (idx: number) => (codes[idx] >= 0 ? categories[codes[idx]] : null);
+  }
+
+  if (labelsType === "values") {
+    const values = getArray("labels");
+    return (idx: number) => (isNaN(values[idx]) ? null : values[idx]);
+  }
+
+  if (labelsType === "strings") {
+    return getStrings("labels");
+  }
+
+  return () => null;
+}
+
+// errors are always returned as JSON, even when a binary payload is requested
+function parseError(buffer: ArrayBuffer) {
+  if (new Uint8Array(buffer, 0, 1)[0] !== "{".charCodeAt(0)) {
+    return null;
+  }
+
+  try {
+    const res = JSON.parse(new TextDecoder().decode(buffer));
+    return res?.error ? res : null;
+  } catch {
+    return null;
+  }
+}
@@ -1,4 +1,6 @@
 import { getFetchFunction } from "@fiftyone/utilities";
+import { MAX_PLOT_POINTS } from "./constants";
+import { decodePlot } from "./decodePlot";
 
 export async function fetchUpdatedSelection(params) {
   return handleErrors(
@@ -24,15 +26,24 @@ export async function fetchPlot({
   view,
   labelField,
   slices,
+  viewport = null,
 }) {
-  const res = await getFetchFunction()("POST", "/embeddings/plot", {
-    datasetName,
-    brainKey,
-    view,
-    labelField,
-    slices,
-  });
-  return handleErrors(res);
+  const res = await getFetchFunction()(
+    "POST",
+    "/embeddings/plot",
+    {
+      datasetName,
+      brainKey,
+      view,
+      labelField,
+      slices,
+      format: "binary",
+      viewport,
+      maxPoints: MAX_PLOT_POINTS,
+    },
+    "arrayBuffer"
+  );
+  return handleErrors(decodePlot(res as ArrayBuffer));
 }
 
 function handleErrors(res) {
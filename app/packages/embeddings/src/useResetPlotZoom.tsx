@@ -2,11 +2,42 @@ import { usePanelStatePartial } from "@fiftyone/spaces";
 
 export const useZoomRevision = () =>
   usePanelStatePartial("zoomRevision", 1, true);
+
+// the `[xmin, ymin, xmax, ymax]` region of the plot that is currently
+// visible, or null if the plot is not zoomed
+export const usePlotViewport = () =>
+  usePanelStatePartial("plotViewport", null, true);
+
 export function useResetPlotZoom() {
   const [zoomRevision, setZoomRevision] = useZoomRevision();
+  const [, setViewport] = usePlotViewport();
   const reset = () => {
     setZoomRevision((rev) => (typeof rev === "number" ? rev + 1 : 2));
+    setViewport(null);
   };
 
   return reset;
 }
+
+// returns the viewport described by a plotly `relayout` event, null if the
+// plot was reset, or undefined if the event does not change the axes
+export function getRelayoutViewport(event) {
+  if (event?.["xaxis.autorange"] || event?.["yaxis.autorange"]) {
+    return null;
+  }
+
+  const [x0, x1] = event?.["xaxis.range"] ?? [
+    event?.["xaxis.range[0]"],
+    event?.["xaxis.range[1]"],
+  ];
+  const [y0, y1] = event?.["yaxis.range"] ?? [
+    event?.["yaxis.range[0]"],
+    event?.["yaxis.range[1]"],
+  ];
+  const range = [x0, y0, x1, y1];
+  if (range.some((v) => typeof v !== "number")) {
+    return undefined;
+  }
+
+  return range;
+}
@@ -1,4 +1,4 @@
-import { useEffect } from "react";
+import { useEffect, useRef } from "react";
 import { useRecoilValue, useSetRecoilState } from "recoil";
 import * as fos from "@fiftyone/state";
 import { usePanelStatePartial } from "@fiftyone/spaces";
@@ -6,6 +6,10 @@ import { useBrainResult } from "./useBrainResult";
 import { useColorByField } from "./useLabelSelector";
 import { useWarnings } from "./useWarnings";
 import { fetchPlot } from "./fetch";
+import { usePlotViewport } from "./useResetPlotZoom";
+
+// the delay after the last zoom or pan before the plot is reloaded
+const VIEWPORT_DEBOUNCE_MS = 250;
 
 export function useViewChangeEffect() {
   const colorSeed = useRecoilValue(fos.colorSeed);
@@ -34,16 +38,33 @@ export function useViewChangeEffect() {
     fos.extendedSelectionOverrideStage
   );
   const warnings = useWarnings();
+  const [viewport] = usePlotViewport();
+  const viewportRef = useRef(viewport);
+  viewportRef.current = viewport;
+  const requestRef = useRef(0);
 
   useEffect(() => {
+    const request = ++requestRef.current;
     setOverrideStage(null);
     setLoadingPlot(true);
-    fetchPlot({ datasetName, filters, brainKey, view, labelField, slices })
+    fetchPlot({
+      datasetName,
+      filters,
+      brainKey,
+      view,
+      labelField,
+      slices,
+      viewport: viewportRef.current,
+    })
       .catch((err) => {
         setLoadingPlotError(err);
         // setBrainKey(null);
       })
       .then((res) => {
+        if (request !== requestRef.current) {
+          return;
+        }
+
         if (!res || !res.index_size) {
           if (res?.index_size === 0) {
             warnings.add(`No samples in the current view.`);
@@ -75,4 +96,62 @@ export function useViewChangeEffect() {
       })
       .finally(() => setLoadingPlot(false));
   }, [datasetName, brainKey, labelField, view, colorSeed, slices, filters]);
+
+  // reload the points in the visible region when zooming or panning a plot
+  // whose points were not all loaded
+  useEffect(() => {
+    if (!loadedPlot?.lod || hasAllPoints(loadedPlot.lod, viewport)) {
+      return;
+    }
+
+    const scheduled = requestRef.current;
+    const timeout = setTimeout(() => {
+      // the plot was reloaded for a new view in the meantime
+      if (scheduled !== requestRef.current) {
+        return;
+      }
+
+      const request = ++requestRef.current;
+      fetchPlot({
+        datasetName,
+        filters,
+        brainKey,
+        view,
+        labelField,
+        slices,
+        viewport,
+      })
+        .then((res) => {
+          if (request === requestRef.current && res?.index_size) {
+            setLoadedPlot(res);
+          }
+        })
+        .catch((err) => setLoadingPlotError(err));
+    }, VIEWPORT_DEBOUNCE_MS);
+
+    return () => clearTimeout(timeout);
+  }, [viewport]);
+}
+
+// whether the loaded points include every point in the given viewport
+function hasAllPoints(lod, viewport) {
+  if (lod.count < lod.total_count) {
+    return false;
+  }
+
+  if (!lod.viewport) {
+    return true;
+  }
+
+  if (!viewport) {
+    return false;
+  }
+
+  const [xmin, ymin, xmax, ymax] = lod.viewport;
+  return (
+    viewport[0] >= xmin &&
+    viewport[1] >= ymin &&
+    viewport[2] <= xmax &&
+    viewport[3] <= ymax
+  );
 }
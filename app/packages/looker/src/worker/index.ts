@@ -338,6 +338,31 @@ interface FrameStream {
   cancel: () => void;
 }
 
+interface FrameColumnsChunk {
+  columns: { [field: string]: unknown[] };
+  range: [number, number];
+}
+
+/**
+ * Converts the columns of a columnar frame chunk into frame samples
+ */
+const fromColumns = (columns: FrameColumnsChunk["columns"]) => {
+  const fields = Object.keys(columns);
+  const count = fields.length ? columns[fields[0]].length : 0;
+  const frames = new Array(count);
+
+  for (let i = 0; i < count; i++) {
+    const frame = {};
+    for (const field of fields) {
+      frame[field] = columns[field][i];
+    }
+
+    frames[i] = frame;
+  }
+
+  return frames as FrameChunk["frames"];
+};
+
 interface FrameChunkResponse extends FrameChunk {
   coloring: Coloring;
   customizeColorSetting: CustomizeColor[];
@@ -373,7 +398,7 @@ const createReader = ({
           controller.close();
           return Promise.resolve();
         }
-        const call = (): Promise<FrameChunk> =>
+        const call = (): Promise<FrameColumnsChunk> =>
           getFetchFunction()(
             "POST",
             "/frames",
@@ -385,6 +410,7 @@ const createReader = ({
               dataset,
               view,
               slice: group?.name,
+              columnar: true,
             },
             "json",
             2
@@ -392,7 +418,8 @@ const createReader = ({
 
         return await (async () => {
           try {
-            const { frames, range } = await call();
+            const { columns, range } = await call();
+            const frames = fromColumns(columns);
 
             controller.enqueue({
               frames,
@@ -40,6 +40,8 @@ export { default as useSetSelected } from "./useSetSelected";
 export { default as useSetSelectedLabels } from "./useSetSelectedLabels";
 export { default as useSetSpaces } from "./useSetSpaces";
 export { default as useSetView, stateProxy } from "./useSetView";
+export * from "./useStatePatch";
+export { default as useStatePatch } from "./useStatePatch";
 export * from "./useStateUpdate";
 export { default as useStateUpdate } from "./useStateUpdate";
 export { default as useTo } from "./useTo";
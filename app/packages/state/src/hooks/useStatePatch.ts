@@ -0,0 +1,75 @@
+import { useColorScheme } from "@mui/material";
+import { useRecoilTransaction_UNSTABLE } from "recoil";
+import {
+  ColorScheme,
+  State,
+  activeColorField,
+  isUsingSessionColorScheme,
+  selectedLabels,
+  selectedSamples,
+  sessionColorScheme,
+  sessionSpaces,
+  theme,
+} from "../recoil";
+import { DEFAULT_APP_COLOR_SCHEME } from "../utils";
+import { parseColorScheme } from "./useStateUpdate";
+
+export interface StatePatch {
+  config?: State.Config;
+  state: Partial<State.Description>;
+}
+
+/**
+ * Applies a patch of the session state, i.e. its selections, spaces, color
+ * scheme or config, directly to the corresponding atoms. Unlike
+ * {@link useStateUpdate}, only the patched attributes are updated and the
+ * dataset is not reloaded
+ */
+const useStatePatch = () => {
+  const { setMode } = useColorScheme();
+  return useRecoilTransaction_UNSTABLE(
+    ({ reset, set }) =>
+      ({ config, state }: StatePatch) => {
+        if ("selected" in state) {
+          set(selectedSamples, new Set(state.selected || []));
+        }
+
+        if ("selectedLabels" in state) {
+          set(
+            selectedLabels,
+            Object.fromEntries(
+              (state.selectedLabels || []).map(({ labelId, ...data }) => [
+                labelId,
+                data,
+              ])
+            )
+          );
+        }
+
+        if ("spaces" in state) {
+          state.spaces
+            ? set(sessionSpaces, state.spaces)
+            : reset(sessionSpaces);
+        }
+
+        if ("colorScheme" in state) {
+          if (state.colorScheme) {
+            set(sessionColorScheme, parseColorScheme(state.colorScheme));
+            set(isUsingSessionColorScheme, true);
+          } else {
+            reset(activeColorField);
+            reset(isUsingSessionColorScheme);
+            set(sessionColorScheme, DEFAULT_APP_COLOR_SCHEME as ColorScheme);
+          }
+        }
+
+        if (config && config.theme !== "browser") {
+          set(theme, config.theme);
+          setMode(config.theme);
+        }
+      },
+    []
+  );
+};
+
+export default useStatePatch;
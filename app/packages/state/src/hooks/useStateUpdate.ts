@@ -102,39 +102,13 @@ const useStateUpdate = (ignoreSpaces = false) => {
         reset(sessionSpaces);
       }
 
-      let colorSetting = DEFAULT_APP_COLOR_SCHEME as ColorScheme;
       if (state?.colorScheme) {
-        const parsedSetting =
-          typeof state.colorScheme === "string"
-            ? typeof JSON.parse(state.colorScheme) === "string"
-              ? JSON.parse(JSON.parse(state.colorScheme))
-              : JSON.parse(state.colorScheme)
-            : state.colorScheme;
-
-        let colorPool = parsedSetting["color_pool"];
-        colorPool =
-          Array.isArray(colorPool) && colorPool?.length > 0
-            ? colorPool
-            : DEFAULT_APP_COLOR_SCHEME.colorPool;
-        colorPool =
-          colorPool.filter((c) => isValidColor(c)).length > 0
-            ? colorPool
-                .filter((c) => isValidColor(c))
-                .map((c) => convertToHex(c))
-            : DEFAULT_APP_COLOR_SCHEME.colorPool;
-        colorSetting = {
-          colorPool,
-          fields:
-            parsedSetting["fields"] ?? parsedSetting?.fields?.length > 0
-              ? parsedSetting.fields
-              : [],
-        } as ColorScheme;
-        set(sessionColorScheme, colorSetting);
+        set(sessionColorScheme, parseColorScheme(state.colorScheme));
         set(isUsingSessionColorScheme, true);
       } else if (!ignoreSpaces) {
         reset(activeColorField);
         reset(isUsingSessionColorScheme);
-        set(sessionColorScheme, colorSetting);
+        set(sessionColorScheme, DEFAULT_APP_COLOR_SCHEME as ColorScheme);
       }
 
       if (dataset) {
@@ -219,4 +193,33 @@ const useStateUpdate = (ignoreSpaces = false) => {
   );
 };
 
+export const parseColorScheme = (
+  colorScheme: string | object
+): ColorScheme => {
+  const parsedSetting =
+    typeof colorScheme === "string"
+      ? typeof JSON.parse(colorScheme) === "string"
+        ? JSON.parse(JSON.parse(colorScheme))
+        : JSON.parse(colorScheme)
+      : colorScheme;
+
+  let colorPool = parsedSetting["color_pool"];
+  colorPool =
+    Array.isArray(colorPool) && colorPool?.length > 0
+      ? colorPool
+      : DEFAULT_APP_COLOR_SCHEME.colorPool;
+  colorPool =
+    colorPool.filter((c) => isValidColor(c)).length > 0
+      ? colorPool.filter((c) => isValidColor(c)).map((c) => convertToHex(c))
+      : DEFAULT_APP_COLOR_SCHEME.colorPool;
+
+  return {
+    colorPool,
+    fields:
+      parsedSetting["fields"] ?? parsedSetting?.fields?.length > 0
+        ? parsedSetting.fields
+        : [],
+  } as ColorScheme;
+};
+
 export default useStateUpdate;
@@ -96,6 +96,12 @@ export const tagging = atomFamily<boolean, { modal: boolean; labels: boolean }>(
   }
 );
 
+// the fraction of a streamed label tagging request that has completed
+export const taggingProgress = atomFamily<number | null, { modal: boolean }>({
+  key: "taggingProgress",
+  default: null,
+});
+
 /**
  * The state of the current dataset. Contains informations about the dataset, and the samples contained in it.
  *
@@ -6,14 +6,11 @@ FiftyOne's public interface.
 |
 """
 import fiftyone.core.config as _foc
-import fiftyone.core.odm as _foo
 
 config = _foc.load_config()
 annotation_config = _foc.load_annotation_config()
 app_config = _foc.load_app_config()
 
-_foo.establish_db_conn(config)
-
 from .core.aggregations import (
     Aggregation,
     Bounds,
@@ -104,6 +101,10 @@ from .core.labels import (
     TemporalDetections,
     GeoLocation,
     GeoLocations,
+    LabelArrays,
+    DetectionsArrays,
+    KeypointsArrays,
+    PolylinesArrays,
 )
 from .core.logging import (
     get_logging_level,
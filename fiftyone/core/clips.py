@@ -9,6 +9,7 @@ from collections import defaultdict
 from copy import deepcopy
 
 from bson import ObjectId
+import numpy as np
 
 import eta.core.utils as etau
 
@@ -152,12 +153,18 @@ class ClipsView(fov.DatasetView):
     def media_type(self):
         return fom.VIDEO
 
-    def _tag_labels(self, tags, label_field, ids=None, label_ids=None):
+    def _tag_labels(
+        self, tags, label_field, ids=None, label_ids=None, progress=None
+    ):
         if label_field == self._classification_field:
             _ids = self.values("_sample_id")
 
         _, label_ids = super()._tag_labels(
-            tags, label_field, ids=ids, label_ids=label_ids
+            tags,
+            label_field,
+            ids=ids,
+            label_ids=label_ids,
+            progress=progress,
         )
 
         if label_field == self._classification_field:
@@ -166,12 +173,18 @@ class ClipsView(fov.DatasetView):
                 tags, label_field, ids=ids, label_ids=label_ids
             )
 
-    def _untag_labels(self, tags, label_field, ids=None, label_ids=None):
+    def _untag_labels(
+        self, tags, label_field, ids=None, label_ids=None, progress=None
+    ):
         if label_field == self._classification_field:
             _ids = self.values("_sample_id")
 
         _, label_ids = super()._untag_labels(
-            tags, label_field, ids=ids, label_ids=label_ids
+            tags,
+            label_field,
+            ids=ids,
+            label_ids=label_ids,
+            progress=progress,
         )
 
         if label_field == self._classification_field:
@@ -846,12 +859,14 @@ def _write_trajectories(dataset, src_collection, field, other_fields=None):
     _tmp_field = "_" + field
 
     trajs = _get_trajectories(src_collection, field)
-    src_collection.set_values(
-        _tmp_field,
-        trajs,
-        expand_schema=False,
-        _allow_missing=True,
-    )
+    if trajs:
+        src_collection.set_values(
+            _tmp_field,
+            trajs,
+            key_field="_id",
+            expand_schema=False,
+            _allow_missing=True,
+        )
 
     try:
         src_collection = fod._always_select_field(src_collection, _tmp_field)
@@ -974,85 +989,77 @@ def _write_manual_clips(dataset, src_collection, clips, other_fields=None):
 def _get_trajectories(sample_collection, frame_field):
     path = sample_collection._FRAMES_PREFIX + frame_field
     root, is_list_field = sample_collection._get_label_field_root(path)
-    root, _ = sample_collection._handle_frame_field(root)
 
     if not is_list_field:
         raise ValueError("Trajectories can only be extracted for label lists")
 
-    fn_expr = F("frames").map(F("frame_number"))
-    uuid_expr = F("frames").map(
-        F(root).map(
-            F("label").concat(
-                ".", (F("index") != None).if_else(F("index").to_string(), "")
-            )
-        )
-    )
-
-    fns, all_uuids = sample_collection.values([fn_expr, uuid_expr])
-
-    trajs = []
-    for sample_fns, sample_uuids in zip(fns, all_uuids):
-        if not sample_uuids:
-            trajs.append(None)
-            continue
-
-        obs = defaultdict(_Bounds)
-        for fn, frame_uuids in zip(sample_fns, sample_uuids):
-            if not frame_uuids:
-                continue
-
-            for uuid in frame_uuids:
-                label, index = uuid.rsplit(".", 1)
-                if index:
-                    index = int(index)
-                    obs[(label, index)].add(fn)
+    # Compute the support of each `(sample, label, index)` server-side. Clips
+    # within each sample are sorted by their first appearance
+    label = "$" + root + ".label"
+    index = "$" + root + ".index"
+    pipeline = [
+        {"$project": {"frames.frame_number": True, root: True}},
+        {"$unwind": "$frames"},
+        {"$unwind": {"path": "$" + root, "includeArrayIndex": "_position"}},
+        {"$match": {root + ".index": {"$ne": None}}},
+        {"$addFields": {"_first": ["$frames.frame_number", "$_position"]}},
+        {
+            "$group": {
+                "_id": {"sample_id": "$_id", "label": label, "index": index},
+                "first": {"$min": "$_first"},
+                "min": {"$min": "$frames.frame_number"},
+                "max": {"$max": "$frames.frame_number"},
+            }
+        },
+        {"$sort": {"_id.sample_id": 1, "first": 1}},
+        {
+            "$group": {
+                "_id": "$_id.sample_id",
+                "clips": {
+                    "$push": {
+                        "label": "$_id.label",
+                        "index": "$_id.index",
+                        "min": "$min",
+                        "max": "$max",
+                    }
+                },
+            }
+        },
+    ]
 
-        clips = []
-        for (label, index), bounds in obs.items():
-            clips.append((label, index, bounds.min, bounds.max))
+    results = sample_collection._aggregate(
+        attach_frames=True, post_pipeline=pipeline
+    )
 
-        trajs.append(clips)
+    trajs = {}
+    for d in results:
+        trajs[d["_id"]] = [
+            (c["label"], c["index"], c["min"], c["max"]) for c in d["clips"]
+        ]
 
     return trajs
 
 
-class _Bounds(object):
-    def __init__(self):
-        self.min = None
-        self.max = None
-
-    def add(self, value):
-        if self.min is None:
-            self.min = value
-            self.max = value
-        else:
-            self.min = min(self.min, value)
-            self.max = max(self.max, value)
-
-
 def _to_rle(frame_numbers, bools, tol=0, min_len=0):
     if not frame_numbers:
         return None
 
-    ranges = []
-    start = None
-    last = None
-    for fn, b in zip(frame_numbers, bools):
-        if start is not None and fn - last > tol + int(b):
-            ranges.append((start, last))
-            start = None
-            last = None
-
-        if b:
-            if start is None:
-                start = fn
+    frame_numbers = np.asarray(frame_numbers)
+    bools = np.asarray(bools, dtype=bool)
 
-            last = fn
+    # Runs of frames for which `bools` is True are split when more than `tol`
+    # frames are skipped
+    fns = frame_numbers[bools]
+    if fns.size == 0:
+        return []
 
-    if start is not None:
-        ranges.append((start, last))
+    breaks = np.flatnonzero(np.diff(fns) > tol + 1)
+    starts = np.concatenate((fns[:1], fns[breaks + 1]))
+    lasts = np.concatenate((fns[breaks], fns[-1:]))
 
     if min_len > 1:
-        return [(s, l) for s, l in ranges if l - s + 1 >= min_len]
+        keep = lasts - starts + 1 >= min_len
+        starts = starts[keep]
+        lasts = lasts[keep]
 
-    return ranges
+    return list(zip(starts.tolist(), lasts.tolist()))
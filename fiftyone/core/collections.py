@@ -6,19 +6,24 @@ Interface for sample collections.
 |
 """
 from collections import defaultdict
+import contextlib
 from copy import copy
 import fnmatch
 import itertools
 import logging
 import numbers
 import os
+import queue
 import random
 import string
+import threading
 import timeit
 import warnings
 
 from bson import ObjectId
+from bson.raw_bson import RawBSONDocument
 from pymongo import InsertOne, UpdateOne, UpdateMany
+from pymongo.errors import CursorNotFound
 
 import eta.core.serial as etas
 import eta.core.utils as etau
@@ -41,6 +46,7 @@ import fiftyone.core.storage as fost
 import fiftyone.core.utils as fou
 
 fod = fou.lazy_import("fiftyone.core.dataset")
+fofr = fou.lazy_import("fiftyone.core.frame")
 fos = fou.lazy_import("fiftyone.core.stages")
 fov = fou.lazy_import("fiftyone.core.view")
 foua = fou.lazy_import("fiftyone.utils.annotations")
@@ -50,6 +56,10 @@ foue = fou.lazy_import("fiftyone.utils.eval")
 
 logger = logging.getLogger(__name__)
 
+# The number of samples whose label tags are edited per database operation
+# when editing the label tags of a collection in-database
+_LABEL_TAGS_BATCH_SIZE = 10000
+
 
 def _make_registrar():
     registry = {}
@@ -75,20 +85,32 @@ class SaveContext(object):
     """Context that saves samples from a collection according to a configurable
     batching strategy.
 
+    Multiple saves of the same sample within a batch are merged into a single
+    database operation whenever possible.
+
+    When ``async_writes`` is True, batches are written to the database by a
+    background thread while the caller continues to register samples for the
+    next batch. At most one batch is written at a time; if a batch is ready
+    before the previous one has been written, :meth:`save` waits for it. Any
+    errors raised by the background thread are raised when the context
+    exits.
+
     Args:
         sample_collection: a
             :class:`fiftyone.core.collections.SampleCollection`
         batch_size (None): the batching strategy to use. Can either be an
             integer specifying the number of samples to save in a batch, or a
             float number of seconds between batched saves
+        async_writes (False): whether to write batches in a background thread
     """
 
-    def __init__(self, sample_collection, batch_size=None):
+    def __init__(self, sample_collection, batch_size=None, async_writes=False):
         if batch_size is None:
             batch_size = 0.2
 
         self.sample_collection = sample_collection
         self.batch_size = batch_size
+        self.async_writes = async_writes
 
         self._dataset = sample_collection._dataset
         self._sample_coll = sample_collection._dataset._sample_collection
@@ -102,15 +124,63 @@ class SaveContext(object):
         self._dynamic_batches = not isinstance(batch_size, numbers.Integral)
         self._last_time = None
 
+        self._queue = None
+        self._thread = None
+        self._written = None
+        self._error = None
+        self._num_pending = 0
+        self._flush_latency = None
+
     def __enter__(self):
         if self._dynamic_batches:
             self._last_time = timeit.default_timer()
 
         self._curr_batch_size = 0
+
+        if self.async_writes:
+            self._queue = queue.Queue()
+            self._written = queue.Queue()
+            self._error = None
+            self._num_pending = 0
+            self._thread = threading.Thread(
+                target=self._write_batches, daemon=True
+            )
+            self._thread.start()
+
         return self
 
     def __exit__(self, *args):
-        self._save_batch()
+        try:
+            self._save_batch()
+        finally:
+            if self._thread is not None:
+                self._queue.put(None)
+                self._thread.join()
+                self._thread = None
+                self._handle_written_batches()
+
+        error = self._error
+        self._error = None
+
+        # Don't mask an exception that was raised within the context
+        if error is not None and args[0] is None:
+            raise error
+
+    @property
+    def flush_latency(self):
+        """The time, in seconds, that it took to write the most recent batch
+        to the database, or None if no batches have been written.
+        """
+        return self._flush_latency
+
+    @property
+    def queue_depth(self):
+        """The number of batches that are waiting to be written to the
+        database or are currently being written.
+
+        Only applicable when ``async_writes`` is True.
+        """
+        return self._num_pending
 
     def save(self, sample):
         """Registers the sample for saving in the next batch.
@@ -139,6 +209,9 @@ class SaveContext(object):
         if updated and isinstance(sample, fosa.SampleView):
             self._reload_parents.append(sample)
 
+        if self._thread is not None:
+            self._handle_written_batches()
+
         if self._dynamic_batches:
             if timeit.default_timer() - self._last_time >= self.batch_size:
                 self._save_batch()
@@ -149,19 +222,162 @@ class SaveContext(object):
     def _save_batch(self):
         self._curr_batch_size = 0
 
-        if self._sample_ops:
-            foo.bulk_write(self._sample_ops, self._sample_coll, ordered=False)
-            self._sample_ops.clear()
+        sample_ops = _merge_update_ops(self._sample_ops)
+        frame_ops = _merge_update_ops(self._frame_ops)
+        reload_parents = self._reload_parents
+
+        self._sample_ops = []
+        self._frame_ops = []
+        self._reload_parents = []
+
+        if not (sample_ops or frame_ops or reload_parents):
+            return
+
+        batch = (sample_ops, frame_ops, reload_parents)
+
+        if self._thread is not None:
+            # Wait for the previous batch to be written
+            self._handle_written_batches(wait=True)
+
+            self._num_pending += 1
+            self._queue.put(batch)
+        else:
+            self._write_batch(batch)
+            self._reload_samples(reload_parents)
+
+    def _write_batch(self, batch):
+        sample_ops, frame_ops, _ = batch
+
+        start_time = timeit.default_timer()
+
+        if sample_ops:
+            foo.bulk_write(sample_ops, self._sample_coll, ordered=False)
+
+        if frame_ops:
+            foo.bulk_write(frame_ops, self._frame_coll, ordered=False)
+
+        self._flush_latency = timeit.default_timer() - start_time
+
+    def _write_batches(self):
+        while True:
+            batch = self._queue.get()
+            if batch is None:
+                break
+
+            # Once an error has occurred, subsequent batches are discarded
+            if self._error is None:
+                try:
+                    self._write_batch(batch)
+                except Exception as e:
+                    self._error = e
+
+            self._written.put(batch)
+
+    def _handle_written_batches(self, wait=False):
+        # In-memory samples are reloaded in the caller's thread
+        while self._num_pending > 0:
+            try:
+                batch = self._written.get(block=wait)
+            except queue.Empty:
+                break
+
+            self._num_pending -= 1
+
+            if self._error is None:
+                self._reload_samples(batch[2])
+
+    def _reload_samples(self, samples):
+        for sample in samples:
+            sample._reload_parents()
+
+
+def _merge_update_ops(ops):
+    # Merges $set/$unset updates to the same document into the last op on
+    # that document. Ops whose target document cannot be determined act as
+    # barriers, so the relative order of ops on each document is preserved
+    merged = []
+    last_inds = {}
+    for op in ops:
+        _id = _get_op_id(op)
+        if _id is None:
+            last_inds.clear()
+            merged.append(op)
+            continue
+
+        idx = last_inds.get(_id, None)
+        if idx is not None:
+            merged_op = _merge_update_op(merged[idx], op)
+            if merged_op is not None:
+                merged[idx] = merged_op
+                continue
+
+        last_inds[_id] = len(merged)
+        merged.append(op)
+
+    return merged
+
+
+def _get_op_id(op):
+    if isinstance(op, InsertOne):
+        return op._doc.get("_id", None)
+
+    if isinstance(op, UpdateOne):
+        if len(op._filter) == 1:
+            return op._filter.get("_id", None)
+
+    return None
+
+
+def _is_mergeable_update(op):
+    return (
+        isinstance(op, UpdateOne)
+        and op._array_filters is None
+        and op._collation is None
+        and op._hint is None
+        and isinstance(op._doc, dict)
+        and set(op._doc.keys()).issubset({"$set", "$unset"})
+    )
+
+
+def _merge_update_op(op1, op2):
+    if not (_is_mergeable_update(op1) and _is_mergeable_update(op2)):
+        return None
+
+    if op1._upsert != op2._upsert:
+        return None
+
+    sets = dict(op1._doc.get("$set", {}))
+    unsets = dict(op1._doc.get("$unset", {}))
+    new_sets = op2._doc.get("$set", {})
+    new_unsets = op2._doc.get("$unset", {})
+
+    # Updating both a path and one of its parents/children in the same
+    # operation is not allowed
+    paths = set(sets.keys()) | set(unsets.keys())
+    for path in itertools.chain(new_sets.keys(), new_unsets.keys()):
+        if any(_is_nested_path(path, p) for p in paths):
+            return None
+
+    for path, value in new_sets.items():
+        unsets.pop(path, None)
+        sets[path] = value
+
+    for path, value in new_unsets.items():
+        sets.pop(path, None)
+        unsets[path] = value
 
-        if self._frame_ops:
-            foo.bulk_write(self._frame_ops, self._frame_coll, ordered=False)
-            self._frame_ops.clear()
+    update = {}
+    if sets:
+        update["$set"] = sets
 
-        if self._reload_parents:
-            for sample in self._reload_parents:
-                sample._reload_parents()
+    if unsets:
+        update["$unset"] = unsets
 
-            self._reload_parents.clear()
+    return UpdateOne(op1._filter, update, upsert=op1._upsert)
+
+
+def _is_nested_path(path1, path2):
+    return path1.startswith(path2 + ".") or path2.startswith(path1 + ".")
 
 
 class SampleCollection(object):
@@ -825,7 +1041,13 @@ class SampleCollection(object):
         """
         raise NotImplementedError("Subclass must implement view()")
 
-    def iter_samples(self, progress=False, autosave=False, batch_size=None):
+    def iter_samples(
+        self,
+        progress=False,
+        autosave=False,
+        batch_size=None,
+        async_writes=False,
+    ):
         """Returns an iterator over the samples in the collection.
 
         Args:
@@ -836,6 +1058,8 @@ class SampleCollection(object):
             batch_size (None): a batch size to use when autosaving samples. Can
                 either be an integer specifying the number of samples to save
                 in a batch, or a float number of seconds between batched saves
+            async_writes (False): whether to write autosaved batches to the
+                database in a background thread while iteration continues
 
         Returns:
             an iterator over :class:`fiftyone.core.sample.Sample` or
@@ -849,6 +1073,7 @@ class SampleCollection(object):
         progress=False,
         autosave=False,
         batch_size=None,
+        async_writes=False,
     ):
         """Returns an iterator over the groups in the collection.
 
@@ -861,6 +1086,8 @@ class SampleCollection(object):
             batch_size (None): a batch size to use when autosaving samples. Can
                 either be an integer specifying the number of samples to save
                 in a batch, or a float number of seconds between batched saves
+            async_writes (False): whether to write autosaved batches to the
+                database in a background thread while iteration continues
 
         Returns:
             an iterator that emits dicts mapping group slice names to
@@ -869,6 +1096,106 @@ class SampleCollection(object):
         """
         raise NotImplementedError("Subclass must implement iter_groups()")
 
+    def iter_dicts(
+        self, fields=None, batch_size=None, raw_bson=False, progress=False
+    ):
+        """Returns an iterator over the raw sample dicts in the collection.
+
+        This method does not construct :class:`fiftyone.core.sample.Sample`
+        instances, so it is the most efficient way to read the field values of
+        large collections.
+
+        The emitted dicts contain the database representation of each sample,
+        which is decoded but not validated. In particular, fields are keyed by
+        their database names (e.g., ``_id`` rather than ``id``), embedded
+        documents such as labels are plain dicts, and frame fields of video
+        collections are not included.
+
+        Examples::
+
+            import fiftyone as fo
+            import fiftyone.zoo as foz
+
+            dataset = foz.load_zoo_dataset("quickstart")
+
+            # Only load the fields that you need
+            for d in dataset.iter_dicts(fields=["filepath", "ground_truth"]):
+                print(d["filepath"], len(d["ground_truth"]["detections"]))
+
+            # Lazily decode the documents as their values are accessed
+            for d in dataset.iter_dicts(raw_bson=True, batch_size=1000):
+                print(d["filepath"])
+
+        Args:
+            fields (None): a field or iterable of fields to include in the
+                dicts. By default, all fields are included. The ``_id`` of
+                each sample is always included
+            batch_size (None): an optional number of documents to retrieve per
+                batch from the database cursor
+            raw_bson (False): whether to emit
+                ``bson.raw_bson.RawBSONDocument`` instances, which only decode
+                the values that are accessed
+            progress (False): whether to render a progress bar tracking the
+                iterator's progress
+
+        Returns:
+            an iterator over dicts
+        """
+        with contextlib.ExitStack() as exit_context:
+            dicts = self._iter_dicts(
+                fields=fields, batch_size=batch_size, raw_bson=raw_bson
+            )
+
+            if progress:
+                pb = fou.ProgressBar(total=len(self))
+                exit_context.enter_context(pb)
+                dicts = pb(dicts)
+
+            for d in dicts:
+                yield d
+
+    def _iter_dicts(self, fields=None, batch_size=None, raw_bson=False):
+        post_pipeline = []
+
+        if fields is not None:
+            if etau.is_str(fields):
+                fields = [fields]
+
+            fields = self._handle_db_fields(fields)
+            post_pipeline.append({"$project": {f: True for f in fields}})
+
+        coll = self._dataset._sample_collection
+        if raw_bson:
+            codec_options = coll.codec_options.with_options(
+                document_class=RawBSONDocument
+            )
+            coll = coll.with_options(codec_options=codec_options)
+
+        kwargs = {"allowDiskUse": True}
+        if batch_size is not None:
+            kwargs["batchSize"] = batch_size
+
+        index = 0
+
+        while True:
+            pipeline = self._pipeline(
+                detach_frames=True,
+                detach_groups=True,
+                post_pipeline=post_pipeline,
+            )
+
+            try:
+                for d in coll.aggregate(pipeline, **kwargs):
+                    index += 1
+                    yield d
+
+                return
+            except CursorNotFound:
+                # The cursor has timed out so we yield from a new one after
+                # skipping to the last offset
+                post_pipeline = post_pipeline + [{"$skip": index}]
+                index = 0
+
     def get_group(self, group_id, group_slices=None):
         """Returns a dict containing the samples for the given group ID.
 
@@ -885,7 +1212,7 @@ class SampleCollection(object):
         """
         raise NotImplementedError("Subclass must implement get_group()")
 
-    def save_context(self, batch_size=None):
+    def save_context(self, batch_size=None, async_writes=False):
         """Returns a context that can be used to save samples from this
         collection according to a configurable batching strategy.
 
@@ -919,15 +1246,28 @@ class SampleCollection(object):
                     sample.ground_truth.label = make_label()
                     context.save(sample)
 
+            # Write batches in a background thread while iterating
+            with dataset.save_context(async_writes=True) as context:
+                for sample in dataset.iter_samples(progress=True):
+                    sample.ground_truth.label = make_label()
+                    context.save(sample)
+
+            print(context.flush_latency)
+
         Args:
             batch_size (None): the batching strategy to use. Can either be an
                 integer specifying the number of samples to save in a batch, or
                 a float number of seconds between batched saves
+            async_writes (False): whether to write batches to the database in
+                a background thread while the caller continues to register
+                samples for saving
 
         Returns:
             a :class:`SaveContext`
         """
-        return SaveContext(self, batch_size=batch_size)
+        return SaveContext(
+            self, batch_size=batch_size, async_writes=async_writes
+        )
 
     def _get_default_sample_fields(
         self,
@@ -1516,7 +1856,7 @@ class SampleCollection(object):
         """
         return self.count_values("tags")
 
-    def tag_labels(self, tags, label_fields=None):
+    def tag_labels(self, tags, label_fields=None, _progress=None):
         """Adds the tag(s) to all labels in the specified label field(s) of
         this collection, if necessary.
 
@@ -1537,20 +1877,31 @@ class SampleCollection(object):
         for label_field in label_fields:
             # We only need to process labels that are missing a tag of interest
             view = self.filter_labels(label_field, match_expr)
-            view._tag_labels(tags, label_field)
+            view._tag_labels(tags, label_field, progress=_progress)
 
-    def _tag_labels(self, tags, label_field, ids=None, label_ids=None):
+    def _tag_labels(
+        self, tags, label_field, ids=None, label_ids=None, progress=None
+    ):
         if etau.is_str(tags):
             update_fcn = lambda path: {"$addToSet": {path: tags}}
+            _tags = [tags]
         else:
             tags = list(tags)
             update_fcn = lambda path: {"$addToSet": {path: {"$each": tags}}}
+            _tags = list(dict.fromkeys(tags))
+
+        expr_fcn = lambda expr: _add_tags_expr(expr, _tags)
 
         return self._edit_label_tags(
-            update_fcn, label_field, ids=ids, label_ids=label_ids
+            update_fcn,
+            label_field,
+            ids=ids,
+            label_ids=label_ids,
+            expr_fcn=expr_fcn,
+            progress=progress,
         )
 
-    def untag_labels(self, tags, label_fields=None):
+    def untag_labels(self, tags, label_fields=None, _progress=None):
         """Removes the tag from all labels in the specified label field(s) of
         this collection, if necessary.
 
@@ -1568,25 +1919,57 @@ class SampleCollection(object):
         for label_field in label_fields:
             # We only need to process labels that have a tag of interest
             view = self.select_labels(tags=tags, fields=label_field)
-            view._untag_labels(tags, label_field)
+            view._untag_labels(tags, label_field, progress=_progress)
 
-    def _untag_labels(self, tags, label_field, ids=None, label_ids=None):
+    def _untag_labels(
+        self, tags, label_field, ids=None, label_ids=None, progress=None
+    ):
         if etau.is_str(tags):
             update_fcn = lambda path: {"$pull": {path: tags}}
+            _tags = [tags]
         else:
             tags = list(tags)
             update_fcn = lambda path: {"$pullAll": {path: tags}}
+            _tags = tags
+
+        expr_fcn = lambda expr: _remove_tags_expr(expr, _tags)
 
         return self._edit_label_tags(
-            update_fcn, label_field, ids=ids, label_ids=label_ids
+            update_fcn,
+            label_field,
+            ids=ids,
+            label_ids=label_ids,
+            expr_fcn=expr_fcn,
+            progress=progress,
         )
 
     def _edit_label_tags(
-        self, update_fcn, label_field, ids=None, label_ids=None
+        self,
+        update_fcn,
+        label_field,
+        ids=None,
+        label_ids=None,
+        expr_fcn=None,
+        progress=None,
     ):
         root, is_list_field = self._get_label_field_root(label_field)
         _root, is_frame_field = self._handle_frame_field(root)
 
+        if (
+            expr_fcn is not None
+            and ids is None
+            and label_ids is None
+            and not self._is_generated
+        ):
+            self._merge_label_tags(
+                expr_fcn,
+                _root,
+                is_list_field,
+                is_frame_field,
+                progress=progress,
+            )
+            return None, None
+
         ops = []
 
         if is_list_field:
@@ -1638,6 +2021,110 @@ class SampleCollection(object):
 
         return ids, label_ids
 
+    def _merge_label_tags(
+        self, expr_fcn, root, is_list_field, is_frame_field, progress=None
+    ):
+        # Edits the tags of the labels in this collection entirely in the
+        # database by merging the label IDs of the view back into the
+        # source collection. When possible, this is done one sample `_id`
+        # range at a time so that progress can be reported
+        if is_list_field:
+            label_expr = "$$label"
+            update_expr = {"$isArray": "$" + root}
+            tags_expr = {
+                "$map": {
+                    "input": "$" + root,
+                    "as": "label",
+                    "in": {
+                        "$cond": [
+                            {"$in": ["$$label._id", "$$new._label_ids"]},
+                            {
+                                "$mergeObjects": [
+                                    label_expr,
+                                    {"tags": expr_fcn(label_expr + ".tags")},
+                                ]
+                            },
+                            label_expr,
+                        ]
+                    },
+                }
+            }
+            is_match = {
+                "$gt": [{"$size": {"$ifNull": ["$_label_ids", []]}}, 0]
+            }
+        else:
+            label_expr = "$" + root
+            update_expr = {"$eq": [label_expr + "._id", "$$new._label_ids"]}
+            tags_expr = {
+                "$mergeObjects": [
+                    label_expr,
+                    {"tags": expr_fcn(label_expr + ".tags")},
+                ]
+            }
+            is_match = {"$gt": ["$_label_ids", None]}
+
+        if is_frame_field:
+            coll_name = self._dataset._frame_collection_name
+        else:
+            coll_name = self._dataset._sample_collection_name
+
+        merge_pipeline = [
+            {"$project": {"_label_ids": "$" + root + "._id"}},
+            {"$match": {"$expr": is_match}},
+            {
+                "$merge": {
+                    "into": coll_name,
+                    "on": "_id",
+                    "whenMatched": [
+                        {
+                            "$set": {
+                                root: {
+                                    "$cond": [
+                                        update_expr,
+                                        tags_expr,
+                                        "$" + root,
+                                    ]
+                                }
+                            }
+                        }
+                    ],
+                    "whenNotMatched": "discard",
+                }
+            },
+        ]
+
+        if _can_batch_by_id(self):
+            coll = self._dataset._sample_collection
+            num_samples = max(coll.estimated_document_count(), 1)
+            id_ranges = _iter_id_ranges(coll, _LABEL_TAGS_BATCH_SIZE)
+        else:
+            # Stages like `Limit` depend on the samples that precede them, so
+            # the view cannot be restricted to a range of samples
+            num_samples = None
+            id_ranges = [None]
+
+        num_merged = 0
+        for id_range in id_ranges:
+            if id_range is not None:
+                view = _match_id_range(self, id_range)
+            else:
+                view = self
+
+            view._aggregate(
+                frames_only=is_frame_field, post_pipeline=merge_pipeline
+            )
+
+            if progress is not None and num_samples is not None:
+                num_merged += _LABEL_TAGS_BATCH_SIZE
+                progress(min(num_merged / num_samples, 1.0))
+            elif progress is not None:
+                progress(1.0)
+
+        if is_frame_field:
+            fofr.Frame._reload_docs(coll_name)
+        else:
+            fosa.Sample._reload_docs(coll_name)
+
     def _get_selected_labels(self, ids=None, tags=None, fields=None):
         if ids is not None or tags is not None:
             view = self.select_labels(ids=ids, tags=tags, fields=fields)
@@ -3190,6 +3677,7 @@ class SampleCollection(object):
         eval_key=None,
         mask_targets=None,
         method="simple",
+        num_workers=None,
         **kwargs,
     ):
         """Evaluates the specified semantic segmentation masks in this
@@ -3240,6 +3728,9 @@ class SampleCollection(object):
                 labels
             method ("simple"): a string specifying the evaluation method to
                 use. Supported values are ``("simple")``
+            num_workers (None): the number of worker threads to use to read
+                masks from disk ahead of time. By default,
+                ``multiprocessing.cpu_count()`` is used
             **kwargs: optional keyword arguments for the constructor of the
                 :class:`fiftyone.utils.eval.segmentation.SegmentationEvaluationConfig`
                 being used
@@ -3254,6 +3745,7 @@ class SampleCollection(object):
             eval_key=eval_key,
             mask_targets=mask_targets,
             method=method,
+            num_workers=num_workers,
             **kwargs,
         )
 
@@ -8940,14 +9432,76 @@ class SampleCollection(object):
         if scalar_result:
             aggregations = [aggregations]
 
+        pipelines, parse_results = self._prepare_aggregations(aggregations)
+
+        # Run all aggregations
+        _results = foo.aggregate(self._dataset._sample_collection, pipelines)
+
+        results = parse_results(_results)
+
+        return results[0] if scalar_result else results
+
+    async def _async_aggregate(self, aggregations):
+        if not aggregations:
+            return []
+
+        scalar_result = isinstance(aggregations, foa.Aggregation)
+
+        if scalar_result:
+            aggregations = [aggregations]
+
+        pipelines, parse_results = self._prepare_aggregations(aggregations)
+
+        # Run all aggregations
+        coll_name = self._dataset._sample_collection_name
+        collection = foo.get_async_db_conn()[coll_name]
+        _results = await foo.aggregate(collection, pipelines)
+
+        results = parse_results(_results)
+
+        return results[0] if scalar_result else results
+
+    async def _async_count(self, field_or_expr=None, expr=None, safe=False):
+        make = lambda field_or_expr: foa.Count(
+            field_or_expr, expr=expr, safe=safe
+        )
+        return await self._async_make_and_aggregate(make, field_or_expr)
+
+    async def _async_distinct(self, field_or_expr, expr=None, safe=False):
+        make = lambda field_or_expr: foa.Distinct(
+            field_or_expr, expr=expr, safe=safe
+        )
+        return await self._async_make_and_aggregate(make, field_or_expr)
+
+    async def _async_values(
+        self,
+        field_or_expr,
+        expr=None,
+        missing_value=None,
+        unwind=False,
+        _allow_missing=False,
+        _big_result=True,
+        _raw=False,
+        _field=None,
+    ):
+        make = lambda field_or_expr: foa.Values(
+            field_or_expr,
+            expr=expr,
+            missing_value=missing_value,
+            unwind=unwind,
+            _allow_missing=_allow_missing,
+            _big_result=_big_result,
+            _raw=_raw,
+            _field=_field,
+        )
+        return await self._async_make_and_aggregate(make, field_or_expr)
+
+    def _prepare_aggregations(self, aggregations):
         # Partition aggregations by type
         big_aggs, batch_aggs, facet_aggs = self._parse_aggregations(
             aggregations, allow_big=True
         )
 
-        # Placeholder to store results
-        results = [None] * len(aggregations)
-
         idx_map = {}
         pipelines = []
 
@@ -8968,67 +9522,20 @@ class SampleCollection(object):
             idx_map[idx] = len(pipelines)
             pipelines.append(pipeline)
 
-        # Run all aggregations
-        _results = foo.aggregate(self._dataset._sample_collection, pipelines)
-
-        # Parse batch results
-        if batch_aggs:
-            result = list(_results[0])
-            for idx, aggregation in batch_aggs.items():
-                results[idx] = self._parse_big_result(aggregation, result)
-
-        # Parse big results
-        for idx, aggregation in big_aggs.items():
-            result = list(_results[idx_map[idx]])
-            results[idx] = self._parse_big_result(aggregation, result)
-
-        # Parse facet-able results
-        for idx, aggregation in compiled_facet_aggs.items():
-            result = list(_results[idx_map[idx]])
-            data = self._parse_faceted_result(aggregation, result)
-            if (
-                isinstance(aggregation, foa.FacetAggregations)
-                and aggregation._compiled
-            ):
-                for idx, d in data.items():
-                    results[idx] = d
-            else:
-                results[idx] = data
-
-        return results[0] if scalar_result else results
-
-    async def _async_aggregate(self, aggregations):
-        if not aggregations:
-            return []
-
-        scalar_result = isinstance(aggregations, foa.Aggregation)
-
-        if scalar_result:
-            aggregations = [aggregations]
-
-        _, _, facet_aggs = self._parse_aggregations(
-            aggregations, allow_big=False
-        )
-
-        # Placeholder to store results
-        results = [None] * len(aggregations)
+        def parse_results(_results):
+            # Placeholder to store results
+            results = [None] * len(aggregations)
 
-        idx_map = {}
-        pipelines = []
-
-        if facet_aggs:
-            # Build facet-able pipelines
-            compiled_facet_aggs, facet_pipelines = self._build_facets(
-                facet_aggs
-            )
-            for idx, pipeline in facet_pipelines.items():
-                idx_map[idx] = len(pipelines)
-                pipelines.append(pipeline)
+            # Parse batch results
+            if batch_aggs:
+                result = list(_results[0])
+                for idx, aggregation in batch_aggs.items():
+                    results[idx] = self._parse_big_result(aggregation, result)
 
-            # Run all aggregations
-            coll_name = self._dataset._sample_collection_name
-            collection = foo.get_async_db_conn()[coll_name]
-            _results = await foo.aggregate(collection, pipelines)
+            # Parse big results
+            for idx, aggregation in big_aggs.items():
+                result = list(_results[idx_map[idx]])
+                results[idx] = self._parse_big_result(aggregation, result)
 
             # Parse facet-able results
             for idx, aggregation in compiled_facet_aggs.items():
@@ -9043,7 +9550,9 @@ class SampleCollection(object):
                 else:
                     results[idx] = data
 
-        return results[0] if scalar_result else results
+            return results
+
+        return pipelines, parse_results
 
     def _parse_aggregations(self, aggregations, allow_big=True):
         big_aggs = {}
@@ -9278,6 +9787,14 @@ class SampleCollection(object):
 
         return self.aggregate(make(args))
 
+    async def _async_make_and_aggregate(self, make, args):
+        if isinstance(args, (list, tuple)):
+            return tuple(
+                await self._async_aggregate([make(arg) for arg in args])
+            )
+
+        return await self._async_aggregate(make(args))
+
     def _build_aggregation(self, aggregations):
         scalar_result = isinstance(aggregations, foa.Aggregation)
         if scalar_result:
@@ -10821,3 +11338,114 @@ def _add_db_fields_to_schema(schema):
             additions[field.db_field] = field
 
     schema.update(additions)
+
+
+def _can_batch_by_id(sample_collection):
+    # Whether restricting the samples that enter the collection's pipeline to
+    # an `_id` range is equivalent to restricting its output to that range,
+    # i.e., whether all of its stages process each sample independently
+    if isinstance(sample_collection, fod.Dataset):
+        return True
+
+    batchable_stages = (
+        fos.Exclude,
+        fos.ExcludeBy,
+        fos.ExcludeFields,
+        fos.ExcludeFrames,
+        fos.ExcludeGroups,
+        fos.ExcludeLabels,
+        fos.Exists,
+        fos.FilterField,
+        fos.FilterKeypoints,
+        fos.FilterLabels,
+        fos.GeoWithin,
+        fos.LimitLabels,
+        fos.MapLabels,
+        fos.Match,
+        fos.MatchFrames,
+        fos.MatchLabels,
+        fos.MatchTags,
+        fos.Select,
+        fos.SelectBy,
+        fos.SelectFields,
+        fos.SelectFrames,
+        fos.SelectGroups,
+        fos.SelectLabels,
+        fos.SetField,
+        fos.SortBy,
+    )
+
+    return all(
+        type(stage) in batchable_stages for stage in sample_collection._stages
+    )
+
+
+def _match_id_range(sample_collection, id_range):
+    # Returns a view whose pipeline first matches the samples in the given
+    # `_id` range, so that the view's stages only process those samples
+    view = sample_collection.view()
+    stage = fos.Mongo([{"$match": {"_id": id_range}}], _needs_frames=False)
+    return fov.DatasetView(
+        view._dataset,
+        _stages=[stage] + view._stages,
+        _media_type=view.media_type,
+        _group_slice=view.group_slice,
+    )
+
+
+def _iter_id_ranges(coll, batch_size):
+    # Generates `_id` conditions that partition the collection into
+    # consecutive ranges of `batch_size` documents, the last of which is
+    # unbounded above. The bounds are read from the `_id` index
+    first = None
+    while True:
+        query = {"_id": {"$gt": first}} if first is not None else {}
+        docs = list(
+            coll.find(query, {"_id": 1})
+            .sort("_id", 1)
+            .skip(batch_size - 1)
+            .limit(1)
+        )
+        last = docs[0]["_id"] if docs else None
+
+        id_range = {}
+        if first is not None:
+            id_range["$gt"] = first
+
+        if last is not None:
+            id_range["$lte"] = last
+        elif first is None:
+            id_range["$exists"] = True
+
+        yield id_range
+
+        if last is None:
+            return
+
+        first = last
+
+
+def _add_tags_expr(tags_expr, tags):
+    tags_expr = {"$ifNull": [tags_expr, []]}
+    return {
+        "$concatArrays": [
+            tags_expr,
+            {
+                "$filter": {
+                    "input": {"$literal": tags},
+                    "as": "tag",
+                    "cond": {"$not": {"$in": ["$$tag", tags_expr]}},
+                }
+            },
+        ]
+    }
+
+
+def _remove_tags_expr(tags_expr, tags):
+    return {
+        "$filter": {
+            "input": {"$ifNull": [tags_expr, []]},
+            "as": "tag",
+            "cond": {"$not": {"$in": ["$$tag", {"$literal": tags}]}},
+        }
+    }
@@ -225,6 +225,30 @@ class FiftyOneConfig(EnvConfig):
             env_var="FIFTYONE_MAX_THREAD_POOL_WORKERS",
             default=None,
         )
+        self.server_metrics = self.parse_bool(
+            d,
+            "server_metrics",
+            env_var="FIFTYONE_SERVER_METRICS",
+            default=False,
+        )
+        self.server_max_media_probes = self.parse_int(
+            d,
+            "server_max_media_probes",
+            env_var="FIFTYONE_SERVER_MAX_MEDIA_PROBES",
+            default=8,
+        )
+        self.server_write_metadata = self.parse_bool(
+            d,
+            "server_write_metadata",
+            env_var="FIFTYONE_SERVER_WRITE_METADATA",
+            default=False,
+        )
+        self.slow_query_threshold = self.parse_number(
+            d,
+            "slow_query_threshold",
+            env_var="FIFTYONE_SLOW_QUERY_THRESHOLD",
+            default=1.0,
+        )
 
         self._init()
 
@@ -10,11 +10,6 @@ import os
 import typing as t
 from urllib.parse import urlparse
 
-try:
-    import IPython.display
-except:
-    pass
-
 
 _COLAB = "COLAB"
 _DATABRICKS = "DATABRICKS"
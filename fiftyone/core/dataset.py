@@ -11,6 +11,7 @@ from datetime import datetime
 import fnmatch
 import itertools
 import logging
+import multiprocessing.dummy
 import numbers
 import os
 import random
@@ -21,7 +22,12 @@ import cachetools
 from deprecated import deprecated
 import mongoengine.errors as moe
 from pymongo import DeleteMany, InsertOne, ReplaceOne, UpdateMany, UpdateOne
-from pymongo.errors import CursorNotFound, BulkWriteError
+from pymongo.errors import (
+    AutoReconnect,
+    BulkWriteError,
+    CursorNotFound,
+    NetworkTimeout,
+)
 
 import eta.core.serial as etas
 import eta.core.utils as etau
@@ -52,6 +58,9 @@ foud = fou.lazy_import("fiftyone.utils.data")
 
 logger = logging.getLogger(__name__)
 
+_MERGE_SHARDS_PER_WORKER = 4
+_MERGE_SHARD_MAX_ATTEMPTS = 3
+
 
 def list_datasets(glob_patt=None, info=False):
     """Lists the available FiftyOne datasets.
@@ -129,6 +138,22 @@ def load_dataset(name):
     return Dataset(name, _create=False)
 
 
+async def _async_load_dataset(name, reload=False):
+    # Datasets that are already in memory are refreshed without blocking the
+    # event loop. Other datasets may need to be migrated, so they are loaded
+    # in a worker thread
+    dataset = Dataset._instances.get(name, None)
+    if dataset is None or dataset.deleted or dataset.name is None:
+        return await fou.run_sync_task(load_dataset, name)
+
+    if reload:
+        await dataset._async_reload()
+    else:
+        await dataset._async_update_last_loaded_at()
+
+    return dataset
+
+
 def get_default_dataset_name():
     """Returns a default dataset name based on the current time.
 
@@ -665,6 +690,43 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._doc.persistent = value
         self.save()
 
+    @property
+    def sparse_frames(self):
+        """Whether frame documents of this video dataset are only stored for
+        frames that contain data.
+
+        When True, empty frames are synthesized on the fly rather than stored:
+
+        -   new frames that are accessed via ``sample.frames[frame_number]``
+            are only written to the database once they contain data
+        -   :meth:`to_frames` does not insert a frame document into this
+            dataset for each frame of the frames view. Frames that are edited
+            in the frames view are inserted when their edits are synced back
+            to this dataset
+        -   the App synthesizes empty frames when streaming frame data
+
+        Note that :meth:`ensure_frames` still inserts a document for every
+        frame of each video, since it is an explicit request to do so. This
+        happens, for example, when annotating videos. Use
+        :meth:`delete_empty_frames` to remove the empty frames afterwards.
+
+        Examples::
+
+            import fiftyone as fo
+            import fiftyone.zoo as foz
+
+            dataset = foz.load_zoo_dataset("quickstart-video")
+
+            dataset.sparse_frames = True
+            dataset.delete_empty_frames()
+        """
+        return self._doc.sparse_frames
+
+    @sparse_frames.setter
+    def sparse_frames(self, value):
+        self._doc.sparse_frames = value
+        self.save()
+
     @property
     def tags(self):
         """A list of tags on the dataset.
@@ -2124,7 +2186,13 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         self.save()
 
-    def iter_samples(self, progress=False, autosave=False, batch_size=None):
+    def iter_samples(
+        self,
+        progress=False,
+        autosave=False,
+        batch_size=None,
+        async_writes=False,
+    ):
         """Returns an iterator over the samples in the dataset.
 
         Examples::
@@ -2165,6 +2233,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             batch_size (None): a batch size to use when autosaving samples. Can
                 either be an integer specifying the number of samples to save
                 in a batch, or a float number of seconds between batched saves
+            async_writes (False): whether to write autosaved batches to the
+                database in a background thread while iteration continues
 
         Returns:
             an iterator over :class:`fiftyone.core.sample.Sample` instances
@@ -2178,7 +2248,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 samples = pb(samples)
 
             if autosave:
-                save_context = foc.SaveContext(self, batch_size=batch_size)
+                save_context = foc.SaveContext(
+                    self, batch_size=batch_size, async_writes=async_writes
+                )
                 exit_context.enter_context(save_context)
 
             for sample in samples:
@@ -2221,6 +2293,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         progress=False,
         autosave=False,
         batch_size=None,
+        async_writes=False,
     ):
         """Returns an iterator over the groups in the dataset.
 
@@ -2266,6 +2339,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             batch_size (None): a batch size to use when autosaving samples. Can
                 either be an integer specifying the number of samples to save
                 in a batch, or a float number of seconds between batched saves
+            async_writes (False): whether to write autosaved batches to the
+                database in a background thread while iteration continues
 
         Returns:
             an iterator that emits dicts mapping group slice names to
@@ -2283,7 +2358,9 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 groups = pb(groups)
 
             if autosave:
-                save_context = foc.SaveContext(self, batch_size=batch_size)
+                save_context = foc.SaveContext(
+                    self, batch_size=batch_size, async_writes=async_writes
+                )
                 exit_context.enter_context(save_context)
 
             for group in groups:
@@ -2493,6 +2570,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         include_info=True,
         overwrite_info=False,
         new_ids=False,
+        num_workers=None,
+        shards=None,
     ):
         """Adds the contents of the given collection to the dataset.
 
@@ -2511,6 +2590,14 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 information. Only applicable when ``include_info`` is True
             new_ids (False): whether to generate new sample/frame/group IDs. By
                 default, the IDs of the input collection are retained
+            num_workers (None): an optional number of threads to use to merge
+                the samples in ``_id`` range shards. See
+                :meth:`Dataset.merge_samples` for details. Only applicable
+                when ``new_ids`` is False
+            shards (None): an optional list of ``_id`` range shards to merge,
+                e.g. the ``shards`` of a :class:`MergeShardsError` raised by a
+                previous call, to resume only the shards that failed. Only
+                applicable when ``new_ids`` is False
 
         Returns:
             a list of IDs of the samples that were added to this dataset
@@ -2531,6 +2618,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             insert_new=True,
             include_info=include_info,
             overwrite_info=overwrite_info,
+            num_workers=num_workers,
+            shards=shards,
         )
         return self.skip(num_samples).values("id")
 
@@ -2803,6 +2892,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         include_info=True,
         overwrite_info=False,
         num_samples=None,
+        num_workers=None,
+        shards=None,
     ):
         """Merges the given samples into this dataset.
 
@@ -2889,6 +2980,22 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             num_samples (None): the number of samples in ``samples``. If not
                 provided, this is computed via ``len(samples)``, if possible.
                 This value is optional and is used only for progress tracking
+            num_workers (None): an optional number of threads to use to merge
+                samples. If provided, the merge is split into ``_id`` range
+                shards that are merged concurrently. Shards that fail due to
+                transient connection errors are retried individually, and a
+                :class:`MergeShardsError` listing the shards that still failed
+                is raised after the other shards have been merged. Note that
+                new samples may not be inserted in the same order as
+                ``samples`` in this case. By default, the merge is performed
+                via a single aggregation. Only applicable when no ``key_fcn``
+                is provided
+            shards (None): an optional list of ``_id`` range shards of
+                ``samples`` to merge, e.g. the ``shards`` of a
+                :class:`MergeShardsError` raised by a previous call, to resume
+                only the shards that failed. Only applicable when ``samples``
+                is a :class:`fiftyone.core.collections.SampleCollection` and
+                no ``key_fcn`` is provided
         """
         if fields is not None:
             if etau.is_str(fields):
@@ -2927,6 +3034,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 omit_fields=omit_fields,
                 merge_lists=merge_lists,
                 overwrite=overwrite,
+                num_workers=num_workers,
+                shards=shards,
             )
             return
 
@@ -2956,6 +3065,7 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                     overwrite=overwrite,
                     expand_schema=expand_schema,
                     include_info=False,
+                    num_workers=num_workers,
                 )
             finally:
                 tmp.delete()
@@ -3872,6 +3982,43 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         """
         self._ensure_frames()
 
+    def delete_empty_frames(self):
+        """Deletes all frames of the video dataset that contain no data.
+
+        A frame is empty if all of its non-default fields are missing or
+        ``None``. This is useful to reclaim storage after calling
+        :meth:`ensure_frames` on a dataset with :meth:`sparse_frames`
+        enabled.
+
+        Note that frames views previously generated via :meth:`to_frames` may
+        no longer be able to sync edits to deleted frames back to this
+        dataset.
+        """
+        if not self._has_frame_fields():
+            return
+
+        default_fields = set(
+            fofr.get_default_frame_fields(
+                include_private=True, use_db_fields=True
+            )
+        )
+        schema = self.get_frame_field_schema(include_private=True)
+        fields = [
+            f
+            for f in self._handle_db_fields(schema.keys(), frames=True)
+            if f not in default_fields
+        ]
+
+        query = {f: None for f in fields}
+
+        frame_ids = [
+            str(d["_id"])
+            for d in self._frame_collection.find(query, {"_id": True})
+        ]
+
+        if frame_ids:
+            self._clear_frames(frame_ids=frame_ids)
+
     def _ensure_frames(self, view=None):
         if not self._has_frame_fields():
             return
@@ -3948,6 +4095,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         expand_schema=True,
         dynamic=False,
         add_info=True,
+        skip_existing=False,
+        key_field="filepath",
         **kwargs,
     ):
         """Adds the contents of the given directory to the dataset.
@@ -4036,6 +4185,17 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 document fields that are encountered
             add_info (True): whether to add dataset info from the importer (if
                 any) to the dataset's ``info``
+            skip_existing (False): whether to skip imported samples whose
+                ``key_field`` value matches an existing sample in the dataset.
+                Samples are inserted in batches as the import progresses, so an
+                interrupted import can be resumed by rerunning it with this
+                option. Existing keys are looked up in batches via an index on
+                ``key_field``, which is created if necessary
+            key_field ("filepath"): the sample field used to detect existing
+                samples when ``skip_existing`` is True. The special value
+                ``"filehash"`` computes an MD5 hash of each media file, stores
+                it in a ``filehash`` field, and skips samples whose content
+                already exists in the dataset
             **kwargs: optional keyword arguments to pass to the constructor of
                 the :class:`fiftyone.utils.data.importers.DatasetImporter` for
                 the specified ``dataset_type``
@@ -4059,6 +4219,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             expand_schema=expand_schema,
             dynamic=dynamic,
             add_info=add_info,
+            skip_existing=skip_existing,
+            key_field=key_field,
         )
 
     def merge_dir(
@@ -4575,6 +4737,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         expand_schema=True,
         dynamic=False,
         add_info=True,
+        skip_existing=False,
+        key_field="filepath",
     ):
         """Adds the samples from the given
         :class:`fiftyone.utils.data.importers.DatasetImporter` to the dataset.
@@ -4608,6 +4772,17 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
                 document fields that are encountered
             add_info (True): whether to add dataset info from the importer (if
                 any) to the dataset's ``info``
+            skip_existing (False): whether to skip imported samples whose
+                ``key_field`` value matches an existing sample in the dataset.
+                Samples are inserted in batches as the import progresses, so an
+                interrupted import can be resumed by rerunning it with this
+                option. Existing keys are looked up in batches via an index on
+                ``key_field``, which is created if necessary
+            key_field ("filepath"): the sample field used to detect existing
+                samples when ``skip_existing`` is True. The special value
+                ``"filehash"`` computes an MD5 hash of each media file, stores
+                it in a ``filehash`` field, and skips samples whose content
+                already exists in the dataset
 
         Returns:
             a list of IDs of the samples that were added to the dataset
@@ -4620,6 +4795,8 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             expand_schema=expand_schema,
             dynamic=dynamic,
             add_info=add_info,
+            skip_existing=skip_existing,
+            key_field=key_field,
         )
 
     def merge_importer(
@@ -6525,6 +6702,29 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
             self, self.name, virtual=True
         )
 
+        self._set_doc(doc, sample_doc_cls, frame_doc_cls)
+        self._update_last_loaded_at()
+
+    async def _async_reload(self):
+        d = await foo.get_async_db_conn().datasets.find_one(
+            {"name": self.name}
+        )
+
+        if d is None:
+            raise ValueError("Dataset '%s' not found" % self.name)
+
+        doc, sample_doc_cls, frame_doc_cls = _load_dataset(
+            self,
+            self.name,
+            virtual=True,
+            dataset_doc=foo.DatasetDocument._from_son(d),
+        )
+
+        self._set_doc(doc, sample_doc_cls, frame_doc_cls)
+        self._reload_docs(hard=True)
+        await self._async_update_last_loaded_at()
+
+    def _set_doc(self, doc, sample_doc_cls, frame_doc_cls):
         new_media_type = doc.media_type != self.media_type
 
         self._doc = doc
@@ -6539,8 +6739,6 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
 
         self._deleted = False
 
-        self._update_last_loaded_at()
-
     def _reload_docs(self, hard=False):
         fos.Sample._reload_docs(self._sample_collection_name, hard=hard)
 
@@ -6554,6 +6752,37 @@ class Dataset(foc.SampleCollection, metaclass=DatasetSingleton):
         self._doc.last_loaded_at = datetime.utcnow()
         self.save()
 
+    async def _async_update_last_loaded_at(self):
+        self._doc.last_loaded_at = datetime.utcnow()
+        await foo.get_async_db_conn().datasets.update_one(
+            {"_id": self._doc.id},
+            {"$set": {"last_loaded_at": self._doc.last_loaded_at}},
+        )
+
+
+class MergeShardsError(Exception):
+    """Exception raised when some ``_id`` range shards of a concurrent merge
+    could not be merged.
+
+    The other shards have been merged, so the merge can be resumed by passing
+    :attr:`shards` to the ``shards`` parameter of
+    :meth:`Dataset.merge_samples` or :meth:`Dataset.add_collection`.
+
+    Args:
+        shards: the list of shards that failed. Each shard is an ``_id`` range
+            query like ``{"$gte": ObjectId(...), "$lt": ObjectId(...)}``
+        errors: the list of exceptions that caused each shard to fail
+    """
+
+    def __init__(self, shards, errors):
+        self.shards = shards
+        self.errors = errors
+
+        super().__init__(
+            "Failed to merge %d shard(s) with IDs in %s"
+            % (len(shards), ", ".join(_format_shard(s) for s in shards))
+        )
+
 
 def _get_random_characters(n):
     return "".join(
@@ -6647,10 +6876,12 @@ def _create_dataset(
         frame_collection_name = src_dataset._doc.frame_collection_name
         frame_doc_cls = src_dataset._frame_doc_cls
         frame_fields = src_dataset._doc.frame_fields
+        sparse_frames = src_dataset._doc.sparse_frames
     else:
         frame_collection_name = None
         frame_doc_cls = None
         frame_fields = None
+        sparse_frames = False
 
     dataset_doc = foo.DatasetDocument(
         id=_id,
@@ -6662,6 +6893,7 @@ def _create_dataset(
         sample_collection_name=sample_collection_name,
         frame_collection_name=frame_collection_name,
         persistent=persistent,
+        sparse_frames=sparse_frames,
         sample_fields=sample_fields,
         frame_fields=frame_fields,
         app_config=DatasetAppConfig(),
@@ -6763,12 +6995,12 @@ def _load_clips_source_dataset(frame_collection_name):
     return load_dataset(doc["name"])
 
 
-def _load_dataset(obj, name, virtual=False):
+def _load_dataset(obj, name, virtual=False, dataset_doc=None):
     if not virtual:
         fomi.migrate_dataset_if_necessary(name)
 
     try:
-        return _do_load_dataset(obj, name)
+        return _do_load_dataset(obj, name, dataset_doc=dataset_doc)
     except Exception as e:
         try:
             version = fomi.get_dataset_revision(name)
@@ -6785,12 +7017,13 @@ def _load_dataset(obj, name, virtual=False):
         raise e
 
 
-def _do_load_dataset(obj, name):
-    try:
-        # pylint: disable=no-member
-        dataset_doc = foo.DatasetDocument.objects.get(name=name)
-    except moe.DoesNotExist:
-        raise ValueError("Dataset '%s' not found" % name)
+def _do_load_dataset(obj, name, dataset_doc=None):
+    if dataset_doc is None:
+        try:
+            # pylint: disable=no-member
+            dataset_doc = foo.DatasetDocument.objects.get(name=name)
+        except moe.DoesNotExist:
+            raise ValueError("Dataset '%s' not found" % name)
 
     sample_collection_name = dataset_doc.sample_collection_name
     frame_collection_name = dataset_doc.frame_collection_name
@@ -7649,6 +7882,8 @@ def _merge_samples_pipeline(
     omit_fields=None,
     merge_lists=True,
     overwrite=True,
+    num_workers=None,
+    shards=None,
 ):
     in_key_field = key_field
     db_fields_map = src_collection._get_db_fields_map()
@@ -7934,17 +8169,35 @@ def _merge_samples_pipeline(
                 frame_index_spec, unique=True
             )
 
+        if shards is None and num_workers is not None and num_workers > 1:
+            shards = _get_id_shards(
+                src_samples, _MERGE_SHARDS_PER_WORKER * num_workers
+            )
+
         # Merge samples
-        src_samples._aggregate(
+        failures = _run_merge_pipeline(
+            src_samples,
+            shards=shards,
+            num_workers=num_workers,
             detach_frames=True,
             detach_groups=True,
             post_pipeline=sample_pipeline,
         )
 
         if contains_videos:
-            # Merge frames
-            _src_videos._aggregate(
-                frames_only=True, post_pipeline=frame_pipeline
+            # Merge the frames of the samples that were merged
+            if shards is not None:
+                failed_shards = [shard for shard, _ in failures]
+                shards = [s for s in shards if s not in failed_shards]
+
+            failures.extend(
+                _run_merge_pipeline(
+                    _src_videos,
+                    shards=shards,
+                    num_workers=num_workers,
+                    frames_only=True,
+                    post_pipeline=frame_pipeline,
+                )
             )
 
             # Finalize IDs
@@ -7973,6 +8226,99 @@ def _merge_samples_pipeline(
     if contains_videos:
         fofr.Frame._reload_docs(dst_dataset._frame_collection_name)
 
+    if failures:
+        raise MergeShardsError(
+            [shard for shard, _ in failures], [e for _, e in failures]
+        ) from failures[0][1]
+
+
+def _run_merge_pipeline(
+    sample_collection, shards=None, num_workers=None, **kwargs
+):
+    # Returns a list of `(shard, error)` tuples for the shards that failed
+    if shards is None:
+        sample_collection._aggregate(**kwargs)
+        return []
+
+    if not shards:
+        return []
+
+    inputs = [(sample_collection, shard, kwargs) for shard in shards]
+    num_workers = max(1, min(num_workers or 1, len(shards)))
+
+    failures = []
+    with fou.ProgressBar(total=len(shards), iters_str="shards") as pb:
+        with multiprocessing.dummy.Pool(processes=num_workers) as pool:
+            for shard, error in pb(pool.imap_unordered(_merge_shard, inputs)):
+                if error is not None:
+                    logger.warning(
+                        "Failed to merge shard with IDs in %s: %s",
+                        _format_shard(shard),
+                        error,
+                    )
+                    failures.append((shard, error))
+
+    return failures
+
+
+def _merge_shard(args):
+    sample_collection, shard, kwargs = args
+
+    # An unbounded shard, e.g. the only shard of a single sample collection,
+    # is an empty range, which must not be matched as an equality condition
+    id_query = shard or {"$exists": True}
+    shard_view = sample_collection.add_stage(
+        fot.Mongo([{"$match": {"_id": id_query}}], _needs_frames=False)
+    )
+
+    # Merges are idempotent, so a shard that fails due to a transient error
+    # can safely be retried
+    for attempt in range(_MERGE_SHARD_MAX_ATTEMPTS):
+        try:
+            shard_view._aggregate(**kwargs)
+            return shard, None
+        except (AutoReconnect, NetworkTimeout) as e:
+            logger.debug(
+                "Failed to merge shard with IDs in %s",
+                _format_shard(shard),
+                exc_info=True,
+            )
+            if attempt + 1 >= _MERGE_SHARD_MAX_ATTEMPTS:
+                return shard, e
+        except Exception as e:
+            return shard, e
+
+
+def _get_id_shards(sample_collection, num_shards):
+    # Returns a list of `_id` range queries that partition the collection
+    pipeline = [
+        {"$project": {"_id": True}},
+        {"$bucketAuto": {"groupBy": "$_id", "buckets": num_shards}},
+    ]
+    buckets = sample_collection._aggregate(
+        detach_frames=True, detach_groups=True, post_pipeline=pipeline
+    )
+    bounds = [b["_id"]["min"] for b in buckets][1:]
+
+    # The first and last shards are unbounded so that every document is
+    # included in exactly one shard
+    shards = []
+    for lower, upper in zip([None] + bounds, bounds + [None]):
+        shard = {}
+        if lower is not None:
+            shard["$gte"] = lower
+
+        if upper is not None:
+            shard["$lt"] = upper
+
+        shards.append(shard)
+
+    return shards
+
+
+def _format_shard(shard):
+    return "[%s, %s)" % (shard.get("$gte", None), shard.get("$lt", None))
+
 
 def _merge_docs(
     sample_collection,
@@ -19,6 +19,9 @@ import fiftyone.core.utils as fou
 fov = fou.lazy_import("fiftyone.core.view")
 
 
+_EMPTY_FRAME_KEYS = {"_id", "frame_number", "_sample_id", "_dataset_id"}
+
+
 def get_default_frame_fields(include_private=False, use_db_fields=False):
     """Returns the default fields present on all frames.
 
@@ -725,8 +728,13 @@ class Frames(object):
 
         ops = []
         new_dicts = {}
+        skipped = {}
         for frame_number, frame in replacements.items():
             d = self._make_dict(frame)
+            if self._skip_empty_frame(frame, d):
+                skipped[frame_number] = frame
+                continue
+
             if not frame._in_db:
                 new_dicts[frame_number] = d
 
@@ -737,7 +745,7 @@ class Frames(object):
             )
             ops.append(op)
 
-        if not deferred:
+        if ops and not deferred:
             self._frame_collection.bulk_write(ops, ordered=False)
 
         if new_dicts:
@@ -752,8 +760,20 @@ class Frames(object):
 
         self._replacements.clear()
 
+        # Empty frames are kept in memory so that they are written if they are
+        # later populated
+        self._replacements.update(skipped)
+
         return ops
 
+    def _skip_empty_frame(self, frame, d):
+        # In sparse frames mode, frame documents are only created once they
+        # contain data
+        if frame._in_db or not self._dataset._doc.sparse_frames:
+            return False
+
+        return all(k in _EMPTY_FRAME_KEYS for k in d.keys())
+
     def _validate_frames(self, frames):
         schema = self._dataset.get_frame_field_schema(include_private=True)
 
@@ -979,8 +999,12 @@ class FramesView(Frames):
             self._validate_frames(self._replacements)
 
         ops = []
+        skipped = {}
         for frame_number, frame in self._replacements.items():
             doc = self._make_dict(frame)
+            if self._skip_empty_frame(frame, doc):
+                skipped[frame_number] = frame
+                continue
 
             # Update elements of filtered array fields separately
             if self._filtered_fields is not None:
@@ -1010,10 +1034,11 @@ class FramesView(Frames):
                 )
             )
 
-        if not deferred:
+        if ops and not deferred:
             self._frame_collection.bulk_write(ops, ordered=False)
 
         self._replacements.clear()
+        self._replacements.update(skipped)
 
         return ops
 
@@ -5,6 +5,7 @@ Labels stored in dataset samples.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import contextvars
 import itertools
 import warnings
 
@@ -598,6 +599,32 @@ class Detections(_HasLabelList, Label):
 
         return Segmentation(mask=mask)
 
+    def to_arrays(self, attributes=None):
+        """Returns a read-only :class:`DetectionsArrays` representation of this
+        instance.
+
+        Args:
+            attributes (None): an optional list of names of additional object
+                attributes to include
+
+        Returns:
+            a :class:`DetectionsArrays`
+        """
+        return DetectionsArrays.from_labels(self, attributes=attributes)
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """Creates a :class:`Detections` instance from a
+        :class:`DetectionsArrays`.
+
+        Args:
+            arrays: a :class:`DetectionsArrays`
+
+        Returns:
+            a :class:`Detections`
+        """
+        return arrays.to_labels()
+
 
 class Polyline(_HasAttributesDict, _HasID, Label):
     """A set of semantically related polylines or polygons.
@@ -940,6 +967,32 @@ class Polylines(_HasLabelList, Label):
 
         return Segmentation(mask=mask)
 
+    def to_arrays(self, attributes=None):
+        """Returns a read-only :class:`PolylinesArrays` representation of this
+        instance.
+
+        Args:
+            attributes (None): an optional list of names of additional object
+                attributes to include
+
+        Returns:
+            a :class:`PolylinesArrays`
+        """
+        return PolylinesArrays.from_labels(self, attributes=attributes)
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """Creates a :class:`Polylines` instance from a
+        :class:`PolylinesArrays`.
+
+        Args:
+            arrays: a :class:`PolylinesArrays`
+
+        Returns:
+            a :class:`Polylines`
+        """
+        return arrays.to_labels()
+
 
 class Keypoint(_HasAttributesDict, _HasID, Label):
     """A list of keypoints in an image.
@@ -989,6 +1042,32 @@ class Keypoints(_HasLabelList, Label):
 
     keypoints = fof.ListField(fof.EmbeddedDocumentField(Keypoint))
 
+    def to_arrays(self, attributes=None):
+        """Returns a read-only :class:`KeypointsArrays` representation of this
+        instance.
+
+        Args:
+            attributes (None): an optional list of names of additional object
+                attributes to include
+
+        Returns:
+            a :class:`KeypointsArrays`
+        """
+        return KeypointsArrays.from_labels(self, attributes=attributes)
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """Creates a :class:`Keypoints` instance from a
+        :class:`KeypointsArrays`.
+
+        Args:
+            arrays: a :class:`KeypointsArrays`
+
+        Returns:
+            a :class:`Keypoints`
+        """
+        return arrays.to_labels()
+
 
 class _HasMedia(object):
     """Mixin for :class:`Label` classes that contain a media field."""
@@ -1427,6 +1506,349 @@ class GeoLocations(_HasID, Label):
         return cls(points=points, lines=lines, polygons=polygons)
 
 
+class LabelArrays(object):
+    """Base class for read-only columnar representations of the objects in
+    :class:`Detections`, :class:`Keypoints`, and :class:`Polylines` instances.
+
+    Rather than storing one :class:`Label` instance per object, columnar
+    representations store each attribute of the objects as an array, which
+    makes them much cheaper to construct and operate on when only a few
+    attributes of many objects are required. In particular,
+    :meth:`from_dict` builds instances directly from the BSON dictionaries
+    stored in the database without instantiating any :class:`Label`
+    documents.
+
+    Label arrays are accepted by :func:`fiftyone.utils.iou.compute_ious`, by
+    the per-image ``evaluate()`` methods of the COCO and Open Images detection
+    evaluations, and by :class:`fiftyone.utils.yolo.YOLOAnnotationWriter`.
+    Methods that operate on sample collections, such as
+    :meth:`fiftyone.core.collections.SampleCollection.evaluate_detections` and
+    :meth:`fiftyone.core.collections.SampleCollection.draw_labels`, require
+    :class:`Label` instances, which you can obtain via :meth:`to_labels`.
+
+    Args:
+        ids: an array of label IDs
+        labels: an array of label strings
+        attributes (None): an optional dict mapping names of additional
+            object attributes to arrays of values
+    """
+
+    _LABELS_CLS = None
+
+    def __init__(self, ids, labels, attributes=None):
+        if attributes is None:
+            attributes = {}
+
+        self._ids = _to_readonly_array(ids, object)
+        self._labels = _to_readonly_array(labels, object)
+        self._attributes = {
+            name: _to_readonly_array(values, object)
+            for name, values in attributes.items()
+        }
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __repr__(self):
+        return "<%s: %d objects>" % (self.__class__.__name__, len(self))
+
+    @property
+    def ids(self):
+        """An array of label IDs."""
+        return self._ids
+
+    @property
+    def labels(self):
+        """An array of label strings."""
+        return self._labels
+
+    @property
+    def attributes(self):
+        """A dict mapping names of additional object attributes to arrays of
+        values.
+        """
+        return self._attributes
+
+    def to_labels(self):
+        """Returns a :class:`Label` representation of this instance.
+
+        Returns:
+            a :class:`Label`
+        """
+        list_field = self._LABELS_CLS._LABEL_LIST_FIELD
+        objects = [self._make_object(i) for i in range(len(self))]
+
+        # pylint: disable=not-callable
+        return self._LABELS_CLS(**{list_field: objects})
+
+    @classmethod
+    def from_labels(cls, labels, attributes=None):
+        """Creates an instance from a :class:`Label`.
+
+        Args:
+            labels: a :class:`Label` of the appropriate type, or ``None``
+            attributes (None): an optional list of names of additional object
+                attributes to include
+
+        Returns:
+            a :class:`LabelArrays`
+        """
+        if labels is None:
+            objects = []
+        else:
+            objects = labels[cls._LABELS_CLS._LABEL_LIST_FIELD] or []
+
+        return cls._from_objects(
+            objects,
+            lambda obj, name: getattr(obj, name, None),
+            lambda obj: obj.id,
+            lambda obj, name: obj.get_attribute_value(name, None),
+            attributes,
+        )
+
+    @classmethod
+    def from_dict(cls, d, attributes=None):
+        """Creates an instance from the BSON/JSON dictionary representation of
+        a :class:`Label`, without instantiating any :class:`Label` documents.
+
+        Args:
+            d: a :class:`Label` dict, or ``None``
+            attributes (None): an optional list of names of additional object
+                attributes to include
+
+        Returns:
+            a :class:`LabelArrays`
+        """
+        if d is None:
+            objects = []
+        else:
+            objects = d.get(cls._LABELS_CLS._LABEL_LIST_FIELD, None) or []
+
+        return cls._from_objects(
+            objects,
+            lambda obj, name: obj.get(name, None),
+            _get_dict_id,
+            _get_dict_attribute_value,
+            attributes,
+        )
+
+    @classmethod
+    def _from_objects(cls, objects, get_value, get_id, get_attr, attributes):
+        ids = [get_id(obj) for obj in objects]
+        labels = [get_value(obj, "label") for obj in objects]
+
+        if attributes:
+            attributes = {
+                name: [get_attr(obj, name) for obj in objects]
+                for name in attributes
+            }
+
+        kwargs = cls._parse_objects(objects, get_value)
+
+        return cls(ids, labels, attributes=attributes, **kwargs)
+
+    @classmethod
+    def _parse_objects(cls, objects, get_value):
+        raise NotImplementedError("Subclass must implement _parse_objects()")
+
+    def _make_object(self, idx):
+        raise NotImplementedError("Subclass must implement _make_object()")
+
+    def _get_object_kwargs(self, idx):
+        kwargs = {"id": self._ids[idx], "label": self._labels[idx]}
+
+        for name, values in self._attributes.items():
+            if values[idx] is not None:
+                kwargs[name] = values[idx]
+
+        return kwargs
+
+
+class DetectionsArrays(LabelArrays):
+    """A read-only columnar representation of a :class:`Detections` instance.
+
+    Args:
+        ids: an array of label IDs
+        labels: an array of label strings
+        confidences: an array of confidences, with ``nan`` for missing values
+        bounding_boxes: a ``num_objects x 4`` array of relative bounding boxes
+            in ``[<top-left-x>, <top-left-y>, <width>, <height>]`` format
+        attributes (None): an optional dict mapping names of additional
+            object attributes to arrays of values
+    """
+
+    _LABELS_CLS = Detections
+
+    def __init__(
+        self, ids, labels, confidences, bounding_boxes, attributes=None
+    ):
+        super().__init__(ids, labels, attributes=attributes)
+
+        self._confidences = _to_readonly_array(confidences, float)
+        self._bounding_boxes = _to_readonly_array(
+            bounding_boxes, float
+        ).reshape(-1, 4)
+
+    @property
+    def confidences(self):
+        """An array of confidences, with ``nan`` for missing values."""
+        return self._confidences
+
+    @property
+    def bounding_boxes(self):
+        """A ``num_objects x 4`` array of relative bounding boxes."""
+        return self._bounding_boxes
+
+    @classmethod
+    def _parse_objects(cls, objects, get_value):
+        return {
+            "confidences": [get_value(obj, "confidence") for obj in objects],
+            "bounding_boxes": [
+                get_value(obj, "bounding_box") or [np.nan] * 4
+                for obj in objects
+            ],
+        }
+
+    def _make_object(self, idx):
+        kwargs = self._get_object_kwargs(idx)
+        kwargs["bounding_box"] = self._bounding_boxes[idx].tolist()
+
+        confidence = self._confidences[idx]
+        if not np.isnan(confidence):
+            kwargs["confidence"] = float(confidence)
+
+        return Detection(**kwargs)
+
+
+class KeypointsArrays(LabelArrays):
+    """A read-only columnar representation of a :class:`Keypoints` instance.
+
+    Args:
+        ids: an array of label IDs
+        labels: an array of label strings
+        points: a list of ``num_points x 2`` arrays of relative keypoints,
+            with ``nan`` for missing points
+        confidences: a list of arrays of per-point confidences, or ``None``
+            for objects without confidences
+        attributes (None): an optional dict mapping names of additional
+            object attributes to arrays of values
+    """
+
+    _LABELS_CLS = Keypoints
+
+    def __init__(self, ids, labels, points, confidences, attributes=None):
+        super().__init__(ids, labels, attributes=attributes)
+
+        self._points = [
+            _to_readonly_array(p, float).reshape(-1, 2) for p in points
+        ]
+        self._confidences = [
+            _to_readonly_array(c, float) if c is not None else None
+            for c in confidences
+        ]
+
+    @property
+    def points(self):
+        """A list of ``num_points x 2`` arrays of relative keypoints."""
+        return self._points
+
+    @property
+    def confidences(self):
+        """A list of arrays of per-point confidences, or ``None``."""
+        return self._confidences
+
+    @classmethod
+    def _parse_objects(cls, objects, get_value):
+        return {
+            "points": [get_value(obj, "points") or [] for obj in objects],
+            "confidences": [get_value(obj, "confidence") for obj in objects],
+        }
+
+    def _make_object(self, idx):
+        kwargs = self._get_object_kwargs(idx)
+        kwargs["points"] = self._points[idx].tolist()
+
+        confidence = self._confidences[idx]
+        if confidence is not None:
+            kwargs["confidence"] = confidence.tolist()
+
+        return Keypoint(**kwargs)
+
+
+class PolylinesArrays(LabelArrays):
+    """A read-only columnar representation of a :class:`Polylines` instance.
+
+    Args:
+        ids: an array of label IDs
+        labels: an array of label strings
+        confidences: an array of confidences, with ``nan`` for missing values
+        points: a list of lists of ``num_vertices x 2`` arrays of relative
+            vertices describing the shapes of each object
+        closed: an array of booleans indicating whether each object is closed
+        filled: an array of booleans indicating whether each object is filled
+        attributes (None): an optional dict mapping names of additional
+            object attributes to arrays of values
+    """
+
+    _LABELS_CLS = Polylines
+
+    def __init__(
+        self, ids, labels, confidences, points, closed, filled, attributes=None
+    ):
+        super().__init__(ids, labels, attributes=attributes)
+
+        self._confidences = _to_readonly_array(confidences, float)
+        self._points = [
+            [_to_readonly_array(s, float).reshape(-1, 2) for s in shapes]
+            for shapes in points
+        ]
+        self._closed = _to_readonly_array(closed, bool)
+        self._filled = _to_readonly_array(filled, bool)
+
+    @property
+    def confidences(self):
+        """An array of confidences, with ``nan`` for missing values."""
+        return self._confidences
+
+    @property
+    def points(self):
+        """A list of lists of ``num_vertices x 2`` arrays of relative
+        vertices.
+        """
+        return self._points
+
+    @property
+    def closed(self):
+        """An array of booleans indicating whether each object is closed."""
+        return self._closed
+
+    @property
+    def filled(self):
+        """An array of booleans indicating whether each object is filled."""
+        return self._filled
+
+    @classmethod
+    def _parse_objects(cls, objects, get_value):
+        return {
+            "confidences": [get_value(obj, "confidence") for obj in objects],
+            "points": [get_value(obj, "points") or [] for obj in objects],
+            "closed": [bool(get_value(obj, "closed")) for obj in objects],
+            "filled": [bool(get_value(obj, "filled")) for obj in objects],
+        }
+
+    def _make_object(self, idx):
+        kwargs = self._get_object_kwargs(idx)
+        kwargs["points"] = [s.tolist() for s in self._points[idx]]
+        kwargs["closed"] = bool(self._closed[idx])
+        kwargs["filled"] = bool(self._filled[idx])
+
+        confidence = self._confidences[idx]
+        if not np.isnan(confidence):
+            kwargs["confidence"] = float(confidence)
+
+        return Polyline(**kwargs)
+
+
 _LABEL_LIST_FIELDS = (
     Classifications,
     Detections,
@@ -1468,9 +1890,53 @@ _LABEL_LIST_TO_SINGLE_MAP = {
 }
 
 
+def _to_readonly_array(values, dtype):
+    if dtype is object:
+        # Avoid numpy converting nested sequences into multidimensional arrays
+        array = np.empty(len(values), dtype=object)
+        array[:] = list(values)
+    else:
+        array = np.array(values, dtype=dtype)
+
+    array.flags.writeable = False
+    return array
+
+
+def _get_dict_id(d):
+    _id = d.get("_id", None)
+    if _id is None:
+        _id = d.get("id", None)
+
+    if isinstance(_id, dict):
+        _id = _id.get("$oid", None)  # extended JSON
+
+    return str(_id) if _id is not None else None
+
+
+def _get_dict_attribute_value(d, name):
+    if name in d:
+        return d[name]
+
+    attributes = d.get("attributes", None) or {}
+    attr = attributes.get(name, None)
+    if attr is not None:
+        return attr.get("value", None)
+
+    return None
+
+
+# Masks and heatmaps of the sample that is currently being emitted by a
+# :func:`fiftyone.utils.labels.prefetch_label_media` iterator in this context,
+# keyed by path
+_prefetched_media = contextvars.ContextVar("prefetched_media", default=None)
+
+
 def _read_mask(mask_path):
-    # pylint: disable=no-member
-    return foui.read(mask_path, flag=cv2.IMREAD_UNCHANGED)
+    mask = _pop_prefetched_media(mask_path)
+    if mask is not None:
+        return mask
+
+    return _read_media(mask_path)
 
 
 def _write_mask(mask, mask_path):
@@ -1529,8 +1995,24 @@ def _mask_to_image(mask):
 
 
 def _read_heatmap(map_path):
+    map = _pop_prefetched_media(map_path)
+    if map is not None:
+        return map
+
+    return _read_media(map_path)
+
+
+def _pop_prefetched_media(path):
+    media = _prefetched_media.get()
+    if media is None:
+        return None
+
+    return media.pop(path, None)
+
+
+def _read_media(path):
     # pylint: disable=no-member
-    return foui.read(map_path, flag=cv2.IMREAD_UNCHANGED)
+    return foui.read(path, flag=cv2.IMREAD_UNCHANGED)
 
 
 def _write_heatmap(map, map_path, range):
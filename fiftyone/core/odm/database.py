@@ -10,6 +10,7 @@ from datetime import datetime
 import logging
 from multiprocessing.pool import ThreadPool
 import os
+import threading
 
 import asyncio
 from bson import json_util, ObjectId
@@ -38,6 +39,7 @@ foa = fou.lazy_import("fiftyone.core.annotation")
 fob = fou.lazy_import("fiftyone.core.brain")
 fod = fou.lazy_import("fiftyone.core.dataset")
 foe = fou.lazy_import("fiftyone.core.evaluation")
+fomi = fou.lazy_import("fiftyone.migrations")
 
 
 logger = logging.getLogger(__name__)
@@ -46,6 +48,8 @@ _client = None
 _async_client = None
 _connection_kwargs = {}
 _db_service = None
+_connected = False
+_connection_lock = threading.RLock()
 
 
 #
@@ -231,20 +235,42 @@ def establish_db_conn(config):
 
 
 def _connect():
+    """Connects to the database, if necessary.
+
+    The database connection is established lazily the first time it is
+    needed, so all database access must go through this method.
+    """
     global _client
-    if _client is None:
-        global _connection_kwargs
+    global _connected
 
-        _client = pymongo.MongoClient(
-            **_connection_kwargs, appname=foc.DATABASE_APPNAME
-        )
-        connect(fo.config.database_name, **_connection_kwargs)
+    if _connected:
+        return
+
+    with _connection_lock:
+        # `_client` is already populated if we're called while connecting
+        if _client is not None:
+            return
+
+        establish_db_conn(fo.config)
+
+        if _client is None:
+            _client = pymongo.MongoClient(
+                **_connection_kwargs, appname=foc.DATABASE_APPNAME
+            )
+            connect(fo.config.database_name, **_connection_kwargs)
+
+        if os.environ.get("FIFTYONE_DISABLE_SERVICES", "0") != "1":
+            fomi.migrate_database_if_necessary()
+
+        _connected = True
 
 
 def _async_connect():
     global _async_client
     if _async_client is None:
-        global _connection_kwargs
+        # Ensures that `_connection_kwargs` are populated
+        _connect()
+
         _async_client = mtr.AsyncIOMotorClient(
             **_connection_kwargs, appname=foc.DATABASE_APPNAME
         )
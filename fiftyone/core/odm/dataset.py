@@ -504,6 +504,7 @@ class DatasetDocument(Document):
     sample_collection_name = StringField(unique=True, required=True)
     frame_collection_name = StringField()
     persistent = BooleanField(default=False)
+    sparse_frames = BooleanField(default=False)
     media_type = StringField()
     group_field = StringField()
     group_media_types = DictField(StringField())
@@ -18,6 +18,8 @@ import fiftyone.core.utils as fou
 
 from .utils import serialize_value, deserialize_value
 
+foodb = fou.lazy_import("fiftyone.core.odm.database")
+
 
 class SerializableDocument(object):
     """Mixin for documents that can be serialized in BSON or JSON format."""
@@ -531,6 +533,14 @@ class BaseDocument(MongoEngineBaseDocument):
 
         return super().__eq__(other)
 
+    @classmethod
+    def _get_db(cls):
+        # The database connection is established on first use
+        foodb._connect()
+
+        # pylint: disable=no-member
+        return super()._get_db()
+
     def _get_repr_fields(self):
         # pylint: disable=no-member
         return self._fields_ordered
@@ -6,8 +6,12 @@ Mixins and helpers for dataset backing documents.
 |
 """
 from collections import OrderedDict
+from contextlib import contextmanager
+from copy import deepcopy
+import weakref
 
 from bson import ObjectId
+from mongoengine import EmbeddedDocument
 from pymongo import UpdateOne
 
 import fiftyone.core.fields as fof
@@ -59,11 +63,92 @@ class DatasetMixin(object):
     _dataset = None
 
     def __setattr__(self, name, value):
-        if name in self._fields and value is not None:
-            self._fields[name].validate(value)
+        if name in self._fields:
+            if value is not None:
+                self._fields[name].validate(value)
+
+            self._discard_raw_value(name)
 
         super().__setattr__(name, value)
 
+    @classmethod
+    def _from_son(cls, son, *args, **kwargs):
+        # Embedded documents are not decoded until they are first accessed.
+        # We must not modify `son` here because callers may retry on error
+        raw = {}
+        for key, value in son.items():
+            field_name = cls._reverse_db_field_map.get(key, key)
+            field = cls._fields.get(field_name, None)
+            if (
+                field is not None
+                and not field.required
+                and _is_embedded_value(value)
+            ):
+                raw[field_name] = value
+
+        if raw:
+            son = {
+                k: v
+                for k, v in son.items()
+                if cls._reverse_db_field_map.get(k, k) not in raw
+            }
+
+        obj = super()._from_son(son, *args, **kwargs)
+
+        if raw:
+            obj._data = _LazyData(obj, obj._data, raw)
+
+        return obj
+
+    def _discard_raw_value(self, field_name):
+        data = getattr(self, "_data", None)
+        if isinstance(data, _LazyData):
+            data.discard_raw(field_name)
+
+    @contextmanager
+    def _without_raw_values(self):
+        # Temporarily hides not-yet-decoded values so that whole-document
+        # methods don't needlessly decode them. Yields the raw values
+        data = getattr(self, "_data", None)
+        if not isinstance(data, _LazyData) or not data.has_raw_values:
+            yield {}
+            return
+
+        raw, self._data = data.split_raw()
+        try:
+            yield raw
+        finally:
+            self._data = data
+
+    def validate(self, *args, **kwargs):
+        # Values that haven't been decoded haven't changed since they were
+        # loaded from the database, so they need not be validated
+        with self._without_raw_values():
+            super().validate(*args, **kwargs)
+
+    def to_mongo(self, use_db_field=True, fields=None):
+        with self._without_raw_values() as raw:
+            d = super().to_mongo(use_db_field=use_db_field, fields=fields)
+
+        root_fields = {f.split(".")[0] for f in fields or []}
+
+        for field_name, value in raw.items():
+            if root_fields and field_name not in root_fields:
+                continue
+
+            if use_db_field:
+                key = self._fields[field_name].db_field or field_name
+            else:
+                key = field_name
+
+            d[key] = deepcopy(value)
+
+        return d
+
+    def _get_changed_fields(self):
+        with self._without_raw_values():
+            return super()._get_changed_fields()
+
     @property
     def collection_name(self):
         return self.__class__.__name__
@@ -149,6 +234,7 @@ class DatasetMixin(object):
                     dynamic=dynamic,
                 )
 
+        self._discard_raw_value(field_name)
         super().__setattr__(field_name, value)
 
     def clear_field(self, field_name):
@@ -1451,6 +1537,142 @@ class DatasetMixin(object):
         return el._id, el_filter
 
 
+class _LazyData(dict):
+    """A document's ``_data`` dict whose values for some fields are stored as
+    raw BSON and only decoded via their field's ``to_python()`` method when
+    they are first accessed.
+    """
+
+    def __init__(self, doc, data, raw):
+        super().__init__(data)
+        super().update(raw)
+        self._raw_keys = set(raw.keys())
+
+        # Snapshot the fields in case the document's schema is later modified
+        self._fields = {k: doc._fields[k] for k in raw.keys()}
+        self._doc = weakref.ref(doc)
+
+    @property
+    def has_raw_values(self):
+        return bool(self._raw_keys)
+
+    def discard_raw(self, key):
+        """Marks the given key as no longer needing to be decoded, e.g.,
+        because its value is about to be overwritten.
+        """
+        self._raw_keys.discard(key)
+
+    def split_raw(self):
+        """Returns a ``(raw, data)`` tuple containing the raw values that have
+        not been decoded and a plain dict containing the remaining values,
+        with ``None`` in place of the raw values.
+        """
+        raw = {k: dict.__getitem__(self, k) for k in self._raw_keys}
+        data = dict(dict.items(self))
+        data.update({k: None for k in raw})
+        return raw, data
+
+    def _decode(self, key):
+        value = dict.__getitem__(self, key)
+        self._raw_keys.discard(key)
+
+        value = self._fields[key].to_python(value)
+
+        # Mimic mongoengine.base.fields.BaseField.__set__()
+        doc = self._doc()
+        if doc is not None:
+            if isinstance(value, EmbeddedDocument):
+                value._instance = weakref.proxy(doc)
+            elif isinstance(value, (list, tuple)):
+                for v in value:
+                    if isinstance(v, EmbeddedDocument):
+                        v._instance = weakref.proxy(doc)
+
+        dict.__setitem__(self, key, value)
+        return value
+
+    def _decode_all(self):
+        for key in list(self._raw_keys):
+            self._decode(key)
+
+    def __getitem__(self, key):
+        if key in self._raw_keys:
+            return self._decode(key)
+
+        return super().__getitem__(key)
+
+    def __setitem__(self, key, value):
+        self._raw_keys.discard(key)
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self._raw_keys.discard(key)
+        super().__delitem__(key)
+
+    def __iter__(self):
+        # Overriding this ensures that dict(self) uses __getitem__()
+        return super().__iter__()
+
+    def __eq__(self, other):
+        self._decode_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+    def get(self, key, default=None):
+        if key in self._raw_keys:
+            return self._decode(key)
+
+        return super().get(key, default)
+
+    def pop(self, key, *args):
+        if key in self._raw_keys:
+            self._decode(key)
+
+        return super().pop(key, *args)
+
+    def popitem(self):
+        self._decode_all()
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        if key in self._raw_keys:
+            return self._decode(key)
+
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+    def clear(self):
+        self._raw_keys.clear()
+        super().clear()
+
+    def values(self):
+        self._decode_all()
+        return super().values()
+
+    def items(self):
+        self._decode_all()
+        return super().items()
+
+    def copy(self):
+        self._decode_all()
+        return dict(self)
+
+
+def _is_embedded_value(value):
+    if isinstance(value, dict):
+        return True
+
+    return isinstance(value, list) and any(isinstance(v, dict) for v in value)
+
+
 class NoDatasetMixin(object):
     """Mixin for :class:`fiftyone.core.odm.document.SerializableDocument`
     subtypes that are not backed by a dataset.
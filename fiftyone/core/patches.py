@@ -156,12 +156,18 @@ class _PatchesView(fov.DatasetView):
     def media_type(self):
         return fom.IMAGE
 
-    def _tag_labels(self, tags, label_field, ids=None, label_ids=None):
+    def _tag_labels(
+        self, tags, label_field, ids=None, label_ids=None, progress=None
+    ):
         if label_field in self._label_fields:
             _ids = self.values("_" + self._id_field)
 
         _, label_ids = super()._tag_labels(
-            tags, label_field, ids=ids, label_ids=label_ids
+            tags,
+            label_field,
+            ids=ids,
+            label_ids=label_ids,
+            progress=progress,
         )
 
         if label_field in self._label_fields:
@@ -170,12 +176,18 @@ class _PatchesView(fov.DatasetView):
                 tags, label_field, ids=ids, label_ids=label_ids
             )
 
-    def _untag_labels(self, tags, label_field, ids=None, label_ids=None):
+    def _untag_labels(
+        self, tags, label_field, ids=None, label_ids=None, progress=None
+    ):
         if label_field in self._label_fields:
             _ids = self.values("_" + self._id_field)
 
         _, label_ids = super()._untag_labels(
-            tags, label_field, ids=ids, label_ids=label_ids
+            tags,
+            label_field,
+            ids=ids,
+            label_ids=label_ids,
+            progress=progress,
         )
 
         if label_field in self._label_fields:
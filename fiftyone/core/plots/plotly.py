@@ -5,7 +5,6 @@ Plotly plots.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
-from collections import defaultdict
 import itertools
 import logging
 import os
@@ -14,7 +13,6 @@ import warnings
 import numpy as np
 from PIL import ImageColor
 import plotly.colors as pc
-import plotly.express as px
 import plotly.graph_objects as go
 
 import eta.core.utils as etau
@@ -31,6 +29,8 @@ from .utils import (
     parse_scatter_inputs,
 )
 
+px = fou.lazy_import("plotly.express")
+
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +42,7 @@ _DEFAULT_LAYOUT = dict(
 _DEFAULT_LINE_COLOR = "#FF6D04"
 _DEFAULT_CONTINUOUS_COLORSCALE = "viridis"
 _MAX_LABEL_TRACES = 25
+_MAX_SVG_POINTS = 1000
 
 
 def plot_confusion_matrix(
@@ -852,6 +853,12 @@ def lines(
 
     colors = _get_qualitative_colors(len(y), colors=colors)
 
+    # WebGL renders large numbers of points much faster than SVG
+    if sum(len(_x) for _x in x) > _MAX_SVG_POINTS:
+        scatter_cls = go.Scattergl
+    else:
+        scatter_cls = go.Scatter
+
     traces = []
     for _x, _y, _i, _s, _l, _c in zip(x, y, ids, sizes, labels, colors):
         marker = {}
@@ -863,7 +870,7 @@ def lines(
             marker.update(dict(size=marker_size))
 
         traces.append(
-            go.Scatter(
+            scatter_cls(
                 x=_x,
                 y=_y,
                 customdata=_i,
@@ -1791,8 +1798,9 @@ class InteractiveScatter(PlotlyInteractivePlot):
         self._figure = figure
         self._traces = None
         self._trace_ids = {}
-        self._ids_to_traces = {}
-        self._ids_to_inds = {}
+        self._sorted_ids = None
+        self._sorted_traces = None
+        self._sorted_inds = None
         self._callback_flags = {}
 
         widget = self._make_widget()
@@ -1800,6 +1808,9 @@ class InteractiveScatter(PlotlyInteractivePlot):
         super().__init__(widget, **kwargs)
 
     def _init_traces(self):
+        all_ids = [np.array([], dtype=str)]
+        all_traces = [np.array([], dtype=int)]
+        all_inds = [np.array([], dtype=int)]
         for idx, trace in enumerate(self._traces):
             trace_ids = np.asarray(trace.customdata)
             if trace_ids.ndim > 1:
@@ -1807,10 +1818,18 @@ class InteractiveScatter(PlotlyInteractivePlot):
 
             self._trace_ids[idx] = trace_ids
 
-            self._ids_to_traces.update({_id: idx for _id in trace_ids})
-            self._ids_to_inds[idx] = {
-                _id: idx for idx, _id in enumerate(trace_ids)
-            }
+            all_ids.append(trace_ids.astype(str))
+            all_traces.append(np.full(len(trace_ids), idx))
+            all_inds.append(np.arange(len(trace_ids)))
+
+        # IDs are sorted so that they can be mapped to their traces and point
+        # indices via binary search. The sort is stable so that, as before,
+        # the last occurrence of a duplicate ID takes precedence
+        all_ids = np.concatenate(all_ids)
+        order = np.argsort(all_ids, kind="stable")
+        self._sorted_ids = all_ids[order]
+        self._sorted_traces = np.concatenate(all_traces)[order]
+        self._sorted_inds = np.concatenate(all_inds)[order]
 
     def _init_callback_flags(self):
         self._callback_flags = {t.name: False for t in self._traces}
@@ -1828,14 +1847,22 @@ class InteractiveScatter(PlotlyInteractivePlot):
             if trace.visible != True:
                 continue
 
-            found |= trace.selectedpoints is not None
-            if trace.selectedpoints:
-                ids.append(self._trace_ids[idx][list(trace.selectedpoints)])
+            selectedpoints = trace.selectedpoints
+            if selectedpoints is None:
+                continue
+
+            found = True
+            if len(selectedpoints) > 0:
+                inds = np.asarray(selectedpoints, dtype=int)
+                ids.append(self._trace_ids[idx][inds])
 
         if not found:
             return None
 
-        return list(itertools.chain.from_iterable(ids))
+        if not ids:
+            return []
+
+        return np.concatenate(ids).tolist()
 
     def _make_widget(self):
         widget = go.FigureWidget(self._figure)
@@ -1875,20 +1902,19 @@ class InteractiveScatter(PlotlyInteractivePlot):
         if deselect:
             ids = []
 
-        # Split IDs into their traces
-        per_trace_ids = defaultdict(list)
-        for _id in ids:
-            trace_id = self._ids_to_traces.get(_id, None)
-            if trace_id is not None:
-                per_trace_ids[trace_id].append(_id)
+        # Map IDs to their traces and point indices
+        ids = np.asarray(list(ids), dtype=str)
+        pos = np.searchsorted(self._sorted_ids, ids, side="right") - 1
+        found = pos >= 0
+        found[found] = self._sorted_ids[pos[found]] == ids[found]
+        pos = pos[found]
+        traces = self._sorted_traces[pos]
+        inds = self._sorted_inds[pos]
 
         with self._widget.batch_update():
             for idx, trace in enumerate(self._traces):
-                # Convert IDs to point indices
-                inds_map = self._ids_to_inds[idx]
-                trace_ids = per_trace_ids[idx]
-                trace_inds = [inds_map[_id] for _id in trace_ids]
-                if not trace_inds and deselect:
+                trace_inds = inds[traces == idx]
+                if not trace_inds.size and deselect:
                     trace_inds = None
 
                 # Select points in trace
@@ -9,14 +9,16 @@ import itertools
 import warnings
 
 import numpy as np
-import sklearn.linear_model as skl
-import sklearn.metrics as skm
 
 import eta.core.serial as etas
 import eta.core.utils as etau
 
 import fiftyone.core.expressions as foe
 import fiftyone.core.labels as fol
+import fiftyone.core.utils as fou
+
+skl = fou.lazy_import("sklearn.linear_model")
+skm = fou.lazy_import("sklearn.metrics")
 
 
 def parse_scatter_inputs(
@@ -89,6 +89,7 @@ class Client:
                                     "close_session",
                                     "reactivate_notebook_cell",
                                     "reload_session",
+                                    "state_patch",
                                     "state_update",
                                 ],
                                 initializer=state,
@@ -25,6 +25,7 @@ EventType = t.Union[
     "CloseSession",
     "DeactivateNotebookCell",
     "ReactivateNotebookCell",
+    "StatePatch",
     "StateUpdate",
 ]
 
@@ -93,12 +94,27 @@ class ReactivateNotebookCell(Event):
     subscription: str
 
 
+@dataclass
+class StatePatch(Event):
+    """State patch event
+
+    Contains only the attributes of the state description that changed, as
+    serialized by
+    :meth:`fiftyone.core.state.StateDescription.serialize_patch`. The
+    version is assigned by the server.
+    """
+
+    patch: t.Dict[str, t.Any]
+    version: t.Optional[int] = None
+
+
 @dataclass
 class StateUpdate(Event):
     """State update event"""
 
     state: fos.StateDescription
     refresh: bool = False
+    version: t.Optional[int] = None
 
 
 @dataclass
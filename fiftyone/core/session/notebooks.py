@@ -13,28 +13,26 @@ from jinja2 import Template
 
 from fiftyone.core.session.client import Client
 
-try:
-    import IPython.display
-except:
-    pass
-
 import fiftyone.core.context as focx
 import fiftyone.core.session.events as fose
 import fiftyone.core.session.templates as fost
+import fiftyone.core.utils as fou
+
+ipd = fou.lazy_import("IPython.display")
 
 
 @dataclass(frozen=True)
 class NotebookCell:
     address: str
     height: int
-    handle: "IPython.display.DisplayHandle"
+    handle: "ipd.DisplayHandle"
     port: int
     subscription: str
 
 
 def capture(cell: NotebookCell, data: fose.CaptureNotebookCell) -> None:
     cell.handle.update(
-        IPython.display.HTML(
+        ipd.HTML(
             fost.SCREENSHOT_HTML.render(
                 subscription=cell.subscription,
                 image=data.src,
@@ -69,7 +67,7 @@ def display_ipython(
     reactivate: bool = False,
     **kwargs: t.Dict[str, t.Union[str, bool]],
 ) -> None:
-    iframe = IPython.display.IFrame(
+    iframe = ipd.IFrame(
         focx.get_url(
             cell.address,
             cell.port,
@@ -120,13 +118,13 @@ def display_colab(
         height=cell.height, port=cell.port, subscription=cell.subscription
     )
 
-    cell.handle.display(IPython.display.HTML(html))
+    cell.handle.display(ipd.HTML(html))
     output.eval_js(script)
 
     def capture(img: str, width: int) -> None:
         with output.redirect_to_element(f"#focontainer-{cell.subscription}"):
-            IPython.display.display(
-                IPython.display.HTML(
+            ipd.display(
+                ipd.HTML(
                     f"<img src='{img}' style='width: 100%%; max-width: {width}px;'/>"
                 )
             )
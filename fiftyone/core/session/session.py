@@ -21,14 +21,10 @@ import typing as t
 import webbrowser
 from uuid import uuid4
 
-try:
-    import IPython.display
-except:
-    pass
-
 import eta.core.serial as etas
 
 import fiftyone as fo
+import fiftyone.core.odm as foo
 import fiftyone.core.odm.dataset as food
 import fiftyone.constants as focn
 import fiftyone.core.dataset as fod
@@ -47,10 +43,12 @@ from fiftyone.core.session.events import (
     CloseSession,
     DeactivateNotebookCell,
     ReactivateNotebookCell,
+    StatePatch,
     StateUpdate,
 )
 import fiftyone.core.session.notebooks as fosn
 
+ipd = fou.lazy_import("IPython.display")
 
 logger = logging.getLogger(__name__)
 
@@ -222,12 +220,18 @@ def close_app() -> None:
         _session = None
 
 
-def update_state(auto_show: bool = False) -> t.Callable:
+def update_state(
+    auto_show: bool = False, patch: t.Optional[t.Tuple[str, ...]] = None
+) -> t.Callable:
     """:class:`Session` method decorator for triggering state update events
 
     Args:
         auto_show (False): whether the method should show a new notebook App
             cell as well, if ``auto`` is ``True``
+        patch (None): an optional tuple of the only state attributes that the
+            method modifies. If provided, a :class:`StatePatch` event
+            containing only these attributes is sent rather than a full
+            :class:`StateUpdate` event
 
     Returns:
         the decorated method
@@ -241,7 +245,13 @@ def update_state(auto_show: bool = False) -> t.Callable:
             if auto_show and session.auto and focx.is_notebook_context():
                 session.freeze()
             result = func(session, *args, **kwargs)
-            session._client.send_event(StateUpdate(state=session._state))
+            if patch:
+                session._client.send_event(
+                    StatePatch(patch=session._state.serialize_patch(patch))
+                )
+            else:
+                session._client.send_event(StateUpdate(state=session._state))
+
             if auto_show and session.auto and focx.is_notebook_context():
                 session.show()
 
@@ -567,7 +577,7 @@ class Session(object):
         return self._state.config
 
     @config.setter  # type: ignore
-    @update_state()
+    @update_state(patch=("config",))
     def config(self, config: t.Optional[AppConfig]) -> None:
         if config is None:
             config = fo.app_config.copy()
@@ -586,7 +596,7 @@ class Session(object):
         return self._state.spaces
 
     @spaces.setter  # type: ignore
-    @update_state()
+    @update_state(patch=("spaces",))
     def spaces(self, spaces: t.Optional[Space]) -> None:
         if spaces is None:
             spaces = default_spaces.copy()
@@ -605,7 +615,7 @@ class Session(object):
         return self._state.color_scheme
 
     @color_scheme.setter  # type: ignore
-    @update_state()
+    @update_state(patch=("color_scheme",))
     def color_scheme(self, color_scheme: t.Optional[food.ColorScheme]) -> None:
         if color_scheme is None:
             color_scheme = build_color_scheme(None, self.dataset, self.config)
@@ -739,16 +749,16 @@ class Session(object):
         return list(self._state.selected)
 
     @selected.setter  # type: ignore
-    @update_state()
+    @update_state(patch=("selected",))
     def selected(self, sample_ids: t.List[str]) -> None:
         self._state.selected = list(sample_ids) if sample_ids else []
 
-    @update_state()
+    @update_state(patch=("selected",))
     def clear_selected(self) -> None:
         """Clears the currently selected samples, if any."""
         self._state.selected = []
 
-    @update_state()
+    @update_state(patch=("selected",))
     def select_samples(
         self,
         ids: t.Optional[t.Union[str, t.Iterable[str]]] = None,
@@ -783,11 +793,11 @@ class Session(object):
         return list(self._state.selected_labels)
 
     @selected_labels.setter  # type: ignore
-    @update_state()
+    @update_state(patch=("selected_labels",))
     def selected_labels(self, labels: dict) -> None:
         self._state.selected_labels = list(labels) if labels else []
 
-    @update_state()
+    @update_state(patch=("selected_labels",))
     def select_labels(
         self,
         labels: t.Optional[t.List[dict]] = None,
@@ -814,7 +824,7 @@ class Session(object):
 
         self._state.selected_labels = list(labels or [])
 
-    @update_state()
+    @update_state(patch=("selected_labels",))
     def clear_selected_labels(self) -> None:
         """Clears the currently selected labels, if any."""
         self._state.selected_labels = []
@@ -987,10 +997,8 @@ class Session(object):
             return
 
         if focx.is_notebook_context():
-            IPython.display.display(
-                IPython.display.Javascript(
-                    "window.open('{url}');".format(url=self.url)
-                )
+            ipd.display(
+                ipd.Javascript("window.open('{url}');".format(url=self.url))
             )
             return
 
@@ -1018,7 +1026,7 @@ class Session(object):
         uuid = str(uuid4())
         cell = fosn.NotebookCell(
             address=self.server_address,
-            handle=IPython.display.DisplayHandle(display_id=uuid),
+            handle=ipd.DisplayHandle(display_id=uuid),
             height=height,
             port=self.server_port,
             subscription=uuid,
@@ -1124,6 +1132,11 @@ def _attach_listeners(session: "Session"):
     )
     session._client.add_event_listener("state_update", on_state_update)
 
+    on_state_patch: t.Callable[[StatePatch], None] = lambda event: (
+        session._state.apply_patch(event.patch),
+    )
+    session._client.add_event_listener("state_patch", on_state_patch)
+
     if focx.is_notebook_context() and not focx.is_colab_context():
 
         def on_capture_notebook_cell(event: CaptureNotebookCell) -> None:
@@ -1189,6 +1202,10 @@ def import_desktop() -> None:
 def _register_session(session: Session) -> None:
     global _server_services  # pylint: disable=global-statement
     if session.server_port not in _server_services:
+        # The server inherits our database connection, so ensure that it has
+        # been established
+        foo.get_db_conn()
+
         _server_services[session.server_port] = fos.ServerService(
             session.server_port,
             address=session.server_address,
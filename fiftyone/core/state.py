@@ -124,6 +124,72 @@ class StateDescription(etas.Serializable):
 
             return d
 
+    def serialize_patch(self, attributes):
+        """Serializes only the given attributes of the state description.
+
+        Unlike :meth:`serialize`, this method does not serialize the dataset
+        or view, so it is cheap to call when only attributes like the current
+        selections have changed.
+
+        Args:
+            attributes: an iterable of attributes in
+                ``("config", "selected", "selected_labels", "spaces",
+                "color_scheme")``
+
+        Returns:
+            a JSON dictionary that can be passed to :meth:`apply_patch`
+        """
+        d = {}
+        for attr in attributes:
+            if attr not in _PATCH_ATTRIBUTES:
+                raise ValueError(
+                    "Unsupported state patch attribute '%s'; supported "
+                    "values are %s" % (attr, _PATCH_ATTRIBUTES)
+                )
+
+            value = getattr(self, attr)
+            if attr == "config":
+                d["config"] = value.serialize(reflective=True)
+                d["config"]["timezone"] = fo.config.timezone
+                d["colorscale"] = (
+                    value.get_colormap() if value.colorscale else None
+                )
+            elif attr in ("spaces", "color_scheme"):
+                d[attr] = value.to_json() if value is not None else None
+            else:
+                d[attr] = list(value)
+
+        return d
+
+    def apply_patch(self, d):
+        """Applies a patch generated by :meth:`serialize_patch` to the state
+        description.
+
+        Args:
+            d: a JSON dictionary
+        """
+        for attr, value in d.items():
+            if attr == "config":
+                # Settings are applied in-place, as in :meth:`from_dict`
+                for field, _value in value.items():
+                    setattr(self.config, field, _value)
+
+                fo.config.timezone = value.get("timezone", None)
+            elif attr == "spaces":
+                self.spaces = (
+                    Space.from_dict(json_util.loads(value))
+                    if value is not None
+                    else None
+                )
+            elif attr == "color_scheme":
+                self.color_scheme = (
+                    ColorScheme.from_dict(json_util.loads(value))
+                    if value
+                    else None
+                )
+            elif attr in ("selected", "selected_labels"):
+                setattr(self, attr, list(value))
+
     def attributes(self):
         return list(
             filter(
@@ -194,6 +260,15 @@ class StateDescription(etas.Serializable):
         )
 
 
+_PATCH_ATTRIBUTES = (
+    "config",
+    "selected",
+    "selected_labels",
+    "spaces",
+    "color_scheme",
+)
+
+
 @gql.type
 class SampleField:
     ftype: str
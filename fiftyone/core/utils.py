@@ -8,10 +8,12 @@ Core utilities.
 import typing as t
 import atexit
 from base64 import b64encode, b64decode
-from collections import defaultdict
+from collections import defaultdict, deque
 from contextlib import contextmanager
+import contextvars
 from copy import deepcopy
 from datetime import date, datetime
+import functools
 import glob
 import hashlib
 import importlib
@@ -20,6 +22,7 @@ import io
 import itertools
 import logging
 import multiprocessing
+import multiprocessing.dummy
 import os
 import platform
 import re
@@ -32,7 +35,6 @@ import timeit
 import types
 from xml.parsers.expat import ExpatError
 import zlib
-from matplotlib import colors as mcolors
 from concurrent.futures import ThreadPoolExecutor
 
 import asyncio
@@ -1489,6 +1491,79 @@ def iter_slices(sliceable, batch_size):
         yield chunk
 
 
+def iter_map(
+    fcn,
+    iterable,
+    num_workers=None,
+    chunksize=None,
+    max_prefetch=None,
+    use_threads=False,
+):
+    """Applies the given function to each element of an iterable, optionally
+    in a pool of workers, and yields the results in order.
+
+    When workers are used, results are computed ahead of consumption, but at
+    most ``max_prefetch`` chunks of ``chunksize`` elements are in flight at
+    any given time, so memory usage is bounded even when the consumer is
+    slower than the workers.
+
+    Args:
+        fcn: the function to apply. When using worker processes, this must be
+            picklable, i.e., a module-level function
+        iterable: an iterable of inputs
+        num_workers (None): the number of workers to use. If None or ``<= 1``,
+            the function is applied serially in the calling thread
+        chunksize (None): the number of inputs to send to a worker at a time.
+            By default, 1 when ``use_threads`` is True and 16 otherwise
+        max_prefetch (None): the maximum number of chunks to process ahead of
+            consumption. By default, ``2 * num_workers``
+        use_threads (False): whether to use a pool of threads (True) rather
+            than a pool of processes (False)
+
+    Returns:
+        a generator that emits the results
+    """
+    if num_workers is None or num_workers <= 1:
+        yield from map(fcn, iterable)
+        return
+
+    if chunksize is None:
+        chunksize = 1 if use_threads else 16
+
+    if max_prefetch is None:
+        max_prefetch = 2 * num_workers
+
+    if use_threads:
+        pool = multiprocessing.dummy.Pool(processes=num_workers)
+    else:
+        ctx = get_multiprocessing_context()
+        pool = ctx.Pool(processes=num_workers)
+
+    it = iter(iterable)
+    pending = deque()
+
+    def _submit():
+        chunk = list(itertools.islice(it, chunksize))
+        if chunk:
+            pending.append(pool.apply_async(_map_chunk, (fcn, chunk)))
+
+        return bool(chunk)
+
+    with pool:
+        for _ in range(max_prefetch):
+            if not _submit():
+                break
+
+        while pending:
+            results = pending.popleft().get()
+            _submit()
+            yield from results
+
+
+def _map_chunk(fcn, chunk):
+    return [fcn(arg) for arg in chunk]
+
+
 def call_on_exit(callback):
     """Registers the given callback function so that it will be called when the
     process exits for (almost) any reason
@@ -1887,16 +1962,40 @@ def to_slug(name):
 _T = t.TypeVar("_T")
 
 sync_task_executor = None
+_num_pending_sync_tasks = 0
 
 
 def get_sync_task_executor():
     global sync_task_executor
-    max_workers = fo.config.max_thread_pool_workers
-    if sync_task_executor is None and max_workers is not None:
-        sync_task_executor = ThreadPoolExecutor(max_workers=max_workers)
+    if sync_task_executor is None:
+        # When `max_workers` is None, the executor uses the same default
+        # number of workers as the event loop's default executor
+        sync_task_executor = ThreadPoolExecutor(
+            max_workers=fo.config.max_thread_pool_workers
+        )
     return sync_task_executor
 
 
+def get_sync_task_metrics():
+    """Returns metrics describing the thread pool that
+    :func:`run_sync_task` uses.
+
+    Returns:
+        a dict containing the maximum number of worker threads
+        (``max_workers``), the number of worker threads that have been started
+        (``num_threads``), the number of tasks that have been submitted but
+        have not finished (``pending_tasks``), and the number of tasks that are
+        waiting for a worker thread (``queue_depth``)
+    """
+    executor = get_sync_task_executor()
+    return {
+        "max_workers": executor._max_workers,
+        "num_threads": len(executor._threads),
+        "pending_tasks": _num_pending_sync_tasks,
+        "queue_depth": executor._work_queue.qsize(),
+    }
+
+
 async def run_sync_task(func: t.Callable[..., _T], *args: t.Any):
     """
     Run a synchronous function as an async background task
@@ -1904,9 +2003,21 @@ async def run_sync_task(func: t.Callable[..., _T], *args: t.Any):
     Args:
         run: a synchronous callable
     """
+    global _num_pending_sync_tasks
+
     loop = asyncio.get_running_loop()
 
-    return await loop.run_in_executor(get_sync_task_executor(), func, *args)
+    # Like `asyncio.to_thread()`, the task runs in a copy of the current
+    # context so that context variables are available to it
+    ctx = contextvars.copy_context()
+
+    _num_pending_sync_tasks += 1
+    try:
+        return await loop.run_in_executor(
+            get_sync_task_executor(), functools.partial(ctx.run, func, *args)
+        )
+    finally:
+        _num_pending_sync_tasks -= 1
 
 
 def validate_color(value):
@@ -1919,6 +2030,8 @@ def validate_color(value):
         ValueError: if ``value`` is not a valid css color name.
     """
 
+    from matplotlib import colors as mcolors
+
     if not etau.is_str(value) or not (
         value in mcolors.CSS4_COLORS
         or re.search(r"^#(?:[0-9a-fA-F]{3}){1,2}$", value)
@@ -161,9 +161,15 @@ class FramesView(fov.DatasetView):
 
         return sample_only_fields
 
-    def _tag_labels(self, tags, label_field, ids=None, label_ids=None):
+    def _tag_labels(
+        self, tags, label_field, ids=None, label_ids=None, progress=None
+    ):
         ids, label_ids = super()._tag_labels(
-            tags, label_field, ids=ids, label_ids=label_ids
+            tags,
+            label_field,
+            ids=ids,
+            label_ids=label_ids,
+            progress=progress,
         )
 
         frame_field = self._source_collection._FRAMES_PREFIX + label_field
@@ -171,9 +177,15 @@ class FramesView(fov.DatasetView):
             tags, frame_field, ids=ids, label_ids=label_ids
         )
 
-    def _untag_labels(self, tags, label_field, ids=None, label_ids=None):
+    def _untag_labels(
+        self, tags, label_field, ids=None, label_ids=None, progress=None
+    ):
         ids, label_ids = super()._untag_labels(
-            tags, label_field, ids=ids, label_ids=label_ids
+            tags,
+            label_field,
+            ids=ids,
+            label_ids=label_ids,
+            progress=progress,
         )
 
         frame_field = self._source_collection._FRAMES_PREFIX + label_field
@@ -319,8 +331,19 @@ class FramesView(fov.DatasetView):
             "_sample_id": sample._sample_id,
             "frame_number": sample.frame_number,
         }
+        update = {"$set": updates}
+
+        # Frames of sparse datasets are inserted on their first edit
+        upsert = dst_dataset.sparse_frames and any(
+            v is not None for k, v in updates.items() if k != "filepath"
+        )
+        if upsert:
+            update["$setOnInsert"] = {
+                "_id": ObjectId(sample.id),
+                "_dataset_id": dst_dataset._doc.id,
+            }
 
-        dst_dataset._frame_collection.update_one(match, {"$set": updates})
+        dst_dataset._frame_collection.update_one(match, update, upsert=upsert)
 
     def _sync_source(self, fields=None, ids=None, update=True, delete=False):
         dst_dataset = self._source_collection._root_dataset
@@ -374,10 +397,66 @@ class FramesView(fov.DatasetView):
 
             self._frames_dataset._aggregate(pipeline=pipeline)
 
+            if dst_dataset.sparse_frames:
+                self._sync_source_sparse(fields=fields, ids=ids)
+
         if delete:
             frame_ids = self._frames_dataset.exclude(self).values("id")
             dst_dataset._clear_frames(frame_ids=frame_ids)
 
+    def _sync_source_sparse(self, fields=None, ids=None):
+        # Sparse datasets only store frames that contain data, so frames that
+        # were populated in this view may need to be inserted
+        dst_dataset = self._source_collection._root_dataset
+        sample_only_fields = self._get_sample_only_fields(
+            include_private=True, use_db_fields=True
+        )
+
+        if fields is None:
+            schema = self._frames_dataset.get_field_schema(
+                include_private=True
+            )
+            fields = [
+                f
+                for f in self._frames_dataset._handle_db_fields(schema.keys())
+                if f not in sample_only_fields
+            ]
+
+        # All frames have filepaths, so they don't count as data
+        data_fields = [f for f in fields if f != "filepath"]
+        if not data_fields:
+            return
+
+        pipeline = []
+
+        if ids is not None:
+            pipeline.append(
+                {"$match": {"_id": {"$in": [ObjectId(_id) for _id in ids]}}}
+            )
+
+        project = {f: True for f in fields}
+        project["_id"] = True
+        project["_sample_id"] = True
+        project["frame_number"] = True
+
+        pipeline.extend(
+            [
+                {"$match": {"$or": [{f: {"$ne": None}} for f in data_fields]}},
+                {"$project": project},
+                {"$addFields": {"_dataset_id": dst_dataset._doc.id}},
+                {
+                    "$merge": {
+                        "into": dst_dataset._frame_collection_name,
+                        "on": ["_sample_id", "frame_number"],
+                        "whenMatched": "keepExisting",
+                        "whenNotMatched": "insert",
+                    }
+                },
+            ]
+        )
+
+        self._frames_dataset._aggregate(pipeline=pipeline)
+
     def _sync_source_field_schema(self, path):
         field = self.get_field(path)
         if field is None:
@@ -744,6 +823,7 @@ def _init_frames(
 
     src_dataset = src_collection._root_dataset
     is_clips = src_collection._dataset._is_clips
+    sparse_frames = src_dataset.sparse_frames
     if src_collection.has_frame_field("filepath"):
         view = src_collection.select_fields("frames.filepath")
     else:
@@ -864,7 +944,11 @@ def _init_frames(
             _rand = foos._generate_rand(_filepath)
             _dataset_id = dataset._doc.id
 
-            if missing_fps is not None and fn in missing_fps:
+            if (
+                missing_fps is not None
+                and fn in missing_fps
+                and (_id is not None or not sparse_frames)
+            ):
                 missing_filepaths.append((_sample_id, fn, _filepath))
 
             if sample_frames == "dynamic":
@@ -887,6 +971,11 @@ def _init_frames(
 
             if _id is not None:
                 doc["_id"] = _id
+            elif sparse_frames:
+                # The source collection only stores frames that contain data,
+                # so we allocate an ID here that will be used to insert the
+                # source frame if it is ever edited via the frames view
+                doc["_id"] = ObjectId()
             elif missing_docs is not None and fn in missing_docs:
                 # Found a frame that we want to include in the frames dataset
                 # whose image is already sampled but for which there is no
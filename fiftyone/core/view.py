@@ -439,7 +439,13 @@ class DatasetView(foc.SampleCollection):
         """
         return copy(self)
 
-    def iter_samples(self, progress=False, autosave=False, batch_size=None):
+    def iter_samples(
+        self,
+        progress=False,
+        autosave=False,
+        batch_size=None,
+        async_writes=False,
+    ):
         """Returns an iterator over the samples in the view.
 
         Examples::
@@ -481,6 +487,8 @@ class DatasetView(foc.SampleCollection):
             batch_size (None): a batch size to use when autosaving samples. Can
                 either be an integer specifying the number of samples to save
                 in a batch, or a float number of seconds between batched saves
+            async_writes (False): whether to write autosaved batches to the
+                database in a background thread while iteration continues
 
         Returns:
             an iterator over :class:`fiftyone.core.sample.SampleView` instances
@@ -494,7 +502,9 @@ class DatasetView(foc.SampleCollection):
                 samples = pb(samples)
 
             if autosave:
-                save_context = foc.SaveContext(self, batch_size=batch_size)
+                save_context = foc.SaveContext(
+                    self, batch_size=batch_size, async_writes=async_writes
+                )
                 exit_context.enter_context(save_context)
 
             for sample in samples:
@@ -551,6 +561,7 @@ class DatasetView(foc.SampleCollection):
         progress=False,
         autosave=False,
         batch_size=None,
+        async_writes=False,
     ):
         """Returns an iterator over the groups in the view.
 
@@ -597,6 +608,8 @@ class DatasetView(foc.SampleCollection):
             batch_size (None): a batch size to use when autosaving samples. Can
                 either be an integer specifying the number of samples to save
                 in a batch, or a float number of seconds between batched saves
+            async_writes (False): whether to write autosaved batches to the
+                database in a background thread while iteration continues
 
         Returns:
             an iterator that emits dicts mapping slice names to
@@ -619,7 +632,9 @@ class DatasetView(foc.SampleCollection):
                 groups = pb(groups)
 
             if autosave:
-                save_context = foc.SaveContext(self, batch_size=batch_size)
+                save_context = foc.SaveContext(
+                    self, batch_size=batch_size, async_writes=async_writes
+                )
                 exit_context.enter_context(save_context)
 
             for group in groups:
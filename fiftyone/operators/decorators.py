@@ -6,15 +6,15 @@ FiftyOne operator decorators.
 |
 """
 import asyncio
-import glob
-
-from cachetools.keys import hashkey
 from contextlib import contextmanager
 from functools import wraps
 import signal
 import os
 
-import fiftyone as fo
+
+# JS dependencies and builds, which do not affect the Python operators
+_IGNORED_PLUGIN_DIRS = {"__pycache__", "dist", "node_modules"}
+_PLUGIN_METADATA_FILENAMES = {"fiftyone.yaml", "fiftyone.yml"}
 
 
 def coroutine_timeout(seconds):
@@ -55,40 +55,41 @@ def raise_timeout_error(seconds):
     raise TimeoutError(f"Timeout occurred after {seconds} seconds") from None
 
 
-cache = {}
-dir_cache = {"state": None}
-
-
-def plugins_cache(func):
-    """Decorator that returns cached function results as long as no
-    subdirectories of ``fo.config.plugins_dir`` have been modified since last
-    time.
-    """
-
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        if not fo.config.plugins_cache_enabled:
-            return func(*args, **kwargs)
-
-        curr_dir_state = dir_state(fo.config.plugins_dir)
-        if curr_dir_state != dir_cache["state"]:
-            cache.clear()
-            dir_cache["state"] = curr_dir_state
+def plugin_dir_state(dirpath):
+    """Returns a fingerprint of the given plugin directory that changes
+    whenever its ``fiftyone.yml`` or any of its Python files are added,
+    removed, or modified.
 
-        key = hashkey(func, *args, **kwargs)
-        if key not in cache:
-            cache[key] = func(*args, **kwargs)
+    Hidden directories and JS build directories like ``node_modules`` and
+    ``dist`` are not traversed.
 
-        return cache[key]
+    Args:
+        dirpath: the plugin directory
 
-    return wrapper
-
-
-def dir_state(dirpath):
+    Returns:
+        a hashable state, or None if the directory does not exist
+    """
     if not os.path.isdir(dirpath):
         return None
-    # use glob instead of os.listdir to ignore hidden files (eg .DS_STORE)
-    return max(
-        (os.path.getmtime(f) for f in glob.glob(os.path.join(dirpath, "*"))),
-        default=None,
-    )
+
+    state = []
+    for root, dirs, files in os.walk(dirpath, followlinks=True):
+        dirs[:] = sorted(
+            d
+            for d in dirs
+            if not d.startswith(".") and d not in _IGNORED_PLUGIN_DIRS
+        )
+        for filename in sorted(files):
+            if not filename.endswith(".py") and (
+                root != dirpath or filename not in _PLUGIN_METADATA_FILENAMES
+            ):
+                continue
+
+            filepath = os.path.join(root, filename)
+            try:
+                stat = os.stat(filepath)
+                state.append((filepath, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                continue
+
+    return tuple(state)
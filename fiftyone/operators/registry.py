@@ -5,9 +5,21 @@ FiftyOne operator registry.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
-from .builtin import BUILTIN_OPERATORS
+import threading
+
+import fiftyone as fo
+import fiftyone.plugins as fop
 import fiftyone.plugins.context as fopc
 
+from .builtin import BUILTIN_OPERATORS
+from .decorators import plugin_dir_state
+
+
+# Maps ``enabled`` values to ``(key, plugin_contexts, operators_map)`` tuples
+# when ``fo.config.plugins_cache_enabled`` is True
+_registry_cache = {}
+_registry_lock = threading.Lock()
+
 
 def get_operator(operator_uri):
     """Gets the operator with the given URI.
@@ -48,7 +60,7 @@ class OperatorRegistry(object):
     """
 
     def __init__(self, enabled=True):
-        self.plugin_contexts = fopc.build_plugin_contexts(enabled=enabled)
+        self.plugin_contexts, self._operators_map = _load_operators(enabled)
 
     def list_operators(self, include_builtin=True):
         """Lists the available FiftyOne operators.
@@ -89,11 +101,7 @@ class OperatorRegistry(object):
         Returns:
             True/False
         """
-        for operator in self.list_operators():
-            if operator_uri == operator.uri:
-                return True
-
-        return False
+        return operator_uri in self._operators_map
 
     def can_execute(self, operator_uri):
         """Whether the operator can be executed.
@@ -115,8 +123,47 @@ class OperatorRegistry(object):
         Returns:
             an :class:`fiftyone.operators.Operator`, or None
         """
-        for operator in self.list_operators():
-            if operator_uri == operator.uri:
-                return operator
+        return self._operators_map.get(operator_uri, None)
+
+
+def _load_operators(enabled):
+    plugin_definitions = fop.list_plugins(enabled=enabled)
+
+    if not fo.config.plugins_cache_enabled:
+        plugin_contexts = fopc._build_plugin_contexts(plugin_definitions)
+        return plugin_contexts, _make_operators_map(plugin_contexts)
+
+    # Registries are rebuilt only when the set of plugins or their files change
+    states = [plugin_dir_state(pd.directory) for pd in plugin_definitions]
+    key = (
+        fopc._plugin_contexts_generation,
+        tuple(pd.directory for pd in plugin_definitions),
+        tuple(states),
+    )
+
+    with _registry_lock:
+        entry = _registry_cache.get(enabled, None)
+        if entry is not None and entry[0] == key:
+            return entry[1], entry[2]
+
+    plugin_contexts = fopc._build_plugin_contexts(
+        plugin_definitions, states=states
+    )
+    operators_map = _make_operators_map(plugin_contexts)
+
+    with _registry_lock:
+        _registry_cache[enabled] = (key, plugin_contexts, operators_map)
+
+    return plugin_contexts, operators_map
+
+
+def _make_operators_map(plugin_contexts):
+    operators_map = {}
+    for pctx in plugin_contexts:
+        for operator in pctx.instances:
+            operators_map.setdefault(operator.uri, operator)
+
+    for operator in BUILTIN_OPERATORS:
+        operators_map.setdefault(operator.uri, operator)
 
-        return None
+    return operators_map
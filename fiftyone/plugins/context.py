@@ -9,12 +9,13 @@ import importlib
 import logging
 import os
 import sys
+import threading
 import traceback
 
 import fiftyone as fo
 import fiftyone.plugins as fop
 
-from fiftyone.operators.decorators import plugins_cache
+from fiftyone.operators.decorators import plugin_dir_state
 from fiftyone.operators.operator import Operator
 
 
@@ -22,11 +23,22 @@ logger = logging.getLogger(__name__)
 
 INIT_FILENAME = "__init__.py"
 
+# Maps plugin directories to ``(state, PluginContext)`` tuples
+_plugin_contexts_cache = {}
+_plugin_contexts_lock = threading.Lock()
+
+# Incremented whenever the cache is cleared, so that dependent caches can
+# detect that all plugins must be reloaded
+_plugin_contexts_generation = 0
+
 
-@plugins_cache
 def build_plugin_contexts(enabled=True):
     """Returns contexts for all available plugins.
 
+    When ``fo.config.plugins_cache_enabled`` is True, the contexts are cached
+    per plugin and a plugin is only reloaded when its ``fiftyone.yml`` or
+    Python files have changed.
+
     Args:
         enabled (True): whether to include only enabled plugins (True) or only
             disabled plugins (False) or all plugins ("all")
@@ -34,13 +46,51 @@ def build_plugin_contexts(enabled=True):
     Returns:
         a list of :class:`PluginContext` instances
     """
-    plugin_contexts = []
-    for pd in fop.list_plugins(enabled=enabled):
-        pctx = PluginContext(pd)
-        pctx.register_all()
-        plugin_contexts.append(pctx)
+    return _build_plugin_contexts(fop.list_plugins(enabled=enabled))
+
+
+def clear_plugin_contexts_cache():
+    """Clears the cache of plugin contexts so that all plugins are reloaded
+    the next time :func:`build_plugin_contexts` is called.
+    """
+    global _plugin_contexts_generation
+
+    with _plugin_contexts_lock:
+        _plugin_contexts_cache.clear()
+        _plugin_contexts_generation += 1
+
+
+def _build_plugin_contexts(plugin_definitions, states=None):
+    if not fo.config.plugins_cache_enabled:
+        return [_load_plugin_context(pd) for pd in plugin_definitions]
+
+    if states is None:
+        states = [plugin_dir_state(pd.directory) for pd in plugin_definitions]
+
+    with _plugin_contexts_lock:
+        return [
+            _get_plugin_context(pd, state)
+            for pd, state in zip(plugin_definitions, states)
+        ]
+
+
+def _get_plugin_context(plugin_definition, state):
+    directory = plugin_definition.directory
+
+    entry = _plugin_contexts_cache.get(directory, None)
+    if entry is not None and entry[0] == state:
+        return entry[1]
+
+    pctx = _load_plugin_context(plugin_definition)
+    _plugin_contexts_cache[directory] = (state, pctx)
+
+    return pctx
+
 
-    return plugin_contexts
+def _load_plugin_context(plugin_definition):
+    pctx = PluginContext(plugin_definition)
+    pctx.register_all()
+    return pctx
 
 
 class PluginContext(object):
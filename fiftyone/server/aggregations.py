@@ -21,6 +21,7 @@ import fiftyone.core.view as fov
 from fiftyone.server.constants import LIST_LIMIT
 from fiftyone.server.filters import GroupElementFilter, SampleFilter
 from fiftyone.server.inputs import SelectedLabel
+import fiftyone.server.metrics as fosmt
 from fiftyone.server.scalars import BSON, BSONArray
 from fiftyone.server.utils import from_dict, meets_type
 import fiftyone.server.view as fosv
@@ -112,7 +113,7 @@ async def aggregate_resolver(
     if not form.dataset:
         raise ValueError("Aggregate form missing dataset")
 
-    view = fosv.get_view(
+    view = await fosv.get_async_view(
         form.dataset,
         view_name=form.view_name or None,
         stages=form.view,
@@ -155,7 +156,8 @@ async def aggregate_resolver(
     # TODO: stop aggregate resolver from being called for non-existent fields,
     #  but fail silently for now by just returning empty results
     try:
-        result = await view._async_aggregate(flattened)
+        with fosmt.span("aggregate"):
+            result = await view._async_aggregate(flattened)
     except:
         return []
 
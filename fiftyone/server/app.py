@@ -27,7 +27,8 @@ import strawberry as gql
 import fiftyone as fo
 import fiftyone.constants as foc
 from fiftyone.server.context import GraphQL
-from fiftyone.server.extensions import EndSession
+from fiftyone.server.extensions import EndSession, Metrics
+import fiftyone.server.metrics as fosmt
 from fiftyone.server.mutation import Mutation
 from fiftyone.server.query import Query
 from fiftyone.server.routes import routes
@@ -36,6 +37,9 @@ from fiftyone.server.scalars import Date, DateTime
 
 etau.ensure_dir(os.path.join(os.path.dirname(__file__), "static"))
 
+if fo.config.server_metrics:
+    fosmt.enable()
+
 
 class Static(StaticFiles):
     async def get_response(self, path: str, scope: Scope) -> Response:
@@ -65,7 +69,7 @@ class HeadersMiddleware(BaseHTTPMiddleware):
 schema = gql.Schema(
     mutation=Mutation,
     query=Query,
-    extensions=[EndSession],
+    extensions=[EndSession, Metrics],
     scalar_overrides={
         date: Date,
         datetime: DateTime,
@@ -75,6 +79,7 @@ schema = gql.Schema(
 
 app = Starlette(
     middleware=[
+        Middleware(fosmt.MetricsMiddleware),
         Middleware(
             CORSMiddleware,
             allow_origins=["*"],
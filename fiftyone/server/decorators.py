@@ -12,6 +12,7 @@ import logging
 from bson import json_util
 
 from fiftyone.core.utils import run_sync_task
+import fiftyone.server.metrics as fosmt
 
 from starlette.endpoints import HTTPEndpoint
 from starlette.responses import JSONResponse, Response
@@ -30,9 +31,12 @@ def route(func):
             if isinstance(response, Response):
                 return response
 
-            return Response(
-                await run_sync_task(lambda: json_util.dumps(response))
-            )
+            with fosmt.span("serialize"):
+                content = await run_sync_task(
+                    lambda: json_util.dumps(response)
+                )
+
+            return Response(content)
         except Exception as e:
             logging.exception(e)
             return JSONResponse(
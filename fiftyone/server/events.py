@@ -6,7 +6,7 @@ FiftyOne Server events.
 |
 """
 from collections import defaultdict
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, replace
 import typing as t
 from datetime import datetime
 
@@ -26,6 +26,7 @@ from fiftyone.core.session.events import (
     dict_factory,
     EventType,
     ListenPayload,
+    StatePatch,
     StateUpdate,
 )
 import fiftyone.core.state as fos
@@ -38,12 +39,24 @@ class Listener:
     subscription: str
 
 
+@dataclass(frozen=True)
+class DispatchedEvent:
+    timestamp: datetime
+    event: EventType
+    data: t.Optional[str]
+    subscription: t.Optional[str] = None
+
+
+_MAX_QUEUE_SIZE = 1000
+
+
 _listeners: t.Dict[str, t.Set[Listener]] = defaultdict(set)
 _requests: t.Dict[str, t.Set[t.Tuple[str, Listener]]] = {}
 _polling_listener: t.Optional[
     t.Tuple[str, t.Set[t.Tuple[str, Listener]]]
 ] = None
 _state: t.Optional[fos.StateDescription] = None
+_state_version = 0
 _app_count = 0
 
 
@@ -60,18 +73,21 @@ async def dispatch_event(
         add_screenshot(event)
         return
 
-    if isinstance(event, StateUpdate):
-        global _state
-        _state = event.state
+    if isinstance(event, (StatePatch, StateUpdate)):
+        event = _update_state(event)
 
     if isinstance(event, ReactivateNotebookCell):
         await dispatch_event(subscription, DeactivateNotebookCell())
 
-    for listener in _listeners[event.get_event_name()]:
-        if listener.subscription == subscription:
-            continue
+    _enqueue_event(subscription, event)
 
-        listener.queue.put_nowait((datetime.now(), event))
+    if isinstance(event, StatePatch):
+        # Listeners that do not handle patches are sent the full state
+        _enqueue_event(
+            subscription,
+            StateUpdate(state=_state, version=event.version),
+            exclude=_listeners[StatePatch.get_event_name()],
+        )
 
 
 async def add_event_listener(
@@ -87,53 +103,58 @@ async def add_event_listener(
         A server sent event source
     """
     data = await _initialize_listener(payload)
+    queue = data.listener.queue
+    version = _state_version
+
+    # Disconnects cancel this generator, so there is no need to poll
     try:
         if data.is_app:
             yield ServerSentEvent(
                 event=StateUpdate.get_event_name(),
-                data=json_util.dumps(
-                    asdict(
-                        StateUpdate(state=data.state.serialize()),
-                        dict_factory=dict_factory,
-                    )
+                data=_serialize_event(
+                    StateUpdate(state=data.state, version=version)
                 ),
             )
 
         while True:
-            disconnected = await request.is_disconnected()
-            if disconnected:
-                await _disconnect(
-                    data.is_app,
-                    data.request_listeners,
-                )
-                break
-
-            events: t.List[t.Tuple[datetime, EventType]] = []
-            for _, listener in data.request_listeners:
-                if listener.queue.qsize():
-                    events.append(listener.queue.get_nowait())
+            # Events that arrive together are sent in a batch
+            events = [await queue.get()]
+            while not queue.empty():
+                events.append(queue.get_nowait())
+
+            for dispatched in events:
+                event = dispatched.event
+                if isinstance(event, (StatePatch, StateUpdate)):
+                    if event.version <= version:
+                        # Already included in a full state sync
+                        continue
+
+                    if (
+                        isinstance(event, StatePatch)
+                        and event.version != version + 1
+                    ):
+                        # A state event was dropped, so the listener cannot
+                        # apply the patch and must sync the full state
+                        version = _state_version
+                        yield ServerSentEvent(
+                            event=StateUpdate.get_event_name(),
+                            data=_serialize_event(
+                                StateUpdate(state=get_state(), version=version)
+                            ),
+                        )
+                        continue
 
-            events = sorted(events, key=lambda event: event[0])
+                    version = event.version
 
-            for _, event in events:
-                if isinstance(event, StateUpdate):
-                    # we copy here as this is a shared object
-                    event = StateUpdate(
-                        state=event.state.serialize(), refresh=event.refresh
-                    )
+                if dispatched.subscription == data.listener.subscription:
+                    continue
 
                 yield ServerSentEvent(
-                    event=event.get_event_name(),
-                    data=json_util.dumps(
-                        asdict(event, dict_factory=dict_factory)
-                    ),
+                    event=dispatched.event.get_event_name(),
+                    data=dispatched.data,
                 )
-
-            await asyncio.sleep(0.2)
-
-    except asyncio.CancelledError as e:
+    finally:
         await _disconnect(data.is_app, data.request_listeners)
-        raise e
 
 
 async def dispatch_polling_event_listener(
@@ -176,27 +197,29 @@ async def dispatch_polling_event_listener(
             ]
         }
 
-    events: t.List[t.Tuple[datetime, EventType]] = []
+    events: t.List[DispatchedEvent] = []
     disconnect = False
     for _, listener in _requests[payload.subscription]:
-        while listener.queue.qsize():
-            event_tuple = listener.queue.get_nowait()
-            if isinstance(event_tuple[1], DeactivateNotebookCell):
+        while not listener.queue.empty():
+            dispatched = listener.queue.get_nowait()
+            if dispatched.subscription == payload.subscription:
+                continue
+
+            if isinstance(dispatched.event, DeactivateNotebookCell):
                 disconnect = True
 
-            events.append(event_tuple)
+            events.append(dispatched)
 
     if disconnect:
         del _requests[payload.subscription]
 
-    events = sorted(events, key=lambda event: event[0])
     return {
         "events": [
             {
-                "event": e.get_event_name(),
-                "data": asdict(e, dict_factory=dict_factory),
+                "event": d.event.get_event_name(),
+                "data": asdict(d.event, dict_factory=dict_factory),
             }
-            for (_, e) in events
+            for d in events
         ],
     }
 
@@ -216,11 +239,79 @@ def get_state() -> fos.StateDescription:
     return _state
 
 
+def _update_state(
+    event: t.Union[StatePatch, StateUpdate]
+) -> t.Union[StatePatch, StateUpdate]:
+    global _state
+    global _state_version
+    _state_version += 1
+
+    if isinstance(event, StatePatch):
+        get_state().apply_patch(event.patch)
+    else:
+        _state = event.state
+
+    return replace(event, version=_state_version)
+
+
+def _serialize_event(event: EventType) -> str:
+    if isinstance(event, StateUpdate):
+        # we copy here as this is a shared object
+        event = StateUpdate(
+            state=event.state.serialize(),
+            refresh=event.refresh,
+            version=event.version,
+        )
+
+    return json_util.dumps(asdict(event, dict_factory=dict_factory))
+
+
+def _enqueue_event(
+    subscription: t.Optional[str],
+    event: EventType,
+    exclude: t.Optional[t.Set[Listener]] = None,
+) -> None:
+    is_state = isinstance(event, (StatePatch, StateUpdate))
+
+    listeners = []
+    is_sent = False
+    for listener in _listeners[event.get_event_name()]:
+        if exclude and listener in exclude:
+            continue
+
+        if listener.subscription != subscription:
+            is_sent = True
+        elif not is_state:
+            continue
+
+        # State events are also enqueued, but not sent, to their sender so
+        # that the state versions seen by each listener stay in order
+        listeners.append(listener)
+
+    if not listeners:
+        return
+
+    # The event is serialized once and shared by all listeners
+    dispatched = DispatchedEvent(
+        timestamp=datetime.now(),
+        event=event,
+        data=_serialize_event(event) if is_sent else None,
+        subscription=subscription,
+    )
+
+    for listener in listeners:
+        if listener.queue.full():
+            # Drop the oldest event of a listener that is not consuming them
+            listener.queue.get_nowait()
+
+        listener.queue.put_nowait(dispatched)
+
+
 async def _disconnect(
     is_app: bool, listeners: t.Set[t.Tuple[str, Listener]]
 ) -> None:
     for event_name, listener in listeners:
-        _listeners[event_name].remove(listener)
+        _listeners[event_name].discard(listener)
 
     if is_app:
         global _app_count
@@ -233,6 +324,7 @@ async def _disconnect(
 @dataclass
 class InitializedListener:
     is_app: bool
+    listener: Listener
     request_listeners: t.Set[t.Tuple[str, Listener]]
     state: fos.StateDescription
 
@@ -304,19 +396,20 @@ async def _initialize_listener(payload: ListenPayload) -> InitializedListener:
         state = payload.initializer
         await dispatch_event(payload.subscription, StateUpdate(state))
 
+    # All events of the request are fanned into a single queue
+    listener = Listener(
+        queue=asyncio.Queue(maxsize=_MAX_QUEUE_SIZE),
+        subscription=payload.subscription,
+    )
     request_listeners: t.Set[t.Tuple[str, Listener]] = set()
     for event_name in payload.events:
-        listener = Listener(
-            queue=asyncio.LifoQueue(maxsize=1000),
-            subscription=payload.subscription,
-        )
         _listeners[event_name].add(listener)
         request_listeners.add((event_name, listener))
 
     global _requests
     _requests[payload.subscription] = request_listeners
 
-    return InitializedListener(is_app, request_listeners, state)
+    return InitializedListener(is_app, listener, request_listeners, state)
 
 
 _PORT = None
@@ -5,12 +5,15 @@ FiftyOne Server extensions
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import time
 import traceback
 
 from graphql import GraphQLError
 from strawberry.extensions import Extension
 from strawberry.utils.await_maybe import AwaitableOrValue
 
+import fiftyone.server.metrics as fosmt
+
 
 class EndSession(Extension):
     async def on_request_end(self) -> AwaitableOrValue[None]:
@@ -30,3 +33,18 @@ class EndSession(Extension):
                 )
                 for error in result.errors
             ]
+
+
+class Metrics(Extension):
+    def on_request_start(self) -> AwaitableOrValue[None]:
+        self._start = time.perf_counter()
+
+    def on_request_end(self) -> AwaitableOrValue[None]:
+        if not fosmt.is_enabled():
+            return
+
+        fosmt.observe(
+            "fiftyone_server_graphql_seconds",
+            time.perf_counter() - self._start,
+            operation=self.execution_context.operation_name or "",
+        )
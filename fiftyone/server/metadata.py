@@ -11,17 +11,23 @@ import shutil
 import struct
 import typing as t
 
-from functools import reduce
+from functools import partial, reduce
 
 import asyncio
 import aiofiles
+import aiofiles.os
+import cachetools
 import strawberry as gql
 
 import eta.core.serial as etas
 import eta.core.utils as etau
 import eta.core.video as etav
+
+import fiftyone as fo
 import fiftyone.core.labels as fol
 from fiftyone.core.collections import SampleCollection
+import fiftyone.core.metadata as fomd
+import fiftyone.core.odm as foo
 from fiftyone.utils.utils3d import OrthographicProjectionMetadata
 
 import fiftyone.core.media as fom
@@ -35,6 +41,12 @@ _ADDITIONAL_MEDIA_FIELDS = {
 }
 _FFPROBE_BINARY_PATH = shutil.which("ffprobe")
 
+# Media probe results, keyed by ``(path, mtime)``, shared by all requests
+_probe_cache = cachetools.LRUCache(maxsize=10000)
+_pending_probes = {}
+_probe_limit = None
+_pending_writes = set()
+
 
 @gql.enum
 class MediaType(Enum):
@@ -101,8 +113,8 @@ async def get_metadata(
 
     if filepath not in metadata_cache:
         try:
-            # Retrieve media metadata from disk
-            metadata_cache[filepath] = await read_metadata(
+            # Retrieve media metadata from disk, unless it was already probed
+            metadata_cache[filepath], doc = await _get_probe_result(
                 filepath_source, is_video
             )
         except Exception as exc:
@@ -116,6 +128,15 @@ async def get_metadata(
                 metadata_cache[filepath] = dict(aspect_ratio=1, frame_rate=30)
             else:
                 metadata_cache[filepath] = dict(aspect_ratio=1)
+        else:
+            if (
+                doc is not None
+                and not metadata
+                and fo.config.server_write_metadata
+                and filepath_source == sample["filepath"]
+                and not collection._is_generated
+            ):
+                _write_metadata(collection, sample["_id"], doc)
 
     return dict(urls=urls, **metadata_cache[filepath])
 
@@ -130,16 +151,15 @@ async def read_metadata(filepath, is_video):
     Returns:
         dict
     """
-    if is_video:
-        info = await get_stream_info(filepath)
-        return dict(
-            aspect_ratio=info.frame_size[0] / info.frame_size[1],
-            frame_rate=info.frame_rate,
-        )
+    metadata, _ = await _probe(filepath, is_video)
+    return metadata
 
-    async with aiofiles.open(filepath, "rb") as f:
-        width, height = await get_image_dimensions(f)
-        return dict(aspect_ratio=width / height)
+
+def clear_metadata_cache():
+    """Clears the process-wide cache of media metadata that was read from
+    disk.
+    """
+    _probe_cache.clear()
 
 
 class Reader(object):
@@ -377,6 +397,112 @@ class FFmpegNotFoundException(RuntimeError):
     pass
 
 
+async def _get_probe_result(filepath, is_video):
+    try:
+        stat = await aiofiles.os.stat(filepath)
+        size_bytes, mtime = stat.st_size, stat.st_mtime_ns
+    except (OSError, ValueError):
+        # Non-local paths, e.g. URLs, are cached by path only
+        size_bytes, mtime = None, None
+
+    key = (filepath, is_video, mtime)
+    result = _probe_cache.get(key, None)
+    if result is not None:
+        return result
+
+    # Concurrent requests for the same file share a single probe
+    task = _pending_probes.get(key, None)
+    if task is None:
+        task = asyncio.ensure_future(
+            _limited_probe(filepath, is_video, size_bytes)
+        )
+        task.add_done_callback(partial(_on_probe_done, key))
+        _pending_probes[key] = task
+
+    return await asyncio.shield(task)
+
+
+async def _limited_probe(filepath, is_video, size_bytes):
+    async with _get_probe_limit():
+        return await _probe(filepath, is_video, size_bytes=size_bytes)
+
+
+def _get_probe_limit():
+    # Semaphores are bound to the event loop in which they are first used
+    global _probe_limit
+
+    loop = asyncio.get_running_loop()
+    limit = max(fo.config.server_max_media_probes or 1, 1)
+    if _probe_limit is None or _probe_limit[:2] != (loop, limit):
+        _probe_limit = loop, limit, asyncio.Semaphore(limit)
+
+    return _probe_limit[2]
+
+
+def _on_probe_done(key, task):
+    _pending_probes.pop(key, None)
+    if task.cancelled():
+        return
+
+    # Failures are not cached, so that files can be fixed while the App runs
+    if task.exception() is None:
+        _probe_cache[key] = task.result()
+
+
+async def _probe(filepath, is_video, size_bytes=None):
+    if is_video:
+        info = await get_stream_info(filepath)
+        metadata = dict(
+            aspect_ratio=info.frame_size[0] / info.frame_size[1],
+            frame_rate=info.frame_rate,
+        )
+        doc = fomd.VideoMetadata(
+            size_bytes=info.size_bytes,
+            mime_type=info.mime_type,
+            frame_width=info.frame_size[0],
+            frame_height=info.frame_size[1],
+            frame_rate=info.frame_rate,
+            total_frame_count=info.total_frame_count,
+            duration=info.duration,
+            encoding_str=info.encoding_str,
+        )
+        return metadata, doc.to_dict()
+
+    async with aiofiles.open(filepath, "rb") as f:
+        width, height = await get_image_dimensions(f)
+
+    if width <= 0 or height <= 0:
+        return dict(aspect_ratio=1), None
+
+    metadata = dict(aspect_ratio=width / height)
+
+    doc = fomd.ImageMetadata(
+        size_bytes=size_bytes,
+        mime_type=etau.guess_mime_type(filepath),
+        width=width,
+        height=height,
+    )
+    return metadata, doc.to_dict()
+
+
+def _write_metadata(collection, sample_id, doc):
+    # Writes happen in the background so that they never delay a response
+    coll = foo.get_async_db_conn()[collection._dataset._sample_collection_name]
+    task = asyncio.ensure_future(
+        coll.update_one(
+            {"_id": sample_id, "metadata": None}, {"$set": {"metadata": doc}}
+        )
+    )
+    _pending_writes.add(task)
+    task.add_done_callback(_on_write_done)
+
+
+def _on_write_done(task):
+    _pending_writes.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("Failed to write metadata", exc_info=task.exception())
+
+
 def _create_media_urls(
     collection: SampleCollection,
     sample: t.Dict,
@@ -0,0 +1,289 @@
+"""
+FiftyOne Server metrics
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+from collections import defaultdict
+import contextlib
+import contextvars
+import hashlib
+import logging
+import threading
+import time
+
+from bson import json_util
+from pymongo import monitoring
+
+import fiftyone as fo
+import fiftyone.core.utils as fou
+
+
+logger = logging.getLogger(__name__)
+
+_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+_PIPELINE_COMMANDS = {"aggregate", "count", "delete", "distinct", "find"}
+
+_enabled = False
+_lock = threading.Lock()
+_histograms = defaultdict(lambda: _Histogram())
+_scope = contextvars.ContextVar("scope", default=None)
+
+
+def enable():
+    """Enables the collection of request, span, and database command metrics
+    for this process.
+
+    Database commands are only observed for clients that are created after
+    this method is called.
+    """
+    global _enabled
+    if _enabled:
+        return
+
+    monitoring.register(_CommandListener())
+    _enabled = True
+
+
+def is_enabled():
+    """Returns whether metrics collection is enabled for this process.
+
+    Returns:
+        True/False
+    """
+    return _enabled
+
+
+@contextlib.contextmanager
+def span(name):
+    """Context manager that records the duration of the enclosed block as a
+    span of the current request.
+
+    Spans may wrap synchronous or asynchronous code. Nothing is recorded when
+    metrics are disabled.
+
+    Args:
+        name: the name of the span, e.g. ``"view"``, ``"aggregate"``, or
+            ``"serialize"``
+    """
+    if not _enabled:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(
+            "fiftyone_server_span_seconds",
+            time.perf_counter() - start,
+            route=_get_endpoint_name(_scope.get()),
+            span=name,
+        )
+
+
+def observe(name, value, **labels):
+    """Records an observation of the given histogram.
+
+    Args:
+        name: the name of the histogram
+        value: the observed value
+        **labels: labels identifying the series of the histogram
+    """
+    key = (name, tuple(sorted(labels.items())))
+    with _lock:
+        _histograms[key].observe(value)
+
+
+def fingerprint(pipeline):
+    """Computes a fingerprint of the given MongoDB pipeline or query that
+    identifies its shape, independent of the literal values that it contains.
+
+    Args:
+        pipeline: a MongoDB pipeline, query, or command argument
+
+    Returns:
+        a hex string
+    """
+    shape = json_util.dumps(_get_shape(pipeline), sort_keys=True)
+    return hashlib.sha1(shape.encode()).hexdigest()[:12]
+
+
+def render():
+    """Renders the current metrics in the Prometheus text exposition format.
+
+    Returns:
+        a string
+    """
+    lines = []
+
+    with _lock:
+        histograms = sorted(_histograms.items())
+
+    described = set()
+    for (name, labels), histogram in histograms:
+        if name not in described:
+            lines.append("# TYPE %s histogram" % name)
+            described.add(name)
+
+        lines.extend(histogram.render(name, labels))
+
+    for key, value in sorted(fou.get_sync_task_metrics().items()):
+        name = "fiftyone_server_thread_pool_%s" % key
+        lines.append("# TYPE %s gauge" % name)
+        lines.append("%s %s" % (name, value))
+
+    return "\n".join(lines) + "\n"
+
+
+def reset():
+    """Clears all recorded metrics."""
+    with _lock:
+        _histograms.clear()
+
+
+class MetricsMiddleware(object):
+    """ASGI middleware that records the latency of every HTTP request by
+    endpoint when metrics are enabled.
+
+    Args:
+        app: the ASGI app
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if not _enabled or scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = [None]
+
+        async def _send(message):
+            if message["type"] == "http.response.start":
+                status[0] = message["status"]
+
+            await send(message)
+
+        start = time.perf_counter()
+        token = _scope.set(scope)
+        try:
+            await self.app(scope, receive, _send)
+        finally:
+            _scope.reset(token)
+            observe(
+                "fiftyone_server_request_seconds",
+                time.perf_counter() - start,
+                route=_get_endpoint_name(scope),
+                status=str(status[0] or 500),
+            )
+
+
+class _Histogram(object):
+    def __init__(self):
+        self.counts = [0] * len(_BUCKETS)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        for idx, bound in enumerate(_BUCKETS):
+            if value <= bound:
+                self.counts[idx] += 1
+
+        self.count += 1
+        self.sum += value
+
+    def render(self, name, labels):
+        labels = ["%s=%s" % (k, json_util.dumps(v)) for k, v in labels]
+
+        lines = []
+        for bound, count in zip(_BUCKETS, self.counts):
+            _labels = ",".join(labels + ['le="%s"' % bound])
+            lines.append("%s_bucket{%s} %d" % (name, _labels, count))
+
+        _labels = ",".join(labels + ['le="+Inf"'])
+        lines.append("%s_bucket{%s} %d" % (name, _labels, self.count))
+
+        _labels = ",".join(labels)
+        lines.append("%s_sum{%s} %f" % (name, _labels, self.sum))
+        lines.append("%s_count{%s} %d" % (name, _labels, self.count))
+
+        return lines
+
+
+class _CommandListener(monitoring.CommandListener):
+    def __init__(self):
+        self._commands = {}
+
+    def started(self, event):
+        if event.command_name not in _PIPELINE_COMMANDS:
+            return
+
+        command = event.command
+        collection = command.get(event.command_name, "")
+        pipeline = command.get(
+            "pipeline", command.get("filter", command.get("query", {}))
+        )
+
+        # Commands run in the context of the request that issued them, if any
+        self._commands[(event.connection_id, event.request_id)] = (
+            collection,
+            fingerprint(pipeline),
+            _get_endpoint_name(_scope.get()),
+        )
+
+    def succeeded(self, event):
+        self._finish(event)
+
+    def failed(self, event):
+        self._finish(event)
+
+    def _finish(self, event):
+        key = (event.connection_id, event.request_id)
+        collection, _fingerprint, route = self._commands.pop(key, ("", "", ""))
+        duration = event.duration_micros / 1e6
+
+        observe(
+            "fiftyone_server_mongo_command_seconds",
+            duration,
+            command=event.command_name,
+            fingerprint=_fingerprint,
+            route=route,
+        )
+
+        threshold = fo.config.slow_query_threshold
+        if threshold is not None and duration >= threshold and _fingerprint:
+            logger.warning(
+                "Slow %s on '%s' took %.3fs (fingerprint %s)",
+                event.command_name,
+                collection,
+                duration,
+                _fingerprint,
+            )
+
+
+def _get_shape(value):
+    if isinstance(value, dict):
+        return {k: _get_shape(v) for k, v in value.items()}
+
+    if isinstance(value, (list, tuple)):
+        # Lists of literals, e.g. `$in` arguments, have no shape
+        return [
+            _get_shape(v) for v in value if isinstance(v, (dict, list, tuple))
+        ]
+
+    return None
+
+
+def _get_endpoint_name(scope):
+    # Routing stores the matched endpoint on the request's scope
+    if scope is None:
+        return ""
+
+    endpoint = scope.get("endpoint", None)
+    if endpoint is None:
+        return ""
+
+    return getattr(endpoint, "__name__", type(endpoint).__name__)
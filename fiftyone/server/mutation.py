@@ -16,7 +16,7 @@ from bson import json_util
 import fiftyone.constants as foc
 import fiftyone.core.dataset as fod
 import fiftyone.core.odm as foo
-from fiftyone.core.session.events import StateUpdate
+from fiftyone.core.session.events import StatePatch, StateUpdate
 from fiftyone.core.session.session import build_color_scheme
 from fiftyone.core.spaces import default_spaces, Space
 import fiftyone.core.stages as fos
@@ -138,7 +138,9 @@ class Mutation:
         state = get_state()
 
         state.selected = selected
-        await dispatch_event(subscription, StateUpdate(state=state))
+        await dispatch_event(
+            subscription, StatePatch(patch=state.serialize_patch(["selected"]))
+        )
         return True
 
     @gql.mutation
@@ -151,7 +153,10 @@ class Mutation:
         state = get_state()
 
         state.selected_labels = [asdict(l) for l in selected_labels]
-        await dispatch_event(subscription, StateUpdate(state=state))
+        await dispatch_event(
+            subscription,
+            StatePatch(patch=state.serialize_patch(["selected_labels"])),
+        )
         return True
 
     @gql.mutation
@@ -404,7 +409,9 @@ class Mutation:
     ) -> bool:
         state = get_state()
         state.spaces = Space.from_dict(spaces)
-        await dispatch_event(subscription, StateUpdate(state=state))
+        await dispatch_event(
+            subscription, StatePatch(patch=state.serialize_patch(["spaces"]))
+        )
         return True
 
     @gql.mutation
@@ -12,6 +12,7 @@ from .events import Events
 from .fiftyone import FiftyOne
 from .frames import Frames
 from .media import Media
+from .metrics import Metrics
 from .plugins import Plugins
 from .select import Select
 from .sort import Sort
@@ -33,6 +34,7 @@ routes = (
         ("/fiftyone", FiftyOne),
         ("/frames", Frames),
         ("/media", Media),
+        ("/metrics", Metrics),
         ("/plugins", Plugins),
         ("/select", Select),
         ("/sort", Sort),
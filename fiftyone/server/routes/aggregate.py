@@ -13,6 +13,7 @@ import fiftyone.core.aggregations as foa
 import fiftyone.core.view as fov
 
 from fiftyone.server.decorators import route
+import fiftyone.server.metrics as fosmt
 
 import fiftyone.server.view as fosv
 
@@ -26,12 +27,15 @@ class Aggregate(HTTPEndpoint):
         stages = data.get("view", None)
         aggregations = data.get("aggregations", [])
 
-        view = fosv.get_view(dataset, stages=stages, filters=filters)
+        view = await fosv.get_async_view(
+            dataset, stages=stages, filters=filters
+        )
 
         if sample_ids:
             view = fov.make_optimized_select_view(view, sample_ids)
 
-        aggregate_result = view.aggregate(
-            [foa.Aggregation._from_dict(agg) for agg in aggregations]
-        )
+        with fosmt.span("aggregate"):
+            aggregate_result = await view._async_aggregate(
+                [foa.Aggregation._from_dict(agg) for agg in aggregations]
+            )
         return {"aggregate": aggregate_result}
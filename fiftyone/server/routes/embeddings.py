@@ -5,10 +5,17 @@ FiftyOne Server ``/embeddings`` route.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from collections import OrderedDict
+import hashlib
 import itertools
+import struct
+import threading
 
+from bson import json_util
+import numpy as np
 from starlette.endpoints import HTTPEndpoint
 from starlette.requests import Request
+from starlette.responses import Response
 
 import fiftyone.core.fields as fof
 import fiftyone.core.stages as fos
@@ -21,6 +28,9 @@ from fiftyone.server.filters import GroupElementFilter, SampleFilter
 
 
 MAX_CATEGORIES = 100
+GRID_INDEX_SIZE = 256
+LOD_GRID_SIZE = 64
+MAX_CACHED_INDEXES = 8
 COLOR_BY_TYPES = (
     fof.StringField,
     fof.BooleanField,
@@ -47,6 +57,9 @@ class OnPlotLoad(HTTPEndpoint):
         filters = data.get("filters", None)
         label_field = data["labelField"]
         slices = data["slices"]
+        binary = data.get("format", None) == "binary"
+        viewport = data.get("viewport", None)
+        max_points = data.get("maxPoints", None)
         dataset = fosu.load_and_cache_dataset(dataset_name)
 
         try:
@@ -92,7 +105,36 @@ class OnPlotLoad(HTTPEndpoint):
             sample_ids = results._curr_sample_ids
         else:
             ids = results._curr_sample_ids
-            sample_ids = itertools.repeat(None)
+            sample_ids = None
+
+        # Level of detail
+        all_ids = ids
+        styles = None
+        if viewport is not None or max_points is not None:
+            key = (
+                dataset_name,
+                brain_key,
+                dataset.get_brain_info(brain_key).timestamp,
+                json_util.dumps([stages, filters, slices]),
+            )
+            index, styles = _get_grid_index(key, points, ids)
+            inds, total_count = index.query(
+                viewport=viewport, max_points=max_points
+            )
+
+            points = points[inds]
+            ids = np.asarray(ids)[inds]
+            if sample_ids is not None:
+                sample_ids = np.asarray(sample_ids)[inds]
+
+            lod = {
+                "bounds": index.bounds,
+                "viewport": viewport,
+                "total_count": total_count,
+                "count": len(inds),
+            }
+        else:
+            lod = None
 
         # Color by data
         if label_field:
@@ -110,42 +152,68 @@ class OnPlotLoad(HTTPEndpoint):
                     patches_field, leaf
                 )
 
-            labels = view._get_values_by_id(
-                label_field, ids, link_field=patches_field
-            )
-
             field = view.get_field(label_field)
-
-            if isinstance(field, fof.ListField):
-                labels = [l[0] if l else None for l in labels]
+            is_list = isinstance(field, fof.ListField)
+            if is_list:
                 field = field.field
 
+            def _get_labels(ids):
+                labels = view._get_values_by_id(
+                    label_field, ids, link_field=patches_field
+                )
+                if is_list:
+                    labels = [l[0] if l else None for l in labels]
+
+                return labels
+
+            labels = _get_labels(ids)
+
             if isinstance(field, fof.FloatField):
                 style = "continuous"
+            elif styles is None:
+                style = _get_style(labels)
             else:
-                if len(set(labels)) <= MAX_CATEGORIES:
-                    style = "categorical"
-                else:
-                    style = "continuous"
+                # The style must not change as the user zooms, so it is
+                # computed from all points and cached with the grid index
+                style = styles.get(label_field, None)
+                if style is None:
+                    style = _get_style(_get_labels(all_ids))
+                    styles[label_field] = style
         else:
-            labels = itertools.repeat(None)
+            labels = None
             style = "uncolored"
 
-        selected = itertools.repeat(True)
-
-        traces = {}
-        for data in zip(points, ids, sample_ids, labels, selected):
-            _add_to_trace(traces, style, *data)
-
-        return {
-            "traces": traces,
+        info = {
             "style": style,
             "index_size": index_size,
             "available_count": available_count,
             "missing_count": missing_count,
             "patches_field": patches_field,
+            "lod": lod,
         }
 
+        if binary:
+            return Response(
+                _encode_plot(info, points, ids, sample_ids, labels, style),
+                media_type="application/octet-stream",
+            )
+
+        if sample_ids is None:
+            sample_ids = itertools.repeat(None)
+
+        if labels is None:
+            labels = itertools.repeat(None)
+
+        selected = itertools.repeat(True)
+
+        traces = {}
+        for data in zip(points, ids, sample_ids, labels, selected):
+            _add_to_trace(traces, style, *data)
+
+        info["traces"] = traces
+
+        return info
+
 
 class EmbeddingsSelection(HTTPEndpoint):
     @route
@@ -329,3 +397,261 @@ def _add_to_trace(traces, style, points, id, sample_id, label, selected):
             "selected": selected,
         }
     )
+
+
+class _GridIndex(object):
+    """A uniform grid index over a set of 2D points that supports
+    level-of-detail viewport queries.
+
+    Each point is assigned a random rank when the index is built, and
+    subsampled queries return the lowest ranked points in each region, so the
+    points returned at a given zoom level are a subset of those returned when
+    zooming further into the same region.
+
+    Args:
+        points: a ``num_points x 2`` array of points
+        grid_size (GRID_INDEX_SIZE): the number of grid cells along each axis
+        seed (51): a random seed for the point ranks
+    """
+
+    def __init__(self, points, grid_size=GRID_INDEX_SIZE, seed=51):
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        num_points = len(points)
+
+        if num_points > 0:
+            mins = points.min(axis=0)
+            maxs = points.max(axis=0)
+        else:
+            mins = np.zeros(2)
+            maxs = np.zeros(2)
+
+        self.points = points
+        self.grid_size = grid_size
+        self.bounds = [float(mins[0]), float(mins[1])]
+        self.bounds += [float(maxs[0]), float(maxs[1])]
+
+        self._mins = mins
+        self._scale = grid_size / np.maximum(maxs - mins, 1e-12)
+        self._rank = np.random.default_rng(seed).permutation(num_points)
+
+        # Points sorted by cell, and the start of each cell in that order
+        cells = self._get_cells(points)
+        self._order = np.argsort(cells, kind="stable")
+        self._starts = np.searchsorted(
+            cells[self._order], np.arange(grid_size * grid_size + 1)
+        )
+
+    def query(self, viewport=None, max_points=None):
+        """Returns the indexes of the points in the given viewport.
+
+        Args:
+            viewport (None): an optional ``[xmin, ymin, xmax, ymax]`` viewport
+            max_points (None): the approximate maximum number of points to
+                return. If more points lie within the viewport, a subset that
+                preserves the density of the points is returned. Sparse
+                regions always retain at least one point
+
+        Returns:
+            a tuple of
+
+            -   a sorted array of point indexes
+            -   the total number of points in the viewport
+        """
+        if viewport is None:
+            inds = np.arange(len(self.points))
+        else:
+            inds = self._query_viewport(viewport)
+
+        total_count = len(inds)
+
+        if max_points is not None and total_count > max_points:
+            inds = self._subsample(inds, viewport, max_points)
+
+        return np.sort(inds), total_count
+
+    def _get_cells(self, points, grid_size=None, mins=None, scale=None):
+        if grid_size is None:
+            grid_size = self.grid_size
+            mins = self._mins
+            scale = self._scale
+
+        ij = np.floor((points - mins) * scale).astype(np.int64)
+        np.clip(ij, 0, grid_size - 1, out=ij)
+        return ij[:, 0] * grid_size + ij[:, 1]
+
+    def _query_viewport(self, viewport):
+        xmin, ymin, xmax, ymax = viewport
+        g = self.grid_size
+
+        lo = np.floor((np.array([xmin, ymin]) - self._mins) * self._scale)
+        hi = np.floor((np.array([xmax, ymax]) - self._mins) * self._scale)
+        i0, j0 = np.clip(lo, 0, g - 1).astype(int)
+        i1, j1 = np.clip(hi, 0, g - 1).astype(int)
+
+        # Each column of cells is a contiguous range of the sorted points
+        chunks = [
+            self._order[
+                self._starts[i * g + j0] : self._starts[i * g + j1 + 1]
+            ]
+            for i in range(i0, i1 + 1)
+        ]
+        if not chunks:
+            return np.zeros(0, dtype=np.int64)
+
+        inds = np.concatenate(chunks)
+
+        # Cells on the boundary may contain points outside the viewport
+        x, y = self.points[inds].T
+        mask = (x >= xmin) & (x <= xmax) & (y >= ymin) & (y <= ymax)
+        return inds[mask]
+
+    def _subsample(self, inds, viewport, max_points):
+        points = self.points[inds]
+        if viewport is not None:
+            mins = np.array(viewport[:2], dtype=float)
+            maxs = np.array(viewport[2:], dtype=float)
+        else:
+            mins = points.min(axis=0)
+            maxs = points.max(axis=0)
+
+        g = LOD_GRID_SIZE
+        scale = g / np.maximum(maxs - mins, 1e-12)
+        cells = self._get_cells(points, grid_size=g, mins=mins, scale=scale)
+
+        # Points whose rank is in the lowest `max_points / len(inds)` fraction
+        # of all ranks are kept, so that zooming in only adds points
+        ranks = self._rank[inds]
+        keep = ranks < len(self.points) * (max_points / len(inds))
+
+        # The lowest ranked point in each cell is always kept
+        min_ranks = np.full(g * g, len(self.points))
+        np.minimum.at(min_ranks, cells, ranks)
+        keep |= ranks == min_ranks[cells]
+
+        return inds[keep]
+
+
+_grid_indexes = OrderedDict()
+_grid_indexes_lock = threading.Lock()
+
+
+def _get_grid_index(key, points, ids):
+    # Indexes are reused only if they contain exactly the same points, which
+    # can change without the key changing, e.g. when samples are deleted.
+    # Each index also caches the plot styles of the label fields of its points
+    ids_hash = _hash_ids(ids)
+
+    with _grid_indexes_lock:
+        entry = _grid_indexes.get(key, None)
+        if entry is not None and entry[0] == ids_hash:
+            _grid_indexes.move_to_end(key)
+            return entry[1], entry[2]
+
+    index = _GridIndex(points)
+    styles = {}
+
+    with _grid_indexes_lock:
+        _grid_indexes[key] = (ids_hash, index, styles)
+        while len(_grid_indexes) > MAX_CACHED_INDEXES:
+            _grid_indexes.popitem(last=False)
+
+    return index, styles
+
+
+def _hash_ids(ids):
+    # IDs have a fixed length, so their concatenation is unambiguous
+    return hashlib.sha1("".join(ids).encode()).hexdigest()
+
+
+def _get_style(labels):
+    if len(set(labels)) <= MAX_CATEGORIES:
+        return "categorical"
+
+    return "continuous"
+
+
+def _encode_plot(info, points, ids, sample_ids, labels, style):
+    """Encodes an embeddings plot in the following binary format:
+
+    -   a little-endian ``uint32`` header length
+    -   a UTF-8 JSON header, padded to a multiple of 8 bytes, containing the
+        plot ``info`` and a ``buffers`` dict that maps buffer names to their
+        ``[dtype, offset, length]`` within the data section
+    -   a data section of 8-byte aligned, little-endian typed arrays
+
+    The ``points`` buffer contains interleaved ``float32`` xy coordinates.
+    IDs are stored as string tables, i.e., ``<name>_data`` UTF-8 bytes and
+    ``<name>_offsets`` ``uint32`` offsets into them. Categorical labels are
+    stored as ``int32`` codes into the ``categories`` list of the header,
+    with ``-1`` for missing values. Numeric labels are stored as ``float32``
+    values with ``NaN`` for missing values, and other labels are stored as a
+    string table.
+    """
+    buffers = OrderedDict()
+    header = dict(info)
+
+    points = np.asarray(points, dtype="<f4").reshape(-1, 2)
+    buffers["points"] = points
+    _add_string_table(buffers, "ids", ids)
+
+    if sample_ids is not None:
+        _add_string_table(buffers, "sample_ids", sample_ids)
+
+    if labels is not None:
+        if style == "categorical":
+            categories = {}
+            for label in labels:
+                if label is not None and label not in categories:
+                    categories[label] = len(categories)
+
+            buffers["labels"] = np.array(
+                [
+                    categories.get(l, -1) if l is not None else -1
+                    for l in labels
+                ],
+                dtype="<i4",
+            )
+            header["labels_type"] = "codes"
+            header["categories"] = list(categories.keys())
+        else:
+            try:
+                buffers["labels"] = np.array(
+                    [l if l is not None else np.nan for l in labels],
+                    dtype="<f4",
+                )
+                header["labels_type"] = "values"
+            except (TypeError, ValueError):
+                _add_string_table(
+                    buffers,
+                    "labels",
+                    [str(l) if l is not None else None for l in labels],
+                )
+                header["labels_type"] = "strings"
+
+    layout = {}
+    chunks = []
+    offset = 0
+    for name, arr in buffers.items():
+        arr = np.ascontiguousarray(arr)
+        layout[name] = [arr.dtype.name, offset, int(arr.size)]
+        chunks.append(arr.tobytes())
+        offset += arr.nbytes
+
+        padding = -offset % 8
+        chunks.append(b"\0" * padding)
+        offset += padding
+
+    header["buffers"] = layout
+    header = json_util.dumps(header).encode("utf-8")
+    header += b" " * (-(len(header) + 4) % 8)
+
+    return b"".join([struct.pack("<I", len(header)), header] + chunks)
+
+
+def _add_string_table(buffers, name, values):
+    data = [v.encode("utf-8") if v is not None else b"" for v in values]
+    offsets = np.zeros(len(data) + 1, dtype="<u4")
+    offsets[1:] = np.cumsum([len(d) for d in data])
+
+    buffers[name + "_data"] = np.frombuffer(b"".join(data), dtype=np.uint8)
+    buffers[name + "_offsets"] = offsets
@@ -5,6 +5,11 @@ FiftyOne Server /frames route
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import asyncio
+from collections import OrderedDict
+
+from bson import json_util, ObjectId
+import cachetools
 from starlette.endpoints import HTTPEndpoint
 from starlette.responses import JSONResponse
 from starlette.requests import Request
@@ -15,9 +20,17 @@ import fiftyone.core.odm as foo
 import fiftyone.core.view as fov
 
 from fiftyone.server.decorators import route
+import fiftyone.server.metrics as fosmt
 import fiftyone.server.view as fosv
 
 
+_streams = cachetools.TTLCache(maxsize=16, ttl=60)  # ttl in seconds
+
+# Maximum number of pending read-aheads per stream, e.g. one per App tab that
+# is playing the same sample
+_MAX_READ_AHEADS = 4
+
+
 class Frames(HTTPEndpoint):
     @route
     async def post(self, request: Request, data: dict):
@@ -29,15 +42,168 @@ class Frames(HTTPEndpoint):
         stages = data.get("view")
         sample_id = data.get("sampleId")
         group_slice = data.get("slice", None)
+        columnar = data.get("columnar", False)
 
-        view = fosv.get_view(dataset, stages=stages, extended_stages=extended)
-        view = fov.make_optimized_select_view(view, sample_id)
-
-        if group_slice is not None:
-            view.group_slice = group_slice
+        stream = _get_frame_stream(
+            dataset, stages, extended, sample_id, group_slice
+        )
 
         end_frame = min(num_frames + start_frame, frame_count)
-        support = None if stages else [start_frame, end_frame]
+        with fosmt.span("aggregate"):
+            frames = await stream.read(start_frame, end_frame)
+
+        # Read ahead the chunk that the player will request next
+        if end_frame < frame_count:
+            stream.prefetch(
+                end_frame + 1, min(num_frames + end_frame + 1, frame_count)
+            )
+
+        if columnar:
+            return JSONResponse(
+                {
+                    "columns": foj.stringify(_to_columns(frames)),
+                    "range": [start_frame, end_frame],
+                }
+            )
+
+        return JSONResponse(
+            {
+                "frames": foj.stringify(frames),
+                "range": [start_frame, end_frame],
+            }
+        )
+
+
+class _FrameStream(object):
+    """Reads chunks of frames of a video sample in a view.
+
+    Views whose stages do not modify frames read directly from the frames
+    collection by ``(_sample_id, frame_number)`` range. Other views attach the
+    frames of the sample via an aggregation.
+
+    Args:
+        view: a :class:`fiftyone.core.view.DatasetView` that selects the
+            sample
+        sample_id: the ID of the sample
+        has_stages: whether the view was defined by stages other than
+            extended stages
+    """
+
+    def __init__(self, view, sample_id, has_stages):
+        self._view = view
+        self._sample_id = sample_id
+        self._has_stages = has_stages
+        self._direct = not view._needs_frames()
+        self._sparse = view._root_dataset.sparse_frames
+        self._frames_query = None
+        self._read_aheads = OrderedDict()
+
+    async def read(self, start_frame, end_frame):
+        """Reads the given range of frames.
+
+        Args:
+            start_frame: the first frame number
+            end_frame: the last frame number
+
+        Returns:
+            a list of frame dicts
+        """
+        task = self._read_aheads.pop((start_frame, end_frame), None)
+        if task is not None:
+            return await task
+
+        return await self._read_frames(start_frame, end_frame)
+
+    def prefetch(self, start_frame, end_frame):
+        """Starts reading the given range of frames in the background so that
+        a subsequent :meth:`read` of the same range can use the result.
+
+        Multiple clients may play the same sample, so up to
+        ``_MAX_READ_AHEADS`` ranges are read ahead at a time, and the oldest
+        pending range is discarded when that limit is exceeded.
+
+        Args:
+            start_frame: the first frame number
+            end_frame: the last frame number
+        """
+        key = (start_frame, end_frame)
+        if key in self._read_aheads:
+            return
+
+        self._read_aheads[key] = asyncio.ensure_future(
+            self._read_frames(start_frame, end_frame)
+        )
+
+        while len(self._read_aheads) > _MAX_READ_AHEADS:
+            _, task = self._read_aheads.popitem(last=False)
+            _discard_task(task)
+
+    def close(self):
+        """Discards any pending read-aheads of the stream."""
+        while self._read_aheads:
+            _, task = self._read_aheads.popitem(last=False)
+            _discard_task(task)
+
+    async def _read_frames(self, start_frame, end_frame):
+        if self._direct:
+            frames = await self._find_frames(start_frame, end_frame)
+        else:
+            frames = await self._aggregate_frames(start_frame, end_frame)
+
+        if self._sparse:
+            frames = _fill_sparse_frames(frames, start_frame, end_frame)
+
+        return frames
+
+    async def _find_frames(self, start_frame, end_frame):
+        if self._frames_query is None:
+            self._frames_query = await self._get_frames_query()
+
+        sample_id, support = self._frames_query
+        if sample_id is None:
+            return []
+
+        if support is not None:
+            start_frame = max(start_frame, support[0])
+            end_frame = min(end_frame, support[1])
+
+        if start_frame > end_frame:
+            return []
+
+        dataset = self._view._dataset
+        return (
+            await foo.get_async_db_conn()[dataset._frame_collection_name]
+            .find(
+                {
+                    "_sample_id": sample_id,
+                    "frame_number": {"$gte": start_frame, "$lte": end_frame},
+                }
+            )
+            .sort("frame_number", 1)
+            .to_list(end_frame - start_frame + 1)
+        )
+
+    async def _get_frames_query(self):
+        dataset = self._view._dataset
+        if not dataset._is_clips:
+            return ObjectId(self._sample_id), None
+
+        # Clips store the ID of their source sample and their frame support
+        d = await foo.get_async_db_conn()[
+            dataset._sample_collection_name
+        ].find_one(
+            {"_id": ObjectId(self._sample_id)},
+            {"_sample_id": True, "support": True},
+        )
+
+        if d is None:
+            return None, None
+
+        return d["_sample_id"], d["support"]
+
+    async def _aggregate_frames(self, start_frame, end_frame):
+        view = self._view
+        support = None if self._has_stages else [start_frame, end_frame]
         if not support:
             view = view.set_field(
                 "frames",
@@ -47,14 +213,75 @@ class Frames(HTTPEndpoint):
                 ),
             )
 
-        frames = await foo.aggregate(
+        return await foo.aggregate(
             foo.get_async_db_conn()[view._dataset._sample_collection_name],
             view._pipeline(frames_only=True, support=support),
         ).to_list(end_frame - start_frame + 1)
 
-        return JSONResponse(
-            {
-                "frames": foj.stringify(frames),
-                "range": [start_frame, end_frame],
-            }
-        )
+
+def _get_frame_stream(dataset, stages, extended, sample_id, group_slice):
+    # The view is built once per sample and view, rather than per chunk
+    key = (
+        dataset,
+        json_util.dumps(stages),
+        json_util.dumps(extended),
+        sample_id,
+        group_slice,
+    )
+
+    stream = _streams.get(key, None)
+    if stream is None:
+        view = fosv.get_view(dataset, stages=stages, extended_stages=extended)
+        view = fov.make_optimized_select_view(view, sample_id)
+
+        if group_slice is not None:
+            view.group_slice = group_slice
+
+        stream = _FrameStream(view, sample_id, bool(stages))
+        _streams[key] = stream
+
+    return stream
+
+
+def clear_frame_streams(dataset):
+    """Clears the cached frame streams of the given dataset, along with their
+    pending read-aheads.
+
+    This must be called whenever the frames of the dataset are edited, so that
+    subsequent reads do not return stale frames.
+
+    Args:
+        dataset: the name of the dataset
+    """
+    for key in [key for key in _streams.keys() if key[0] == dataset]:
+        stream = _streams.pop(key, None)
+        if stream is not None:
+            stream.close()
+
+
+def _discard_task(task):
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        # Retrieves any exception so that it is not logged
+        task.exception()
+
+
+def _to_columns(frames):
+    # Columns avoid repeating the field names of every frame
+    fields = {}
+    for frame in frames:
+        fields.update(dict.fromkeys(frame))
+
+    return {
+        field: [frame.get(field, None) for frame in frames] for field in fields
+    }
+
+
+def _fill_sparse_frames(frames, start_frame, end_frame):
+    # Sparse datasets do not store empty frames, so we provide placeholders
+    frame_map = {frame["frame_number"]: frame for frame in frames}
+    return [
+        frame_map.get(fn, {"frame_number": fn})
+        for fn in range(start_frame, end_frame + 1)
+    ]
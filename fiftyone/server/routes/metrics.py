@@ -0,0 +1,21 @@
+"""
+FiftyOne Server /metrics route
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+from starlette.endpoints import HTTPEndpoint
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+
+from fiftyone.server.decorators import route
+import fiftyone.server.metrics as fosmt
+
+
+class Metrics(HTTPEndpoint):
+    @route
+    async def get(self, request: Request, data: dict):
+        return PlainTextResponse(
+            fosmt.render(), media_type="text/plain; version=0.0.4"
+        )
@@ -5,17 +5,25 @@ FiftyOne Server /tag route
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import asyncio
+import logging
+import traceback
+
+from bson import json_util
 from starlette.endpoints import HTTPEndpoint
 from starlette.requests import Request
+from starlette.responses import StreamingResponse
 
 from fiftyone.core.expressions import ViewField as F
 import fiftyone.core.json as foj
 import fiftyone.core.media as fom
 import fiftyone.core.odm as foo
+from fiftyone.core.utils import run_sync_task
 import fiftyone.core.view as fov
 
 from fiftyone.server.decorators import route
 from fiftyone.server.filters import GroupElementFilter, SampleFilter
+import fiftyone.server.routes.frames as fosf
 import fiftyone.server.tags as fost
 import fiftyone.server.utils as fosu
 import fiftyone.server.view as fosv
@@ -39,7 +47,8 @@ class Tag(HTTPEndpoint):
         slices = data.get("slices", None)
         slice = data.get("slice", None)
         group_id = data.get("group_id", None)
-        view = fost.get_tag_view(
+        stream = data.get("stream", False)
+        view = await fost.get_tag_view(
             dataset,
             stages=stages,
             filters=filters,
@@ -57,47 +66,136 @@ class Tag(HTTPEndpoint):
             sample_ids=sample_ids,
         )
 
-        if target_labels:
-            fosu.change_label_tags(view, changes, label_fields=label_fields)
-        else:
-            fosu.change_sample_tags(view, changes)
+        async def get_samples():
+            if not modal:
+                return []
 
-        if not modal:
-            return {"samples": []}
+            return await _get_samples(
+                dataset,
+                stages=stages,
+                filters=filters,
+                extended=extended,
+                labels=labels,
+                hidden_labels=hidden_labels,
+                sample_ids=sample_ids,
+                group_id=group_id,
+                slices=slices,
+                current_frame=current_frame,
+                modal=modal,
+            )
 
-        view = fost.get_tag_view(
-            dataset,
-            stages=stages,
-            filters=filters,
-            extended_stages=extended,
-            labels=labels,
-            hidden_labels=hidden_labels,
-            sample_ids=sample_ids,
-            sample_filter=SampleFilter(
-                group=GroupElementFilter(id=group_id, slices=slices)
-                if not sample_ids
-                else None
-            ),
-            target_labels=False,
-        )
+        if target_labels and stream:
+            return StreamingResponse(
+                _change_label_tags_stream(
+                    view, changes, label_fields, get_samples
+                ),
+                media_type="application/json",
+                headers={
+                    "Cache-Control": "no-cache, no-transform",
+                    "X-Accel-Buffering": "no",
+                },
+            )
 
-        is_video = view.media_type == fom.VIDEO
-        if is_video and current_frame is not None:
-            default_filter = F("frame_number") == 1
-            current_filter = F("frame_number").is_in([current_frame, 1])
-            filter_frames = lambda f: F("frames").filter(f)
-            expr = F.if_else(
-                F("_id").to_string() == modal,
-                filter_frames(current_filter),
-                filter_frames(default_filter),
+        try:
+            if target_labels:
+                await run_sync_task(
+                    fosu.change_label_tags, view, changes, label_fields
+                )
+            else:
+                await run_sync_task(fosu.change_sample_tags, view, changes)
+        finally:
+            fosf.clear_frame_streams(view._root_dataset.name)
+
+        return {"samples": await get_samples()}
+
+
+async def _change_label_tags_stream(view, changes, label_fields, get_samples):
+    # Streams newline-delimited progress updates while the tags are edited in
+    # a worker thread, followed by the updated samples, or by an error if the
+    # tags could not be edited
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+
+    def _progress(fraction):
+        loop.call_soon_threadsafe(queue.put_nowait, fraction)
+
+    def _run():
+        try:
+            fosu.change_label_tags(
+                view, changes, label_fields=label_fields, progress=_progress
             )
-            view = view.set_field("frames", expr)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+
+    task = asyncio.ensure_future(run_sync_task(_run))
+
+    while True:
+        fraction = await queue.get()
+        if fraction is None:
+            break
+
+        yield json_util.dumps({"progress": fraction}) + "\n"
+
+    try:
+        await task
+    except Exception as e:
+        logging.exception(e)
+        yield json_util.dumps(
+            {"error": str(e), "stack": traceback.format_exc()}
+        ) + "\n"
+        return
+    finally:
+        fosf.clear_frame_streams(view._root_dataset.name)
+
+    yield json_util.dumps({"samples": await get_samples()}) + "\n"
+
+
+async def _get_samples(
+    dataset,
+    stages=None,
+    filters=None,
+    extended=None,
+    labels=None,
+    hidden_labels=None,
+    sample_ids=None,
+    group_id=None,
+    slices=None,
+    current_frame=None,
+    modal=None,
+):
+    view = await fost.get_tag_view(
+        dataset,
+        stages=stages,
+        filters=filters,
+        extended_stages=extended,
+        labels=labels,
+        hidden_labels=hidden_labels,
+        sample_ids=sample_ids,
+        sample_filter=SampleFilter(
+            group=GroupElementFilter(id=group_id, slices=slices)
+            if not sample_ids
+            else None
+        ),
+        target_labels=False,
+    )
+
+    is_video = view.media_type == fom.VIDEO
+    if is_video and current_frame is not None:
+        default_filter = F("frame_number") == 1
+        current_filter = F("frame_number").is_in([current_frame, 1])
+        filter_frames = lambda f: F("frames").filter(f)
+        expr = F.if_else(
+            F("_id").to_string() == modal,
+            filter_frames(current_filter),
+            filter_frames(default_filter),
+        )
+        view = view.set_field("frames", expr)
 
-        samples = []
-        async for document in foo.aggregate(
-            foo.get_async_db_conn()[view._dataset._sample_collection_name],
-            view._pipeline(attach_frames=is_video, detach_frames=is_video),
-        ):
-            samples.append(document)
+    samples = []
+    async for document in foo.aggregate(
+        foo.get_async_db_conn()[view._dataset._sample_collection_name],
+        view._pipeline(attach_frames=is_video, detach_frames=is_video),
+    ):
+        samples.append(document)
 
-        return {"samples": foj.stringify(samples)}
+    return foj.stringify(samples)
@@ -15,6 +15,7 @@ import fiftyone.core.collections as foc
 import fiftyone.core.labels as fol
 from fiftyone.server.decorators import route
 from fiftyone.server.filters import GroupElementFilter, SampleFilter
+import fiftyone.server.metrics as fosmt
 import fiftyone.server.tags as fost
 
 
@@ -33,7 +34,7 @@ class Tagging(HTTPEndpoint):
         slices = data.get("slices", None)
         group_id = data.get("group_id", None)
         slice = data.get("slice", None)
-        view = fost.get_tag_view(
+        view = await fost.get_tag_view(
             dataset,
             stages=stages,
             filters=filters,
@@ -54,7 +55,8 @@ class Tagging(HTTPEndpoint):
 
         if target_labels:
             count_aggs, tag_aggs = build_label_tag_aggregations(view)
-            results = await view._async_aggregate(count_aggs + tag_aggs)
+            with fosmt.span("aggregate"):
+                results = await view._async_aggregate(count_aggs + tag_aggs)
             items = None
             count = sum(results[: len(count_aggs)])
             tags = defaultdict(int)
@@ -66,9 +68,10 @@ class Tagging(HTTPEndpoint):
 
                     tags[tag] += num
         else:
-            tags, items = await view._async_aggregate(
-                [foa.CountValues("tags"), foa.Count()]
-            )
+            with fosmt.span("aggregate"):
+                tags, items = await view._async_aggregate(
+                    [foa.CountValues("tags"), foa.Count()]
+                )
             count = sum([v for k, v in tags.items() if k is not None])
 
         return {"count": count, "tags": tags, "items": items}
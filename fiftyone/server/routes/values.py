@@ -14,6 +14,7 @@ import fiftyone.core.media as fom
 
 import fiftyone.server.constants as foc
 from fiftyone.server.filters import GroupElementFilter, SampleFilter
+import fiftyone.server.metrics as fosmt
 import fiftyone.server.view as fosv
 from fiftyone.server.decorators import route
 
@@ -35,7 +36,7 @@ class Values(HTTPEndpoint):
         slices = data.get("slices", None)
         slice = data.get("slice", None)
 
-        view = fosv.get_view(
+        view = await fosv.get_async_view(
             dataset,
             stages=stages,
             extended_stages=extended,
@@ -61,16 +62,17 @@ class Values(HTTPEndpoint):
             else None
         )
 
-        count, first = await view._async_aggregate(
-            foa.CountValues(
-                path,
-                _first=limit,
-                _asc=asc,
-                _sort_by=sort_by,
-                _search=regex_safe_search,
-                _selected=selected,
+        with fosmt.span("aggregate"):
+            count, first = await view._async_aggregate(
+                foa.CountValues(
+                    path,
+                    _first=limit,
+                    _asc=asc,
+                    _sort_by=sort_by,
+                    _search=regex_safe_search,
+                    _selected=selected,
+                )
             )
-        )
 
         return {
             "count": count,
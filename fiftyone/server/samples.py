@@ -17,6 +17,7 @@ from fiftyone.core.utils import run_sync_task
 
 from fiftyone.server.filters import SampleFilter
 import fiftyone.server.metadata as fosm
+import fiftyone.server.metrics as fosmt
 from fiftyone.server.paginator import Connection, Edge, PageInfo
 from fiftyone.server.scalars import BSON, JSON, BSONArray
 from fiftyone.server.utils import from_dict
@@ -83,10 +84,11 @@ async def paginate_samples(
         sample_filter=sample_filter,
         reload=reload,
     )
-    try:
-        view = await run_sync_task(run, False)
-    except:
-        view = await run_sync_task(run, True)
+    with fosmt.span("view"):
+        try:
+            view = await run_sync_task(run, False)
+        except:
+            view = await run_sync_task(run, True)
 
     # check frame field schema explicitly, media type is not reliable for groups
     has_frames = view.get_frame_field_schema() is not None
@@ -115,10 +117,11 @@ async def paginate_samples(
     if has_frames:
         pipeline.append({"$addFields": {"frames": {"$slice": ["$frames", 1]}}})
 
-    samples = await foo.aggregate(
-        foo.get_async_db_conn()[view._dataset._sample_collection_name],
-        pipeline,
-    ).to_list(first + 1)
+    with fosmt.span("aggregate"):
+        samples = await foo.aggregate(
+            foo.get_async_db_conn()[view._dataset._sample_collection_name],
+            pipeline,
+        ).to_list(first + 1)
 
     more = False
     if len(samples) > first:
@@ -127,14 +130,15 @@ async def paginate_samples(
 
     metadata_cache = {}
     url_cache = {}
-    nodes = await asyncio.gather(
-        *[
-            _create_sample_item(
-                view, sample, metadata_cache, url_cache, pagination_data
-            )
-            for sample in samples
-        ]
-    )
+    with fosmt.span("metadata"):
+        nodes = await asyncio.gather(
+            *[
+                _create_sample_item(
+                    view, sample, metadata_cache, url_cache, pagination_data
+                )
+                for sample in samples
+            ]
+        )
 
     edges = []
     for idx, node in enumerate(nodes):
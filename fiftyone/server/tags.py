@@ -15,7 +15,7 @@ from fiftyone.server.filters import SampleFilter
 import fiftyone.server.view as fosv
 
 
-def get_tag_view(
+async def get_tag_view(
     dataset: str,
     stages: t.List,
     filters: t.Dict,
@@ -27,7 +27,7 @@ def get_tag_view(
     target_labels: bool = False,
     sample_ids: t.List[str] = None,
 ) -> foc.SampleCollection:
-    view = fosv.get_view(
+    view = await fosv.get_async_view(
         dataset,
         stages=stages,
         filters=filters,
@@ -71,7 +71,9 @@ def change_sample_tags(sample_collection, changes):
         sample_collection.untag_samples(del_tags)
 
 
-def change_label_tags(sample_collection, changes, label_fields=None):
+def change_label_tags(
+    sample_collection, changes, label_fields=None, progress=None
+):
     """Applies the changes to tags to all labels in the specified label
     field(s) of the collection, if necessary.
 
@@ -84,14 +86,43 @@ def change_label_tags(sample_collection, changes, label_fields=None):
         label_fields (None): an optional name or iterable of names of
             :class:`fiftyone.core.labels.Label` fields. By default, all label
             fields are used
+        progress (None): an optional function that is called with the
+            fraction of the edits that have been completed after each batch
+            of labels is processed
     """
     add_tags, del_tags = _parse_changes(changes)
 
-    if add_tags:
-        sample_collection.tag_labels(add_tags, label_fields=label_fields)
-
-    if del_tags:
-        sample_collection.untag_labels(del_tags, label_fields=label_fields)
+    if label_fields is None:
+        label_fields = sample_collection._get_label_fields()
+    elif isinstance(label_fields, str):
+        label_fields = [label_fields]
+
+    edits = []
+    for label_field in label_fields:
+        if add_tags:
+            edits.append((sample_collection.tag_labels, add_tags, label_field))
+
+        if del_tags:
+            edits.append(
+                (sample_collection.untag_labels, del_tags, label_field)
+            )
+
+    last_fraction = 0
+
+    def _report(fraction):
+        nonlocal last_fraction
+        if progress is not None and fraction > last_fraction:
+            last_fraction = fraction
+            progress(fraction)
+
+    for idx, (edit_fcn, tags, label_field) in enumerate(edits):
+        # Edits of non-generated collections report progress per batch
+        edit_fcn(
+            tags,
+            label_fields=label_field,
+            _progress=lambda f, idx=idx: _report((idx + f) / len(edits)),
+        )
+        _report((idx + 1) / len(edits))
 
 
 def from_dict(data_class: t.Type[T], data: Data) -> T:
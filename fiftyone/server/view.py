@@ -21,6 +21,7 @@ import fiftyone.core.utils as fou
 import fiftyone.core.view as fov
 
 from fiftyone.server.aggregations import GroupElementFilter, SampleFilter
+import fiftyone.server.metrics as fosmt
 from fiftyone.server.scalars import BSONArray, JSON
 
 
@@ -102,11 +103,64 @@ def get_view(
     Returns:
         a :class:`fiftyone.core.view.DatasetView`
     """
-    dataset = fod.load_dataset(dataset_name)
+    with fosmt.span("view"):
+        dataset = fod.load_dataset(dataset_name)
+
+        if reload:
+            dataset.reload()
+
+        return _build_view(
+            dataset,
+            view_name=view_name,
+            stages=stages,
+            filters=filters,
+            pagination_data=pagination_data,
+            extended_stages=extended_stages,
+            sample_filter=sample_filter,
+        )
+
+
+async def get_async_view(
+    dataset_name,
+    view_name=None,
+    stages=None,
+    filters=None,
+    pagination_data=False,
+    extended_stages=None,
+    sample_filter=None,
+    reload=True,
+):
+    """Gets the view defined by the given request parameters without blocking
+    the event loop on database reads.
+
+    See :func:`get_view` for a description of the parameters.
+
+    Returns:
+        a :class:`fiftyone.core.view.DatasetView`
+    """
+    with fosmt.span("view"):
+        dataset = await fod._async_load_dataset(dataset_name, reload=reload)
+
+        return _build_view(
+            dataset,
+            view_name=view_name,
+            stages=stages,
+            filters=filters,
+            pagination_data=pagination_data,
+            extended_stages=extended_stages,
+            sample_filter=sample_filter,
+        )
 
-    if reload:
-        dataset.reload()
 
+def _build_view(
+    dataset,
+    view_name=None,
+    stages=None,
+    filters=None,
+    pagination_data=False,
+    extended_stages=None,
+    sample_filter=None,
+):
     if view_name is not None:
         return dataset.load_saved_view(view_name)
 
@@ -9,7 +9,6 @@ Utilities for working with datasets in
 from collections import defaultdict
 import csv
 from datetime import datetime
-from itertools import groupby
 import logging
 import multiprocessing
 import multiprocessing.dummy
@@ -338,6 +337,9 @@ class COCODetectionDatasetImporter(
             number of samples loaded may be less than this maximum value if the
             dataset does not contain sufficient samples matching your
             requirements. By default, all matching samples are loaded
+        num_workers (None): a number of worker processes to use to convert the
+            COCO annotations into labels in parallel. By default, labels are
+            converted serially
     """
 
     def __init__(
@@ -358,6 +360,7 @@ class COCODetectionDatasetImporter(
         shuffle=False,
         seed=None,
         max_samples=None,
+        num_workers=None,
     ):
         if dataset_dir is None and data_path is None and labels_path is None:
             raise ValueError(
@@ -406,6 +409,7 @@ class COCODetectionDatasetImporter(
         self.only_matching = only_matching
         self.use_polylines = use_polylines
         self.tolerance = tolerance
+        self.num_workers = num_workers
 
         self._label_types = _label_types
         self._info = None
@@ -416,95 +420,27 @@ class COCODetectionDatasetImporter(
         self._image_dicts_map = None
         self._annotations = None
         self._filenames = None
-        self._iter_filenames = None
+        self._iter_samples = None
 
     def __iter__(self):
-        self._iter_filenames = iter(self._filenames)
+        self._iter_samples = fou.iter_map(
+            _load_coco_sample, self._iter_tasks(), num_workers=self.num_workers
+        )
         return self
 
     def __len__(self):
         return len(self._filenames)
 
     def __next__(self):
-        filename = next(self._iter_filenames)
-
-        if os.path.isabs(filename):
-            image_path = filename
-        else:
-            image_path = self._image_paths_map[filename]
-
-        image_dict = self._image_dicts_map.get(filename, None)
+        image_path, image_dict, image_metadata, label = next(
+            self._iter_samples
+        )
 
         if image_dict is None:
-            image_metadata = fom.ImageMetadata.build_for(image_path)
             return image_path, image_metadata, None
 
-        image_id = image_dict["id"]
-        width = image_dict["width"]
-        height = image_dict["height"]
-
-        image_metadata = fom.ImageMetadata(width=width, height=height)
-
-        label = {}
-
-        if self._annotations is not None:
-            coco_objects = self._annotations.get(image_id, [])
-            frame_size = (width, height)
-
-            if self.classes is not None and self.only_matching:
-                coco_objects = _get_matching_objects(
-                    coco_objects, self.classes, self._classes
-                )
-
-            if "detections" in self._label_types:
-                detections = _coco_objects_to_detections(
-                    coco_objects,
-                    frame_size,
-                    self._classes,
-                    self._supercategory_map,
-                    False,  # no segmentations
-                    self.include_annotation_id,
-                )
-                if detections is not None:
-                    label["detections"] = detections
-
-            if "segmentations" in self._label_types:
-                if self.use_polylines:
-                    segmentations = _coco_objects_to_polylines(
-                        coco_objects,
-                        frame_size,
-                        self._classes,
-                        self._supercategory_map,
-                        self.tolerance,
-                        self.include_annotation_id,
-                    )
-                else:
-                    segmentations = _coco_objects_to_detections(
-                        coco_objects,
-                        frame_size,
-                        self._classes,
-                        self._supercategory_map,
-                        True,  # load segmentations
-                        self.include_annotation_id,
-                    )
-
-                if segmentations is not None:
-                    label["segmentations"] = segmentations
-
-            if "keypoints" in self._label_types:
-                keypoints = _coco_objects_to_keypoints(
-                    coco_objects,
-                    frame_size,
-                    self._classes,
-                    self._supercategory_map,
-                    self.include_annotation_id,
-                )
-
-                if keypoints is not None:
-                    label["keypoints"] = keypoints
-
         if "coco_id" in self._label_types:
-            label["coco_id"] = image_id
+            label["coco_id"] = image_dict["id"]
 
         if "license" in self._label_types:
             license_id = image_dict.get("license", None)
@@ -515,6 +451,37 @@ class COCODetectionDatasetImporter(
 
         return image_path, image_metadata, label
 
+    def _iter_tasks(self):
+        if self.classes is not None and self.only_matching:
+            target_classes = self.classes
+        else:
+            target_classes = None
+
+        options = dict(
+            label_types=self._label_types,
+            classes=self._classes,
+            supercategory_map=self._supercategory_map,
+            target_classes=target_classes,
+            use_polylines=self.use_polylines,
+            tolerance=self.tolerance,
+            include_id=self.include_annotation_id,
+        )
+
+        for filename in self._filenames:
+            if os.path.isabs(filename):
+                image_path = filename
+            else:
+                image_path = self._image_paths_map[filename]
+
+            image_dict = self._image_dicts_map.get(filename, None)
+
+            if image_dict is not None and self._annotations is not None:
+                coco_objects = self._annotations.get(image_dict["id"], [])
+            else:
+                coco_objects = None
+
+            yield image_path, image_dict, coco_objects, options
+
     @property
     def has_dataset_info(self):
         return True
@@ -609,6 +576,11 @@ class COCODetectionDatasetImporter(
     def get_dataset_info(self):
         return self._info
 
+    def close(self, *args):
+        if self._iter_samples is not None:
+            self._iter_samples.close()
+            self._iter_samples = None
+
 
 class COCODetectionDatasetExporter(
     foud.LabeledImageDatasetExporter, foud.ExportPathsMixin
@@ -2003,6 +1975,96 @@ def _make_images_list(images_dir):
     return images
 
 
+def _load_coco_sample(args):
+    image_path, image_dict, coco_objects, options = args
+
+    if image_dict is None:
+        image_metadata = fom.ImageMetadata.build_for(image_path)
+        return image_path, None, image_metadata, None
+
+    width = image_dict["width"]
+    height = image_dict["height"]
+
+    image_metadata = fom.ImageMetadata(width=width, height=height)
+
+    if coco_objects is not None:
+        label = _coco_objects_to_labels(
+            coco_objects, (width, height), **options
+        )
+    else:
+        label = {}
+
+    return image_path, image_dict, image_metadata, label
+
+
+def _coco_objects_to_labels(
+    coco_objects,
+    frame_size,
+    label_types,
+    classes,
+    supercategory_map,
+    target_classes,
+    use_polylines,
+    tolerance,
+    include_id,
+):
+    label = {}
+
+    if target_classes is not None:
+        coco_objects = _get_matching_objects(
+            coco_objects, target_classes, classes
+        )
+
+    if "detections" in label_types:
+        detections = _coco_objects_to_detections(
+            coco_objects,
+            frame_size,
+            classes,
+            supercategory_map,
+            False,  # no segmentations
+            include_id,
+        )
+        if detections is not None:
+            label["detections"] = detections
+
+    if "segmentations" in label_types:
+        if use_polylines:
+            segmentations = _coco_objects_to_polylines(
+                coco_objects,
+                frame_size,
+                classes,
+                supercategory_map,
+                tolerance,
+                include_id,
+            )
+        else:
+            segmentations = _coco_objects_to_detections(
+                coco_objects,
+                frame_size,
+                classes,
+                supercategory_map,
+                True,  # load segmentations
+                include_id,
+            )
+
+        if segmentations is not None:
+            label["segmentations"] = segmentations
+
+    if "keypoints" in label_types:
+        keypoints = _coco_objects_to_keypoints(
+            coco_objects,
+            frame_size,
+            classes,
+            supercategory_map,
+            include_id,
+        )
+
+        if keypoints is not None:
+            label["keypoints"] = keypoints
+
+    return label
+
+
 def _to_labels_map_rev(classes):
     return {c: i for i, c in enumerate(classes)}
 
@@ -2128,12 +2190,11 @@ def _get_polygons_for_segmentation(segmentation, frame_size, tolerance):
     else:
         if isinstance(segmentation["counts"], list):
             # Uncompressed RLE
-            rle = mask_utils.frPyObjects(segmentation, height, width)
+            mask = _decode_uncompressed_rle(segmentation["counts"], height)
         else:
             # RLE
-            rle = segmentation
+            mask = mask_utils.decode(segmentation)
 
-        mask = mask_utils.decode(rle)
         abs_points = _mask_to_polygons(mask, tolerance)
 
     # Convert to [[(x1, y1), (x2, y2), ...]] in relative coordinates
@@ -2156,25 +2217,58 @@ def _coco_segmentation_to_mask(segmentation, bbox, frame_size):
     x, y, w, h = bbox
     width, height = frame_size
 
+    x0 = min(max(int(round(x)), 0), width)
+    x1 = min(max(int(round(x + w)), 0), width)
+    y0 = min(max(int(round(y)), 0), height)
+    y1 = min(max(int(round(y + h)), 0), height)
+
+    if x1 <= x0 or y1 <= y0:
+        # The box lies outside of the image
+        return np.zeros((max(y1 - y0, 0), max(x1 - x0, 0)), dtype=bool)
+
     if isinstance(segmentation, list):
         # Polygon -- a single object might consist of multiple parts, so merge
         # all parts into one mask RLE code
         rle = mask_utils.merge(
             mask_utils.frPyObjects(segmentation, height, width)
         )
+        mask = mask_utils.decode(rle)[:, x0:x1]
     elif isinstance(segmentation["counts"], list):
-        # Uncompressed RLE
-        rle = mask_utils.frPyObjects(segmentation, height, width)
+        # Uncompressed RLE -- only decode the columns spanned by the box
+        mask = _decode_uncompressed_rle(
+            segmentation["counts"], height, x0=x0, x1=x1
+        )
     else:
         # RLE
-        rle = segmentation
+        mask = mask_utils.decode(segmentation)[:, x0:x1]
+
+    return mask[y0:y1].astype(bool)
+
 
-    mask = mask_utils.decode(rle).astype(bool)
+def _decode_uncompressed_rle(counts, height, x0=0, x1=None):
+    # Uncompressed RLEs alternate between background and foreground run
+    # lengths over the column-major pixels of the image, starting with
+    # background. Rather than expanding every run, we mark the foreground
+    # run boundaries that fall within columns [x0, x1) and integrate them
+    counts = np.asarray(counts, dtype=np.int64)
+    ends = np.cumsum(counts)
 
-    return mask[
-        int(round(y)) : int(round(y + h)),
-        int(round(x)) : int(round(x + w)),
-    ]
+    if x1 is None:
+        x1 = int(ends[-1]) // height if ends.size > 0 else 0
+
+    x1 = max(x1, x0)
+    lo = x0 * height
+    hi = x1 * height
+
+    starts = np.clip(ends[:-1:2], lo, hi) - lo
+    ends = np.clip(ends[1::2], lo, hi) - lo
+
+    delta = np.zeros(hi - lo + 1, dtype=np.int64)
+    np.add.at(delta, starts, 1)
+    np.add.at(delta, ends, -1)
+
+    mask = np.cumsum(delta[:-1]) > 0
+    return mask.reshape((x1 - x0, height)).T
 
 
 def _polyline_to_coco_segmentation(polyline, frame_size, iscrowd="iscrowd"):
@@ -2232,12 +2326,16 @@ def _make_coco_keypoints(keypoint, frame_size):
 
 
 def _mask_to_rle(mask):
-    counts = []
-    for i, (value, elements) in enumerate(groupby(mask.ravel(order="F"))):
-        if i == 0 and value == 1:
-            counts.append(0)
+    values = mask.ravel(order="F")
+    if values.size == 0:
+        return {"counts": [], "size": list(mask.shape)}
+
+    changes = np.flatnonzero(values[1:] != values[:-1]) + 1
+    bounds = np.concatenate(([0], changes, [values.size]))
+    counts = np.diff(bounds).tolist()
 
-        counts.append(len(list(elements)))
+    if values[0] == 1:
+        counts.insert(0, 0)
 
     return {"counts": counts, "size": list(mask.shape)}
 
@@ -3107,6 +3107,9 @@ class CVATBackendConfig(foua.AnnotationBackendConfig):
 
             Note that this argument cannot be provided when uploading existing
             tracks
+        num_workers (None): an optional number of threads to use to create
+            tasks and download their annotations concurrently. By default,
+            tasks are processed serially
     """
 
     def __init__(
@@ -3137,6 +3140,7 @@ class CVATBackendConfig(foua.AnnotationBackendConfig):
         frame_start=None,
         frame_stop=None,
         frame_step=None,
+        num_workers=None,
         **kwargs,
     ):
         super().__init__(name, label_schema, media_field=media_field, **kwargs)
@@ -3160,6 +3164,7 @@ class CVATBackendConfig(foua.AnnotationBackendConfig):
         self.frame_start = _validate_frame_arg(frame_start, "frame_start")
         self.frame_stop = _validate_frame_arg(frame_stop, "frame_stop")
         self.frame_step = _validate_frame_arg(frame_step, "frame_step")
+        self.num_workers = num_workers
 
         # store privately so these aren't serialized
         self._username = username
@@ -3293,6 +3298,7 @@ class CVATBackend(foua.AnnotationBackend):
             password=self.config.password,
             headers=self.config.headers,
             organization=self.config.organization,
+            num_workers=self.config.num_workers,
         )
 
     def upload_annotations(self, samples, anno_key, launch_editor=False):
@@ -3541,6 +3547,9 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
         headers (None): an optional dict of headers to add to all requests
         organization (None): the name of the organization to use when sending
             requests to CVAT
+        num_workers (None): the maximum number of concurrent requests that
+            will be made to the server. Used to size the connection pool of
+            the session
     """
 
     def __init__(
@@ -3551,6 +3560,7 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
         password=None,
         headers=None,
         organization=None,
+        num_workers=None,
     ):
         self._name = name
         self._url = url.rstrip("/")
@@ -3558,6 +3568,7 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
         self._password = password
         self._headers = headers
         self._organization = organization
+        self._num_workers = num_workers
 
         self._server_version = None
         self._session = None
@@ -3716,6 +3727,15 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
 
         self._session = requests.Session()
 
+        if self._num_workers is not None and self._num_workers > 1:
+            # Allow all workers to keep their connections alive
+            pool_size = max(
+                self._num_workers, requests.adapters.DEFAULT_POOLSIZE
+            )
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_size)
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+
         if self._headers:
             # pylint: disable=too-many-function-args
             self._session.headers.update(self._headers)
@@ -4400,7 +4420,13 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
         if num_samples <= batch_size:
             pb_kwargs["quiet"] = True
 
-        with fou.ProgressBar(**pb_kwargs) as pb:
+        # Task payloads are built lazily and serially in this thread since they
+        # may update `id_map` and `cvat_schema`, while the tasks are created
+        # concurrently, so only the payloads of the tasks that are in flight
+        # are held in memory
+        def _iter_upload_tasks():
+            nonlocal project_id
+
             for idx, offset in enumerate(range(0, num_samples, batch_size)):
                 samples_batch = samples[offset : (offset + batch_size)]
                 anno_tags = []
@@ -4498,37 +4524,42 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
                 if num_batches > 1:
                     task_name += f"_{idx + 1}"
 
-                (
-                    task_id,
-                    class_id_map,
-                    attr_id_map,
-                ) = self._create_task_upload_data(
+                yield (
                     config,
                     idx,
                     task_name,
-                    cvat_schema,
+                    deepcopy(cvat_schema),
                     project_id,
                     samples_batch,
-                    task_ids,
-                    job_ids,
-                    frame_id_map,
                     _frame_start,
                     _frame_stop,
                     _frame_step,
-                )
-
-                for label_field in label_schema.keys():
-                    labels_task_map[label_field].append(task_id)
-
-                server_id_map = self._upload_annotations(
                     anno_shapes,
                     anno_tags,
                     anno_tracks,
-                    class_id_map,
-                    attr_id_map,
-                    task_id,
                 )
 
+        server_id_map = {}
+        with fou.ProgressBar(**pb_kwargs) as pb:
+            for (
+                task_id,
+                task_job_ids,
+                task_frame_id_map,
+                server_id_map,
+            ) in fou.iter_map(
+                self._create_task_upload_samples,
+                _iter_upload_tasks(),
+                num_workers=config.num_workers,
+                max_prefetch=config.num_workers,
+                use_threads=True,
+            ):
+                task_ids.append(task_id)
+                job_ids[task_id] = task_job_ids
+                frame_id_map[task_id] = task_frame_id_map
+
+                for label_field in label_schema.keys():
+                    labels_task_map[label_field].append(task_id)
+
                 pb.update(batch_size)
 
         results = CVATAnnotationResults(
@@ -4603,26 +4634,29 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
         if len(task_ids) == 1:
             pb_kwargs["quiet"] = True
 
+        task_data = fou.iter_map(
+            self._download_task_data,
+            task_ids,
+            num_workers=results.config.num_workers,
+            max_prefetch=results.config.num_workers,
+            use_threads=True,
+        )
+
         with fou.ProgressBar(**pb_kwargs) as pb:
-            for task_id in pb(task_ids):
-                if not self.task_exists(task_id):
+            for task_id, _task_data in pb(zip(task_ids, task_data)):
+                if _task_data is None:
                     deleted_tasks.append(task_id)
                     logger.warning(
                         "Skipping task %d, which no longer exists", task_id
                     )
                     continue
 
-                data_resp = self.get(self.task_data_meta_url(task_id)).json()
+                data_resp, attr_id_map, _class_map_rev, task_resp = _task_data
                 frames = data_resp["frames"]
                 frame_start = data_resp["start_frame"]
                 frame_stop = data_resp["stop_frame"]
                 frame_step = _parse_frame_step(data_resp)
 
-                # Download task data
-                attr_id_map, _class_map_rev = self._get_attr_class_maps(
-                    task_id
-                )
-                task_resp = self.get(self.task_annotation_url(task_id)).json()
                 all_shapes = task_resp["shapes"]
                 all_tags = task_resp["tags"]
                 all_tracks = task_resp["tracks"]
@@ -4783,6 +4817,16 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
 
         return annotations
 
+    def _download_task_data(self, task_id):
+        if not self.task_exists(task_id):
+            return None
+
+        data_resp = self.get(self.task_data_meta_url(task_id)).json()
+        attr_id_map, class_map_rev = self._get_attr_class_maps(task_id)
+        task_resp = self.get(self.task_annotation_url(task_id)).json()
+
+        return data_resp, attr_id_map, class_map_rev, task_resp
+
     def _get_attr_class_maps(self, task_id):
         labels = self._get_task_labels(task_id)
         _class_map = {}
@@ -5268,6 +5312,52 @@ class CVATAnnotationAPI(foua.AnnotationAPI):
 
         return min(task_size, num_samples)
 
+    def _create_task_upload_samples(self, args):
+        (
+            config,
+            idx,
+            task_name,
+            cvat_schema,
+            project_id,
+            samples_batch,
+            frame_start,
+            frame_stop,
+            frame_step,
+            anno_shapes,
+            anno_tags,
+            anno_tracks,
+        ) = args
+
+        task_ids = []
+        job_ids = {}
+        frame_id_map = {}
+
+        task_id, class_id_map, attr_id_map = self._create_task_upload_data(
+            config,
+            idx,
+            task_name,
+            cvat_schema,
+            project_id,
+            samples_batch,
+            task_ids,
+            job_ids,
+            frame_id_map,
+            frame_start,
+            frame_stop,
+            frame_step,
+        )
+
+        server_id_map = self._upload_annotations(
+            anno_shapes,
+            anno_tags,
+            anno_tracks,
+            class_id_map,
+            attr_id_map,
+            task_id,
+        )
+
+        return task_id, job_ids[task_id], frame_id_map[task_id], server_id_map
+
     def _create_task_upload_data(
         self,
         config,
@@ -30,6 +30,7 @@ import fiftyone.core.storage as fos
 import fiftyone.core.utils as fou
 import fiftyone.utils.eta as foue
 import fiftyone.utils.image as foui
+import fiftyone.utils.labels as foul
 import fiftyone.utils.patches as foup
 
 from .parsers import (
@@ -860,6 +861,11 @@ def _write_image_dataset(
 ):
     labeled_images = isinstance(dataset_exporter, LabeledImageDatasetExporter)
 
+    if labeled_images:
+        samples = _prefetch_label_media(
+            dataset_exporter, samples, sample_parser
+        )
+
     with fou.ProgressBar(total=num_samples) as pb:
         with dataset_exporter:
             if sample_collection is not None:
@@ -904,6 +910,30 @@ def _write_image_dataset(
                     )
 
 
+def _prefetch_label_media(dataset_exporter, samples, sample_parser):
+    # This exporter copies mask images rather than reading them
+    if isinstance(dataset_exporter, ImageSegmentationDirectoryExporter):
+        return samples
+
+    if not isinstance(samples, foc.SampleCollection) or not isinstance(
+        sample_parser, FiftyOneLabeledImageSampleParser
+    ):
+        return samples
+
+    label_field = sample_parser.label_field
+    if label_field is None:
+        return samples
+
+    media_fields = samples._get_media_fields(
+        include_filepath=False, whitelist=label_field
+    )
+    fields = [f for f, v in media_fields.items() if v is not None]
+    if not fields:
+        return samples
+
+    return foul.prefetch_label_media(samples, fields=fields)
+
+
 def _write_video_dataset(
     dataset_exporter,
     samples,
@@ -24,7 +24,8 @@ import fiftyone.core.annotation as foa
 import fiftyone.core.brain as fob
 import fiftyone.core.dataset as fod
 import fiftyone.core.evaluation as foe
-import fiftyone.core.frame as fof
+import fiftyone.core.fields as fof
+import fiftyone.core.frame as fofr
 import fiftyone.core.groups as fog
 import fiftyone.core.labels as fol
 import fiftyone.core.metadata as fom
@@ -57,6 +58,8 @@ def import_samples(
     expand_schema=True,
     dynamic=False,
     add_info=True,
+    skip_existing=False,
+    key_field="filepath",
 ):
     """Adds the samples from the given :class:`DatasetImporter` to the dataset.
 
@@ -87,6 +90,17 @@ def import_samples(
             document fields that are encountered
         add_info (True): whether to add dataset info from the importer (if
             any) to the dataset
+        skip_existing (False): whether to skip imported samples whose
+            ``key_field`` value matches an existing sample in the dataset (or
+            a sample imported earlier in the same call). Samples are inserted
+            in batches as the import progresses, so an interrupted import can
+            be resumed by rerunning it with this option
+        key_field ("filepath"): the sample field used to detect existing
+            samples when ``skip_existing`` is True. The special value
+            ``"filehash"`` computes an MD5 hash of each media file, stores it
+            in a ``filehash`` field of the imported samples, and skips samples
+            whose content already exists in the dataset. An index is created
+            on this field, if necessary
 
     Returns:
         a list of IDs of the samples that were added to the dataset
@@ -98,6 +112,14 @@ def import_samples(
 
     dataset_importer = _handle_legacy_formats(dataset_importer)
 
+    if skip_existing and isinstance(
+        dataset_importer, (BatchDatasetImporter, GroupDatasetImporter)
+    ):
+        raise ValueError(
+            "`skip_existing=True` is not supported for %s instances"
+            % type(dataset_importer)
+        )
+
     # Batch imports
     if isinstance(dataset_importer, BatchDatasetImporter):
         # @todo support `expand_schema=False` here?
@@ -140,6 +162,10 @@ def import_samples(
         else:
             samples = map(parse_sample, iter(dataset_importer))
 
+        if skip_existing:
+            skipper = _ExistingSamplesFilter(dataset, key_field)
+            samples = skipper.filter(samples)
+
         sample_ids = dataset.add_samples(
             samples,
             expand_schema=expand_schema,
@@ -147,6 +173,9 @@ def import_samples(
             num_samples=num_samples,
         )
 
+        if skip_existing:
+            skipper.close()
+
         if add_info and dataset_importer.has_dataset_info:
             info = dataset_importer.get_dataset_info()
             if info:
@@ -351,6 +380,81 @@ def merge_samples(
             dataset_importer.import_extras(dataset)
 
 
+class _ExistingSamplesFilter(object):
+    """Filters samples whose ``key_field`` values already exist in a dataset.
+
+    Existing keys are looked up in batches via indexed ``$in`` queries, so
+    memory usage is bounded by the number of newly imported samples rather
+    than the size of the dataset.
+    """
+
+    def __init__(self, dataset, key_field, batch_size=1000):
+        self.dataset = dataset
+        self.key_field = key_field
+        self.batch_size = batch_size
+        self.num_skipped = 0
+
+        if key_field == _FILEHASH_FIELD and not dataset.has_field(key_field):
+            dataset.add_sample_field(key_field, fof.StringField)
+
+        # If the field does not exist yet, the only possible duplicates are
+        # samples imported by this filter
+        self._query_db = dataset.has_field(key_field)
+        self._seen = set()
+        self._ensure_index()
+
+    def filter(self, samples):
+        for batch in fou.iter_batches(samples, self.batch_size):
+            keys = [self._get_key(sample) for sample in batch]
+            existing = self._get_existing_keys(keys)
+
+            for sample, key in zip(batch, keys):
+                if key in existing or key in self._seen:
+                    self.num_skipped += 1
+                    continue
+
+                self._seen.add(key)
+                yield sample
+
+    def close(self):
+        self._ensure_index()
+
+        if self.num_skipped > 0:
+            logger.info(
+                "Skipped %d samples whose '%s' already exists",
+                self.num_skipped,
+                self.key_field,
+            )
+
+    def _get_key(self, sample):
+        if self.key_field == _FILEHASH_FIELD:
+            filehash = fou.compute_filehash(
+                sample.filepath, method=_FILEHASH_METHOD
+            )
+            sample[_FILEHASH_FIELD] = filehash
+            return filehash
+
+        return sample[self.key_field]
+
+    def _get_existing_keys(self, keys):
+        if not self._query_db:
+            return set()
+
+        return set(
+            self.dataset._sample_collection.distinct(
+                self.key_field, {self.key_field: {"$in": keys}}
+            )
+        )
+
+    def _ensure_index(self):
+        if self.dataset.has_field(self.key_field):
+            self.dataset.create_index(self.key_field)
+
+
+_FILEHASH_FIELD = "filehash"
+_FILEHASH_METHOD = "md5"
+
+
 def _handle_legacy_formats(dataset_importer):
     if (
         isinstance(dataset_importer, FiftyOneDatasetImporter)
@@ -1657,7 +1761,7 @@ class LegacyFiftyOneDatasetImporter(GenericSampleDatasetImporter):
     def _import_frame_labels(self, sample, labels_path):
         frames_map = etas.read_json(labels_path).get("frames", {})
         for key, value in frames_map.items():
-            sample.frames[int(key)] = fof.Frame.from_dict(value)
+            sample.frames[int(key)] = fofr.Frame.from_dict(value)
 
 
 class FiftyOneDatasetImporter(BatchDatasetImporter):
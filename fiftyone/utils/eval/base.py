@@ -8,10 +8,12 @@ Base evaluation methods.
 import itertools
 
 import numpy as np
-import sklearn.metrics as skm
 
 import fiftyone.core.evaluation as foe
 import fiftyone.core.plots as fop
+import fiftyone.core.utils as fou
+
+skm = fou.lazy_import("sklearn.metrics")
 
 
 class BaseEvaluationResults(foe.EvaluationResults):
@@ -9,7 +9,6 @@ import itertools
 import warnings
 
 import numpy as np
-import sklearn.metrics as skm
 
 import fiftyone.core.evaluation as foe
 from fiftyone.core.expressions import ViewField as F
@@ -21,6 +20,8 @@ import fiftyone.core.validation as fov
 
 from .base import BaseEvaluationResults
 
+skm = fou.lazy_import("sklearn.metrics")
+
 
 def evaluate_classifications(
     samples,
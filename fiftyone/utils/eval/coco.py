@@ -12,6 +12,7 @@ import numpy as np
 
 import eta.core.utils as etau
 
+import fiftyone.core.labels as fol
 import fiftyone.core.plots as fop
 import fiftyone.utils.iou as foui
 
@@ -144,9 +145,14 @@ class COCOEvaluation(DetectionEvaluation):
         then the object can have multiple true positive predictions matched to
         it.
 
+        The ground truth and predicted objects may also be provided as
+        :class:`fiftyone.core.labels.DetectionsArrays`, which are read-only, so
+        their matches are returned but not recorded on them.
+
         Args:
-            sample_or_frame: a :class:`fiftyone.core.sample.Sample` or
-                :class:`fiftyone.core.frame.Frame`
+            sample_or_frame: a :class:`fiftyone.core.sample.Sample`,
+                :class:`fiftyone.core.frame.Frame`, or dict mapping field names
+                to labels
             eval_key (None): the evaluation key for this evaluation
 
         Returns:
@@ -154,8 +160,8 @@ class COCOEvaluation(DetectionEvaluation):
             ``(gt_label, pred_label, iou, pred_confidence, gt_id, pred_id)``
             tuples
         """
-        gts = sample_or_frame[self.gt_field]
-        preds = sample_or_frame[self.pred_field]
+        gts = _parse_labels(sample_or_frame[self.gt_field])
+        preds = _parse_labels(sample_or_frame[self.pred_field])
 
         if eval_key is None:
             # Don't save results on user's data
@@ -756,6 +762,15 @@ def _compute_pr_curves(samples, config, classes=None):
     return precision, recall, thresholds, iou_threshs, classes
 
 
+def _parse_labels(labels):
+    # Columnar labels are read-only, so we match label instances with the same
+    # IDs instead
+    if isinstance(labels, fol.LabelArrays):
+        return labels.to_labels()
+
+    return labels
+
+
 def _copy_labels(labels):
     if labels is None:
         return None
@@ -10,6 +10,7 @@ from copy import deepcopy
 
 import numpy as np
 
+import fiftyone.core.labels as fol
 import fiftyone.core.plots as fop
 import fiftyone.utils.iou as foui
 
@@ -168,9 +169,14 @@ class OpenImagesEvaluation(DetectionEvaluation):
         then the object can have multiple true positive predictions matched to
         it.
 
+        The ground truth and predicted objects may also be provided as
+        :class:`fiftyone.core.labels.DetectionsArrays`, which are read-only, so
+        their matches are returned but not recorded on them.
+
         Args:
-            sample_or_frame: a :class:`fiftyone.core.sample.Sample` or
-                :class:`fiftyone.core.frame.Frame`
+            sample_or_frame: a :class:`fiftyone.core.sample.Sample`,
+                :class:`fiftyone.core.frame.Frame`, or dict mapping field names
+                to labels
             eval_key (None): the evaluation key for this evaluation
 
         Returns:
@@ -178,8 +184,8 @@ class OpenImagesEvaluation(DetectionEvaluation):
             ``(gt_label, pred_label, iou, pred_confidence, gt_id, pred_id)``
             tuples
         """
-        gts = sample_or_frame[self.gt_field]
-        preds = sample_or_frame[self.pred_field]
+        gts = _parse_labels(sample_or_frame[self.gt_field])
+        preds = _parse_labels(sample_or_frame[self.pred_field])
 
         pos_labs = None
         if self.config.pos_label_field:
@@ -810,6 +816,15 @@ def _interpolate_pr(precision, recall, thresholds=None, num_points=101):
     return pre, rec, thr
 
 
+def _parse_labels(labels):
+    # Columnar labels are read-only, so we match label instances with the same
+    # IDs instead
+    if isinstance(labels, fol.LabelArrays):
+        return labels.to_labels()
+
+    return labels
+
+
 def _copy_labels(labels):
     if labels is None:
         return None
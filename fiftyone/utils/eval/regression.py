@@ -10,7 +10,6 @@ import itertools
 import numbers
 
 import numpy as np
-import sklearn.metrics as skm
 from tabulate import tabulate
 
 import eta.core.utils as etau
@@ -22,6 +21,8 @@ import fiftyone.core.plots as fop
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
+skm = fou.lazy_import("sklearn.metrics")
+
 
 logger = logging.getLogger(__name__)
 
@@ -9,7 +9,6 @@ import logging
 import warnings
 
 import numpy as np
-import sklearn.metrics as skm
 
 import eta.core.image as etai
 
@@ -18,9 +17,12 @@ import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
+import fiftyone.utils.labels as foul
 
 from .base import BaseEvaluationResults
 
+skm = fou.lazy_import("sklearn.metrics")
+
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +34,7 @@ def evaluate_segmentations(
     eval_key=None,
     mask_targets=None,
     method="simple",
+    num_workers=None,
     **kwargs,
 ):
     """Evaluates the specified semantic segmentation masks in the given
@@ -80,6 +83,9 @@ def evaluate_segmentations(
             labels. If not provided, the observed values are used as labels
         method ("simple"): a string specifying the evaluation method to use.
             Supported values are ``("simple")``
+        num_workers (None): the number of worker threads to use to read masks
+            from disk ahead of time. By default,
+            ``multiprocessing.cpu_count()`` is used
         **kwargs: optional keyword arguments for the constructor of the
             :class:`SegmentationEvaluationConfig` being used
 
@@ -98,7 +104,10 @@ def evaluate_segmentations(
     eval_method.register_samples(samples, eval_key)
 
     results = eval_method.evaluate_samples(
-        samples, eval_key=eval_key, mask_targets=mask_targets
+        samples,
+        eval_key=eval_key,
+        mask_targets=mask_targets,
+        num_workers=num_workers,
     )
     eval_method.save_run_results(samples, eval_key, results)
 
@@ -167,7 +176,9 @@ class SegmentationEvaluation(foe.EvaluationMethod):
             if processing_frames:
                 dataset.add_frame_field(dice_field, fof.FloatField)
 
-    def evaluate_samples(self, samples, eval_key=None, mask_targets=None):
+    def evaluate_samples(
+        self, samples, eval_key=None, mask_targets=None, num_workers=None
+    ):
         """Evaluates the predicted segmentation masks in the given samples with
         respect to the specified ground truth masks.
 
@@ -178,6 +189,9 @@ class SegmentationEvaluation(foe.EvaluationMethod):
                 contain a subset of the possible classes if you wish to
                 evaluate a subset of the semantic classes. By default, the
                 observed pixel values are used as labels
+            num_workers (None): the number of worker threads to use to read
+                masks from disk ahead of time. By default,
+                ``multiprocessing.cpu_count()`` is used
 
         Returns:
             a :class:`SegmentationResults` instance
@@ -301,7 +315,9 @@ class SimpleEvaluation(SegmentationEvaluation):
         config: a :class:`SimpleEvaluationConfig`
     """
 
-    def evaluate_samples(self, samples, eval_key=None, mask_targets=None):
+    def evaluate_samples(
+        self, samples, eval_key=None, mask_targets=None, num_workers=None
+    ):
         pred_field = self.config.pred_field
         gt_field = self.config.gt_field
 
@@ -314,7 +330,9 @@ class SimpleEvaluation(SegmentationEvaluation):
             values, classes = zip(*sorted(mask_targets.items()))
         else:
             logger.info("Computing possible mask values...")
-            values, classes = _get_mask_values(samples, pred_field, gt_field)
+            values, classes = _get_mask_values(
+                samples, pred_field, gt_field, num_workers=num_workers
+            )
 
         _samples = samples.select_fields([gt_field, pred_field])
         pred_field, processing_frames = samples._handle_frame_field(pred_field)
@@ -335,7 +353,11 @@ class SimpleEvaluation(SegmentationEvaluation):
                 dice_field = "%s_dice" % eval_key
 
         logger.info("Evaluating segmentations...")
-        for sample in _samples.iter_samples(progress=True):
+        for sample in foul.prefetch_label_media(
+            _samples.iter_samples(progress=True),
+            fields=[self.config.gt_field, self.config.pred_field],
+            num_workers=num_workers,
+        ):
             if processing_frames:
                 images = sample.frames.values()
             else:
@@ -556,15 +578,20 @@ def _compute_accuracy_precision_recall(confusion_matrix, values, average):
     return metrics["accuracy"], metrics["precision"], metrics["recall"]
 
 
-def _get_mask_values(samples, pred_field, gt_field):
+def _get_mask_values(samples, pred_field, gt_field, num_workers=None):
     _samples = samples.select_fields([gt_field, pred_field])
+    fields = [gt_field, pred_field]
     pred_field, processing_frames = samples._handle_frame_field(pred_field)
     gt_field, _ = samples._handle_frame_field(gt_field)
 
     values = set()
     is_rgb = False
 
-    for sample in _samples.iter_samples(progress=True):
+    for sample in foul.prefetch_label_media(
+        _samples.iter_samples(progress=True),
+        fields=fields,
+        num_workers=num_workers,
+    ):
         if processing_frames:
             images = sample.frames.values()
         else:
@@ -43,20 +43,28 @@ def compute_ious(
     For keypoints, "IoUs" are computed via
     `object keypoint similarity <https://cocodataset.org/#keypoints-eval>`_.
 
+    Bounding box IoUs between :class:`fiftyone.core.labels.DetectionsArrays`
+    are computed in a fully vectorized manner, without instantiating any
+    :class:`fiftyone.core.labels.Detection` objects.
+
     Args:
         preds: a list of predicted
             :class:`fiftyone.core.labels.Detection`,
             :class:`fiftyone.core.labels.Polyline`, or
-            :class:`fiftyone.core.labels.Keypoints` instances
+            :class:`fiftyone.core.labels.Keypoints` instances, or a
+            :class:`fiftyone.core.labels.LabelArrays`
         gts: a list of ground truth
             :class:`fiftyone.core.labels.Detection`,
             :class:`fiftyone.core.labels.Polyline`, or
-            :class:`fiftyone.core.labels.Keypoints` instances
+            :class:`fiftyone.core.labels.Keypoints` instances, or a
+            :class:`fiftyone.core.labels.LabelArrays`
         iscrowd (None): an optional name of a boolean attribute or boolean
             function to apply to each label that determines whether a ground
             truth object is a crowd. If provided, the area of the predicted
             object is used as the "union" area for IoU calculations involving
-            crowd objects
+            crowd objects. When ``gts`` is a
+            :class:`fiftyone.core.labels.LabelArrays`, attributes that were
+            included in its ``attributes`` are used directly
         classwise (False): whether to consider objects with different ``label``
             values as always non-overlapping (True) or to compute IoUs for all
             objects regardless of label (False)
@@ -84,8 +92,17 @@ def compute_ious(
     if not preds or not gts:
         return np.zeros((len(preds), len(gts)))
 
+    if isinstance(preds, fol.LabelArrays) or isinstance(gts, fol.LabelArrays):
+        if _can_compute_array_ious(preds, gts, iscrowd, use_masks):
+            return _compute_array_bbox_ious(
+                preds, gts, iscrowd=iscrowd, classwise=classwise
+            )
+
+        preds, gts = _label_arrays_to_lists(preds, gts)
+
     if etau.is_str(iscrowd):
-        iscrowd = lambda l: bool(l.get_attribute_value(iscrowd, False))
+        crowd_attr = iscrowd
+        iscrowd = lambda l: bool(l.get_attribute_value(crowd_attr, False))
 
     if isinstance(preds[0], fol.Polyline):
         if use_boxes:
@@ -429,33 +446,6 @@ def _get_bbox_dim(detection):
     return 2
 
 
-def _compute_bbox_iou(gt, pred, gt_crowd=False):
-    gx, gy, gw, gh = gt.bounding_box
-    gt_area = gh * gw
-
-    px, py, pw, ph = pred.bounding_box
-    pred_area = ph * pw
-
-    # Width of intersection
-    w = min(px + pw, gx + gw) - max(px, gx)
-    if w <= 0:
-        return 0
-
-    # Height of intersection
-    h = min(py + ph, gy + gh) - max(py, gy)
-    if h <= 0:
-        return 0
-
-    inter = h * w
-
-    if gt_crowd:
-        union = pred_area
-    else:
-        union = pred_area + gt_area - inter
-
-    return min(etan.safe_divide(inter, union), 1)
-
-
 def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
     is_symmetric = preds is gts
 
@@ -472,10 +462,16 @@ def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
         else:
             gts = _polylines_to_detections(gts)
 
-    if _get_bbox_dim(gts[0]) == 3:
-        bbox_iou_fcn = _compute_cuboid_iou
-    else:
-        bbox_iou_fcn = _compute_bbox_iou
+    if _get_bbox_dim(gts[0]) != 3:
+        return _compute_vectorized_bbox_ious(
+            np.array([p.bounding_box for p in preds], dtype=float),
+            np.array([g.bounding_box for g in gts], dtype=float),
+            _get_label_array(preds),
+            _get_label_array(gts),
+            gt_crowds,
+            is_symmetric=is_symmetric,
+            classwise=classwise,
+        )
 
     ious = np.zeros((len(preds), len(gts)))
 
@@ -489,13 +485,103 @@ def _compute_bbox_ious(preds, gts, iscrowd=None, classwise=False):
             elif classwise and pred.label != gt.label:
                 continue
             else:
-                iou = bbox_iou_fcn(gt, pred, gt_crowd=gt_crowd)
+                iou = _compute_cuboid_iou(gt, pred, gt_crowd=gt_crowd)
 
             ious[i, j] = iou
 
     return ious
 
 
+def _compute_vectorized_bbox_ious(
+    pred_boxes,
+    gt_boxes,
+    pred_labels,
+    gt_labels,
+    gt_crowds,
+    is_symmetric=False,
+    classwise=False,
+):
+    px, py, pw, ph = (pred_boxes[:, i, np.newaxis] for i in range(4))
+    gx, gy, gw, gh = (gt_boxes[np.newaxis, :, i] for i in range(4))
+
+    pred_area = ph * pw
+    gt_area = gh * gw
+
+    # Width and height of intersections
+    w = np.minimum(px + pw, gx + gw) - np.maximum(px, gx)
+    h = np.minimum(py + ph, gy + gh) - np.maximum(py, gy)
+    inter = np.where((w > 0) & (h > 0), h * w, 0)
+
+    gt_crowds = np.asarray(gt_crowds, dtype=bool)[np.newaxis, :]
+    union = np.where(gt_crowds, pred_area, pred_area + gt_area - inter)
+
+    ious = np.divide(inter, union, out=np.zeros_like(inter), where=union != 0)
+    ious = np.minimum(ious, 1)
+
+    if classwise:
+        ious[pred_labels[:, np.newaxis] != gt_labels[np.newaxis, :]] = 0
+
+    if is_symmetric:
+        # Crowd semantics are asymmetric, so mirror the lower triangle
+        ious = np.tril(ious, k=-1) + np.tril(ious, k=-1).T
+        np.fill_diagonal(ious, 1)
+
+    return ious
+
+
+def _get_label_array(labels):
+    array = np.empty(len(labels), dtype=object)
+    array[:] = [l.label for l in labels]
+    return array
+
+
+def _can_compute_array_ious(preds, gts, iscrowd, use_masks):
+    if use_masks:
+        return False
+
+    if not isinstance(preds, fol.DetectionsArrays) or not isinstance(
+        gts, fol.DetectionsArrays
+    ):
+        return False
+
+    return iscrowd is None or (
+        etau.is_str(iscrowd) and iscrowd in gts.attributes
+    )
+
+
+def _compute_array_bbox_ious(preds, gts, iscrowd=None, classwise=False):
+    if iscrowd is not None:
+        gt_crowds = [bool(c) for c in gts.attributes[iscrowd]]
+    else:
+        gt_crowds = [False] * len(gts)
+
+    return _compute_vectorized_bbox_ious(
+        preds.bounding_boxes,
+        gts.bounding_boxes,
+        preds.labels,
+        gts.labels,
+        gt_crowds,
+        is_symmetric=preds is gts,
+        classwise=classwise,
+    )
+
+
+def _label_arrays_to_lists(preds, gts):
+    is_symmetric = preds is gts
+
+    if isinstance(preds, fol.LabelArrays):
+        labels = preds.to_labels()
+        preds = labels[labels._LABEL_LIST_FIELD]
+
+    if is_symmetric:
+        gts = preds
+    elif isinstance(gts, fol.LabelArrays):
+        labels = gts.to_labels()
+        gts = labels[labels._LABEL_LIST_FIELD]
+
+    return preds, gts
+
+
 def _compute_polyline_ious(
     preds, gts, error_level, iscrowd=None, classwise=False, gt_crowds=None
 ):
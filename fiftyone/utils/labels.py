@@ -5,9 +5,13 @@ Label utilities.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import itertools
+import multiprocessing
+
 import eta.core.utils as etau
 
 import fiftyone.core.labels as fol
+import fiftyone.core.media as fom
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
@@ -230,31 +234,37 @@ def import_segmentations(
     )
 
     samples = sample_collection.select_fields(in_field)
+    fields = [in_field]
     in_field, processing_frames = samples._handle_frame_field(in_field)
 
-    for sample in samples.iter_samples(autosave=True, progress=True):
-        if processing_frames:
-            images = sample.frames.values()
-        else:
-            images = [sample]
+    with samples.save_context() as context:
+        for sample in prefetch_label_media(
+            samples.iter_samples(progress=True), fields=fields
+        ):
+            if processing_frames:
+                images = sample.frames.values()
+            else:
+                images = [sample]
 
-        for image in images:
-            label = image[in_field]
-            if label is None:
-                continue
+            for image in images:
+                label = image[in_field]
+                if label is None:
+                    continue
 
-            if isinstance(label, fol.Heatmap):
-                if label.map_path is not None:
-                    del_path = label.map_path if delete_images else None
-                    label.import_map(update=update)
-                    if del_path:
-                        etau.delete_file(del_path)
-            else:
-                if label.mask_path is not None:
-                    del_path = label.mask_path if delete_images else None
-                    label.import_mask(update=update)
-                    if del_path:
-                        etau.delete_file(del_path)
+                if isinstance(label, fol.Heatmap):
+                    if label.map_path is not None:
+                        del_path = label.map_path if delete_images else None
+                        label.import_map(update=update)
+                        if del_path:
+                            etau.delete_file(del_path)
+                else:
+                    if label.mask_path is not None:
+                        del_path = label.mask_path if delete_images else None
+                        label.import_mask(update=update)
+                        if del_path:
+                            etau.delete_file(del_path)
+
+            context.save(sample)
 
 
 def transform_segmentations(
@@ -305,6 +315,7 @@ def transform_segmentations(
     )
 
     samples = sample_collection.select_fields(in_field)
+    fields = [in_field]
     in_field, processing_frames = samples._handle_frame_field(in_field)
 
     if output_dir is not None:
@@ -315,25 +326,32 @@ def transform_segmentations(
             output_dir=output_dir, rel_dir=rel_dir, idempotent=False
         )
 
-    for sample in samples.iter_samples(autosave=True, progress=True):
-        if processing_frames:
-            images = sample.frames.values()
-        else:
-            images = [sample]
+    with samples.save_context() as context:
+        for sample in prefetch_label_media(
+            samples.iter_samples(progress=True), fields=fields
+        ):
+            if processing_frames:
+                images = sample.frames.values()
+            else:
+                images = [sample]
 
-        for image in images:
-            label = image[in_field]
-            if label is None:
-                continue
+            for image in images:
+                label = image[in_field]
+                if label is None:
+                    continue
 
-            if output_dir is not None:
-                outpath = filename_maker.get_output_path(
-                    image.filepath, output_ext=".png"
+                if output_dir is not None:
+                    outpath = filename_maker.get_output_path(
+                        image.filepath, output_ext=".png"
+                    )
+                else:
+                    outpath = None
+
+                label.transform_mask(
+                    targets_map, outpath=outpath, update=update
                 )
-            else:
-                outpath = None
 
-            label.transform_mask(targets_map, outpath=outpath, update=update)
+            context.save(sample)
 
     if update_mask_targets:
         mask_targets = sample_collection.mask_targets.get(in_field, None)
@@ -359,6 +377,166 @@ def _transform_mask_targets(mask_targets, targets_map):
     return _mask_targets
 
 
+def prefetch_label_media(
+    samples, fields=None, num_workers=None, max_prefetch=None
+):
+    """Wraps the given iterable of samples so that the on-disk masks and maps
+    of their :class:`fiftyone.core.labels.Segmentation` and
+    :class:`fiftyone.core.labels.Heatmap` labels are read ahead of time in a
+    pool of worker threads.
+
+    While a sample is being processed, the media of the next
+    ``max_prefetch`` samples are read in the background, so that calls to
+    :meth:`fiftyone.core.labels.Segmentation.get_mask`,
+    :meth:`fiftyone.core.labels.Heatmap.get_map`, and the like for the
+    current sample return immediately. Any media of a sample that are not used
+    by the time the next sample is requested are discarded, so at most
+    ``max_prefetch + 1`` samples' worth of media are held in memory.
+
+    Examples::
+
+        import fiftyone as fo
+        import fiftyone.utils.labels as foul
+        import fiftyone.zoo as foz
+
+        dataset = foz.load_zoo_dataset("quickstart")
+
+        samples = dataset.iter_samples(progress=True)
+        for sample in foul.prefetch_label_media(samples, fields="segmentation"):
+            mask = sample.segmentation.get_mask()
+
+    Args:
+        samples: an iterable of :class:`fiftyone.core.sample.Sample` instances
+            or sample dicts
+        fields (None): a field or iterable of fields whose media to prefetch.
+            Frame-level fields of video samples are specified via the
+            ``frames.`` prefix. Embedded fields of sample dicts may be
+            specified via ``embedded.field.name`` syntax. By default, all
+            top-level fields (and frame-level fields) of samples are searched
+        num_workers (None): the number of worker threads to use. By default,
+            ``multiprocessing.cpu_count()`` is used once a sample with media
+            to read is encountered. If ``num_workers <= 1``, no prefetching
+            is performed
+        max_prefetch (None): the maximum number of samples whose media to read
+            ahead of time. By default, ``2 * num_workers``
+
+    Returns:
+        a generator that emits the samples
+    """
+    if etau.is_str(fields):
+        fields = [fields]
+
+    if num_workers is not None and num_workers <= 1:
+        yield from samples
+        return
+
+    tasks = ((s, _get_label_media_paths(s, fields)) for s in samples)
+
+    if num_workers is None:
+        # Only start worker threads once there is media to read
+        for sample, paths in tasks:
+            if paths:
+                tasks = itertools.chain([(sample, paths)], tasks)
+                break
+
+            yield sample
+        else:
+            return
+
+        num_workers = multiprocessing.cpu_count()
+
+    for sample, media in fou.iter_map(
+        _read_label_media,
+        tasks,
+        num_workers=num_workers,
+        max_prefetch=max_prefetch,
+        use_threads=True,
+    ):
+        # The media are only visible to the consumer of this iterator
+        prev_media = fol._prefetched_media.get()
+        fol._prefetched_media.set(media)
+        try:
+            yield sample
+        finally:
+            fol._prefetched_media.set(prev_media)
+
+
+def _get_label_media_paths(sample, fields):
+    paths = []
+    for label in _iter_media_labels(sample, fields):
+        if isinstance(label, dict):
+            cls = label.get("_cls", None)
+            if cls == "Segmentation":
+                array, path = label.get("mask", None), label.get("mask_path")
+            elif cls == "Heatmap":
+                array, path = label.get("map", None), label.get("map_path")
+            else:
+                continue
+        elif isinstance(label, fol.Segmentation):
+            array, path = label.mask, label.mask_path
+        elif isinstance(label, fol.Heatmap):
+            array, path = label.map, label.map_path
+        else:
+            continue
+
+        if array is None and path is not None:
+            paths.append(path)
+
+    return paths
+
+
+def _iter_media_labels(sample, fields):
+    if isinstance(sample, dict):
+        for field in fields or sample.keys():
+            value = sample
+            for key in field.split("."):
+                if not isinstance(value, dict):
+                    value = None
+                    break
+
+                value = value.get(key, None)
+
+            yield value
+
+        return
+
+    if fields is None:
+        sample_fields = None
+        frame_fields = None
+    else:
+        sample_fields = [f for f in fields if not f.startswith("frames.")]
+        frame_fields = [f[7:] for f in fields if f.startswith("frames.")]
+
+    yield from _iter_field_values(sample, sample_fields)
+
+    if sample.media_type == fom.VIDEO and frame_fields != []:
+        for frame in sample.frames.values():
+            yield from _iter_field_values(frame, frame_fields)
+
+
+def _iter_field_values(doc, fields):
+    if fields is None:
+        for _, value in doc.iter_fields():
+            yield value
+    else:
+        for field in fields:
+            yield doc[field]
+
+
+def _read_label_media(args):
+    sample, paths = args
+
+    media = {}
+    for path in paths:
+        try:
+            media[path] = fol._read_media(path)
+        except Exception:
+            # The error will be raised when the media is actually requested
+            pass
+
+    return sample, media
+
+
 def segmentations_to_detections(
     sample_collection,
     in_field,
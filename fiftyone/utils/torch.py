@@ -9,7 +9,10 @@ import logging
 import itertools
 import multiprocessing
 import os
+import queue
+import random
 import sys
+import threading
 
 import cv2
 import numpy as np
@@ -20,17 +23,21 @@ import eta.core.learning as etal
 import eta.core.utils as etau
 
 import fiftyone.core.config as foc
+import fiftyone.core.dataset as fod
 import fiftyone.core.labels as fol
 import fiftyone.core.models as fom
 import fiftyone.core.odm as foo
 import fiftyone.core.utils as fou
+import fiftyone.core.validation as fov
+import fiftyone.core.view as fovi
 import fiftyone.utils.image as foui
+import fiftyone.utils.labels as foul
 
 fou.ensure_torch()
 import torch
 import torchvision
 from torchvision.transforms import functional as F
-from torch.utils.data import Dataset
+from torch.utils.data import Dataset, IterableDataset
 
 
 logger = logging.getLogger(__name__)
@@ -1930,6 +1937,398 @@ class TorchImagePatchesDataset(Dataset):
         return image_paths, sample_ids, patch_edges, patches
 
 
+class TorchStreamingDataset(IterableDataset):
+    """A :class:`torch:torch.utils.data.IterableDataset` that streams images
+    and their labels from a
+    :class:`fiftyone.core.collections.SampleCollection`.
+
+    Unlike :class:`TorchImageDataset`, this class does not extract the
+    contents of the collection into memory when it is constructed. Instead,
+    the collection is partitioned into contiguous ``_id`` ranges via a
+    server-side ``$bucketAuto`` aggregation, and each ``(rank, worker)`` pair
+    streams only its own shards through batched cursors that project only the
+    required fields. Images are loaded and labels are decoded by a background
+    thread that prefetches upcoming items while the current ones are consumed,
+    and any on-disk masks or heatmaps of the labels are read concurrently via
+    :func:`fiftyone.utils.labels.prefetch_label_media`.
+
+    Instances of this dataset emit images for each sample, or
+    ``(img, targets)`` pairs if ``label_fields`` are provided, where
+    ``targets`` is a dict mapping label field names to their values decoded
+    into numpy arrays. Object lists like
+    :class:`fiftyone.core.labels.Detections` are decoded into their columnar
+    :class:`fiftyone.core.labels.LabelArrays` representations. If
+    ``include_ids == True``, the sample ID is appended to each item.
+
+    When ``shuffle == True``, both the assignment of shards to
+    ``(rank, worker)`` pairs and the order of the samples within each shard
+    are randomized as a deterministic function of ``seed`` and the current
+    epoch, which you can set via :meth:`set_epoch`. Therefore ``seed`` must be
+    the same on all ranks.
+
+    Example usage::
+
+        import torch
+
+        import fiftyone.utils.torch as fout
+        import fiftyone.zoo as foz
+
+        dataset = foz.load_zoo_dataset("quickstart")
+
+        torch_dataset = fout.TorchStreamingDataset(
+            dataset, label_fields="ground_truth", shuffle=True
+        )
+        data_loader = torch.utils.data.DataLoader(
+            torch_dataset,
+            batch_size=16,
+            num_workers=4,
+            collate_fn=lambda batch: list(zip(*batch)),
+        )
+
+        for epoch in range(10):
+            torch_dataset.set_epoch(epoch)
+            for imgs, targets in data_loader:
+                pass
+
+    Args:
+        samples: an image :class:`fiftyone.core.collections.SampleCollection`
+        label_fields (None): a label field or iterable of label fields of
+            ``samples`` to include in the returned items
+        include_ids (False): whether to include the IDs of the ``samples`` in
+            the returned items
+        transform (None): an optional transform function to apply to each
+            image. When ``use_numpy == False``, this is typically a
+            torchvision transform
+        use_numpy (False): whether to use numpy arrays rather than PIL images
+            and Torch tensors when loading data
+        force_rgb (False): whether to force convert the images to RGB
+        shuffle (False): whether to shuffle the samples each epoch
+        seed (0): the random seed to use when ``shuffle == True``
+        num_shards (None): the number of ``_id`` ranges into which to
+            partition ``samples``. By default, one shard per
+            ``(rank, worker)`` pair is used
+        batch_size (None): an optional batch size to use for the database
+            cursors
+        prefetch (32): the maximum number of items that each worker loads
+            ahead of time. Set to ``0`` to disable prefetching
+        rank (None): the rank of this process. By default, this is inferred
+            from :mod:`torch:torch.distributed`, if initialized
+        world_size (None): the number of ranks. By default, this is inferred
+            from :mod:`torch:torch.distributed`, if initialized
+        skip_failures (False): whether to return an ``Exception`` object rather
+            than raising it if an error occurs while loading an image
+    """
+
+    def __init__(
+        self,
+        samples,
+        label_fields=None,
+        include_ids=False,
+        transform=None,
+        use_numpy=False,
+        force_rgb=False,
+        shuffle=False,
+        seed=0,
+        num_shards=None,
+        batch_size=None,
+        prefetch=32,
+        rank=None,
+        world_size=None,
+        skip_failures=False,
+    ):
+        fov.validate_image_collection(samples)
+
+        if label_fields is None:
+            label_fields = []
+        elif etau.is_str(label_fields):
+            label_fields = [label_fields]
+        else:
+            label_fields = list(label_fields)
+
+        if rank is None or world_size is None:
+            _rank, _world_size = _get_distributed_info()
+            if rank is None:
+                rank = _rank
+
+            if world_size is None:
+                world_size = _world_size
+
+        self.label_fields = label_fields
+        self.include_ids = include_ids
+        self.transform = transform
+        self.use_numpy = use_numpy
+        self.force_rgb = force_rgb
+        self.shuffle = shuffle
+        self.seed = seed
+        self.num_shards = num_shards
+        self.batch_size = batch_size
+        self.prefetch = prefetch
+        self.rank = rank
+        self.world_size = world_size
+        self.skip_failures = skip_failures
+
+        self._samples = samples.select_fields(label_fields)
+        self._dataset_name = samples._root_dataset.name
+        self._stages = self._samples.view()._serialize(include_uuids=False)
+        self._epoch = 0
+        self._shards = None
+
+    def __getstate__(self):
+        # Collections are not picklable, so we rebuild from the serialized
+        # view when the dataset is sent to spawned workers
+        d = self.__dict__.copy()
+        d["_samples"] = None
+        return d
+
+    def __iter__(self):
+        worker_info = torch.utils.data.get_worker_info()
+        if worker_info is not None:
+            worker_id = worker_info.id
+            num_workers = worker_info.num_workers
+        else:
+            worker_id = 0
+            num_workers = 1
+
+        num_streams = self.world_size * num_workers
+        stream_id = self.rank * num_workers + worker_id
+
+        shards = self._get_shards(self.num_shards or num_streams)
+        if self.shuffle:
+            rng = random.Random("%s-%d" % (self.seed, self._epoch))
+            rng.shuffle(shards)
+            randint = rng.randint(int(1e7), int(1e10))
+        else:
+            randint = None
+
+        docs = itertools.chain.from_iterable(
+            self._iter_shard(shard, randint)
+            for shard in shards[stream_id::num_streams]
+        )
+
+        if self.label_fields and self.prefetch:
+            # Read on-disk masks and heatmaps concurrently
+            docs = foul.prefetch_label_media(
+                docs, fields=self.label_fields, max_prefetch=self.prefetch
+            )
+
+        return _iter_prefetched(map(self._load_item, docs), self.prefetch)
+
+    @property
+    def epoch(self):
+        """The current epoch."""
+        return self._epoch
+
+    def set_epoch(self, epoch):
+        """Sets the current epoch, which determines the shuffled order of the
+        samples when ``shuffle == True``.
+
+        Call this method at the beginning of each epoch, before creating an
+        iterator over a :class:`torch:torch.utils.data.DataLoader` that uses
+        this dataset.
+
+        Args:
+            epoch: the epoch number
+        """
+        self._epoch = epoch
+
+    @property
+    def samples(self):
+        """The :class:`fiftyone.core.collections.SampleCollection` from which
+        this dataset is streamed.
+        """
+        if self._samples is None:
+            dataset = fod.load_dataset(self._dataset_name)
+            self._samples = fovi.DatasetView._build(dataset, self._stages)
+
+        return self._samples
+
+    def _get_shards(self, num_shards):
+        if self._shards is None or len(self._shards) != num_shards:
+            pipeline = [
+                {"$bucketAuto": {"groupBy": "$_id", "buckets": num_shards}}
+            ]
+            buckets = list(self.samples._aggregate(pipeline=pipeline))
+
+            shards = []
+            for idx, bucket in enumerate(buckets):
+                last = idx == len(buckets) - 1
+                shards.append(
+                    (bucket["_id"]["min"], bucket["_id"]["max"], last)
+                )
+
+            # There may be fewer buckets than requested if the collection is
+            # small, in which case some workers will simply not get any data
+            self._shards = shards
+
+        return list(self._shards)
+
+    def _iter_shard(self, shard, randint):
+        first, last, inclusive = shard
+        op = "$lte" if inclusive else "$lt"
+
+        project = {"_id": True, "filepath": True}
+        for field in self.label_fields:
+            project[field] = True
+
+        pipeline = [{"$match": {"_id": {"$gte": first, op: last}}}]
+
+        if randint is not None:
+            pipeline.extend(
+                [
+                    {"$set": {"_rand_stream": {"$mod": [randint, "$_rand"]}}},
+                    {"$sort": {"_rand_stream": 1}},
+                ]
+            )
+        else:
+            pipeline.append({"$sort": {"_id": 1}})
+
+        pipeline.append({"$project": project})
+
+        cursor = self.samples._aggregate(pipeline=pipeline)
+        if self.batch_size is not None:
+            cursor = cursor.batch_size(self.batch_size)
+
+        return cursor
+
+    def _load_item(self, d):
+        try:
+            img = _load_image(d["filepath"], self.use_numpy, self.force_rgb)
+
+            if self.transform is not None:
+                img = self.transform(img)
+        except Exception as e:
+            if not self.skip_failures:
+                raise e
+
+            img = e
+
+        item = [img]
+
+        if self.label_fields:
+            targets = {}
+            for field in self.label_fields:
+                value = _get_nested_value(d, field)
+                targets[field] = _label_dict_to_numpy(value)
+
+            item.append(targets)
+
+        if self.include_ids:
+            item.append(str(d["_id"]))
+
+        if len(item) == 1:
+            return img
+
+        return tuple(item)
+
+
+def _get_distributed_info():
+    if torch.distributed.is_available() and torch.distributed.is_initialized():
+        return torch.distributed.get_rank(), torch.distributed.get_world_size()
+
+    return 0, 1
+
+
+def _iter_prefetched(items, prefetch):
+    if not prefetch:
+        yield from items
+        return
+
+    done = object()
+    stop = threading.Event()
+    q = queue.Queue(maxsize=prefetch)
+
+    def _run():
+        try:
+            for item in items:
+                if stop.is_set():
+                    return
+
+                q.put((item, None))
+        except Exception as e:
+            q.put((None, e))
+            return
+
+        q.put((done, None))
+
+    thread = threading.Thread(target=_run, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item, error = q.get()
+            if error is not None:
+                raise error
+
+            if item is done:
+                break
+
+            yield item
+    finally:
+        stop.set()
+
+        # Drain the queue so that the producer cannot remain blocked
+        while thread.is_alive():
+            try:
+                q.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+
+def _get_nested_value(d, path):
+    for key in path.split("."):
+        if not isinstance(d, dict):
+            return None
+
+        d = d.get(key, None)
+
+    return d
+
+
+_LABEL_ARRAYS_CLASSES = {
+    "Detections": fol.DetectionsArrays,
+    "Keypoints": fol.KeypointsArrays,
+    "Polylines": fol.PolylinesArrays,
+}
+
+
+def _label_dict_to_numpy(d):
+    if d is None:
+        return None
+
+    label_cls = d.get("_cls", None)
+
+    if label_cls in ("Classification", "Regression"):
+        return {
+            k: v for k, v in d.items() if k in ("label", "value", "confidence")
+        }
+
+    if label_cls == "Classifications":
+        objects = d.get("classifications", None) or []
+        return {
+            "labels": np.array(
+                [obj.get("label", None) or "" for obj in objects], dtype=str
+            ),
+            "confidences": np.array(
+                [obj.get("confidence", None) for obj in objects],
+                dtype=np.float32,
+            ),
+        }
+
+    arrays_cls = _LABEL_ARRAYS_CLASSES.get(label_cls, None)
+    if arrays_cls is not None:
+        return arrays_cls.from_dict(d)
+
+    label = fol.Label.from_dict(d)
+
+    if isinstance(label, fol.Segmentation):
+        return {"mask": label.get_mask()}
+
+    if isinstance(label, fol.Heatmap):
+        return {"map": label.get_map(), "range": label.range}
+
+    return label
+
+
 def _to_eta_bbox(bounding_box):
     tlx, tly, w, h = bounding_box
     return etag.BoundingBox.from_coords(tlx, tly, tlx + w, tly + h)
@@ -446,6 +446,7 @@ def compute_orthographic_projection_images(
     subsampling_rate=None,
     projection_normal=None,
     bounds=None,
+    num_workers=None,
 ):
     """Computes orthographic projection images for the point clouds in the
     given collection.
@@ -509,6 +510,9 @@ def compute_orthographic_projection_images(
             to generate each map. Either element of the tuple or any/all of its
             values can be None, in which case a tight crop of the point cloud
             along the missing dimension(s) are used
+        num_workers (None): the number of worker processes to use to compute
+            the projections. By default, the projections are computed in the
+            main process
     """
     if in_group_slice is None and samples.media_type == fom.GROUP:
         in_group_slice = _get_point_cloud_slice(samples)
@@ -532,42 +536,89 @@ def compute_orthographic_projection_images(
         output_dir=output_dir, rel_dir=rel_dir
     )
 
+    inputs = []
+    for filepath in filepaths:
+        image_path = filename_maker.get_output_path(
+            filepath, output_ext=".png"
+        )
+        inputs.append(
+            (
+                filepath,
+                image_path,
+                size,
+                shading_mode,
+                colormap,
+                subsampling_rate,
+                projection_normal,
+                bounds,
+            )
+        )
+
+    if num_workers is None or num_workers <= 1:
+        all_metadata = _compute_projections_single(inputs)
+    else:
+        all_metadata = _compute_projections_multi(inputs, num_workers)
+
     if out_group_slice is not None:
         out_samples = []
+        for metadata, group in zip(all_metadata, groups):
+            sample = Sample(filepath=metadata.filepath)
+            sample[group_field] = group.element(out_group_slice)
+            sample[metadata_field] = metadata
+            out_samples.append(sample)
+
+        samples.add_samples(out_samples)
 
+    point_cloud_view.set_values(metadata_field, all_metadata)
+
+
+def _compute_projections_single(inputs):
     all_metadata = []
+    with fou.ProgressBar(total=len(inputs)) as pb:
+        for args in pb(inputs):
+            all_metadata.append(_do_compute_projection(args))
 
-    with fou.ProgressBar(total=len(filepaths)) as pb:
-        for filepath, group in pb(zip(filepaths, groups)):
-            image_path = filename_maker.get_output_path(
-                filepath, output_ext=".png"
-            )
+    return all_metadata
 
-            img, metadata = compute_orthographic_projection_image(
-                filepath,
-                size,
-                shading_mode=shading_mode,
-                colormap=colormap,
-                subsampling_rate=subsampling_rate,
-                projection_normal=projection_normal,
-                bounds=bounds,
-            )
 
-            foui.write(img, image_path)
-            metadata.filepath = image_path
+def _compute_projections_multi(inputs, num_workers):
+    all_metadata = []
+    with fou.ProgressBar(total=len(inputs)) as pb:
+        with fou.get_multiprocessing_context().Pool(
+            processes=num_workers
+        ) as pool:
+            for metadata in pb(pool.imap(_do_compute_projection, inputs)):
+                all_metadata.append(metadata)
 
-            if out_group_slice is not None:
-                sample = Sample(filepath=image_path)
-                sample[group_field] = group.element(out_group_slice)
-                sample[metadata_field] = metadata
-                out_samples.append(sample)
+    return all_metadata
 
-            all_metadata.append(metadata)
 
-    if out_group_slice is not None:
-        samples.add_samples(out_samples)
+def _do_compute_projection(args):
+    (
+        filepath,
+        image_path,
+        size,
+        shading_mode,
+        colormap,
+        subsampling_rate,
+        projection_normal,
+        bounds,
+    ) = args
+
+    img, metadata = compute_orthographic_projection_image(
+        filepath,
+        size,
+        shading_mode=shading_mode,
+        colormap=colormap,
+        subsampling_rate=subsampling_rate,
+        projection_normal=projection_normal,
+        bounds=bounds,
+    )
 
-    point_cloud_view.set_values(metadata_field, all_metadata)
+    foui.write(img, image_path)
+    metadata.filepath = image_path
+
+    return metadata
 
 
 def compute_orthographic_projection_image(
@@ -619,11 +670,7 @@ def compute_orthographic_projection_image(
         -   the orthographic projection image
         -   an :class:`OrthographicProjectionMetadata` instance
     """
-    if colormap is None:
-        colormap = DEFAULT_SHADING_GRADIENT_MAP
-
-    if not isinstance(colormap, dict):
-        colormap = dict(zip(np.linspace(0, 1, len(colormap)), colormap))
+    colormap_values, colormap_colors = _parse_colormap(colormap)
 
     points, colors, metadata = _parse_point_cloud(
         filepath,
@@ -650,9 +697,7 @@ def compute_orthographic_projection_image(
         and shading_mode != "height"
     ):
         if shading_mode == "rgb":
-            image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = (
-                colors * 255.0
-            )
+            rgbs = colors * 255.0
         else:
             # use R channel for intensity, discard G and B channels
             min_intensity = np.min(colors[:, 0])
@@ -662,11 +707,9 @@ def compute_orthographic_projection_image(
             )
 
             # map intensity value to RGB
-            rgb_refs = _clamp_to_discrete(
-                intensities_normalized_t, list(colormap.keys())
+            rgbs = _apply_colormap(
+                intensities_normalized_t, colormap_values, colormap_colors
             )
-            rgbs = np.array([colormap[v] for v in rgb_refs])
-            image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = rgbs
     elif shading_mode == "height":
         # color by height (z)
         max_z = np.max(points[:, 2])
@@ -674,11 +717,11 @@ def compute_orthographic_projection_image(
         z_normalized = (points[:, 2] - min_z) / (max_z - min_z)
 
         # map z value to color
-        rgb_refs = _clamp_to_discrete(z_normalized, list(colormap.keys()))
-        rgbs = np.array([colormap[v] for v in rgb_refs])
-        image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = rgbs
+        rgbs = _apply_colormap(z_normalized, colormap_values, colormap_colors)
     else:
-        image[np.int_(points[:, 0]), np.int_(points[:, 1]), :] = 255.0
+        rgbs = 255.0
+
+    _render_points(image, points, rgbs)
 
     # change axis orientation such that y is up
     image = np.rot90(image, k=1, axes=(0, 1))
@@ -761,6 +804,56 @@ def _get_point_cloud_slice(samples):
     return slice_name
 
 
+def _parse_colormap(colormap):
+    """Returns a ``(values, colors)`` lookup table for the given colormap,
+    where ``values`` are the sorted gradient values and ``colors`` is a
+    ``len(values) x 3`` array of the corresponding RGB colors.
+    """
+    if colormap is None:
+        colormap = DEFAULT_SHADING_GRADIENT_MAP
+
+    if not isinstance(colormap, dict):
+        colormap = dict(zip(np.linspace(0, 1, len(colormap)), colormap))
+
+    values = sorted(colormap.keys())
+    colors = np.array([colormap[v] for v in values])
+
+    return np.array(values), colors
+
+
+def _apply_colormap(arr, values, colors):
+    """Maps each value in ``arr`` to the color of the closest gradient value
+    in the given lookup table. See :func:`_clamp_to_discrete`.
+    """
+    idx = np.searchsorted(values, arr - 1e-8)
+    return colors[np.clip(idx, 0, len(values) - 1)]
+
+
+def _render_points(image, points, values):
+    """Renders the given projected points into the image.
+
+    When multiple points fall in the same pixel, the point with the largest
+    ``z`` coordinate (i.e., the one nearest to the viewer) is rendered.
+    """
+    if len(points) == 0:
+        return
+
+    x = points[:, 0].astype(int)
+    y = points[:, 1].astype(int)
+    z = points[:, 2]
+    pixels = x * image.shape[1] + y
+
+    # z-buffer containing the maximum depth of each pixel
+    zbuffer = np.full(image.shape[0] * image.shape[1], -np.inf)
+    np.maximum.at(zbuffer, pixels, z)
+    inds = np.flatnonzero(z >= zbuffer[pixels])
+
+    if np.ndim(values) > 0:
+        values = values[inds]
+
+    image[x[inds], y[inds], :] = values
+
+
 def _clamp_to_discrete(arr, discrete):
     """Discretize by mapping each continuous value in ``arr`` to the closest
     value in ``discrete``.
@@ -74,6 +74,8 @@ class VOCDetectionDatasetImporter(
         seed (None): a random seed to use when shuffling
         max_samples (None): a maximum number of samples to import. By default,
             all samples are imported
+        num_workers (None): a number of worker processes to use to load the
+            labels files in parallel. By default, labels are loaded serially
     """
 
     def __init__(
@@ -86,6 +88,7 @@ class VOCDetectionDatasetImporter(
         shuffle=False,
         seed=None,
         max_samples=None,
+        num_workers=None,
     ):
         if dataset_dir is None and data_path is None and labels_path is None:
             raise ValueError(
@@ -116,28 +119,32 @@ class VOCDetectionDatasetImporter(
         self.labels_path = labels_path
         self.include_all_data = include_all_data
         self.extra_attrs = extra_attrs
+        self.num_workers = num_workers
 
         self._image_paths_map = None
         self._labels_paths_map = None
         self._uuids = None
-        self._iter_uuids = None
+        self._iter_labels = None
         self._num_samples = None
 
     def __iter__(self):
-        self._iter_uuids = iter(self._uuids)
+        tasks = (
+            (uuid, self._labels_paths_map.get(uuid, None), self.extra_attrs)
+            for uuid in self._uuids
+        )
+        self._iter_labels = fou.iter_map(
+            _load_voc_labels, tasks, num_workers=self.num_workers
+        )
         return self
 
     def __len__(self):
         return self._num_samples
 
     def __next__(self):
-        uuid = next(self._iter_uuids)
+        uuid, annotation, detections = next(self._iter_labels)
 
-        labels_path = self._labels_paths_map.get(uuid, None)
-        if labels_path:
+        if annotation is not None:
             # Labeled image
-            annotation = load_voc_detection_annotations(labels_path)
-
             # Use image filename from annotation file if possible
             if annotation.filename:
                 _uuid = os.path.splitext(annotation.filename)[0]
@@ -160,12 +167,10 @@ class VOCDetectionDatasetImporter(
                 raise ValueError("No image found for sample '%s'" % _uuid)
 
             image_metadata = annotation.metadata
-            detections = annotation.to_detections(extra_attrs=self.extra_attrs)
         else:
             # Unlabeled image
             image_path = self._image_paths_map[uuid]
             image_metadata = None
-            detections = None
 
         return image_path, image_metadata, detections
 
@@ -208,6 +213,11 @@ class VOCDetectionDatasetImporter(
         self._uuids = uuids
         self._num_samples = len(uuids)
 
+    def close(self, *args):
+        if self._iter_labels is not None:
+            self._iter_labels.close()
+            self._iter_labels = None
+
 
 class VOCDetectionDatasetExporter(
     foud.LabeledImageDatasetExporter, foud.ExportPathsMixin
@@ -784,6 +794,18 @@ VOC_DETECTION_CLASSES = [
 ]
 
 
+def _load_voc_labels(args):
+    uuid, labels_path, extra_attrs = args
+
+    if not labels_path:
+        return uuid, None, None
+
+    annotation = load_voc_detection_annotations(labels_path)
+    detections = annotation.to_detections(extra_attrs=extra_attrs)
+
+    return uuid, annotation, detections
+
+
 def _ensure_list(value):
     if value is None:
         return []
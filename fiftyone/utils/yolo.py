@@ -15,6 +15,7 @@ import eta.core.utils as etau
 
 import fiftyone.core.labels as fol
 import fiftyone.core.storage as fos
+import fiftyone.core.utils as fou
 import fiftyone.utils.data as foud
 
 
@@ -199,6 +200,8 @@ class YOLOv4DatasetImporter(
         seed (None): a random seed to use when shuffling
         max_samples (None): a maximum number of samples to import. By default,
             all samples are imported
+        num_workers (None): a number of worker processes to use to load the
+            labels files in parallel. By default, labels are loaded serially
     """
 
     def __init__(
@@ -213,6 +216,7 @@ class YOLOv4DatasetImporter(
         shuffle=False,
         seed=None,
         max_samples=None,
+        num_workers=None,
     ):
         if dataset_dir is None and data_path is None and labels_path is None:
             raise ValueError(
@@ -253,33 +257,34 @@ class YOLOv4DatasetImporter(
         self.objects_path = objects_path
         self.classes = classes
         self.include_all_data = include_all_data
+        self.num_workers = num_workers
 
         self._info = None
         self._classes = None
         self._labels_paths_map = None
         self._filepaths = None
-        self._iter_filepaths = None
+        self._iter_samples = None
         self._num_samples = None
 
     def __iter__(self):
-        self._iter_filepaths = iter(self._filepaths)
+        tasks = (
+            (
+                filepath,
+                self._labels_paths_map.get(filepath, None),
+                self._classes,
+            )
+            for filepath in self._filepaths
+        )
+        self._iter_samples = fou.iter_map(
+            _load_yolo_sample, tasks, num_workers=self.num_workers
+        )
         return self
 
     def __len__(self):
         return self._num_samples
 
     def __next__(self):
-        filepath = next(self._iter_filepaths)
-
-        labels_path = self._labels_paths_map.get(filepath, None)
-        if labels_path:
-            # Labeled image
-            label = load_yolo_annotations(labels_path, self._classes)
-        else:
-            # Unlabeled image
-            label = None
-
-        return filepath, None, label
+        return next(self._iter_samples)
 
     @property
     def has_dataset_info(self):
@@ -364,6 +369,11 @@ class YOLOv4DatasetImporter(
     def get_dataset_info(self):
         return self._info
 
+    def close(self, *args):
+        if self._iter_samples is not None:
+            self._iter_samples.close()
+            self._iter_samples = None
+
 
 class YOLOv5DatasetImporter(
     foud.LabeledImageDatasetImporter, foud.ImportPathsMixin
@@ -395,6 +405,8 @@ class YOLOv5DatasetImporter(
         seed (None): a random seed to use when shuffling
         max_samples (None): a maximum number of samples to import. By default,
             all samples are imported
+        num_workers (None): a number of worker processes to use to load the
+            labels files in parallel. By default, labels are loaded serially
     """
 
     def __init__(
@@ -406,6 +418,7 @@ class YOLOv5DatasetImporter(
         shuffle=False,
         seed=None,
         max_samples=None,
+        num_workers=None,
     ):
         if dataset_dir is None and yaml_path is None:
             raise ValueError(
@@ -428,33 +441,34 @@ class YOLOv5DatasetImporter(
         self.yaml_path = yaml_path
         self.split = split
         self.include_all_data = include_all_data
+        self.num_workers = num_workers
 
         self._info = None
         self._classes = None
         self._labels_paths_map = None
         self._filepaths = None
-        self._iter_filepaths = None
+        self._iter_samples = None
         self._num_samples = None
 
     def __iter__(self):
-        self._iter_filepaths = iter(self._filepaths)
+        tasks = (
+            (
+                filepath,
+                self._labels_paths_map.get(filepath, None),
+                self._classes,
+            )
+            for filepath in self._filepaths
+        )
+        self._iter_samples = fou.iter_map(
+            _load_yolo_sample, tasks, num_workers=self.num_workers
+        )
         return self
 
     def __len__(self):
         return self._num_samples
 
     def __next__(self):
-        filepath = next(self._iter_filepaths)
-
-        labels_path = self._labels_paths_map.get(filepath, None)
-        if labels_path:
-            # Labeled image
-            label = load_yolo_annotations(labels_path, self._classes)
-        else:
-            # Unlabeled image
-            label = None
-
-        return filepath, None, label
+        return next(self._iter_samples)
 
     @property
     def has_dataset_info(self):
@@ -528,6 +542,11 @@ class YOLOv5DatasetImporter(
     def get_dataset_info(self):
         return self._info
 
+    def close(self, *args):
+        if self._iter_samples is not None:
+            self._iter_samples.close()
+            self._iter_samples = None
+
 
 class YOLOv4DatasetExporter(
     foud.LabeledImageDatasetExporter, foud.ExportPathsMixin
@@ -969,7 +988,8 @@ class YOLOAnnotationWriter(object):
         """Writes the detections to disk.
 
         Args:
-            detections: a :class:`fiftyone.core.labels.Detections` instance
+            detections: a :class:`fiftyone.core.labels.Detections` or
+                :class:`fiftyone.core.labels.DetectionsArrays` instance
             txt_path: the path to write the annotation TXT file
             labels_map_rev: a dictionary mapping class label strings to target
                 integers
@@ -978,10 +998,20 @@ class YOLOAnnotationWriter(object):
             include_confidence (False): whether to include confidences in the
                 export, if they exist
         """
-        rows = []
-        for detection in detections.detections:
-            label = detection.label
+        if isinstance(detections, fol.DetectionsArrays):
+            objects = zip(
+                detections.labels,
+                detections.bounding_boxes.tolist(),
+                detections.confidences.tolist(),
+            )
+        else:
+            objects = (
+                (d.label, d.bounding_box, d.confidence)
+                for d in detections.detections
+            )
 
+        rows = []
+        for label, bounding_box, confidence in objects:
             if dynamic_classes and label not in labels_map_rev:
                 target = len(labels_map_rev)
                 labels_map_rev[label] = target
@@ -995,14 +1025,10 @@ class YOLOAnnotationWriter(object):
             else:
                 target = labels_map_rev[label]
 
-            if include_confidence:
-                confidence = detection.confidence
-            else:
-                confidence = None
+            if not include_confidence or confidence != confidence:
+                confidence = None  # NaN confidences are missing
 
-            row = _make_yolo_row(
-                detection.bounding_box, target, confidence=confidence
-            )
+            row = _make_yolo_row(bounding_box, target, confidence=confidence)
             rows.append(row)
 
         _write_file_lines(rows, txt_path)
@@ -1036,6 +1062,19 @@ def load_yolo_annotations(txt_path, classes):
     return fol.Detections(detections=detections)
 
 
+def _load_yolo_sample(args):
+    filepath, labels_path, classes = args
+
+    if labels_path:
+        # Labeled image
+        label = load_yolo_annotations(labels_path, classes)
+    else:
+        # Unlabeled image
+        label = None
+
+    return filepath, None, label
+
+
 def _parse_yolo_v5_path(filepath, yaml_path):
     if os.path.isabs(filepath):
         return filepath
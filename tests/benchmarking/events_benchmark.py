@@ -0,0 +1,115 @@
+"""
+Benchmarking for :mod:`fiftyone.server.events`.
+
+Measures the CPU usage of the server process while many App listeners are
+connected but idle, and the latency with which state updates are delivered
+to all of them.
+
+Results are written to `events_benchmark.log`.
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import asyncio
+import logging
+import os
+import time
+
+import eta.core.logging as etal
+
+from fiftyone.core.session.events import ListenPayload, StateUpdate
+import fiftyone.core.state as fos
+import fiftyone.server.events as fose
+
+
+logger = logging.getLogger(__name__)
+
+
+# Logs everything written by a `logger` in this benchmark
+etal.custom_setup(
+    etal.LoggingConfig(
+        dict(
+            filename=os.path.splitext(os.path.abspath(__file__))[0] + ".log",
+            file_format="%(message)s",
+        )
+    ),
+    verbose=False,
+)
+
+
+NUM_LISTENERS = 100
+IDLE_TIME = 5
+NUM_UPDATES = 100
+
+
+async def _listen(idx, latencies, sent):
+    payload = ListenPayload(
+        initializer=fos.StateDescription(),
+        events=[StateUpdate.get_event_name()],
+        subscription="listener%d" % idx,
+    )
+    async for _ in fose.add_event_listener(None, payload):
+        # Ignore the updates that other listeners dispatch when they connect
+        if sent[0] is not None:
+            latencies.append(time.perf_counter() - sent[0])
+
+
+async def _run():
+    latencies = []
+    sent = [None]
+    tasks = [
+        asyncio.ensure_future(_listen(idx, latencies, sent))
+        for idx in range(NUM_LISTENERS)
+    ]
+    await asyncio.sleep(0.1)
+
+    # Idle listeners
+    cpu_start = time.process_time()
+    await asyncio.sleep(IDLE_TIME)
+    cpu_time = time.process_time() - cpu_start
+
+    logger.info(
+        "Idle CPU usage with %d listeners: %.2f%%"
+        % (NUM_LISTENERS, 100 * cpu_time / IDLE_TIME)
+    )
+
+    # State updates
+    state = fos.StateDescription()
+    cpu_start = time.process_time()
+    for _ in range(NUM_UPDATES):
+        sent[0] = time.perf_counter()
+        await fose.dispatch_event(None, StateUpdate(state=state))
+        while len(latencies) < NUM_LISTENERS:
+            await asyncio.sleep(0)
+
+        latencies.clear()
+
+    cpu_time = time.process_time() - cpu_start
+    logger.info(
+        "Delivered %d state updates to %d listeners in %.3fs of CPU time"
+        % (NUM_UPDATES, NUM_LISTENERS, cpu_time)
+    )
+
+    # Latency of a single update
+    sent[0] = time.perf_counter()
+    await fose.dispatch_event(None, StateUpdate(state=state))
+    while len(latencies) < NUM_LISTENERS:
+        await asyncio.sleep(0)
+
+    logger.info(
+        "State update latency: mean %.2fms, max %.2fms"
+        % (
+            1000 * sum(latencies) / len(latencies),
+            1000 * max(latencies),
+        )
+    )
+
+    for task in tasks:
+        task.cancel()
+
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+logger.info("\nStarting test")
+asyncio.run(_run())
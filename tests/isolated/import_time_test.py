@@ -5,12 +5,27 @@ Test that fiftyone can be imported in a reasonable amount of time.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import json
+import os
+import subprocess
+import sys
 import warnings
 import time
 
 
-# TODO: decrease these once the DB service is started on-demand?
-IMPORT_WARN_THRESHOLD = 3
+IMPORT_WARN_THRESHOLD = 2
+IMPORT_TIME_BUDGET = 2.5
+
+# Number of modules to include in the import time breakdown
+NUM_BREAKDOWN_MODULES = 20
+
+# Heavy modules that must not be loaded by `import fiftyone`
+DEFERRED_MODULES = [
+    "IPython",
+    "matplotlib",
+    "plotly.express",
+    "sklearn",
+]
 
 
 def test_import_time(capsys):
@@ -26,3 +41,93 @@ def test_import_time(capsys):
             # message must follow this format:
             # https://docs.github.com/en/actions/reference/workflow-commands-for-github-actions#setting-a-warning-message
             print("\n::warning::%s\n" % message)
+
+
+def test_import_time_budget(capsys):
+    total_time, module_times = _get_import_times()
+
+    breakdown = "\n".join(
+        "%8.3fs  %s" % (t, m)
+        for m, t in sorted(
+            module_times.items(), key=lambda kv: kv[1], reverse=True
+        )[:NUM_BREAKDOWN_MODULES]
+    )
+
+    with capsys.disabled():
+        print(
+            "\n`import fiftyone` took %f seconds. Slowest imports:\n%s\n"
+            % (total_time, breakdown)
+        )
+
+    assert total_time <= IMPORT_TIME_BUDGET, (
+        "`import fiftyone` took %f seconds, which exceeds the budget of %f "
+        "seconds. Slowest imports:\n%s"
+        % (total_time, IMPORT_TIME_BUDGET, breakdown)
+    )
+
+
+def test_deferred_imports():
+    code = (
+        "import json, sys; import fiftyone; "
+        "import fiftyone.core.odm.database as foodb; "
+        "print(json.dumps([foodb._client is None, "
+        "[m for m in %r if m in sys.modules]]))" % (DEFERRED_MODULES,)
+    )
+    out = subprocess.check_output(
+        [sys.executable, "-c", code], env=_get_env(), text=True
+    )
+    no_client, loaded = json.loads(out.strip().splitlines()[-1])
+
+    # The database connection is established on first use
+    assert no_client
+
+    assert not loaded, "`import fiftyone` imported %s" % loaded
+
+
+def _get_import_times():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import fiftyone"],
+        env=_get_env(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+
+    # Lines have the format:
+    # import time: self [us] | cumulative | imported package
+    module_times = {}
+    total_time = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        chunks = line[len("import time:") :].split("|")
+        try:
+            cumulative = int(chunks[1]) / 1e6
+        except ValueError:
+            continue  # header
+
+        name = chunks[2]
+        module = name.strip()
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+
+        if module == "fiftyone" and depth == 0:
+            total_time = cumulative
+
+        # Direct dependencies of `fiftyone` and `fiftyone.__public__`
+        if depth in (1, 2):
+            module_times[module] = max(cumulative, module_times.get(module, 0))
+
+    return total_time, module_times
+
+
+def _get_env():
+    env = dict(os.environ)
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+
+    # Import tracking happens in a background thread, which would pollute the
+    # import timings
+    env["FIFTYONE_DO_NOT_TRACK"] = "true"
+
+    return env
@@ -5,13 +5,17 @@ Tests for the :mod:`fiftyone.utils.torch` module.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import os
 import unittest
+from unittest import mock
 
 import numpy as np
 from PIL import Image
 import torch
 import torchvision
 
+import eta.core.utils as etau
+
 import fiftyone as fo
 import fiftyone.utils.torch as fout
 
@@ -51,6 +55,171 @@ def test_torch_max_size():
     assert result.size == (200, 200)
 
 
+def _make_streaming_dataset(tmp_dir, num_samples=20):
+    samples = []
+    for idx in range(num_samples):
+        filepath = os.path.join(tmp_dir, "%06d.png" % idx)
+        _get_fake_img(8, 8).save(filepath)
+
+        samples.append(
+            fo.Sample(
+                filepath=filepath,
+                ground_truth=fo.Classification(label=str(idx % 3)),
+                predictions=fo.Detections(
+                    detections=[
+                        fo.Detection(
+                            label="cat", bounding_box=[0.1, 0.1, 0.4, 0.4]
+                        )
+                    ]
+                ),
+            )
+        )
+
+    dataset = fo.Dataset()
+    dataset.add_samples(samples)
+
+    return dataset
+
+
+def _get_worker_info(worker_id, num_workers):
+    return mock.Mock(id=worker_id, num_workers=num_workers)
+
+
+def _iter_streaming_ids(torch_dataset, worker_id=0, num_workers=1):
+    with mock.patch.object(
+        torch.utils.data,
+        "get_worker_info",
+        return_value=_get_worker_info(worker_id, num_workers),
+    ):
+        return [item[-1] for item in torch_dataset]
+
+
+def test_torch_streaming_dataset_shards():
+    with etau.TempDir() as tmp_dir:
+        dataset = _make_streaming_dataset(tmp_dir)
+        view = dataset.skip(2).limit(15)
+
+        world_size = 2
+        num_workers = 3
+
+        stream_ids = []
+        for rank in range(world_size):
+            torch_dataset = fout.TorchStreamingDataset(
+                view,
+                include_ids=True,
+                use_numpy=True,
+                shuffle=True,
+                rank=rank,
+                world_size=world_size,
+            )
+
+            for worker_id in range(num_workers):
+                stream_ids.append(
+                    _iter_streaming_ids(
+                        torch_dataset,
+                        worker_id=worker_id,
+                        num_workers=num_workers,
+                    )
+                )
+
+        all_ids = [_id for ids in stream_ids for _id in ids]
+
+        # Shards are disjoint and together they cover the view
+        assert len(all_ids) == len(set(all_ids))
+        assert sorted(all_ids) == sorted(view.values("id"))
+        assert sum(bool(ids) for ids in stream_ids) > 1
+
+        dataset.delete()
+
+
+def test_torch_streaming_dataset_epochs():
+    with etau.TempDir() as tmp_dir:
+        dataset = _make_streaming_dataset(tmp_dir)
+
+        torch_dataset = fout.TorchStreamingDataset(
+            dataset,
+            include_ids=True,
+            use_numpy=True,
+            shuffle=True,
+            seed=51,
+            num_shards=4,
+        )
+
+        torch_dataset.set_epoch(1)
+        ids1 = _iter_streaming_ids(torch_dataset)
+        ids1b = _iter_streaming_ids(torch_dataset)
+
+        torch_dataset.set_epoch(2)
+        ids2 = _iter_streaming_ids(torch_dataset)
+
+        torch_dataset.set_epoch(1)
+        ids1c = _iter_streaming_ids(torch_dataset)
+
+        # The same epoch yields the same order
+        assert ids1 == ids1b
+        assert ids1 == ids1c
+
+        # A new epoch yields a different order of the same samples
+        assert ids2 != ids1
+        assert sorted(ids2) == sorted(ids1)
+
+        # Shuffling is a function of the seed, not of the instance
+        other_dataset = fout.TorchStreamingDataset(
+            dataset,
+            include_ids=True,
+            use_numpy=True,
+            shuffle=True,
+            seed=51,
+            num_shards=4,
+        )
+        other_dataset.set_epoch(2)
+        assert _iter_streaming_ids(other_dataset) == ids2
+
+        dataset.delete()
+
+
+def test_torch_streaming_dataset_fields():
+    with etau.TempDir() as tmp_dir:
+        dataset = _make_streaming_dataset(tmp_dir, num_samples=5)
+
+        torch_dataset = fout.TorchStreamingDataset(
+            dataset,
+            label_fields="ground_truth",
+            use_numpy=True,
+            prefetch=0,
+        )
+
+        docs = []
+        load_item = torch_dataset._load_item
+
+        def _load_item(d):
+            docs.append(d)
+            return load_item(d)
+
+        with mock.patch.object(
+            torch_dataset, "_load_item", side_effect=_load_item
+        ), mock.patch.object(
+            fout, "_label_dict_to_numpy", wraps=fout._label_dict_to_numpy
+        ) as label_dict_to_numpy:
+            items = list(torch_dataset)
+
+        assert len(items) == 5
+        for img, targets in items:
+            assert isinstance(img, np.ndarray)
+            assert set(targets.keys()) == {"ground_truth"}
+
+        # Only the selected fields are loaded from the database and decoded
+        assert len(docs) == 5
+        for d in docs:
+            assert set(d.keys()) == {"_id", "filepath", "ground_truth"}
+
+        assert label_dict_to_numpy.call_count == 5
+        for call in label_dict_to_numpy.call_args_list:
+            assert call.args[0]["_cls"] == "Classification"
+
+        dataset.delete()
+
+
 @unittest.skip("Must be run manually")
 def test_torch_image_patches_dataset():
     image_path = "/path/to/an/image.png"
@@ -0,0 +1,265 @@
+"""
+FiftyOne CVAT unit tests.
+
+These tests run against a local stub of the CVAT REST API. See
+``tests/intensive/cvat_tests.py`` for tests that require a real CVAT server.
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import re
+import threading
+import time
+import unittest
+import unittest.mock
+
+import fiftyone as fo
+import fiftyone.core.utils as fou
+import fiftyone.utils.cvat as fouc
+
+from decorators import drop_datasets
+
+
+class _StubCVATHandler(BaseHTTPRequestHandler):
+    deleted_tasks = set()
+    lock = threading.Lock()
+    num_active = 0
+    max_active = 0
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        if self.path == "/api/auth/login":
+            return self._send_json({})
+
+        self._send_json({}, status=404)
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.num_active += 1
+            cls.max_active = max(cls.max_active, cls.num_active)
+
+        try:
+            d = self._handle_get()
+        finally:
+            # Mark the request inactive before responding, since the client
+            # may send its next request as soon as it receives the response
+            with cls.lock:
+                cls.num_active -= 1
+
+        if d is not None:
+            self._send_json(d)
+        else:
+            self._send_json({}, status=404)
+
+    def _handle_get(self):
+        if self.path == "/api/server/about":
+            return {"version": "2.3.0"}
+
+        m = re.match(r"^/api/tasks/(\d+)(/.*)?$", self.path)
+        if m is None:
+            return None
+
+        task_id = int(m.group(1))
+        route = m.group(2) or ""
+
+        if task_id in self.deleted_tasks:
+            return None
+
+        # Make later tasks respond faster so that responses arrive out of order
+        time.sleep(0.01 * (10 - task_id))
+
+        if route == "/status":
+            return {"state": "Finished"}
+
+        if route == "/data/meta":
+            return {
+                "frames": [{"width": 10, "height": 10}],
+                "start_frame": 0,
+                "stop_frame": 0,
+                "frame_filter": "",
+            }
+
+        if route == "/annotations":
+            return {
+                "shapes": [{"task": task_id}],
+                "tags": [],
+                "tracks": [],
+            }
+
+        if route == "":
+            return {
+                "labels": [
+                    {
+                        "id": 10 * task_id,
+                        "name": "label%d" % task_id,
+                        "attributes": [],
+                    }
+                ]
+            }
+
+        return None
+
+    def _send_json(self, d, status=200):
+        body = json.dumps(d).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class CVATStubServerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubCVATHandler)
+        cls.thread = threading.Thread(
+            target=cls.server.serve_forever, daemon=True
+        )
+        cls.thread.start()
+
+        host, port = cls.server.server_address
+        cls.url = "http://%s:%d" % (host, port)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        _StubCVATHandler.deleted_tasks = {4}
+        _StubCVATHandler.max_active = 0
+
+    def _connect(self, num_workers=None):
+        return fouc.CVATAnnotationAPI(
+            "cvat",
+            self.url,
+            username="user",
+            password="pass",
+            num_workers=num_workers,
+        )
+
+    def _download_task_data(self, num_workers):
+        api = self._connect(num_workers=num_workers)
+        task_ids = [1, 2, 3, 4, 5, 6]
+        try:
+            return list(
+                fou.iter_map(
+                    api._download_task_data,
+                    task_ids,
+                    num_workers=num_workers,
+                    max_prefetch=num_workers,
+                    use_threads=True,
+                )
+            )
+        finally:
+            api.close()
+
+    def _check_task_data(self, task_data):
+        self.assertEqual(len(task_data), 6)
+        self.assertIsNone(task_data[3])
+
+        for task_id, _task_data in zip(
+            [1, 2, 3, 5, 6], task_data[:3] + task_data[4:]
+        ):
+            data_resp, attr_id_map, class_map_rev, task_resp = _task_data
+            self.assertEqual(data_resp["stop_frame"], 0)
+            self.assertDictEqual(attr_id_map, {10 * task_id: {}})
+            self.assertDictEqual(
+                class_map_rev, {"label%d" % task_id: 10 * task_id}
+            )
+            self.assertEqual(task_resp["shapes"][0]["task"], task_id)
+
+    def test_download_task_data(self):
+        task_data = self._download_task_data(None)
+        self._check_task_data(task_data)
+        self.assertEqual(_StubCVATHandler.max_active, 1)
+
+    def test_download_task_data_concurrent(self):
+        task_data = self._download_task_data(4)
+        self._check_task_data(task_data)
+        self.assertGreater(_StubCVATHandler.max_active, 1)
+
+    def _upload_samples(self, num_workers):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    metadata=fo.ImageMetadata(width=10, height=10),
+                    gt=fo.Detections(
+                        detections=[
+                            fo.Detection(
+                                label="cat", bounding_box=[0, 0, 1, 1]
+                            )
+                        ]
+                    ),
+                )
+                for i in range(4)
+            ]
+        )
+
+        label_schema = {
+            "gt": {
+                "type": "detections",
+                "classes": ["cat"],
+                "attributes": {},
+                "existing_field": True,
+            }
+        }
+        config = fouc.CVATBackendConfig(
+            "cvat",
+            label_schema,
+            url=self.url,
+            task_size=1,
+            num_workers=num_workers,
+        )
+        backend = fouc.CVATBackend(config)
+
+        events = []
+        update_shapes_tags_tracks = (
+            fouc.CVATAnnotationAPI._update_shapes_tags_tracks
+        )
+
+        def _update_shapes_tags_tracks(api, *args):
+            events.append("build")
+            return update_shapes_tags_tracks(api, *args)
+
+        def _create_task_upload_samples(api, args):
+            events.append("create")
+            task_id = args[1] + 1
+            return task_id, [task_id], {}, {}
+
+        api = self._connect(num_workers=num_workers)
+        try:
+            with unittest.mock.patch.multiple(
+                fouc.CVATAnnotationAPI,
+                _update_shapes_tags_tracks=_update_shapes_tags_tracks,
+                _create_task_upload_samples=_create_task_upload_samples,
+            ):
+                results = api.upload_samples(dataset, "test", backend)
+        finally:
+            api.close()
+
+        return results, events
+
+    @drop_datasets
+    def test_upload_samples(self):
+        # Task payloads are built as the tasks are created
+        results, events = self._upload_samples(None)
+        self.assertListEqual(results.task_ids, [1, 2, 3, 4])
+        self.assertListEqual(events, ["build", "create"] * 4)
+
+        results, events = self._upload_samples(2)
+        self.assertListEqual(results.task_ids, [1, 2, 3, 4])
+        self.assertListEqual(events[:2], ["build", "build"])
+        self.assertNotEqual(events[2:4], ["build", "build"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
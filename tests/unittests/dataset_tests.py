@@ -12,17 +12,23 @@ import os
 import random
 import string
 import unittest
+import unittest.mock
 
 from bson import ObjectId
 from mongoengine import ValidationError
 import numpy as np
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import AutoReconnect
 import pytz
 
 import eta.core.utils as etau
 
 import fiftyone as fo
+import fiftyone.core.collections as foc
+import fiftyone.core.dataset as fod
 import fiftyone.core.fields as fof
 import fiftyone.core.odm as foo
+import fiftyone.core.view as fov
 import fiftyone.utils.data as foud
 from fiftyone import ViewField as F
 
@@ -529,6 +535,129 @@ class DatasetTests(unittest.TestCase):
 
         self.assertTupleEqual(dataset.bounds("int"), (4, 53))
 
+        for idx, sample in enumerate(
+            dataset.iter_samples(
+                autosave=True, batch_size=7, async_writes=True
+            )
+        ):
+            sample["int"] = idx + 5
+
+        self.assertTupleEqual(dataset.bounds("int"), (5, 54))
+
+        with dataset.save_context(batch_size=10, async_writes=True) as ctx:
+            for idx, sample in enumerate(dataset):
+                sample["int"] = idx + 6
+                ctx.save(sample)
+
+                # Multiple saves of the same sample are merged
+                sample["str"] = str(idx)
+                ctx.save(sample)
+
+                sample["str"] = None
+                sample["int2"] = idx
+                ctx.save(sample)
+
+            self.assertLessEqual(ctx.queue_depth, 1)
+
+        self.assertEqual(ctx.queue_depth, 0)
+        self.assertIsNotNone(ctx.flush_latency)
+        self.assertTupleEqual(dataset.bounds("int"), (6, 55))
+        self.assertTupleEqual(dataset.bounds("int2"), (0, 49))
+        self.assertEqual(dataset.count("str"), 0)
+
+    @drop_datasets
+    def test_iter_dicts(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    int=i,
+                    gt=fo.Classification(label=str(i)),
+                )
+                for i in range(10)
+            ]
+        )
+
+        dicts = list(dataset.iter_dicts())
+        self.assertEqual(len(dicts), 10)
+        self.assertIsInstance(dicts[0]["_id"], ObjectId)
+        self.assertEqual(dicts[0]["gt"]["label"], "0")
+        self.assertIn("filepath", dicts[0])
+
+        dicts = list(dataset.iter_dicts(fields=["id", "int"], batch_size=3))
+        self.assertListEqual([d["int"] for d in dicts], list(range(10)))
+        self.assertSetEqual(set(dicts[0].keys()), {"_id", "int"})
+        self.assertListEqual(
+            [str(d["_id"]) for d in dicts], dataset.values("id")
+        )
+
+        view = dataset.match(F("int") > 5).sort_by("int", reverse=True)
+        dicts = list(view.iter_dicts(fields="gt.label", raw_bson=True))
+        self.assertListEqual(
+            [d["gt"]["label"] for d in dicts], ["9", "8", "7", "6"]
+        )
+
+    @drop_datasets
+    def test_save_context_merge_ops(self):
+        _id1 = ObjectId()
+        _id2 = ObjectId()
+
+        ops = foc._merge_update_ops(
+            [
+                UpdateOne({"_id": _id1}, {"$set": {"a": 1, "b.c": 2}}),
+                UpdateOne({"_id": _id2}, {"$set": {"a": 1}}),
+                UpdateOne({"_id": _id1}, {"$set": {"b.c": 3, "d": 4}}),
+                UpdateOne({"_id": _id1}, {"$unset": {"a": ""}}),
+            ]
+        )
+
+        self.assertEqual(len(ops), 2)
+        self.assertDictEqual(
+            ops[0]._doc, {"$set": {"b.c": 3, "d": 4}, "$unset": {"a": ""}}
+        )
+
+        # Conflicting paths cannot be merged
+        ops = foc._merge_update_ops(
+            [
+                UpdateOne({"_id": _id1}, {"$set": {"b.c": 2}}),
+                UpdateOne({"_id": _id1}, {"$set": {"b": {"c": 3}}}),
+            ]
+        )
+
+        self.assertEqual(len(ops), 2)
+
+        # Ops with array filters are not merged
+        ops = foc._merge_update_ops(
+            [
+                UpdateOne({"_id": _id1}, {"$set": {"a": 1}}),
+                UpdateOne(
+                    {"_id": _id1},
+                    {"$set": {"b.$[element].c": 1}},
+                    array_filters=[{"element._id": _id2}],
+                ),
+                UpdateOne({"_id": _id1}, {"$set": {"a": 2}}),
+            ]
+        )
+
+        self.assertEqual(len(ops), 3)
+
+    @drop_datasets
+    def test_save_context_async_errors(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i) for i in range(5)]
+        )
+
+        # Errors from the background thread are raised on exit
+        with self.assertRaises(Exception):
+            with dataset.save_context(async_writes=True) as ctx:
+                for sample in dataset:
+                    # Inserting a sample with an existing ID will fail
+                    d = sample.to_mongo_dict(include_id=True)
+                    ctx._sample_ops.append(InsertOne(d))
+                    ctx.save(sample)
+
     @drop_datasets
     def test_date_fields(self):
         dataset = fo.Dataset()
@@ -1349,6 +1478,142 @@ class DatasetTests(unittest.TestCase):
         self.assertIsNotNone(sample12.gt)
         self.assertIsNotNone(sample12.new_gt)
 
+    @drop_datasets
+    def test_merge_samples_sharded(self):
+        dataset1 = fo.Dataset()
+        dataset1.add_samples(
+            [
+                fo.Sample(filepath="image%d.jpg" % i, field=i, tags=["a"])
+                for i in range(0, 50)
+            ]
+        )
+
+        dataset2 = fo.Dataset()
+        dataset2.add_samples(
+            [
+                fo.Sample(filepath="image%d.jpg" % i, other=i, tags=["b"])
+                for i in range(25, 75)
+            ]
+        )
+
+        expected = dataset1.clone()
+        expected.merge_samples(dataset2)
+
+        dataset = dataset1.clone()
+        dataset.merge_samples(dataset2, num_workers=3)
+
+        self.assertEqual(len(dataset), 75)
+        fields = ["filepath", "field", "other", "tags"]
+        self.assertListEqual(
+            sorted(zip(*dataset.values(fields)), key=lambda v: v[0]),
+            sorted(zip(*expected.values(fields)), key=lambda v: v[0]),
+        )
+
+        # Merge a view
+        dataset = dataset1.clone()
+        dataset.merge_samples(
+            dataset2.match(F("other") >= 50), insert_new=False, num_workers=2
+        )
+
+        self.assertEqual(len(dataset), 50)
+        self.assertEqual(dataset.count("other"), 0)
+
+        dataset.merge_samples(
+            dataset2.match(F("other") < 50), insert_new=False, num_workers=2
+        )
+
+        self.assertEqual(len(dataset), 50)
+        self.assertEqual(dataset.count("other"), 25)
+
+    @drop_datasets
+    def test_merge_samples_sharded_single_sample(self):
+        dataset1 = fo.Dataset()
+        dataset1.add_sample(fo.Sample(filepath="image0.jpg", field=0))
+
+        dataset2 = fo.Dataset()
+        dataset2.add_sample(fo.Sample(filepath="image1.jpg", other=1))
+
+        dataset1.merge_samples(dataset2, num_workers=2)
+
+        self.assertEqual(len(dataset1), 2)
+        self.assertEqual(dataset1.count("other"), 1)
+
+        # Merge into an existing sample
+        dataset3 = fo.Dataset()
+        dataset3.add_sample(fo.Sample(filepath="image0.jpg", other=2))
+
+        dataset1.merge_samples(dataset3, num_workers=2)
+
+        self.assertEqual(len(dataset1), 2)
+        self.assertEqual(dataset1.count("other"), 2)
+
+    @drop_datasets
+    def test_merge_samples_shard_retry(self):
+        dataset1 = fo.Dataset()
+        dataset1.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i) for i in range(20)]
+        )
+
+        dataset2 = fo.Dataset()
+        dataset2.add_samples(
+            [fo.Sample(filepath="image%d.jpg" % i, field=i) for i in range(20)]
+        )
+
+        aggregate = fov.DatasetView._aggregate
+        failures = {}
+
+        def flaky_aggregate(view, *args, **kwargs):
+            # Fail the first attempt of each shard after it has been applied
+            result = aggregate(view, *args, **kwargs)
+            key = str(view._stages[-1].pipeline)
+            if key not in failures:
+                failures[key] = True
+                raise AutoReconnect("shard failed")
+
+            return result
+
+        with unittest.mock.patch.object(
+            fov.DatasetView, "_aggregate", flaky_aggregate
+        ):
+            dataset1.merge_samples(dataset2, num_workers=2)
+
+        self.assertGreater(len(failures), 1)
+        self.assertEqual(len(dataset1), 20)
+        self.assertListEqual(dataset1.values("field"), list(range(20)))
+
+        # Non-transient errors are not retried, and the shards that failed
+        # can be resumed
+        dataset1.set_field("field", None).save()
+        attempts = []
+
+        def failing_aggregate(view, *args, **kwargs):
+            # Fail the first shard
+            shard = view._stages[-1].pipeline[0]["$match"]["_id"]
+            attempts.append(shard)
+            if "$gte" not in shard:
+                raise ValueError("shard failed")
+
+            return aggregate(view, *args, **kwargs)
+
+        with unittest.mock.patch.object(
+            fov.DatasetView, "_aggregate", failing_aggregate
+        ):
+            with self.assertRaises(fod.MergeShardsError) as cm:
+                dataset1.merge_samples(dataset2, num_workers=2)
+
+        shards = cm.exception.shards
+        self.assertEqual(len(shards), 1)
+        self.assertNotIn("$gte", shards[0])
+        self.assertIsInstance(cm.exception.errors[0], ValueError)
+        self.assertEqual(len(attempts), len(set(map(str, attempts))))
+
+        num_failed = len(dataset2.mongo([{"$match": {"_id": shards[0]}}]))
+        self.assertGreater(num_failed, 0)
+        self.assertEqual(dataset1.count("field"), 20 - num_failed)
+
+        dataset1.merge_samples(dataset2, shards=cm.exception.shards)
+        self.assertListEqual(dataset1.values("field"), list(range(20)))
+
     @drop_datasets
     def test_merge_samples_and_labels(self):
         sample11 = fo.Sample(filepath="image1.png")
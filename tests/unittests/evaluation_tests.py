@@ -16,6 +16,8 @@ import numpy as np
 import eta.core.utils as etau
 
 import fiftyone as fo
+import fiftyone.utils.eval.coco as fouec
+import fiftyone.utils.eval.openimages as fouei
 import fiftyone.utils.labels as foul
 import fiftyone.utils.iou as foui
 
@@ -1641,6 +1643,137 @@ class DetectionsTests(unittest.TestCase):
             detection["eval2"]
 
 
+class BoxIoUTests(unittest.TestCase):
+    def _make_detections(self, num_objects, seed):
+        rng = np.random.default_rng(seed)
+        xy = rng.uniform(0, 0.7, size=(num_objects, 2))
+        wh = rng.uniform(0, 0.3, size=(num_objects, 2))
+        labels = rng.choice(["cat", "dog"], size=num_objects)
+
+        return fo.Detections(
+            detections=[
+                fo.Detection(
+                    label=str(label),
+                    bounding_box=list(b[:2]) + list(b[2:]),
+                    iscrowd=bool(i % 3 == 0),
+                )
+                for i, (label, b) in enumerate(
+                    zip(labels, np.hstack([xy, wh]))
+                )
+            ]
+        )
+
+    def _compute_iou(self, gt, pred, gt_crowd=False):
+        gx, gy, gw, gh = gt.bounding_box
+        px, py, pw, ph = pred.bounding_box
+
+        w = min(px + pw, gx + gw) - max(px, gx)
+        h = min(py + ph, gy + gh) - max(py, gy)
+        if w <= 0 or h <= 0:
+            return 0
+
+        inter = w * h
+        if gt_crowd:
+            union = pw * ph
+        else:
+            union = pw * ph + gw * gh - inter
+
+        return min(inter / union, 1)
+
+    def test_compute_ious(self):
+        preds = self._make_detections(20, 0)
+        gts = self._make_detections(15, 1)
+
+        for classwise in (False, True):
+            for iscrowd in (None, "iscrowd"):
+                ious = foui.compute_ious(
+                    preds.detections,
+                    gts.detections,
+                    classwise=classwise,
+                    iscrowd=iscrowd,
+                )
+
+                expected = np.zeros((20, 15))
+                for i, pred in enumerate(preds.detections):
+                    for j, gt in enumerate(gts.detections):
+                        if classwise and pred.label != gt.label:
+                            continue
+
+                        gt_crowd = iscrowd is not None and gt.iscrowd
+                        expected[i, j] = self._compute_iou(
+                            gt, pred, gt_crowd=gt_crowd
+                        )
+
+                self.assertTrue(np.allclose(ious, expected))
+
+                array_ious = foui.compute_ious(
+                    preds.to_arrays(),
+                    gts.to_arrays(attributes=["iscrowd"]),
+                    classwise=classwise,
+                    iscrowd=iscrowd,
+                )
+
+                self.assertTrue(np.allclose(array_ious, expected))
+
+    def test_compute_ious_symmetric(self):
+        dets = self._make_detections(10, 2).detections
+
+        ious = foui.compute_ious(dets, dets, iscrowd="iscrowd")
+
+        self.assertTrue(np.allclose(ious, ious.T))
+        self.assertTrue(np.allclose(np.diag(ious), 1))
+
+        arrays = fo.Detections(detections=dets).to_arrays(
+            attributes=["iscrowd"]
+        )
+        array_ious = foui.compute_ious(arrays, arrays, iscrowd="iscrowd")
+
+        self.assertTrue(np.allclose(array_ious, ious))
+
+    def test_compute_ious_empty(self):
+        dets = self._make_detections(3, 3)
+        empty = fo.Detections()
+
+        ious = foui.compute_ious(dets.to_arrays(), empty.to_arrays())
+        self.assertEqual(ious.shape, (3, 0))
+
+    def test_evaluate_arrays(self):
+        gts = self._make_detections(10, 0)
+        preds = self._make_detections(10, 1)
+        for idx, pred in enumerate(preds.detections):
+            pred.confidence = idx / 10
+
+        images = {"ground_truth": gts, "predictions": preds}
+        arrays = {
+            "ground_truth": gts.to_arrays(attributes=["iscrowd"]),
+            "predictions": preds.to_arrays(),
+        }
+
+        for config_cls, eval_cls in (
+            (fouec.COCOEvaluationConfig, fouec.COCOEvaluation),
+            (fouei.OpenImagesEvaluationConfig, fouei.OpenImagesEvaluation),
+        ):
+            config = config_cls(
+                "predictions",
+                "ground_truth",
+                iou=0.1,
+                classwise=False,
+                iscrowd="iscrowd",
+            )
+            eval_method = eval_cls(config)
+            eval_method.gt_field = "ground_truth"
+            eval_method.pred_field = "predictions"
+
+            expected = eval_method.evaluate(images)
+            self.assertTrue(len(expected) > 0)
+
+            matches = eval_method.evaluate(arrays)
+            self.assertListEqual(matches, expected)
+
+            matches = eval_method.evaluate(arrays, eval_key="eval")
+            self.assertListEqual(matches, expected)
+
+
 class CuboidTests(unittest.TestCase):
     def _make_dataset(self):
         group = fo.Group()
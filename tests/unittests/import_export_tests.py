@@ -5,10 +5,12 @@ FiftyOne import/export-related unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+from concurrent.futures import ThreadPoolExecutor
 import os
 import random
 import string
 import unittest
+import unittest.mock
 
 import cv2
 import numpy as np
@@ -18,6 +20,8 @@ import eta.core.utils as etau
 import eta.core.video as etav
 
 import fiftyone as fo
+import fiftyone.core.labels as fol
+import fiftyone.core.utils as fou
 import fiftyone.utils.coco as fouc
 import fiftyone.utils.image as foui
 import fiftyone.utils.labels as foul
@@ -442,6 +446,71 @@ class UnlabeledImageDatasetTests(ImageDatasetTests):
         # _images/<filename>
         self.assertEqual(len(relpath.split(os.path.sep)), 2)
 
+    @drop_datasets
+    def test_add_dir_skip_existing(self):
+        for _ in range(3):
+            self._new_image()
+
+        dataset = fo.Dataset()
+        dataset.add_dir(
+            dataset_dir=self.images_dir,
+            dataset_type=fo.types.ImageDirectory,
+            max_samples=2,
+        )
+        self.assertEqual(len(dataset), 2)
+
+        # Resume an interrupted import
+        sample_ids = dataset.add_dir(
+            dataset_dir=self.images_dir,
+            dataset_type=fo.types.ImageDirectory,
+            skip_existing=True,
+        )
+        self.assertEqual(len(sample_ids), 1)
+        self.assertEqual(len(dataset), 3)
+        self.assertEqual(len(dataset.distinct("filepath")), 3)
+
+        # Nothing new to import
+        sample_ids = dataset.add_dir(
+            dataset_dir=self.images_dir,
+            dataset_type=fo.types.ImageDirectory,
+            skip_existing=True,
+        )
+        self.assertEqual(len(sample_ids), 0)
+        self.assertEqual(len(dataset), 3)
+
+        # Content-addressed dedup: all images have the same content
+        dataset2 = fo.Dataset()
+        dataset2.add_dir(
+            dataset_dir=self.images_dir,
+            dataset_type=fo.types.ImageDirectory,
+            skip_existing=True,
+            key_field="filehash",
+        )
+        self.assertEqual(len(dataset2), 1)
+        self.assertIn("filehash", dataset2.get_field_schema())
+        self.assertIn("filehash", dataset2.list_indexes())
+
+        self._new_image()
+        sample_ids = dataset2.add_dir(
+            dataset_dir=self.images_dir,
+            dataset_type=fo.types.ImageDirectory,
+            skip_existing=True,
+            key_field="filehash",
+        )
+        self.assertEqual(len(sample_ids), 0)
+
+        img = np.random.randint(255, size=(32, 32, 3), dtype=np.uint8)
+        foui.write(img, os.path.join(self.images_dir, "new.png"))
+
+        sample_ids = dataset2.add_dir(
+            dataset_dir=self.images_dir,
+            dataset_type=fo.types.ImageDirectory,
+            skip_existing=True,
+            key_field="filehash",
+        )
+        self.assertEqual(len(sample_ids), 1)
+        self.assertEqual(len(dataset2), 2)
+
 
 class ImageClassificationDatasetTests(ImageDatasetTests):
     def _make_dataset(self):
@@ -1700,6 +1769,103 @@ class ImageDetectionDatasetTests(ImageDatasetTests):
             dataset.count_values("coco.detections.label"),
         )
 
+    @skipwindows
+    @drop_datasets
+    def test_detection_datasets_num_workers(self):
+        dataset = self._make_dataset()
+
+        for dataset_type, kwargs in (
+            (fo.types.COCODetectionDataset, {"label_types": "detections"}),
+            (fo.types.VOCDetectionDataset, {}),
+            (fo.types.YOLOv4Dataset, {}),
+            (fo.types.YOLOv5Dataset, {}),
+        ):
+            export_dir = self._new_dir()
+
+            dataset.export(
+                export_dir=export_dir,
+                dataset_type=dataset_type,
+                label_field="predictions",
+            )
+
+            dataset1 = fo.Dataset.from_dir(
+                dataset_dir=export_dir,
+                dataset_type=dataset_type,
+                label_field="predictions",
+                include_all_data=True,
+                **kwargs,
+            )
+
+            dataset2 = fo.Dataset.from_dir(
+                dataset_dir=export_dir,
+                dataset_type=dataset_type,
+                label_field="predictions",
+                include_all_data=True,
+                **kwargs,
+                num_workers=2,
+            )
+
+            self.assertEqual(len(dataset1), len(dataset))
+            self.assertListEqual(
+                dataset1.values("filepath"), dataset2.values("filepath")
+            )
+            self.assertListEqual(
+                dataset1.values("predictions.detections.label"),
+                dataset2.values("predictions.detections.label"),
+            )
+            self.assertListEqual(
+                dataset1.values("predictions.detections.bounding_box"),
+                dataset2.values("predictions.detections.bounding_box"),
+            )
+
+    def test_coco_rle_masks(self):
+        mask = np.zeros((8, 10), dtype=bool)
+        mask[1:5, 2:7] = True
+        mask[6, 0] = True
+
+        rle = fouc._mask_to_rle(mask)
+        self.assertListEqual(rle["size"], [8, 10])
+        self.assertEqual(sum(rle["counts"]), mask.size)
+
+        full_mask = fouc._coco_segmentation_to_mask(
+            rle, [0, 0, 10, 8], (10, 8)
+        )
+        self.assertTrue(np.array_equal(full_mask, mask))
+
+        box_mask = fouc._coco_segmentation_to_mask(rle, [2, 1, 5, 4], (10, 8))
+        self.assertEqual(box_mask.shape, (4, 5))
+        self.assertTrue(box_mask.all())
+
+        box_mask = fouc._coco_segmentation_to_mask(rle, [0, 5, 3, 3], (10, 8))
+        self.assertTrue(np.array_equal(box_mask, mask[5:8, 0:3]))
+
+        # Boxes that extend past or lie outside of the image are clamped
+        box_mask = fouc._coco_segmentation_to_mask(
+            rle, [-2, -1, 5, 4], (10, 8)
+        )
+        self.assertTrue(np.array_equal(box_mask, mask[0:3, 0:3]))
+
+        box_mask = fouc._coco_segmentation_to_mask(rle, [13, 2, 4, 3], (10, 8))
+        self.assertEqual(box_mask.size, 0)
+
+        box_mask = fouc._coco_segmentation_to_mask(rle, [2, 10, 4, 3], (10, 8))
+        self.assertEqual(box_mask.size, 0)
+
+        polygon = [[2, 1, 7, 1, 7, 5, 2, 5]]
+        box_mask = fouc._coco_segmentation_to_mask(
+            polygon, [13, 2, 4, 3], (10, 8)
+        )
+        self.assertEqual(box_mask.size, 0)
+
+        rle = fouc._mask_to_rle(~mask)
+        self.assertEqual(rle["counts"][0], 0)
+        self.assertTrue(
+            np.array_equal(
+                fouc._coco_segmentation_to_mask(rle, [0, 0, 10, 8], (10, 8)),
+                ~mask,
+            )
+        )
+
 
 class ImageSegmentationDatasetTests(ImageDatasetTests):
     def _make_dataset(self):
@@ -1985,6 +2151,75 @@ class ImageSegmentationDatasetTests(ImageDatasetTests):
         # data/_images/<filename>
         self.assertEqual(len(relpath.split(os.path.sep)), 3)
 
+    @drop_datasets
+    def test_prefetch_label_media(self):
+        dataset = self._make_dataset()
+        masks = dataset.values("segmentations.mask")
+
+        segmentations_dir = self._new_dir()
+        foul.export_segmentations(dataset, "segmentations", segmentations_dir)
+        self.assertEqual(dataset.count("segmentations.mask"), 0)
+
+        samples = foul.prefetch_label_media(
+            dataset, fields="segmentations", num_workers=4
+        )
+        for sample, mask in zip(samples, masks):
+            if mask is None:
+                self.assertIsNone(sample.segmentations)
+            else:
+                self.assertTrue(
+                    np.array_equal(sample.segmentations.get_mask(), mask)
+                )
+
+        # Unused media are discarded
+        for sample in foul.prefetch_label_media(dataset, num_workers=4):
+            pass
+
+        self.assertIsNone(fol._prefetched_media.get())
+
+        # Concurrent iterators do not share prefetched media
+        samples1 = foul.prefetch_label_media(
+            dataset, fields="segmentations", num_workers=4
+        )
+        samples2 = foul.prefetch_label_media(
+            dataset, fields="segmentations", num_workers=4
+        )
+        for sample1, sample2, mask in zip(samples1, samples2, masks):
+            if mask is None:
+                continue
+
+            for sample in (sample1, sample2):
+                self.assertTrue(
+                    np.array_equal(sample.segmentations.get_mask(), mask)
+                )
+
+        def _iter_in_thread():
+            for sample in foul.prefetch_label_media(dataset, num_workers=4):
+                return fol._prefetched_media.get() is not None
+
+        with ThreadPoolExecutor(1) as executor:
+            self.assertTrue(executor.submit(_iter_in_thread).result())
+
+        self.assertIsNone(fol._prefetched_media.get())
+
+        # Worker threads are only used when there is media to read
+        with unittest.mock.patch.object(fou, "iter_map") as iter_map:
+            samples = list(
+                foul.prefetch_label_media(dataset, fields="filepath")
+            )
+
+        self.assertEqual(len(samples), len(dataset))
+        iter_map.assert_not_called()
+
+        foul.import_segmentations(dataset, "segmentations")
+        self.assertEqual(dataset.count("segmentations.mask_path"), 0)
+
+        for mask1, mask2 in zip(masks, dataset.values("segmentations.mask")):
+            if mask1 is None:
+                self.assertIsNone(mask2)
+            else:
+                self.assertTrue(np.array_equal(mask1, mask2))
+
     @drop_datasets
     def test_image_segmentation_fiftyone_dataset(self):
         self._test_image_segmentation_fiftyone_dataset(
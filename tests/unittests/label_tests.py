@@ -463,6 +463,106 @@ class LabelTests(unittest.TestCase):
         self.assertEqual(len(poly3.polylines), 2)
         self.assertEqual(len(poly4.polylines), 1)
 
+    @drop_datasets
+    def test_label_arrays(self):
+        detections = fo.Detections(
+            detections=[
+                fo.Detection(
+                    label="cat",
+                    bounding_box=[0.1, 0.1, 0.4, 0.4],
+                    confidence=0.9,
+                    iscrowd=True,
+                ),
+                fo.Detection(label="dog", bounding_box=[0.5, 0.5, 0.2, 0.2]),
+            ]
+        )
+        keypoints = fo.Keypoints(
+            keypoints=[
+                fo.Keypoint(
+                    label="person",
+                    points=[(0.1, 0.2), (0.3, 0.4)],
+                    confidence=[0.5, 0.6],
+                )
+            ]
+        )
+        polylines = fo.Polylines(
+            polylines=[
+                fo.Polyline(
+                    label="road",
+                    points=[[(0.1, 0.1), (0.2, 0.2), (0.3, 0.1)]],
+                    closed=True,
+                )
+            ]
+        )
+
+        arrays = detections.to_arrays(attributes=["iscrowd"])
+
+        self.assertIsInstance(arrays, fo.DetectionsArrays)
+        self.assertEqual(len(arrays), 2)
+        self.assertEqual(arrays.bounding_boxes.shape, (2, 4))
+        self.assertListEqual(list(arrays.labels), ["cat", "dog"])
+        self.assertListEqual(
+            list(arrays.ids), [d.id for d in detections.detections]
+        )
+        self.assertAlmostEqual(arrays.confidences[0], 0.9)
+        self.assertTrue(np.isnan(arrays.confidences[1]))
+        self.assertListEqual(list(arrays.attributes["iscrowd"]), [True, None])
+
+        with self.assertRaises(ValueError):
+            arrays.bounding_boxes[0, 0] = 1.0
+
+        detections2 = fo.Detections.from_arrays(arrays)
+
+        self.assertEqual(len(detections2.detections), 2)
+        self.assertEqual(
+            detections2.detections[0].id, detections.detections[0].id
+        )
+        self.assertListEqual(
+            detections2.detections[1].bounding_box, [0.5, 0.5, 0.2, 0.2]
+        )
+        self.assertIsNone(detections2.detections[1].confidence)
+        self.assertTrue(detections2.detections[0].iscrowd)
+
+        sample = fo.Sample(
+            filepath="image.jpg",
+            detections=detections,
+            keypoints=keypoints,
+            polylines=polylines,
+        )
+
+        dataset = fo.Dataset()
+        dataset.add_sample(sample)
+
+        d = dataset._sample_collection.find_one({})
+
+        arrays = fo.DetectionsArrays.from_dict(
+            d["detections"], attributes=["iscrowd"]
+        )
+        self.assertListEqual(
+            list(arrays.ids), [d.id for d in detections.detections]
+        )
+        self.assertTrue(
+            np.allclose(arrays.bounding_boxes[0], [0.1] * 2 + [0.4] * 2)
+        )
+        self.assertListEqual(list(arrays.attributes["iscrowd"]), [True, None])
+
+        arrays = fo.KeypointsArrays.from_dict(d["keypoints"])
+        self.assertEqual(arrays.points[0].shape, (2, 2))
+        self.assertTrue(np.allclose(arrays.confidences[0], [0.5, 0.6]))
+        self.assertEqual(
+            fo.Keypoints.from_arrays(arrays).keypoints[0].points,
+            [[0.1, 0.2], [0.3, 0.4]],
+        )
+
+        arrays = fo.PolylinesArrays.from_dict(d["polylines"])
+        self.assertEqual(arrays.points[0][0].shape, (3, 2))
+        self.assertListEqual(list(arrays.closed), [True])
+        self.assertListEqual(list(arrays.filled), [False])
+
+        arrays = fo.DetectionsArrays.from_dict(None)
+        self.assertEqual(len(arrays), 0)
+        self.assertEqual(arrays.bounding_boxes.shape, (0, 4))
+
 
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
@@ -6,57 +6,52 @@ Unit tests for operators/decorators.
 |
 """
 import os
+import tempfile
 import unittest
-from unittest import mock
-from unittest.mock import patch
-
-from fiftyone.operators.decorators import dir_state
-
-
-class DirStateTests(unittest.TestCase):
-    @patch("glob.glob")
-    @patch("os.path.isdir")
-    def test_dir_state_non_existing_dir(self, mock_isdir, mock_glob):
-        mock_isdir.return_value = False
-        dirpath = "/non/existing/dir"
-        try:
-            result = dir_state(dirpath)
-        except Exception as e:
-            self.fail(e)
-
-        self.assertIsNone(result)
-        assert not mock_glob.called
-
-    @patch("glob.glob")
-    @patch("os.path.isdir")
-    def test_dir_state_existing_empty_dir(self, mock_isdir, mock_glob):
-        mock_isdir.return_value = True
-        mock_glob.return_value = []
-        dirpath = "/existing/empty/dir"
-
-        try:
-            result = dir_state(dirpath)
-        except Exception as e:
-            self.fail(e)
-        self.assertIsNone(result)
-        mock_isdir.assert_called_once_with(dirpath)
-        mock_glob.assert_called_once_with(os.path.join(dirpath, "*"))
-
-    @patch("os.path.isdir")
-    @patch("glob.glob")
-    @patch("os.path.getmtime")
-    def test_dir_state_with_existing_nonempty_dir(
-        self, mock_getmtime, mock_glob, mock_isdir
-    ):
-        mock_isdir.return_value = True
-        mock_glob.return_value = ["file1.txt", "file2.txt"]
-        mock_getmtime.side_effect = [1000, 2000]
-
-        result = dir_state("/my/dir/path")
-
-        self.assertEqual(result, 2000)
-        mock_isdir.assert_called_once_with("/my/dir/path")
-        mock_glob.assert_called_once_with(os.path.join("/my/dir/path", "*"))
-        mock_getmtime.assert_has_calls(
-            [unittest.mock.call("file1.txt"), unittest.mock.call("file2.txt")]
-        )
+
+from fiftyone.operators.decorators import plugin_dir_state
+
+
+class PluginDirStateTests(unittest.TestCase):
+    def _write(self, path, contents="x"):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(contents)
+
+    def test_plugin_dir_state_non_existing_dir(self):
+        self.assertIsNone(plugin_dir_state("/non/existing/dir"))
+
+    def test_plugin_dir_state(self):
+        with tempfile.TemporaryDirectory() as plugin_dir:
+            self.assertTupleEqual(plugin_dir_state(plugin_dir), ())
+
+            self._write(os.path.join(plugin_dir, "fiftyone.yml"))
+            self._write(os.path.join(plugin_dir, "__init__.py"))
+            self._write(os.path.join(plugin_dir, "lib", "utils.py"))
+            state = plugin_dir_state(plugin_dir)
+
+            paths = [s[0] for s in state]
+            self.assertListEqual(
+                paths,
+                [
+                    os.path.join(plugin_dir, "__init__.py"),
+                    os.path.join(plugin_dir, "fiftyone.yml"),
+                    os.path.join(plugin_dir, "lib", "utils.py"),
+                ],
+            )
+
+            # JS files and build directories do not affect the state
+            self._write(os.path.join(plugin_dir, "package.json"))
+            self._write(os.path.join(plugin_dir, "dist", "index.umd.js"))
+            self._write(
+                os.path.join(plugin_dir, "node_modules", "pkg", "setup.py")
+            )
+            self._write(os.path.join(plugin_dir, ".git", "hook.py"))
+            self.assertTupleEqual(plugin_dir_state(plugin_dir), state)
+
+            self._write(os.path.join(plugin_dir, "__init__.py"), "xy")
+            self.assertNotEqual(plugin_dir_state(plugin_dir), state)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,82 @@
+"""
+FiftyOne plot unit tests.
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import unittest
+import warnings
+
+import plotly.graph_objects as go
+
+import fiftyone.core.plots.plotly as fopl
+
+
+class InteractiveScatterTests(unittest.TestCase):
+    def _make_plot(self):
+        figure = go.Figure()
+        figure.add_trace(
+            go.Scattergl(
+                x=[0, 1, 2],
+                y=[0, 1, 2],
+                customdata=["a", "b", "c"],
+                name="first",
+                visible=True,
+            )
+        )
+        figure.add_trace(
+            go.Scattergl(
+                x=[3, 4],
+                y=[3, 4],
+                customdata=[["d", 1], ["e", 2]],
+                name="second",
+                visible=True,
+            )
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return fopl.InteractiveScatter(figure)
+
+    def test_select_ids(self):
+        plot = self._make_plot()
+        first, second = plot._traces
+
+        self.assertIsNone(plot._selected_ids)
+
+        plot._select_ids(["e", "missing", "c", "a"])
+        self.assertListEqual(list(first.selectedpoints), [2, 0])
+        self.assertListEqual(list(second.selectedpoints), [1])
+
+        ids = plot._selected_ids
+        self.assertListEqual(ids, ["c", "a", "e"])
+        self.assertTrue(all(type(_id) is str for _id in ids))
+
+        plot._select_ids([])
+        self.assertListEqual(list(first.selectedpoints), [])
+        self.assertListEqual(plot._selected_ids, [])
+
+        plot._select_ids(None)
+        self.assertIsNone(first.selectedpoints)
+        self.assertIsNone(second.selectedpoints)
+        self.assertIsNone(plot._selected_ids)
+
+    def test_lines_scattergl(self):
+        def _lines(n):
+            figure = go.Figure()
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                fopl.lines(
+                    x=[list(range(n))], y=[list(range(n))], figure=figure
+                )
+
+            return figure.data[0]
+
+        n = fopl._MAX_SVG_POINTS
+        self.assertIsInstance(_lines(n), go.Scatter)
+        self.assertIsInstance(_lines(n + 1), go.Scattergl)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
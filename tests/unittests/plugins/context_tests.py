@@ -0,0 +1,151 @@
+"""
+Unit tests for plugin contexts.
+
+| Copyright 2017-2023, Voxel51, Inc.
+| `voxel51.com <https://voxel51.com/>`_
+|
+"""
+import os
+import json
+import time
+from unittest import mock
+
+import pytest
+import yaml
+
+import fiftyone as fo
+import fiftyone.operators.registry as foor
+import fiftyone.plugins.context as fopc
+
+_DEFAULT_TEST_PLUGINS = ["test-plugin1", "test-plugin2"]
+
+_PLUGIN_INIT = """
+import fiftyone.operators as foo
+
+
+class TestOperator(foo.Operator):
+    @property
+    def config(self):
+        return foo.OperatorConfig(name="test_operator", label="%s")
+
+
+def register(p):
+    p.register(TestOperator)
+"""
+
+
+@pytest.fixture(autouse=True)
+def app_config_path(tmp_path_factory):
+    fn = tmp_path_factory.mktemp(".fiftyone") / "app_config.json"
+    with open(fn, "w") as f:
+        f.write(json.dumps({}))
+
+    with mock.patch.dict(os.environ, {"FIFTYONE_APP_CONFIG_PATH": str(fn)}):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def plugins_dir(tmp_path_factory):
+    plugins_dir = tmp_path_factory.mktemp("fiftyone-plugins")
+    for plugin in _DEFAULT_TEST_PLUGINS:
+        _write_plugin(plugins_dir / plugin, plugin, "v1")
+
+    fopc.clear_plugin_contexts_cache()
+    with mock.patch.object(fo.config, "plugins_dir", str(plugins_dir)):
+        with mock.patch.object(fo.config, "plugins_cache_enabled", True):
+            yield plugins_dir
+
+    fopc.clear_plugin_contexts_cache()
+
+
+def _write_plugin(plugin_dir, name, label):
+    os.makedirs(plugin_dir, exist_ok=True)
+    with open(plugin_dir / "fiftyone.yml", "w") as f:
+        f.write(yaml.dump({"name": name, "operators": ["test_operator"]}))
+
+    with open(plugin_dir / "__init__.py", "w") as f:
+        f.write(_PLUGIN_INIT % label)
+
+
+def test_build_plugin_contexts_cached(plugins_dir):
+    pctxs1 = {p.name: p for p in fopc.build_plugin_contexts()}
+    pctxs2 = {p.name: p for p in fopc.build_plugin_contexts()}
+
+    assert set(pctxs1.keys()) == set(_DEFAULT_TEST_PLUGINS)
+    for name in _DEFAULT_TEST_PLUGINS:
+        assert pctxs1[name] is pctxs2[name]
+
+    # Contexts are shared between different `enabled` values
+    pctxs3 = {p.name: p for p in fopc.build_plugin_contexts(enabled="all")}
+    for name in _DEFAULT_TEST_PLUGINS:
+        assert pctxs1[name] is pctxs3[name]
+
+
+def test_build_plugin_contexts_reloads_changed(plugins_dir):
+    pctxs1 = {p.name: p for p in fopc.build_plugin_contexts()}
+
+    # Ensure that the file modification time changes
+    time.sleep(0.01)
+    _write_plugin(plugins_dir / "test-plugin2", "test-plugin2", "v2")
+
+    pctxs2 = {p.name: p for p in fopc.build_plugin_contexts()}
+
+    assert pctxs1["test-plugin1"] is pctxs2["test-plugin1"]
+    assert pctxs1["test-plugin2"] is not pctxs2["test-plugin2"]
+    assert pctxs2["test-plugin2"].instances[0].config.label == "v2"
+
+
+def test_build_plugin_contexts_cache_disabled(plugins_dir):
+    with mock.patch.object(fo.config, "plugins_cache_enabled", False):
+        pctxs1 = fopc.build_plugin_contexts()
+        pctxs2 = fopc.build_plugin_contexts()
+
+    assert not any(p1 is p2 for p1, p2 in zip(pctxs1, pctxs2))
+
+
+def test_registry_get_operator(plugins_dir):
+    registry = foor.OperatorRegistry()
+
+    uri = "test-plugin1/test_operator"
+    assert registry.operator_exists(uri)
+    assert registry.get_operator(uri).uri == uri
+    assert registry.get_operator("test-plugin1/missing") is None
+    assert not registry.operator_exists("test-plugin1/missing")
+
+    builtin = registry.list_operators()[-1]
+    assert registry.get_operator(builtin.uri) is builtin
+
+
+def test_registry_not_cached(plugins_dir):
+    with mock.patch.object(fo.config, "plugins_cache_enabled", False):
+        registry1 = foor.OperatorRegistry()
+        registry2 = foor.OperatorRegistry()
+
+        uri = "test-plugin2/test_operator"
+        operator = registry1.get_operator(uri)
+        assert registry2.get_operator(uri) is not operator
+        assert registry2.operator_exists(uri)
+
+
+def test_registry_cached(plugins_dir):
+    with mock.patch.object(fo.config, "plugins_cache_enabled", True):
+        registry1 = foor.OperatorRegistry()
+        registry2 = foor.OperatorRegistry()
+
+        uri = "test-plugin2/test_operator"
+        operator = registry1.get_operator(uri)
+        assert registry2.get_operator(uri) is operator
+
+        # Ensure that the file modification time changes
+        time.sleep(0.01)
+        _write_plugin(plugins_dir / "test-plugin2", "test-plugin2", "v2")
+
+        registry3 = foor.OperatorRegistry()
+        assert registry3.get_operator(uri) is not operator
+        assert registry3.get_operator(uri).config.label == "v2"
+
+        # Disabling a plugin changes the registry
+        fo.plugins.disable_plugin("test-plugin1")
+        registry4 = foor.OperatorRegistry()
+        assert not registry4.operator_exists("test-plugin1/test_operator")
+        assert registry4.operator_exists(uri)
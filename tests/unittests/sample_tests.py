@@ -520,6 +520,55 @@ class SampleInDatasetTests(unittest.TestCase):
         with self.assertRaises(KeyError):
             sample2["dynamic.classifications.classifications.foo"]
 
+    @drop_datasets
+    def test_lazy_embedded_fields(self):
+        dataset = fo.Dataset()
+        dataset.add_samples(
+            [
+                fo.Sample(
+                    filepath="image%d.jpg" % i,
+                    cls=fo.Classification(label="cat"),
+                    dets=fo.Detections(detections=[fo.Detection(label="dog")]),
+                )
+                for i in range(2)
+            ]
+        )
+
+        sample = dataset.first()
+        raw_keys = sample._doc._data._raw_keys
+        self.assertSetEqual(raw_keys, {"cls", "dets"})
+
+        self.assertEqual(sample.cls.label, "cat")
+        self.assertIsInstance(sample.cls, fo.Classification)
+        self.assertSetEqual(raw_keys, {"dets"})
+
+        # Modifying one field must not affect the undecoded field
+        sample.cls.label = "dog"
+        sample.save()
+
+        self.assertSetEqual(raw_keys, {"dets"})
+        self.assertEqual(
+            sample.to_dict()["dets"]["detections"][0]["label"], "dog"
+        )
+
+        with dataset.save_context() as context:
+            for sample in dataset:
+                sample.dets.detections.append(fo.Detection(label="bird"))
+                context.save(sample)
+
+        for sample in dataset.iter_samples(autosave=True):
+            sample["dets"] = None
+
+        self.assertListEqual(dataset.values("cls.label"), ["dog", "cat"])
+        self.assertListEqual(dataset.values("dets"), [None, None])
+
+        sample = dataset.first()
+        sample.tags.append("test")
+        sample.save()
+
+        self.assertEqual(dataset.count("tags"), 1)
+        self.assertListEqual(dataset.values("cls.label"), ["dog", "cat"])
+
 
 class SampleCollectionTests(unittest.TestCase):
     @drop_datasets
@@ -5,14 +5,37 @@ FiftyOne server-related unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import asyncio
+import json
 import math
+import os
+import struct
+import tempfile
 import unittest
+import unittest.mock
+
+import numpy as np
 
 import fiftyone as fo
 import fiftyone.core.dataset as fod
 import fiftyone.core.labels as fol
 import fiftyone.core.odm as foo
 import fiftyone.core.sample as fos
+import fiftyone.core.utils as fou
+from fiftyone.core.session.events import (
+    CloseSession,
+    ListenPayload,
+    StatePatch,
+    StateUpdate,
+)
+import fiftyone.core.state as fost
+import fiftyone.server.events as fosev
+import fiftyone.server.metadata as fosm
+import fiftyone.server.metrics as fosmt
+import fiftyone.server.routes.embeddings as fose
+import fiftyone.server.routes.frames as fosf
+import fiftyone.server.routes.tag as fostr
+import fiftyone.server.utils as fosu
 import fiftyone.server.view as fosv
 from fiftyone.server.samples import paginate_samples
 
@@ -803,6 +826,137 @@ class ServerViewTests(unittest.TestCase):
         )
         self.assertEqual(second_view.first().id, second.id)
 
+    @drop_datasets
+    def test_change_label_tags(self):
+        dataset = fod.Dataset()
+        dataset.add_sample(
+            fos.Sample(
+                filepath="image.png",
+                classification=fol.Classification(label="cat", tags=["old"]),
+                detections=fol.Detections(
+                    detections=[fol.Detection(label="cat")]
+                ),
+            )
+        )
+
+        progress = []
+        fosu.change_label_tags(
+            dataset, {"new": True, "old": False}, progress=progress.append
+        )
+
+        self.assertListEqual(progress, [0.25, 0.5, 0.75, 1.0])
+        self.assertDictEqual(dataset.count_label_tags(), {"new": 2})
+
+    @drop_datasets
+    def test_change_label_tags_batches(self):
+        dataset = fod.Dataset()
+        dataset.add_samples(
+            [
+                fos.Sample(
+                    filepath="image%d.png" % i,
+                    classification=fol.Classification(label="cat"),
+                )
+                for i in range(4)
+            ]
+        )
+
+        progress = []
+        with unittest.mock.patch(
+            "fiftyone.core.collections._LABEL_TAGS_BATCH_SIZE", 1
+        ):
+            fosu.change_label_tags(
+                dataset, {"new": True}, progress=progress.append
+            )
+
+        self.assertListEqual(progress, [0.25, 0.5, 0.75, 1.0])
+        self.assertDictEqual(dataset.count_label_tags(), {"new": 4})
+
+        # Views whose stages depend on other samples are not batched
+        view = dataset.sort_by("filepath").skip(1).limit(2)
+
+        progress = []
+        with unittest.mock.patch(
+            "fiftyone.core.collections._LABEL_TAGS_BATCH_SIZE", 1
+        ):
+            fosu.change_label_tags(
+                view, {"other": True}, progress=progress.append
+            )
+
+        self.assertListEqual(progress, [1.0])
+        self.assertListEqual(
+            dataset.sort_by("filepath").values("classification.tags"),
+            [["new"], ["new", "other"], ["new", "other"], ["new"]],
+        )
+
+    @drop_datasets
+    def test_change_frame_label_tags_batches(self):
+        samples = []
+        for i in range(3):
+            sample = fos.Sample(filepath="video%d.mp4" % i)
+            sample.frames[1] = fo.Frame(
+                classification=fol.Classification(label="cat")
+            )
+            sample.frames[2] = fo.Frame(
+                classification=fol.Classification(label="dog")
+            )
+            samples.append(sample)
+
+        dataset = fod.Dataset()
+        dataset.add_samples(samples)
+
+        view = dataset.filter_labels(
+            "frames.classification", fo.ViewField("label") == "cat"
+        )
+
+        progress = []
+        with unittest.mock.patch(
+            "fiftyone.core.collections._LABEL_TAGS_BATCH_SIZE", 1
+        ):
+            fosu.change_label_tags(
+                view,
+                {"new": True},
+                label_fields="frames.classification",
+                progress=progress.append,
+            )
+
+        self.assertEqual(len(progress), 3)
+        self.assertEqual(progress[-1], 1.0)
+        self.assertDictEqual(
+            dataset.count_label_tags("frames.classification"), {"new": 3}
+        )
+
+    @drop_datasets
+    def test_change_label_tags_stream_error(self):
+        dataset = fod.Dataset()
+        dataset.add_sample(
+            fos.Sample(
+                filepath="image.png",
+                classification=fol.Classification(label="cat"),
+            )
+        )
+
+        async def get_samples():
+            return []
+
+        async def stream():
+            return [
+                json.loads(line)
+                async for line in fostr._change_label_tags_stream(
+                    dataset, {"new": True}, None, get_samples
+                )
+            ]
+
+        lines = _run(stream())
+        self.assertEqual(lines[-1], {"samples": []})
+
+        with unittest.mock.patch.object(
+            fosu, "change_label_tags", side_effect=ValueError("oops")
+        ):
+            lines = _run(stream())
+
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0]["error"], "oops")
+
 
 class AysncServerViewTests(unittest.IsolatedAsyncioTestCase):
     @drop_datasets
@@ -838,3 +992,590 @@ class AysncServerViewTests(unittest.IsolatedAsyncioTestCase):
         )
         self.assertEqual(len(second_samples.edges), 1)
         self.assertEqual(second_samples.edges[0].node.id, second._id)
+
+
+# The async database client is bound to the first event loop that uses it, so
+# all tests that read from the database asynchronously share a single loop
+_loop = asyncio.new_event_loop()
+
+
+def _run(coro):
+    return _loop.run_until_complete(coro)
+
+
+class AsyncReadTests(unittest.TestCase):
+    @drop_datasets
+    def test_async_aggregate(self):
+        dataset = fod.Dataset()
+        dataset.add_samples(
+            [
+                fos.Sample(
+                    filepath="image%d.png" % i,
+                    gt=fol.Classification(label=str(i % 2)),
+                    value=i,
+                )
+                for i in range(4)
+            ]
+        )
+        view = dataset.match(fo.ViewField("value") > 0)
+
+        aggregations = [
+            fo.Count(),
+            fo.CountValues("gt.label"),
+            fo.Values("value"),
+            fo.Values("id", _big_result=False),
+            fo.Distinct("gt.label"),
+        ]
+        self.assertListEqual(
+            _run(view._async_aggregate(aggregations)),
+            view.aggregate(aggregations),
+        )
+
+        self.assertEqual(_run(view._async_count()), 3)
+        self.assertTupleEqual(_run(view._async_count(["gt", "value"])), (3, 3))
+        self.assertListEqual(
+            _run(view._async_distinct("gt.label")), ["0", "1"]
+        )
+        self.assertListEqual(_run(view._async_values("value")), [1, 2, 3])
+
+    @drop_datasets
+    def test_async_load_dataset(self):
+        dataset = fod.Dataset()
+        dataset.add_sample(fos.Sample(filepath="image.png"))
+
+        # Simulate another process editing the dataset
+        foo.get_db_conn().datasets.update_one(
+            {"_id": dataset._doc.id}, {"$set": {"info": {"edited": True}}}
+        )
+
+        _dataset = _run(fod._async_load_dataset(dataset.name))
+        self.assertIs(_dataset, dataset)
+        self.assertDictEqual(dataset.info, {})
+
+        _run(fod._async_load_dataset(dataset.name, reload=True))
+        self.assertDictEqual(dataset.info, {"edited": True})
+
+        view = _run(fosv.get_async_view(dataset.name, stages=[]))
+        self.assertEqual(len(view), 1)
+
+    def test_sync_task_metrics(self):
+        async def _test():
+            metrics = []
+            await fou.run_sync_task(
+                lambda: metrics.append(fou.get_sync_task_metrics())
+            )
+            return metrics[0]
+
+        metrics = _run(_test())
+        self.assertEqual(metrics["pending_tasks"], 1)
+
+        metrics = fou.get_sync_task_metrics()
+        self.assertEqual(metrics["pending_tasks"], 0)
+        self.assertEqual(metrics["queue_depth"], 0)
+        self.assertGreaterEqual(metrics["num_threads"], 1)
+        self.assertLessEqual(metrics["num_threads"], metrics["max_workers"])
+
+
+class MetricsTests(unittest.TestCase):
+    def test_fingerprint(self):
+        pipeline = [
+            {"$match": {"_id": {"$in": [1, 2, 3]}}},
+            {"$project": {"label": "$gt.label"}},
+        ]
+        same_shape = [
+            {"$match": {"_id": {"$in": [4]}}},
+            {"$project": {"label": "$other.label"}},
+        ]
+        other_shape = [{"$match": {"_id": {"$in": [1, 2, 3]}}}]
+
+        self.assertEqual(
+            fosmt.fingerprint(pipeline), fosmt.fingerprint(same_shape)
+        )
+        self.assertNotEqual(
+            fosmt.fingerprint(pipeline), fosmt.fingerprint(other_shape)
+        )
+
+    def test_render(self):
+        fosmt.reset()
+
+        # Nothing is recorded unless metrics are enabled
+        with fosmt.span("view"):
+            pass
+
+        self.assertNotIn("fiftyone_server_span_seconds", fosmt.render())
+
+        fosmt._enabled = True
+        try:
+            with fosmt.span("view"):
+                pass
+
+            fosmt.observe("test_seconds", 0.2, route="Values")
+            fosmt.observe("test_seconds", 20, route="Values")
+        finally:
+            fosmt._enabled = False
+
+        metrics = fosmt.render()
+        fosmt.reset()
+
+        self.assertIn("# TYPE fiftyone_server_span_seconds histogram", metrics)
+        self.assertIn(
+            'fiftyone_server_span_seconds_count{route="",span="view"} 1',
+            metrics,
+        )
+        self.assertIn(
+            'test_seconds_bucket{route="Values",le="0.1"} 0', metrics
+        )
+        self.assertIn(
+            'test_seconds_bucket{route="Values",le="0.25"} 1', metrics
+        )
+        self.assertIn(
+            'test_seconds_bucket{route="Values",le="+Inf"} 2', metrics
+        )
+        self.assertIn('test_seconds_count{route="Values"} 2', metrics)
+        self.assertIn("fiftyone_server_thread_pool_queue_depth 0", metrics)
+
+
+class MetadataTests(unittest.TestCase):
+    def _write_png(self, path, width, height):
+        with open(path, "wb") as f:
+            f.write(b"\211PNG\r\n\032\n\x00\x00\x00\x0dIHDR")
+            f.write(struct.pack(">LL", width, height))
+
+    async def _get_metadata(self, dataset, sample):
+        metadata = await fosm.get_metadata(
+            dataset, sample, fo.core.media.IMAGE, {}, {}
+        )
+        await asyncio.gather(*fosm._pending_writes)
+        return metadata
+
+    @drop_datasets
+    def test_metadata_cache(self):
+        fosm.clear_metadata_cache()
+        write_metadata = fo.config.server_write_metadata
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, "image.png")
+            self._write_png(filepath, 20, 10)
+
+            dataset = fod.Dataset()
+            dataset.add_sample(fos.Sample(filepath=filepath))
+            d = foo.get_db_conn()[dataset._sample_collection_name].find_one()
+
+            try:
+                fo.config.server_write_metadata = False
+                metadata = _run(self._get_metadata(dataset, d))
+                self.assertEqual(metadata["aspect_ratio"], 2)
+                self.assertEqual(len(fosm._probe_cache), 1)
+
+                # Cached results are keyed by path and modification time
+                _run(self._get_metadata(dataset, d))
+                self.assertEqual(len(fosm._probe_cache), 1)
+
+                self._write_png(filepath, 10, 10)
+                stat = os.stat(filepath)
+                os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+                metadata = _run(self._get_metadata(dataset, d))
+                self.assertEqual(metadata["aspect_ratio"], 1)
+                self.assertEqual(len(fosm._probe_cache), 2)
+
+                dataset.reload()
+                self.assertIsNone(dataset.first().metadata)
+
+                fo.config.server_write_metadata = True
+                _run(self._get_metadata(dataset, d))
+            finally:
+                fo.config.server_write_metadata = write_metadata
+
+            dataset.reload()
+            metadata = dataset.first().metadata
+            self.assertIsInstance(metadata, fo.ImageMetadata)
+            self.assertEqual(metadata.width, 10)
+            self.assertEqual(metadata.height, 10)
+            self.assertEqual(metadata.mime_type, "image/png")
+            self.assertEqual(metadata.size_bytes, 24)
+
+    def test_probe_empty_image(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, "image.png")
+            self._write_png(filepath, 20, 0)
+
+            metadata, doc = _run(fosm._probe(filepath, False))
+
+        self.assertEqual(metadata["aspect_ratio"], 1)
+        self.assertIsNone(doc)
+
+    def test_probe_limit(self):
+        fosm.clear_metadata_cache()
+        active = [0, 0]
+        calls = []
+
+        async def _probe(filepath, is_video, size_bytes=None):
+            calls.append(filepath)
+            active[0] += 1
+            active[1] = max(active)
+            await asyncio.sleep(0.01)
+            active[0] -= 1
+            return dict(aspect_ratio=1), None
+
+        async def _run_probes():
+            filepaths = ["image%d.png" % (i % 6) for i in range(12)]
+            return await asyncio.gather(
+                *[fosm._get_probe_result(f, False) for f in filepaths]
+            )
+
+        max_media_probes = fo.config.server_max_media_probes
+        try:
+            fo.config.server_max_media_probes = 2
+            with unittest.mock.patch.object(fosm, "_probe", _probe):
+                results = _run(_run_probes())
+        finally:
+            fo.config.server_max_media_probes = max_media_probes
+
+        self.assertEqual(len(results), 12)
+        self.assertEqual(len(calls), 6)
+        self.assertEqual(active[1], 2)
+        self.assertDictEqual(fosm._pending_probes, {})
+        self.assertEqual(len(fosm._probe_cache), 6)
+
+
+class FramesRouteTests(unittest.TestCase):
+    def _make_dataset(self):
+        dataset = fod.Dataset()
+        sample = fos.Sample(filepath="video.mp4")
+        for fn in range(1, 11):
+            sample.frames[fn] = fo.Frame(
+                gt=fol.Detections(
+                    detections=[
+                        fol.Detection(label="cat" if fn % 2 else "dog")
+                    ]
+                )
+            )
+
+        dataset.add_sample(sample)
+        return dataset, sample
+
+    async def _read(self, dataset, stages, sample_id, start, end):
+        stream = fosf._get_frame_stream(
+            dataset.name, stages, None, sample_id, None
+        )
+        return stream, await stream.read(start, end)
+
+    @drop_datasets
+    def test_frame_stream(self):
+        _run(self._test_frame_stream())
+
+    async def _test_frame_stream(self):
+        dataset, sample = self._make_dataset()
+
+        # Views that do not modify frames read the frames collection directly
+        stream, frames = await self._read(dataset, [], sample.id, 3, 5)
+        self.assertTrue(stream._direct)
+        self.assertListEqual([f["frame_number"] for f in frames], [3, 4, 5])
+        self.assertEqual(frames[0]["gt"]["detections"][0]["label"], "cat")
+
+        # Streams are reused per sample and view
+        _stream, _ = await self._read(dataset, [], sample.id, 6, 8)
+        self.assertIs(_stream, stream)
+
+        # Read ahead chunks are used by the next read of the same range
+        stream.prefetch(9, 10)
+        task = stream._read_aheads[(9, 10)]
+        frames = await stream.read(9, 10)
+        self.assertTrue(task.done())
+        self.assertDictEqual(stream._read_aheads, {})
+        self.assertListEqual([f["frame_number"] for f in frames], [9, 10])
+
+        # Clients playing the same sample do not cancel each other's reads
+        stream.prefetch(7, 8)
+        stream.prefetch(9, 10)
+        task = stream._read_aheads[(7, 8)]
+        frames = await stream.read(7, 8)
+        self.assertFalse(task.cancelled())
+        self.assertListEqual([f["frame_number"] for f in frames], [7, 8])
+        self.assertListEqual(list(stream._read_aheads), [(9, 10)])
+
+        for idx in range(fosf._MAX_READ_AHEADS + 1):
+            stream.prefetch(idx + 1, idx + 1)
+
+        self.assertEqual(len(stream._read_aheads), fosf._MAX_READ_AHEADS)
+        self.assertNotIn((9, 10), stream._read_aheads)
+        await stream.read(1, 1)
+
+        view = dataset.filter_labels(
+            "frames.gt", fo.ViewField("label") == "dog"
+        )
+        stream, frames = await self._read(
+            dataset, view._serialize(), sample.id, 1, 4
+        )
+        self.assertFalse(stream._direct)
+        self.assertListEqual(
+            [len(f["gt"]["detections"]) for f in frames], [0, 1, 0, 1]
+        )
+
+        # Clips read the frames of their source sample within their support
+        dataset.add_sample_field("support", fo.FrameSupportField)
+        sample["support"] = [4, 6]
+        sample.save()
+
+        clips = dataset.to_clips("support")
+        clip_id = clips.first().id
+
+        stream, frames = await self._read(
+            dataset, clips._serialize(), clip_id, 1, 5
+        )
+        self.assertTrue(stream._direct)
+        self.assertListEqual([f["frame_number"] for f in frames], [4, 5])
+
+    @drop_datasets
+    def test_frame_stream_tagging(self):
+        _run(self._test_frame_stream_tagging())
+
+    async def _test_frame_stream_tagging(self):
+        dataset, sample = self._make_dataset()
+
+        stream, _ = await self._read(dataset, [], sample.id, 1, 2)
+        stream.prefetch(3, 4)
+        task = stream._read_aheads[(3, 4)]
+        await task
+
+        async def get_samples():
+            return []
+
+        # Editing tags discards the cached streams and their read-aheads
+        async for _ in fostr._change_label_tags_stream(
+            dataset, {"new": True}, ["frames.gt"], get_samples
+        ):
+            pass
+
+        self.assertDictEqual(stream._read_aheads, {})
+
+        _stream, frames = await self._read(dataset, [], sample.id, 3, 4)
+        self.assertIsNot(_stream, stream)
+        self.assertListEqual(
+            [f["gt"]["detections"][0]["tags"] for f in frames],
+            [["new"], ["new"]],
+        )
+
+    def test_to_columns(self):
+        frames = [{"frame_number": 1, "gt": "a"}, {"frame_number": 2}]
+        self.assertDictEqual(
+            fosf._to_columns(frames),
+            {"frame_number": [1, 2], "gt": ["a", None]},
+        )
+
+
+class EmbeddingsPlotTests(unittest.TestCase):
+    def test_grid_index(self):
+        rng = np.random.default_rng(0)
+        points = np.concatenate([rng.normal(size=(10000, 2)), [[10.0, 10.0]]])
+        index = fose._GridIndex(points, grid_size=32)
+
+        inds, total_count = index.query()
+        self.assertEqual(total_count, len(points))
+        self.assertEqual(len(inds), len(points))
+
+        viewport = [0.0, 0.0, 1.0, 1.0]
+        inds, total_count = index.query(viewport=viewport)
+        x, y = points.T
+        expected = np.nonzero((x >= 0) & (x <= 1) & (y >= 0) & (y <= 1))[0]
+        self.assertListEqual(inds.tolist(), expected.tolist())
+        self.assertEqual(total_count, len(expected))
+
+        # Subsets are approximately bounded and retain outliers
+        inds, total_count = index.query(max_points=500)
+        self.assertEqual(total_count, len(points))
+        self.assertLess(len(inds), 1500)
+        self.assertIn(len(points) - 1, inds)
+
+        # Zooming in retains the points that were previously shown
+        inds1, _ = index.query(viewport=viewport, max_points=100)
+        inds2, _ = index.query(viewport=[0.0, 0.0, 0.5, 0.5], max_points=100)
+        x, y = points[inds1].T
+        shown = set(inds1[(x <= 0.5) & (y <= 0.5)].tolist())
+        self.assertTrue(shown.issubset(set(inds2.tolist())))
+
+    def test_grid_index_cache(self):
+        fose._grid_indexes.clear()
+
+        points = np.array([[0, 1], [2, 3], [4, 5]], dtype=float)
+        ids = ["a" * 24, "b" * 24, "c" * 24]
+        key = ("dataset", "brain_key")
+
+        index, styles = fose._get_grid_index(key, points, ids)
+        styles["label"] = "categorical"
+
+        _index, _styles = fose._get_grid_index(key, points, list(ids))
+        self.assertIs(_index, index)
+        self.assertIs(_styles, styles)
+
+        # Indexes are rebuilt when their points change, even if their count
+        # does not
+        ids[1] = "d" * 24
+        _index, _styles = fose._get_grid_index(key, points, ids)
+        self.assertIsNot(_index, index)
+        self.assertDictEqual(_styles, {})
+        self.assertEqual(len(fose._grid_indexes), 1)
+
+    def test_encode_plot(self):
+        points = np.array([[0, 1], [2, 3], [4, 5]], dtype=float)
+        ids = ["a" * 24, "b" * 24, "c" * 24]
+        labels = ["cat", None, "dog"]
+        info = {"style": "categorical", "lod": None}
+
+        b = fose._encode_plot(info, points, ids, None, labels, "categorical")
+
+        header_len = struct.unpack("<I", b[:4])[0]
+        self.assertEqual((4 + header_len) % 8, 0)
+
+        header = json.loads(b[4 : 4 + header_len])
+        data = b[4 + header_len :]
+
+        def _get(name):
+            dtype, offset, length = header["buffers"][name]
+            self.assertEqual(offset % 8, 0)
+            return np.frombuffer(
+                data, dtype=dtype, count=length, offset=offset
+            )
+
+        self.assertEqual(header["style"], "categorical")
+        self.assertListEqual(_get("points").tolist(), [0, 1, 2, 3, 4, 5])
+
+        ids_data = _get("ids_data").tobytes().decode()
+        offsets = _get("ids_offsets")
+        self.assertListEqual(
+            [ids_data[i:j] for i, j in zip(offsets[:-1], offsets[1:])], ids
+        )
+
+        self.assertListEqual(header["categories"], ["cat", "dog"])
+        self.assertListEqual(_get("labels").tolist(), [0, -1, 1])
+
+
+class EventsTests(unittest.IsolatedAsyncioTestCase):
+    async def test_add_event_listener(self):
+        payload = ListenPayload(
+            initializer=fost.StateDescription(),
+            events=[
+                StateUpdate.get_event_name(),
+                CloseSession.get_event_name(),
+            ],
+            subscription="listener",
+        )
+        events = fosev.add_event_listener(None, payload)
+        listener = asyncio.ensure_future(events.__anext__())
+
+        await asyncio.sleep(0)
+        self.assertFalse(listener.done())
+
+        state = fost.StateDescription()
+        await fosev.dispatch_event("other", StateUpdate(state=state))
+        await fosev.dispatch_event("other", CloseSession())
+
+        # Events from all subscriptions are received in order
+        event = await asyncio.wait_for(listener, 1)
+        self.assertEqual(event.event, StateUpdate.get_event_name())
+        self.assertEqual(
+            event.data,
+            fosev._serialize_event(
+                StateUpdate(state, version=fosev._state_version)
+            ),
+        )
+
+        event = await asyncio.wait_for(events.__anext__(), 1)
+        self.assertEqual(event.event, CloseSession.get_event_name())
+
+        await events.aclose()
+
+        for event_name in payload.events:
+            self.assertFalse(
+                any(
+                    l.subscription == "listener"
+                    for l in fosev._listeners[event_name]
+                )
+            )
+
+    async def test_state_patch(self):
+        def _listen(subscription, events):
+            return fosev.add_event_listener(
+                None,
+                ListenPayload(
+                    initializer=fost.StateDescription(),
+                    events=events,
+                    subscription=subscription,
+                ),
+            )
+
+        patches = _listen(
+            "patches",
+            [StatePatch.get_event_name(), StateUpdate.get_event_name()],
+        )
+        updates = _listen("updates", [StateUpdate.get_event_name()])
+
+        # Registers the listeners in order
+        patch_event = asyncio.ensure_future(patches.__anext__())
+        await asyncio.sleep(0)
+        update_event = asyncio.ensure_future(updates.__anext__())
+        await asyncio.sleep(0)
+
+        # The initial state of the "updates" listener
+        event = await asyncio.wait_for(patch_event, 1)
+        self.assertEqual(event.event, StateUpdate.get_event_name())
+
+        state = fost.StateDescription()
+        state.selected = ["sample"]
+        await fosev.dispatch_event(
+            "other", StatePatch(patch=state.serialize_patch(["selected"]))
+        )
+        version = fosev._state_version
+
+        self.assertListEqual(fosev.get_state().selected, ["sample"])
+
+        # Listeners that handle patches receive only the changes
+        event = await asyncio.wait_for(patches.__anext__(), 1)
+        self.assertEqual(event.event, StatePatch.get_event_name())
+        self.assertDictEqual(
+            json.loads(event.data),
+            {"patch": {"selected": ["sample"]}, "version": version},
+        )
+
+        # Other listeners receive the full state
+        event = await asyncio.wait_for(update_event, 1)
+        data = json.loads(event.data)
+        self.assertEqual(event.event, StateUpdate.get_event_name())
+        self.assertListEqual(data["state"]["selected"], ["sample"])
+        self.assertEqual(data["version"], version)
+
+        # Patches are not sent back to their sender, but still count towards
+        # the version that the sender has seen
+        state.selected_labels = [{"label_id": "label"}]
+        await fosev.dispatch_event(
+            "patches",
+            StatePatch(patch=state.serialize_patch(["selected_labels"])),
+        )
+        state.selected = []
+        await fosev.dispatch_event(
+            "other", StatePatch(patch=state.serialize_patch(["selected"]))
+        )
+
+        event = await asyncio.wait_for(patches.__anext__(), 1)
+        self.assertEqual(event.event, StatePatch.get_event_name())
+        self.assertEqual(json.loads(event.data)["version"], version + 2)
+
+        # A listener that misses a patch is sent the full state instead
+        await fosev.dispatch_event(
+            "other", StatePatch(patch=state.serialize_patch(["selected"]))
+        )
+        await fosev.dispatch_event(
+            "other", StatePatch(patch=state.serialize_patch(["selected"]))
+        )
+        _, listener = next(iter(fosev._requests["patches"]))
+        listener.queue.get_nowait()
+
+        event = await asyncio.wait_for(patches.__anext__(), 1)
+        data = json.loads(event.data)
+        self.assertEqual(event.event, StateUpdate.get_event_name())
+        self.assertEqual(data["version"], version + 4)
+        self.assertListEqual(
+            data["state"]["selected_labels"], [{"label_id": "label"}]
+        )
+
+        await patches.aclose()
+        await updates.aclose()
@@ -238,6 +238,59 @@ class OrthographicProjectionTests(BaseOrthographicProjectionTests):
             get_abs_path("specs/3d/100x100_seed_10_height.png"),
         )
 
+    @drop_datasets
+    def test_projection_num_workers(self):
+        dataset = fo.Dataset()
+        filepaths = []
+        for seed in (1, 10):
+            filepath = os.path.join(self.temp_dir.name, "%d.pcd" % seed)
+            self.test_pcd_path = filepath
+            self.write_test_pcd(num_points=1000, seed=seed, pcd_type="rgb")
+            filepaths.append(filepath)
+
+        dataset.add_samples([fo.Sample(filepath=f) for f in filepaths])
+
+        fou3d.compute_orthographic_projection_images(
+            dataset,
+            size=(50, 50),
+            output_dir=os.path.join(self.temp_dir.name, "multi"),
+            shading_mode="rgb",
+            num_workers=2,
+        )
+
+        metadata1 = dataset.values("orthographic_projection_metadata")
+
+        for filepath, metadata in zip(filepaths, metadata1):
+            img, expected = fou3d.compute_orthographic_projection_image(
+                filepath, (50, 50), shading_mode="rgb"
+            )
+            self.assertTrue(
+                np.array_equal(np.array(Image.open(metadata.filepath)), img)
+            )
+            self.assertTrue(
+                np.array_equal(metadata.min_bound, expected.min_bound)
+            )
+            self.assertEqual(metadata.width, expected.width)
+
+    def test_render_points_z_buffer(self):
+        image = np.zeros((2, 2, 3), dtype=np.uint8)
+        points = np.array(
+            [
+                [0.0, 0.0, 1.0],
+                [0.0, 0.0, 3.0],
+                [0.0, 0.0, 2.0],
+                [1.0, 1.0, 0.0],
+            ]
+        )
+        values = np.array([[1, 1, 1], [3, 3, 3], [2, 2, 2], [4, 4, 4]])
+
+        fou3d._render_points(image, points, values)
+
+        # the highest point in each pixel is rendered
+        self.assertListEqual(image[0, 0].tolist(), [3, 3, 3])
+        self.assertListEqual(image[1, 1].tolist(), [4, 4, 4])
+        self.assertListEqual(image[0, 1].tolist(), [0, 0, 0])
+
 
 class DataModelTests(unittest.TestCase):
     @drop_datasets
@@ -280,6 +333,20 @@ class HelperMethodTests(unittest.TestCase):
         actual = fou3d._clamp_to_discrete(arr, discrete)
         self.assertTrue(np.array_equal(expected, actual))
 
+    def test_apply_colormap(self):
+        colormap = fou3d.DEFAULT_SHADING_GRADIENT_MAP
+        values, colors = fou3d._parse_colormap(colormap)
+        arr = np.random.rand(100)
+
+        expected = np.array(
+            [
+                colormap[v]
+                for v in fou3d._clamp_to_discrete(arr, list(colormap.keys()))
+            ]
+        )
+        actual = fou3d._apply_colormap(arr, values, colors)
+        self.assertTrue(np.array_equal(expected, actual))
+
 
 if __name__ == "__main__":
     fo.config.show_progress_bars = False
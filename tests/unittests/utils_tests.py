@@ -21,6 +21,10 @@ from fiftyone.migrations.runner import MigrationRunner
 from decorators import drop_datasets
 
 
+def _square(x):
+    return x * x
+
+
 class CoreUtilsTests(unittest.TestCase):
     def test_validate_hex_color(self):
         # Valid colors
@@ -42,6 +46,32 @@ class CoreUtilsTests(unittest.TestCase):
         with self.assertRaises(ValueError):
             fou.validate_hex_color("#FFFF")
 
+    def test_iter_map(self):
+        inputs = list(range(50))
+        expected = [_square(x) for x in inputs]
+
+        self.assertListEqual(list(fou.iter_map(_square, inputs)), expected)
+
+        for use_threads in (False, True):
+            results = fou.iter_map(
+                _square,
+                iter(inputs),
+                num_workers=3,
+                chunksize=4,
+                max_prefetch=2,
+                use_threads=use_threads,
+            )
+            self.assertListEqual(list(results), expected)
+
+        self.assertListEqual(
+            list(fou.iter_map(_square, [], num_workers=3)), []
+        )
+
+        # Closing a partially consumed iterator releases the pool
+        results = fou.iter_map(_square, inputs, num_workers=2)
+        self.assertEqual(next(results), 0)
+        results.close()
+
     def test_validate_color(self):
         # valid
         fou.validate_color("#ff6d04")
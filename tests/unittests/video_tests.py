@@ -13,6 +13,7 @@ import numpy as np
 import unittest
 
 import fiftyone as fo
+import fiftyone.core.clips as foc
 import fiftyone.core.odm as foo
 from fiftyone import ViewField as F
 
@@ -1378,6 +1379,29 @@ class VideoTests(unittest.TestCase):
         self.assertIsNone(dataset.last()["foo"])
         self.assertIsNone(dataset.last().frames.last()["foo"])
 
+    @drop_datasets
+    def test_add_collection_sharded(self):
+        dataset1 = fo.Dataset()
+        dataset2 = fo.Dataset()
+        for i in range(20):
+            sample = fo.Sample(filepath="video%d.mp4" % i, index=i)
+            sample.frames[1] = fo.Frame(index=i)
+            sample.frames[2] = fo.Frame(index=i + 1)
+            dataset2.add_sample(sample)
+
+        dataset1.add_collection(dataset2, num_workers=2)
+
+        self.assertEqual(len(dataset1), 20)
+        self.assertEqual(dataset1.count("frames"), 40)
+
+        # Concurrently merged shards may be inserted in any order
+        self.assertSetEqual(
+            set(dataset1.values("id")), set(dataset2.values("id"))
+        )
+
+        for sample in dataset1:
+            self.assertEqual(sample.frames[2].index, sample.index + 1)
+
     @drop_datasets
     def test_add_collection_new_ids(self):
         sample1 = fo.Sample(filepath="video.mp4", foo="bar")
@@ -1808,6 +1832,30 @@ class VideoTests(unittest.TestCase):
         with self.assertRaises(KeyError):
             frame["detections"]
 
+    def test_to_rle(self):
+        frame_numbers = [1, 2, 3, 4, 5, 6, 7, 8, 10, 11]
+        bools = [True, True, False, True, False, False, True, True, True, True]
+
+        self.assertIsNone(foc._to_rle([], []))
+        self.assertListEqual(foc._to_rle(frame_numbers, [False] * 10), [])
+
+        self.assertListEqual(
+            foc._to_rle(frame_numbers, bools),
+            [(1, 2), (4, 4), (7, 8), (10, 11)],
+        )
+        self.assertListEqual(
+            foc._to_rle(frame_numbers, bools, tol=1),
+            [(1, 4), (7, 11)],
+        )
+        self.assertListEqual(
+            foc._to_rle(frame_numbers, bools, min_len=2),
+            [(1, 2), (7, 8), (10, 11)],
+        )
+        self.assertListEqual(
+            foc._to_rle(frame_numbers, bools, tol=1, min_len=5),
+            [(7, 11)],
+        )
+
     @drop_datasets
     def test_to_frames(self):
         dataset = fo.Dataset()
@@ -2101,6 +2149,95 @@ class VideoTests(unittest.TestCase):
         self.assertTrue(still_view.is_saved)
         self.assertEqual(still_view, view)
 
+    @drop_datasets
+    def test_sparse_frames(self):
+        dataset = fo.Dataset()
+        self.assertFalse(dataset.sparse_frames)
+
+        dataset.sparse_frames = True
+        self.assertTrue(dataset.sparse_frames)
+
+        sample = fo.Sample(
+            filepath="video.mp4",
+            metadata=fo.VideoMetadata(total_frame_count=3),
+        )
+        dataset.add_sample(sample)
+
+        # Empty frames are not stored
+        frame = sample.frames[2]
+        sample.save()
+
+        self.assertEqual(dataset.count("frames"), 0)
+        self.assertEqual(len(sample.frames), 1)
+
+        frame["hello"] = "world"
+        sample.save()
+
+        self.assertEqual(dataset.count("frames"), 1)
+        self.assertListEqual(
+            dataset.values("frames.frame_number", unwind=True), [2]
+        )
+
+        # Explicitly requested frames are still inserted
+        dataset.ensure_frames()
+        self.assertEqual(dataset.count("frames"), 3)
+
+        dataset.delete_empty_frames()
+        self.assertEqual(dataset.count("frames"), 1)
+        self.assertListEqual(
+            dataset.values("frames.hello", unwind=True), ["world"]
+        )
+
+    @drop_datasets
+    def test_sparse_frames_to_frames(self):
+        dataset = fo.Dataset()
+        dataset.sparse_frames = True
+
+        sample = fo.Sample(filepath="video.mp4")
+        sample.frames[1] = fo.Frame(filepath="frame1.jpg")
+        sample.frames[2] = fo.Frame(filepath="frame2.jpg", hello="world")
+        sample.frames[3] = fo.Frame(filepath="frame3.jpg")
+        dataset.add_sample(sample)
+
+        frames = dataset.to_frames()
+        frame_ids = frames.values("id")
+
+        # Simulate frames that are not stored in the source dataset
+        dataset._clear_frames(frame_ids=[frame_ids[0], frame_ids[2]])
+        self.assertEqual(dataset.count("frames"), 1)
+
+        # Saving a frame without data does not insert it
+        frame = frames.first()
+        frame["hello"] = None
+        frame.save()
+
+        self.assertEqual(dataset.count("frames"), 1)
+
+        frame["hello"] = "there"
+        frame.save()
+
+        self.assertEqual(dataset.count("frames"), 2)
+        self.assertListEqual(
+            dataset.values("frames.id", unwind=True), frame_ids[:2]
+        )
+
+        frames.set_values("hello", ["a", "b", None])
+
+        self.assertEqual(dataset.count("frames"), 2)
+        self.assertListEqual(
+            dataset.values("frames.hello", unwind=True), ["a", "b"]
+        )
+
+        frames.set_values("hello", ["a", "b", "c"])
+
+        self.assertEqual(dataset.count("frames"), 3)
+        self.assertListEqual(
+            dataset.values("frames.id", unwind=True), frame_ids
+        )
+        self.assertListEqual(
+            dataset.values("frames.hello", unwind=True), ["a", "b", "c"]
+        )
+
     @drop_datasets
     def test_to_frames_schema(self):
         sample = fo.Sample(filepath="video.mp4")
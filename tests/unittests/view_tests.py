@@ -3344,6 +3344,45 @@ class ViewStageTests(unittest.TestCase):
         tags = self.dataset.count_label_tags("test_dets")
         self.assertDictEqual(tags, {})
 
+    @drop_datasets
+    def test_tag_frame_labels(self):
+        sample = fo.Sample(filepath="video.mp4")
+        sample.frames[1] = fo.Frame(
+            gt=fo.Classification(label="cat", tags=["old"]),
+            dets=fo.Detections(
+                detections=[
+                    fo.Detection(label="cat"),
+                    fo.Detection(label="dog", tags=["old"]),
+                ]
+            ),
+        )
+        sample.frames[2] = fo.Frame(gt=fo.Classification(label="dog"))
+
+        dataset = fo.Dataset()
+        dataset.add_sample(sample)
+
+        view = dataset.filter_labels("frames.dets", F("label") == "dog")
+        view.tag_labels(["test", "test", "old"], "frames.dets")
+
+        self.assertDictEqual(
+            dataset.count_label_tags("frames.dets"), {"old": 1, "test": 1}
+        )
+        self.assertListEqual(
+            sample.frames[1].dets.detections[1].tags, ["old", "test"]
+        )
+
+        view = dataset.match_frames(F("gt.label") == "cat")
+        view.tag_labels("test", "frames.gt")
+
+        self.assertListEqual(
+            dataset.values("frames.gt.tags"), [[["old", "test"], []]]
+        )
+
+        dataset.untag_labels(["old", "test"])
+
+        self.assertDictEqual(dataset.count_label_tags(), {})
+        self.assertListEqual(sample.frames[1].gt.tags, [])
+
     def test_match(self):
         self.sample1["value"] = "value"
         self.sample1.save()